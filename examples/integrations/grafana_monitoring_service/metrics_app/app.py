@@ -9,7 +9,6 @@ The service gets a reference dataset from reference.csv file and process current
 
 Metrics calculation results are available with `GET /metrics` HTTP method in Prometheus compatible format.
 """
-import hashlib
 import os
 
 import dataclasses
@@ -38,6 +37,7 @@ from evidently.model_monitoring import RegressionPerformanceMonitor
 
 from evidently.runner.loader import DataLoader
 from evidently.runner.loader import DataOptions
+from evidently.utils.fingerprint import get_fingerprint
 
 
 app = Flask(__name__)
@@ -109,7 +109,7 @@ class MonitoringService:
 
         self.metrics = {}
         self.next_run_time = {}
-        self.hash = hashlib.sha256(pd.util.hash_pandas_object(self.reference["bike_random_forest"]).values).hexdigest()
+        self.hash = get_fingerprint(self.reference["bike_random_forest"]).hash
         self.hash_metric = prometheus_client.Gauge("evidently:reference_dataset_hash", "", labelnames=["hash"])
 
     def iterate(self, dataset_name: str, new_rows: pd.DataFrame):
@@ -3,7 +3,7 @@ import json
 import logging
 import os
 import sys
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from dataclasses import dataclass
 
@@ -23,6 +23,8 @@ class DataFormatOptions:
     header: bool
     separator: str
     date_column: str
+    # csv, parquet, feather or arrow, the format is inferred from the file extension if it is not set
+    file_format: Optional[str] = None
 
 
 @dataclass
@@ -47,6 +49,7 @@ class DashboardOptions(CalculateOptions):
 class ProfileOptions(CalculateOptions):
     profile_parts: Dict[str, Dict[str, str]]
     pretty_print: bool = False
+    chunk_size: Optional[int] = None
 
 
 def __get_not_none(src: Dict, key, default):
@@ -92,6 +95,7 @@ def calculate_dashboard(config: str, reference: str, current: str, output_path:
                 date_column=opts.data_format.date_column,
                 separator=opts.data_format.separator,
                 header=opts.data_format.header,
+                file_format=opts.data_format.file_format,
             ),
             reference_data_sampling=opts.sampling.reference,
             current_data_path=current,
@@ -99,6 +103,7 @@ def calculate_dashboard(config: str, reference: str, current: str, output_path:
                 date_column=opts.data_format.date_column,
                 separator=opts.data_format.separator,
                 header=opts.data_format.header,
+                file_format=opts.data_format.file_format,
             ),
             current_data_sampling=opts.sampling.current,
             dashboard_tabs=opts.dashboard_tabs,
@@ -128,6 +133,7 @@ def calculate_profile(config: str, reference: str, current: str, output_path: st
         column_mapping=opts_data["column_mapping"],
         profile_parts=opts_data["profile_sections"],
         pretty_print=opts_data["pretty_print"],
+        chunk_size=opts_data.get("chunk_size", None),
         sampling=Sampling(
             reference=SamplingOptions(**ref_sampling),
             current=SamplingOptions(**cur_sampling),
@@ -141,6 +147,7 @@ def calculate_profile(config: str, reference: str, current: str, output_path: st
                 date_column=opts.data_format.date_column,
                 separator=opts.data_format.separator,
                 header=opts.data_format.header,
+                file_format=opts.data_format.file_format,
             ),
             reference_data_sampling=opts.sampling.reference,
             current_data_path=current,
@@ -148,6 +155,7 @@ def calculate_profile(config: str, reference: str, current: str, output_path: st
                 date_column=opts.data_format.date_column,
                 separator=opts.data_format.separator,
                 header=opts.data_format.header,
+                file_format=opts.data_format.file_format,
             ),
             current_data_sampling=opts.sampling.current,
             profile_parts=opts.profile_parts,
@@ -155,6 +163,7 @@ def calculate_profile(config: str, reference: str, current: str, output_path: st
             options=parse_options(opts_data.get("options", None)),
             output_path=os.path.join(output_path, report_name),
             pretty_print=opts.pretty_print,
+            chunk_size=opts.chunk_size,
         )
     )
     runner.run()
@@ -29,6 +29,10 @@ class BaseAnalyzerResult:
 
 
 class Analyzer:
+    def __init__(self):
+        # default options for analyzers that are used without a pipeline, a pipeline sets its own provider
+        self.options_provider = OptionsProvider()
+
     @abc.abstractmethod
     def calculate(
         self, reference_data: pd.DataFrame, current_data: Optional[pd.DataFrame], column_mapping: ColumnMapping
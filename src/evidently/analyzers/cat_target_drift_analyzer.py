@@ -16,7 +16,7 @@ from evidently.calculations.data_drift import calculate_data_drift_for_category_
 from evidently.calculations.data_drift import define_predictions_type
 from evidently.calculations.data_drift import DataDriftMetrics
 from evidently.calculations.data_quality import get_rows_count
-from evidently.utils.data_operations import replace_infinity_values_to_nan
+from evidently.utils.data_operations import select_finite_rows
 from evidently.options import DataDriftOptions
 from evidently.options import QualityMetricsOptions
 
@@ -107,9 +107,10 @@ class CatTargetDriftAnalyzer(Analyzer):
             current_data_count=get_rows_count(current_data),
         )
 
-        # consider replacing only values in target and prediction column
-        reference_data = replace_infinity_values_to_nan(reference_data)
-        current_data = replace_infinity_values_to_nan(current_data)
+        # infinite values are replaced in copies of target and prediction columns only
+        used_columns = [column for column in (target_column, prediction_column) if column is not None]
+        reference_data = select_finite_rows(reference_data, [], used_columns)
+        current_data = select_finite_rows(current_data, [], used_columns)
 
         if target_column is not None:
             result.target_metrics = calculate_data_drift_for_category_feature(
@@ -8,13 +8,13 @@ from typing import Sequence
 from typing import Union
 
 import pandas as pd
-import numpy as np
 from sklearn import metrics
 
 from evidently import ColumnMapping
 from evidently.analyzers.base_analyzer import Analyzer
 from evidently.analyzers.base_analyzer import BaseAnalyzerResult
 from evidently.utils.data_operations import process_columns
+from evidently.utils.data_operations import select_finite_rows
 from evidently.calculations.classification_performance import calculate_confusion_by_classes
 from evidently.calculations.classification_performance import ConfusionMatrix
 
@@ -78,8 +78,7 @@ def _calculate_performance_metrics(
         target_and_preds += [prediction_column]
     else:
         target_and_preds += prediction_column
-    data.replace([np.inf, -np.inf], np.nan, inplace=True)
-    data.dropna(axis=0, how="any", inplace=True, subset=target_and_preds)
+    data = select_finite_rows(data, target_and_preds, target_and_preds)
     return classification_performance_metrics(data[target_column], data[prediction_column], target_names)
 
 
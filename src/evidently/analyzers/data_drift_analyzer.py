@@ -2,6 +2,7 @@
 # coding: utf-8
 
 from typing import Optional
+from typing import Union
 from dataclasses import dataclass
 
 import pandas as pd
@@ -11,6 +12,7 @@ from evidently.analyzers.base_analyzer import Analyzer
 from evidently.analyzers.base_analyzer import BaseAnalyzerResult
 from evidently.calculations.data_drift import get_overall_data_drift
 from evidently.calculations.data_drift import DataDriftAnalyzerMetrics
+from evidently.calculations.reference_profile import ReferenceProfile
 from evidently.options import DataDriftOptions
 from evidently.utils.data_operations import process_columns
 
@@ -27,13 +29,19 @@ class DataDriftAnalyzer(Analyzer):
         return analyzer_results[DataDriftAnalyzer]
 
     def calculate(
-        self, reference_data: pd.DataFrame, current_data: Optional[pd.DataFrame], column_mapping: ColumnMapping
+        self,
+        reference_data: Union[pd.DataFrame, ReferenceProfile],
+        current_data: Optional[pd.DataFrame],
+        column_mapping: ColumnMapping,
     ) -> DataDriftAnalyzerResults:
         if current_data is None:
             raise ValueError("current_data should be present")
 
         data_drift_options = self.options_provider.get(DataDriftOptions)
-        columns = process_columns(reference_data, column_mapping)
+        if isinstance(reference_data, ReferenceProfile):
+            columns = process_columns(current_data, column_mapping)
+        else:
+            columns = process_columns(reference_data, column_mapping)
         result_metrics = get_overall_data_drift(
             current_data=current_data,
             reference_data=reference_data,
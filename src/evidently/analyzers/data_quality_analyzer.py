@@ -14,6 +14,7 @@ from evidently.utils.data_operations import recognize_task
 from evidently.calculations.data_quality import DataQualityStats
 from evidently.calculations.data_quality import calculate_data_quality_stats
 from evidently.calculations.data_quality import calculate_correlations
+from evidently.options import DataQualityOptions
 
 
 @dataclass
@@ -115,10 +116,15 @@ class DataQualityAnalyzer(Analyzer):
             current_features_stats = None
 
         # calculate correlations
-        reference_correlations: Dict = calculate_correlations(reference_data, reference_features_stats, target_name)
+        data_quality_options = self.options_provider.get(DataQualityOptions)
+        reference_correlations: Dict = calculate_correlations(
+            reference_data, reference_features_stats, target_name, data_quality_options
+        )
 
         if current_features_stats is not None:
-            current_correlations: Dict = calculate_correlations(current_data, current_features_stats, target_name)
+            current_correlations: Dict = calculate_correlations(
+                current_data, current_features_stats, target_name, data_quality_options
+            )
 
         else:
             current_correlations = {}
@@ -15,7 +15,9 @@ from evidently.analyzers.base_analyzer import Analyzer
 from evidently.analyzers.base_analyzer import BaseAnalyzerResult
 from evidently.options import QualityMetricsOptions
 from evidently.utils.data_operations import process_columns
+from evidently.utils.data_operations import select_finite_rows
 from evidently.calculations.classification_performance import calculate_confusion_by_classes
+from evidently.calculations.classification_performance import calculate_pr_table
 
 
 @dataclass
@@ -77,8 +79,7 @@ class ProbClassificationPerformanceAnalyzer(Analyzer):
                 target_and_preds += [prediction_column]
             else:
                 target_and_preds += prediction_column
-            reference_data.replace([np.inf, -np.inf], np.nan, inplace=True)
-            reference_data.dropna(axis=0, how="any", inplace=True, subset=target_and_preds)
+            reference_data = select_finite_rows(reference_data, target_and_preds, target_and_preds)
             binaraized_target = (reference_data[target_column].values.reshape(-1, 1) == prediction_column).astype(int)
             array_prediction = reference_data[prediction_column].to_numpy()
 
@@ -138,23 +139,9 @@ class ProbClassificationPerformanceAnalyzer(Analyzer):
                 pr, rcl, thrs = metrics.precision_recall_curve(binaraized_target, reference_data[prediction_column[0]])
                 result.reference_metrics.pr_curve = {"pr": pr.tolist(), "rcl": rcl.tolist(), "thrs": thrs.tolist()}
 
-                pr_table = []
-                step_size = 0.05
-                binded = list(zip(binaraized_target["target"].tolist(), reference_data[prediction_column[0]].tolist()))
-                binded.sort(key=lambda item: item[1], reverse=True)
-                data_size = len(binded)
-                target_class_size = sum([x[0] for x in binded])
-                offset = max(round(data_size * step_size), 1)
-
-                for step in np.arange(offset, data_size + offset, offset):
-                    count = min(step, data_size)
-                    prob = round(binded[min(step, data_size - 1)][1], 2)
-                    top = round(100.0 * min(step, data_size) / data_size, 1)
-                    tp = sum([x[0] for x in binded[: min(step, data_size)]])
-                    fp = count - tp
-                    precision = round(100.0 * tp / count, 1)
-                    recall = round(100.0 * tp / target_class_size, 1)
-                    pr_table.append([top, int(count), prob, int(tp), int(fp), precision, recall])
+                pr_table = calculate_pr_table(
+                    binaraized_target["target"].to_numpy(), reference_data[prediction_column[0]].to_numpy()
+                )
 
                 result.reference_metrics.pr_table = pr_table
 
@@ -164,7 +151,10 @@ class ProbClassificationPerformanceAnalyzer(Analyzer):
 
                 result.reference_metrics.roc_curve = {}
                 result.reference_metrics.pr_curve = {}
-                result.reference_metrics.pr_table = {}
+                pr_tables = calculate_pr_table(
+                    binaraized_target[prediction_column].to_numpy(), reference_data[prediction_column].to_numpy()
+                )
+                result.reference_metrics.pr_table = dict(zip(prediction_column, pr_tables))
 
                 for label in prediction_column:
                     fpr, tpr, thrs = metrics.roc_curve(binaraized_target[label], reference_data[label])
@@ -181,28 +171,8 @@ class ProbClassificationPerformanceAnalyzer(Analyzer):
                         "thrs": thrs.tolist(),
                     }
 
-                    pr_table = []
-                    step_size = 0.05
-                    binded = list(zip(binaraized_target[label].tolist(), reference_data[label].tolist()))
-                    binded.sort(key=lambda item: item[1], reverse=True)
-                    data_size = len(binded)
-                    target_class_size = sum([x[0] for x in binded])
-                    offset = max(round(data_size * step_size), 1)
-
-                    for step in np.arange(offset, data_size + offset, offset):
-                        count = min(step, data_size)
-                        prob = round(binded[min(step, data_size - 1)][1], 2)
-                        top = round(100.0 * min(step, data_size) / data_size, 1)
-                        tp = sum([x[0] for x in binded[: min(step, data_size)]])
-                        fp = count - tp
-                        precision = round(100.0 * tp / count, 1)
-                        recall = round(100.0 * tp / target_class_size, 1)
-                        pr_table.append([top, int(count), prob, int(tp), int(fp), precision, recall])
-                    result.reference_metrics.pr_table[label] = pr_table
-
             if current_data is not None:
-                current_data.replace([np.inf, -np.inf], np.nan, inplace=True)
-                current_data.dropna(axis=0, how="any", inplace=True, subset=target_and_preds)
+                current_data = select_finite_rows(current_data, target_and_preds, target_and_preds)
 
                 binaraized_target = (current_data[target_column].values.reshape(-1, 1) == prediction_column).astype(int)
 
@@ -265,25 +235,9 @@ class ProbClassificationPerformanceAnalyzer(Analyzer):
                     )
                     result.current_metrics.pr_curve = {"pr": pr.tolist(), "rcl": rcl.tolist(), "thrs": thrs.tolist()}
 
-                    pr_table = []
-                    step_size = 0.05
-                    binded = list(
-                        zip(binaraized_target["target"].tolist(), current_data[prediction_column[0]].tolist())
+                    pr_table = calculate_pr_table(
+                        binaraized_target["target"].to_numpy(), current_data[prediction_column[0]].to_numpy()
                     )
-                    binded.sort(key=lambda item: item[1], reverse=True)
-                    data_size = len(binded)
-                    target_class_size = sum([x[0] for x in binded])
-                    offset = max(round(data_size * step_size), 1)
-
-                    for step in np.arange(offset, data_size + offset, offset):
-                        count = min(step, data_size)
-                        prob = round(binded[min(step, data_size - 1)][1], 2)
-                        top = round(100.0 * min(step, data_size) / data_size, 1)
-                        tp = sum([x[0] for x in binded[: min(step, data_size)]])
-                        fp = count - tp
-                        precision = round(100.0 * tp / count, 1)
-                        recall = round(100.0 * tp / target_class_size, 1)
-                        pr_table.append([top, int(count), prob, int(tp), int(fp), precision, recall])
 
                     result.current_metrics.pr_table = pr_table
 
@@ -293,7 +247,10 @@ class ProbClassificationPerformanceAnalyzer(Analyzer):
 
                     result.current_metrics.roc_curve = {}
                     result.current_metrics.pr_curve = {}
-                    result.current_metrics.pr_table = {}
+                    pr_tables = calculate_pr_table(
+                        binaraized_target[prediction_column].to_numpy(), current_data[prediction_column].to_numpy()
+                    )
+                    result.current_metrics.pr_table = dict(zip(prediction_column, pr_tables))
 
                     for label in prediction_column:
                         fpr, tpr, thrs = metrics.roc_curve(binaraized_target[label], current_data[label])
@@ -310,24 +267,4 @@ class ProbClassificationPerformanceAnalyzer(Analyzer):
                             "thrs": thrs.tolist(),
                         }
 
-                        pr_table = []
-                        step_size = 0.05
-                        binded = list(zip(binaraized_target[label].tolist(), current_data[label].tolist()))
-                        binded.sort(key=lambda item: item[1], reverse=True)
-                        data_size = len(binded)
-                        target_class_size = sum([x[0] for x in binded])
-                        offset = max(round(data_size * step_size), 1)
-
-                        for step in np.arange(offset, data_size + offset, offset):
-                            count = min(step, data_size)
-                            prob = round(binded[min(step, data_size - 1)][1], 2)
-                            top = round(100.0 * min(step, data_size) / data_size, 1)
-                            tp = sum([x[0] for x in binded[: min(step, data_size)]])
-                            fp = count - tp
-                            precision = round(100.0 * tp / count, 1)
-                            recall = round(100.0 * tp / target_class_size, 1)
-                            pr_table.append([top, int(count), prob, int(tp), int(fp), precision, recall])
-
-                        result.current_metrics.pr_table[label] = pr_table
-
         return result
@@ -0,0 +1,277 @@
+"""Results of data drift and data quality analyzers calculated from mergeable statistics of columns.
+
+Statistics are updated with new data without keeping it, see `evidently.calculations.streaming`,
+they are used by streaming model monitoring and by chunked profiles.
+"""
+
+import copy
+from typing import Dict
+from typing import List
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from evidently.analyzers.data_drift_analyzer import DataDriftAnalyzerResults
+from evidently.calculations import stattests
+from evidently.calculations.data_drift import DataDriftAnalyzerFeatureMetrics
+from evidently.calculations.data_drift import DataDriftAnalyzerMetrics
+from evidently.calculations.data_drift import PValueWithDrift
+from evidently.calculations.data_drift import dataset_drift_evaluation
+from evidently.calculations.data_quality import DataQualityStats
+from evidently.calculations.streaming import ColumnWindowStats
+from evidently.calculations.streaming import calculate_drift_by_counts
+from evidently.calculations.streaming import get_bin_edges
+from evidently.calculations.streaming import get_bin_edges_by_counts
+from evidently.calculations.streaming import get_stattest_by_counts
+from evidently.options import DataDriftOptions
+from evidently.pipeline.column_mapping import ColumnMapping
+from evidently.utils.data_operations import DatasetColumns
+from evidently.utils.data_operations import is_numeric_column
+from evidently.utils.data_operations import process_columns
+from evidently.utils.data_operations import recognize_task
+
+_STATTESTS = {
+    stattest.name: stattest
+    for stattest in (
+        stattests.ks_stat_test,
+        stattests.wasserstein_stat_test,
+        stattests.psi_stat_test,
+        stattests.kl_div_stat_test,
+        stattests.jensenshannon_stat_test,
+        stattests.chi_stat_test,
+        stattests.z_stat_test,
+    )
+}
+
+
+class ColumnsStats:
+    """Statistics of columns of reference and current data.
+
+    Columns, the task and bins of numerical columns are defined by a sample of reference data:
+    numerical columns get `n_bins` equal-sized bins of the sample, values out of them get to two outer bins.
+    Bins can be defined again by all added reference data with `set_reference_bin_edges`.
+    Statistics of current data (and of reference data with `reference_extremums`) keep the minimum
+    and the maximum of numerical and datetime columns.
+    Numerical columns keep sketches of `sketch_size` instead of exact counts of values when it is set,
+    see `ColumnWindowStats`, then values cannot be removed.
+    """
+
+    def __init__(
+        self,
+        reference_sample: pd.DataFrame,
+        column_mapping: Optional[ColumnMapping] = None,
+        n_bins: int = 100,
+        reference_extremums: bool = False,
+        sketch_size: Optional[int] = None,
+    ):
+        self.column_mapping = ColumnMapping() if column_mapping is None else column_mapping
+        self.columns = process_columns(reference_sample, self.column_mapping)
+
+        if isinstance(self.columns.utility_columns.prediction, list):
+            raise ValueError("Streaming calculations do not support a list of prediction columns")
+
+        target_name = self.columns.utility_columns.target
+        self.task: Optional[str]
+
+        if self.column_mapping.task is not None:
+            self.task = self.column_mapping.task
+
+        elif target_name is not None:
+            self.task = recognize_task(target_name, reference_sample)
+
+        else:
+            self.task = None
+
+        self.reference_stats: Dict[str, ColumnWindowStats] = {}
+        self.current_stats: Dict[str, ColumnWindowStats] = {}
+
+        self.n_bins = n_bins
+
+        for column_name in self.get_column_names():
+            reference_column = reference_sample[column_name]
+            is_numeric = column_name not in self.columns.cat_feature_names and is_numeric_column(reference_column)
+            bin_edges = get_bin_edges(reference_column.to_numpy(dtype=float), n_bins) if is_numeric else None
+            track_extremums = is_numeric or column_name in self.get_datetime_column_names()
+            self.reference_stats[column_name] = ColumnWindowStats(
+                bin_edges, reference_extremums and track_extremums, sketch_size
+            )
+            self.current_stats[column_name] = ColumnWindowStats(bin_edges, track_extremums, sketch_size)
+
+    def get_datetime_column_names(self) -> List[str]:
+        date_column = self.columns.utility_columns.date
+        return self.columns.datetime_feature_names + ([date_column] if date_column else [])
+
+    def get_column_names(self) -> List[str]:
+        column_names = (
+            self.columns.num_feature_names + self.columns.cat_feature_names + self.get_datetime_column_names()
+        )
+        for column_name in (self.columns.utility_columns.target, self.columns.utility_columns.prediction):
+            if column_name is not None and column_name not in column_names:
+                column_names.append(column_name)
+        return column_names
+
+    def is_numeric(self, column_name: str) -> bool:
+        return self.reference_stats[column_name].is_numeric
+
+    def get_values(self, data: pd.DataFrame, column_name: str) -> np.ndarray:
+        if self.is_numeric(column_name):
+            return data[column_name].to_numpy(dtype=float, na_value=np.nan)
+        # keep pandas values (Timestamp instead of numpy datetime64) for counting and comparison
+        return data[column_name].astype(object).to_numpy()
+
+    def add_reference(self, data: pd.DataFrame) -> None:
+        for column_name, column_stats in self.reference_stats.items():
+            column_stats.add(self.get_values(data, column_name))
+
+    def add_current(self, data: pd.DataFrame) -> None:
+        for column_name, column_stats in self.current_stats.items():
+            column_stats.add(self.get_values(data, column_name))
+
+    def set_reference_bin_edges(self) -> None:
+        """Define bins of numerical columns by counts of values of all added reference data, not by the sample.
+
+        Counts in bins are calculated again for reference and current data, with sketches they are approximate.
+        """
+        for column_name, reference_stats in self.reference_stats.items():
+            if reference_stats.is_numeric:
+                bin_edges = get_bin_edges_by_counts(*reference_stats.get_weighted_values(), self.n_bins)
+                reference_stats.set_bin_edges(bin_edges)
+                self.current_stats[column_name].set_bin_edges(bin_edges)
+
+    @staticmethod
+    def _get_stattest_name(feature_name: str, feature_type: str, options: DataDriftOptions) -> Optional[str]:
+        stattest_func = options.get_feature_stattest_func(feature_name, feature_type)
+        if stattest_func is None:
+            return None
+        empty_data = pd.Series(dtype=float)
+        return stattests.get_stattest(empty_data, empty_data, feature_type, stattest_func).name
+
+    def _calculate_feature_drift(
+        self, feature_name: str, feature_type: str, options: DataDriftOptions
+    ) -> DataDriftAnalyzerFeatureMetrics:
+        reference_stats = self.reference_stats[feature_name]
+        current_stats = self.current_stats[feature_name]
+        stattest_name = self._get_stattest_name(feature_name, feature_type, options)
+        stattest = _STATTESTS[get_stattest_by_counts(reference_stats, current_stats, feature_type, stattest_name)]
+        threshold = options.get_threshold(feature_name)
+        threshold = stattest.default_threshold if threshold is None else threshold
+        drift_score, drifted = calculate_drift_by_counts(
+            reference_stats, current_stats, feature_type, stattest.name, threshold
+        )
+        keys = set(reference_stats.value_counts.index) | set(current_stats.value_counts.index)
+        return DataDriftAnalyzerFeatureMetrics(
+            current_small_hist=self._get_small_hist(current_stats, feature_type, keys),
+            ref_small_hist=self._get_small_hist(reference_stats, feature_type, keys),
+            feature_type=feature_type,
+            stattest_name=stattest.display_name,
+            p_value=drift_score,
+            threshold=threshold,
+            drift_detected=bool(drifted),
+        )
+
+    @staticmethod
+    def _get_small_hist(column_stats: ColumnWindowStats, feature_type: str, keys: set) -> list:
+        if feature_type == "num":
+            # density in bins of reference data instead of bins of each dataset
+            counts = column_stats.bin_counts[1:-1]
+            widths = np.diff(column_stats.bin_edges)
+            density = counts / max(counts.sum(), 1) / np.where(widths > 0, widths, 1)
+            return [density.tolist(), column_stats.bin_edges.tolist()]
+        counts = column_stats.value_counts.reindex(list(keys), fill_value=0)
+        return list(reversed(list(map(list, zip(*sorted(counts.items(), key=lambda x: x[0]))))))
+
+    def calculate_data_drift(self, options: DataDriftOptions) -> DataDriftAnalyzerResults:
+        """The same results as DataDriftAnalyzer, drift of numerical features is approximate"""
+        columns: DatasetColumns = copy.deepcopy(self.columns)
+        target_name = columns.utility_columns.target
+        prediction_name = columns.utility_columns.prediction
+
+        # the same types of target and prediction as in data drift calculations
+        for column_name, is_numeric in (
+            (target_name, self.task == "regression"),
+            (prediction_name, len(self.reference_stats.get(prediction_name, ColumnWindowStats()).value_counts) > 5),
+        ):
+            if column_name is None:
+                continue
+            if is_numeric and self.is_numeric(column_name):
+                columns.num_feature_names.append(column_name)
+            else:
+                columns.cat_feature_names.append(column_name)
+
+        features = {}
+        p_values = {}
+
+        for feature_type, feature_names in (("num", columns.num_feature_names), ("cat", columns.cat_feature_names)):
+            for feature_name in feature_names:
+                features[feature_name] = self._calculate_feature_drift(feature_name, feature_type, options)
+                p_values[feature_name] = PValueWithDrift(
+                    features[feature_name].p_value, features[feature_name].drift_detected
+                )
+
+        n_drifted_features, share_drifted_features, dataset_drift = dataset_drift_evaluation(
+            p_values, options.drift_share
+        )
+        return DataDriftAnalyzerResults(
+            columns=columns,
+            options=options,
+            metrics=DataDriftAnalyzerMetrics(
+                n_features=len(features),
+                n_drifted_features=n_drifted_features,
+                share_drifted_features=share_drifted_features,
+                dataset_drift=dataset_drift,
+                features=features,
+            ),
+        )
+
+    def get_features_stats(
+        self, columns_stats: Dict[str, ColumnWindowStats], exact_percentiles: bool = False
+    ) -> DataQualityStats:
+        """Data quality stats of reference or current statistics with extremums.
+
+        Percentiles are approximate unless `exact_percentiles` is set, see `ColumnWindowStats.get_feature_stats`.
+        """
+
+        def get_stats(feature_names: List[str], feature_type: str):
+            return {
+                feature_name: columns_stats[feature_name].get_feature_stats(feature_type, exact_percentiles)
+                for feature_name in feature_names
+            }
+
+        features_stats = DataQualityStats(
+            num_features_stats=get_stats(self.columns.num_feature_names, "num"),
+            cat_features_stats=get_stats(self.columns.cat_feature_names, "cat"),
+            datetime_features_stats=get_stats(self.get_datetime_column_names(), "datetime"),
+        )
+        utility_feature_type = "cat" if self.task == "classification" else "num"
+
+        if self.columns.utility_columns.target is not None:
+            features_stats.target_stats = get_stats([self.columns.utility_columns.target], utility_feature_type)
+
+        if self.columns.utility_columns.prediction is not None:
+            features_stats.prediction_stats = get_stats([self.columns.utility_columns.prediction], utility_feature_type)
+
+        return features_stats
+
+    def get_current_features_stats(self, exact_percentiles: bool = False) -> DataQualityStats:
+        """Data quality stats of current data with counts of new and unused values of categorical features"""
+        current_features_stats = self.get_features_stats(self.current_stats, exact_percentiles)
+        all_cat_features = dict(current_features_stats.cat_features_stats or {})
+
+        if self.task == "classification" and current_features_stats.target_stats is not None:
+            all_cat_features.update(current_features_stats.target_stats)
+
+        # the same counts of new and unused values as in DataQualityAnalyzer, NaN is a value too
+        for feature_name, cat_feature_stats in all_cat_features.items():
+            reference_stats = self.reference_stats[feature_name]
+            current_stats = self.current_stats[feature_name]
+            reference_values = set(reference_stats.value_counts.index)
+            current_values = set(current_stats.value_counts.index)
+            cat_feature_stats.new_in_current_values_count = len(current_values - reference_values) + int(
+                current_stats.n_missing > 0 and reference_stats.n_missing == 0
+            )
+            cat_feature_stats.unused_in_current_values_count = len(reference_values - current_values) + int(
+                reference_stats.n_missing > 0 and current_stats.n_missing == 0
+            )
+
+        return current_features_stats
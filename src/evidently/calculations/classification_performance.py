@@ -1,7 +1,13 @@
-from typing import List, Dict
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
 
 import numpy as np
 import pandas as pd
+from sklearn import metrics
 
 from dataclasses import dataclass
 
@@ -12,6 +18,199 @@ class ConfusionMatrix:
     values: list
 
 
+@dataclass
+class ClassificationQuality:
+    """Quality metrics of predicted labels.
+
+    `confusion_matrix` has rows for target labels and columns for predicted labels,
+    labels are sorted values of target and prediction.
+    """
+
+    accuracy: float
+    precision: float
+    recall: float
+    f1: float
+    metrics_matrix: dict
+    confusion_matrix: np.ndarray
+
+
+def _get_labels_kind(values: np.ndarray) -> Optional[str]:
+    if values.ndim != 1:
+        return None
+
+    if values.dtype.kind in "iu":
+        return "integer"
+
+    if values.dtype.kind == "b":
+        return "boolean"
+
+    if values.dtype.kind in "OU":
+        inferred_kind = pd.api.types.infer_dtype(values, skipna=False)
+
+        if inferred_kind in ("string", "integer", "boolean"):
+            return inferred_kind
+
+    return None
+
+
+def _encode_labels(target: np.ndarray, prediction: np.ndarray) -> Optional[Tuple[list, np.ndarray, np.ndarray]]:
+    """Encode labels with indexes of sorted labels as sklearn does.
+
+    Returns None for labels which are not supported by the fast path.
+    """
+    target_kind = _get_labels_kind(target)
+
+    if target_kind is None or target_kind != _get_labels_kind(prediction) or target.shape != prediction.shape:
+        return None
+
+    codes, uniques = pd.factorize(np.concatenate([target, prediction]))
+
+    if codes.shape[0] == 0 or (codes < 0).any():
+        return None
+
+    labels_order = sorted(range(len(uniques)), key=lambda idx: uniques[idx])
+    labels_ranks = np.empty(len(uniques), dtype=np.int64)
+    labels_ranks[labels_order] = np.arange(len(uniques))
+    codes = labels_ranks[codes]
+    return [uniques[idx] for idx in labels_order], codes[: target.shape[0]], codes[target.shape[0] :]
+
+
+def _calculate_classification_quality_by_sklearn(
+    target: np.ndarray, prediction: np.ndarray, average: str, pos_label: Optional[Union[str, int]]
+) -> ClassificationQuality:
+    if average == "binary":
+        average_args = {"average": average, "pos_label": pos_label}
+
+    else:
+        average_args = {"average": average}
+
+    return ClassificationQuality(
+        accuracy=metrics.accuracy_score(target, prediction),
+        precision=metrics.precision_score(target, prediction, **average_args),
+        recall=metrics.recall_score(target, prediction, **average_args),
+        f1=metrics.f1_score(target, prediction, **average_args),
+        metrics_matrix=metrics.classification_report(target, prediction, output_dict=True),
+        confusion_matrix=metrics.confusion_matrix(target, prediction),
+    )
+
+
+def _divide(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    # zero division gives 0.0 like sklearn metrics by default
+    return numerator / np.where(denominator == 0, 1, denominator)
+
+
+def _get_scores(tp: np.ndarray, predicted: np.ndarray, support: np.ndarray) -> Tuple[np.ndarray, ...]:
+    precision = _divide(tp, predicted)
+    recall = _divide(tp, support)
+    denominator = precision + recall
+    denominator[denominator == 0.0] = 1
+    f1 = 2 * precision * recall / denominator
+    return precision, recall, f1
+
+
+def calculate_classification_quality(
+    target: Union[pd.Series, np.ndarray],
+    prediction: Union[pd.Series, np.ndarray],
+    average: str,
+    pos_label: Optional[Union[str, int]] = None,
+) -> ClassificationQuality:
+    """Calculate accuracy, averaged precision, recall and F1, `classification_report` and the confusion matrix.
+
+    Labels are encoded once and all metrics are derived from the confusion matrix,
+    values are equal to the values of sklearn metrics with default arguments.
+    Labels which are neither integers, booleans nor strings are processed by sklearn metrics.
+
+    Args:
+        target: true labels
+        prediction: predicted labels
+        average: "binary" for metrics of `pos_label` class or "macro" for unweighted mean of classes metrics
+        pos_label: the positive label for "binary" average
+    """
+    if average not in ("binary", "macro"):
+        raise ValueError(f"Unexpected average {average}, expected 'binary' or 'macro'")
+
+    target = np.asarray(target)
+    prediction = np.asarray(prediction)
+    encoded = _encode_labels(target, prediction)
+
+    if encoded is None:
+        return _calculate_classification_quality_by_sklearn(target, prediction, average, pos_label)
+
+    labels, target_codes, prediction_codes = encoded
+    labels_count = len(labels)
+
+    if average == "binary" and (labels_count > 2 or (pos_label not in labels and labels_count == 2)):
+        # sklearn raises an error about the labels
+        return _calculate_classification_quality_by_sklearn(target, prediction, average, pos_label)
+
+    confusion_matrix = np.bincount(
+        target_codes * labels_count + prediction_codes, minlength=labels_count * labels_count
+    ).reshape(labels_count, labels_count)
+    return calculate_quality_by_confusion_matrix(confusion_matrix, labels, average, pos_label)
+
+
+def calculate_quality_by_confusion_matrix(
+    confusion_matrix: np.ndarray, labels: list, average: str, pos_label: Optional[Union[str, int]] = None
+) -> ClassificationQuality:
+    """Derive quality metrics from the confusion matrix as `calculate_classification_quality` does.
+
+    Args:
+        confusion_matrix: counts of objects with rows for target labels and columns for predicted labels
+        labels: sorted labels of the confusion matrix, all of them are present in target or prediction
+        average: "binary" for metrics of `pos_label` class or "macro" for unweighted mean of classes metrics
+        pos_label: the positive label for "binary" average
+    """
+    tp = np.diag(confusion_matrix)
+    predicted = confusion_matrix.sum(axis=0)
+    support = confusion_matrix.sum(axis=1)
+
+    if tp.sum() == 0:
+        # sklearn counts are float without true positives, keep the same types of the report values
+        tp, predicted, support = tp.astype(float), predicted.astype(float), support.astype(float)
+
+    precision, recall, f1 = _get_scores(tp, predicted, support)
+    accuracy = tp.sum() / confusion_matrix.sum()
+
+    metrics_matrix: Dict[str, Any] = {
+        str(label): {
+            "precision": precision[idx].item(),
+            "recall": recall[idx].item(),
+            "f1-score": f1[idx].item(),
+            "support": support[idx].item(),
+        }
+        for idx, label in enumerate(labels)
+    }
+    metrics_matrix["accuracy"] = accuracy.item()
+    total_support = np.sum(support).item()
+
+    for name, weights in (("macro avg", None), ("weighted avg", support)):
+        metrics_matrix[name] = {
+            "precision": np.average(precision, weights=weights).item(),
+            "recall": np.average(recall, weights=weights).item(),
+            "f1-score": np.average(f1, weights=weights).item(),
+            "support": total_support,
+        }
+
+    if average == "binary":
+        if pos_label in labels:
+            pos_idx = labels.index(pos_label)
+            binary_scores = tp[[pos_idx]], predicted[[pos_idx]], support[[pos_idx]]
+
+        else:
+            binary_scores = np.zeros(1, dtype=np.int64), np.zeros(1, dtype=np.int64), np.zeros(1, dtype=np.int64)
+
+        precision, recall, f1 = _get_scores(*binary_scores)
+
+    return ClassificationQuality(
+        accuracy=accuracy,
+        precision=np.average(precision),
+        recall=np.average(recall),
+        f1=np.average(f1),
+        metrics_matrix=metrics_matrix,
+        confusion_matrix=confusion_matrix,
+    )
+
+
 def calculate_confusion_by_classes(confusion_matrix: pd.DataFrame, class_names: List[str]) -> Dict[str, Dict[str, int]]:
     """Calculate metrics
         TP (true positive)
@@ -46,3 +245,150 @@ def calculate_confusion_by_classes(confusion_matrix: pd.DataFrame, class_names:
         }
 
     return confusion_by_classes
+
+
+def calculate_pr_table(
+    binaraized_target: np.ndarray, prediction_probas: np.ndarray, step_size: float = 0.05
+) -> List[list]:
+    """Calculate precision/recall tables for all classes in one pass.
+
+    Args:
+        binaraized_target: binary target with a column for each class, or 1-dimensional binary target
+        prediction_probas: predicted probabilities with the same shape as `binaraized_target`
+        step_size: a share of rows in one line of the tables
+
+    Returns:
+        A table for each column of `binaraized_target`, a table for 1-dimensional inputs.
+        Every line of a table is `[top, count, prob, tp, fp, precision, recall]` for top rows by probability.
+    """
+    binaraized_target = np.asarray(binaraized_target)
+    prediction_probas = np.asarray(prediction_probas, dtype=float)
+
+    if binaraized_target.shape != prediction_probas.shape:
+        raise ValueError(
+            f"Target shape {binaraized_target.shape} differs from prediction shape {prediction_probas.shape}"
+        )
+
+    is_single = binaraized_target.ndim == 1
+
+    if is_single:
+        binaraized_target = binaraized_target.reshape(-1, 1)
+        prediction_probas = prediction_probas.reshape(-1, 1)
+
+    data_size = binaraized_target.shape[0]
+
+    if data_size == 0:
+        tables: List[list] = [[] for _ in range(binaraized_target.shape[1])]
+        return tables[0] if is_single else tables
+
+    # stable sort keeps the original order of equal probabilities
+    order = np.argsort(-prediction_probas, axis=0, kind="stable")
+    sorted_target = np.take_along_axis(binaraized_target, order, axis=0).astype(np.int64)
+    sorted_probas = np.take_along_axis(prediction_probas, order, axis=0)
+    target_cumsum = np.cumsum(sorted_target, axis=0)
+
+    offset = max(round(data_size * step_size), 1)
+    steps = np.arange(offset, data_size + offset, offset)
+    counts = np.minimum(steps, data_size)
+    tps = target_cumsum[counts - 1]
+    fps = counts.reshape(-1, 1) - tps
+    probs = sorted_probas[np.minimum(steps, data_size - 1)]
+    tops = 100.0 * counts / data_size
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        precisions = 100.0 * tps / counts.reshape(-1, 1)
+        recalls = 100.0 * tps / target_cumsum[-1]
+
+    tables = []
+
+    for idx in range(binaraized_target.shape[1]):
+        tables.append(
+            [
+                [round(top, 1), count, round(prob, 2), tp, fp, round(precision, 1), round(recall, 1)]
+                for top, count, prob, tp, fp, precision, recall in zip(
+                    tops.tolist(),
+                    counts.tolist(),
+                    probs[:, idx].tolist(),
+                    tps[:, idx].tolist(),
+                    fps[:, idx].tolist(),
+                    precisions[:, idx].tolist(),
+                    recalls[:, idx].tolist(),
+                )
+            ]
+        )
+
+    return tables[0] if is_single else tables
+
+
+@dataclass
+class ThresholdsConfusion:
+    """Counts of binary classification outcomes, a value for each threshold"""
+
+    tp: np.ndarray
+    fp: np.ndarray
+    tn: np.ndarray
+    fn: np.ndarray
+
+
+def calculate_confusion_by_thresholds(
+    binaraized_target: np.ndarray, prediction_probas: np.ndarray, thresholds: np.ndarray
+) -> ThresholdsConfusion:
+    """Calculate TP, FP, TN and FN for every threshold with one sort of probabilities.
+
+    Objects with probability not lower than a threshold are positive predictions.
+    """
+    binaraized_target = np.asarray(binaraized_target)
+    prediction_probas = np.asarray(prediction_probas, dtype=float)
+    thresholds = np.asarray(thresholds, dtype=float)
+    negative_probas = np.sort(prediction_probas[binaraized_target == 0])
+    positive_probas = np.sort(prediction_probas[binaraized_target == 1])
+    tn = np.searchsorted(negative_probas, thresholds, side="left")
+    fn = np.searchsorted(positive_probas, thresholds, side="left")
+    return ThresholdsConfusion(
+        tp=positive_probas.shape[0] - fn,
+        fp=negative_probas.shape[0] - tn,
+        tn=tn,
+        fn=fn,
+    )
+
+
+def calculate_negative_rates(
+    binaraized_target: np.ndarray, prediction_probas: np.ndarray, thresholds: np.ndarray
+) -> Tuple[List[float], List[float]]:
+    """Calculate TNR (true negative rate) and FNR (false negative rate) for every threshold.
+
+    Objects with probability lower than a threshold are negative predictions.
+    Rates of thresholds not lower than 1 are 1, as `roc_curve` adds such a threshold for the start of the curve.
+
+    Returns:
+        A tuple of lists (tnr, fnr) with a value for each threshold.
+    """
+    thresholds = np.asarray(thresholds, dtype=float)
+    confusion = calculate_confusion_by_thresholds(binaraized_target, prediction_probas, thresholds)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        tnr = np.where(thresholds < 1, confusion.tn / (confusion.tn + confusion.fp), 1.0)
+        fnr = np.where(thresholds < 1, confusion.fn / (confusion.fn + confusion.tp), 1.0)
+
+    return tnr.tolist(), fnr.tolist()
+
+
+def downsample_curve(curve: Dict[str, list], size: Optional[int]) -> Dict[str, list]:
+    """Keep `size` points of a curve with evenly spaced indexes, the first and the last points are kept.
+
+    All values of the `curve` dict should be lists of the same length. Curves with `size` or fewer points
+    and curves with `size` equal to None are returned without changes.
+    """
+    if size is None:
+        return curve
+
+    if size < 2:
+        raise ValueError(f"Size of a curve should be at least 2, got {size}")
+
+    curve_size = len(next(iter(curve.values()), []))
+
+    if curve_size <= size:
+        return curve
+
+    indexes = np.unique(np.linspace(0, curve_size - 1, size).round().astype(int))
+    return {key: [values[idx] for idx in indexes.tolist()] for key, values in curve.items()}
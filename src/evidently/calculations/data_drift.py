@@ -1,6 +1,8 @@
 """Methods for data drift calculations"""
 
 import collections
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict
 from typing import List
 from typing import Optional
@@ -12,15 +14,25 @@ import numpy as np
 import pandas as pd
 from dataclasses import dataclass
 
+from evidently.calculations.histogram import count_in_bins
+from evidently.calculations.histogram import get_bin_edges
+from evidently.calculations.histogram import get_density
+from evidently.calculations.reference_profile import ReferenceProfile
+from evidently.calculations.stattests import get_default_stattest_by_stats
 from evidently.calculations.stattests import get_stattest
 from evidently.calculations.stattests import PossibleStatTestType
 from evidently.calculations.stattests import StatTest
+from evidently.calculations.stattests.registry import StatTestResult
+from evidently.calculations.stattests.utils import count_unique_values
 from evidently.options import DataDriftOptions
 from evidently.utils.data_operations import DatasetColumns
+from evidently.utils.data_operations import is_numeric_column
 from evidently.utils.data_operations import recognize_task
 
 
 PValueWithDrift = collections.namedtuple("PValueWithDrift", ["p_value", "drifted"])
+# raw reference data or its precalculated statistics
+DriftReferenceDataType = Union[pd.DataFrame, ReferenceProfile]
 
 
 def _get_pred_labels_from_prob(dataframe: pd.DataFrame, prediction_column: list) -> List[str]:
@@ -108,8 +120,8 @@ def calculate_data_drift_for_category_feature(
     threshold: float,
 ):
     return calculate_data_drift(
-        current_data=current_data.dropna(subset=[column_name]),
-        reference_data=reference_data.dropna(subset=[column_name]),
+        current_data=current_data[[column_name]].dropna(),
+        reference_data=reference_data[[column_name]].dropna(),
         column_name=column_name,
         stattest=stattest,
         threshold=threshold,
@@ -170,9 +182,310 @@ def dataset_drift_evaluation(p_values, drift_share=0.5) -> Tuple[int, float, boo
     return n_drifted_features, share_drifted_features, dataset_drift
 
 
+StatTestWithResult = Tuple[StatTest, StatTestResult]
+
+
+def _calculate_num_features_batch_drift(
+    reference_data: pd.DataFrame,
+    current_data: pd.DataFrame,
+    feature_names: List[str],
+    data_drift_options: DataDriftOptions,
+) -> Dict[str, StatTestWithResult]:
+    """Calculate drift for numerical features with stattests that have a batch implementation.
+
+    All such features are passed to the stattest at once as 2-D arrays.
+    Features with other stattests or with non-numeric or empty data are skipped.
+    """
+    feature_names = [
+        feature_name
+        for feature_name in dict.fromkeys(feature_names)
+        if is_numeric_column(reference_data[feature_name]) and is_numeric_column(current_data[feature_name])
+    ]
+
+    if not feature_names:
+        return {}
+
+    reference = reference_data[feature_names].to_numpy(dtype=float, na_value=np.nan)
+    current = current_data[feature_names].to_numpy(dtype=float, na_value=np.nan)
+    reference[np.isinf(reference)] = np.nan
+    current[np.isinf(current)] = np.nan
+    reference_sizes = (~np.isnan(reference)).sum(axis=0)
+    current_sizes = (~np.isnan(current)).sum(axis=0)
+    n_values = None
+    # stattests are not hashable, so group features by id of stattest
+    tests: Dict[int, StatTest] = {}
+    features_by_test: Dict[int, List[int]] = {}
+
+    for feature_idx, feature_name in enumerate(feature_names):
+        if reference_sizes[feature_idx] == 0 or current_sizes[feature_idx] == 0:
+            continue
+
+        stattest_func = data_drift_options.get_feature_stattest_func(feature_name, "num")
+
+        if stattest_func is None:
+            if n_values is None:
+                n_values = count_unique_values(np.concatenate([reference, current]))
+
+            test = get_default_stattest_by_stats(int(reference_sizes[feature_idx]), int(n_values[feature_idx]), "num")
+
+        else:
+            test = get_stattest(reference_data[feature_name], current_data[feature_name], "num", stattest_func)
+
+        if test.func_batch is not None:
+            tests[id(test)] = test
+            features_by_test.setdefault(id(test), []).append(feature_idx)
+
+    result = {}
+
+    for test_id, features_idx in features_by_test.items():
+        test = tests[test_id]
+        test_results = test.batch(
+            reference[:, features_idx],
+            current[:, features_idx],
+            "num",
+            [data_drift_options.get_threshold(feature_names[feature_idx]) for feature_idx in features_idx],
+        )
+
+        for feature_idx, test_result in zip(features_idx, test_results):
+            result[feature_names[feature_idx]] = (test, test_result)
+
+    return result
+
+
+def _get_small_hist(values: np.ndarray, bins: int, weights: Optional[np.ndarray] = None) -> List[list]:
+    """Density histogram as `np.histogram(values, bins, weights=weights, density=True)` in lists"""
+    edges = get_bin_edges([values], bins)
+    return [get_density(count_in_bins(values, edges, weights), edges).tolist(), edges.tolist()]
+
+
+def _calculate_num_feature_drift(
+    reference_data: DriftReferenceDataType,
+    current_data: pd.DataFrame,
+    feature_name: str,
+    data_drift_options: DataDriftOptions,
+    batch_result: Optional[StatTestWithResult] = None,
+) -> Tuple[PValueWithDrift, DataDriftAnalyzerFeatureMetrics]:
+    if batch_result is not None:
+        test, drift_result = batch_result
+
+    else:
+        threshold = data_drift_options.get_threshold(feature_name)
+        feature_type = "num"
+        if isinstance(reference_data, ReferenceProfile):
+            ref_feature = reference_data[feature_name]
+        else:
+            ref_feature = reference_data[feature_name].replace([-np.inf, np.inf], np.nan).dropna()
+        curr_feature = current_data[feature_name].replace([-np.inf, np.inf], np.nan).dropna()
+        test = get_stattest(
+            ref_feature,
+            curr_feature,
+            feature_type,
+            data_drift_options.get_feature_stattest_func(feature_name, feature_type),
+        )
+        drift_result = test(ref_feature, curr_feature, feature_type, threshold)
+
+    p_value = drift_result.drift_score
+    drifted = drift_result.drifted
+    threshold = drift_result.actual_threshold
+    current_nbinsx = data_drift_options.get_nbinsx(feature_name)
+    if isinstance(reference_data, ReferenceProfile):
+        ref_finite_values, ref_counts = reference_data[feature_name].get_weighted_values("num")
+    else:
+        ref_finite_values = reference_data[feature_name][np.isfinite(reference_data[feature_name])]
+        ref_counts = None
+    feature_metrics = DataDriftAnalyzerFeatureMetrics(
+        current_small_hist=_get_small_hist(
+            current_data[feature_name][np.isfinite(current_data[feature_name])].to_numpy(dtype=float),
+            current_nbinsx,
+        ),
+        ref_small_hist=_get_small_hist(np.asarray(ref_finite_values, dtype=float), current_nbinsx, ref_counts),
+        feature_type="num",
+        stattest_name=test.display_name,
+        p_value=p_value,
+        drift_detected=drifted,
+        threshold=threshold,
+    )
+    return PValueWithDrift(p_value, drifted), feature_metrics
+
+
+def _calculate_cat_feature_drift(
+    reference_data: DriftReferenceDataType,
+    current_data: pd.DataFrame,
+    feature_name: str,
+    data_drift_options: DataDriftOptions,
+) -> Tuple[PValueWithDrift, DataDriftAnalyzerFeatureMetrics]:
+    threshold = data_drift_options.get_threshold(feature_name)
+    if isinstance(reference_data, ReferenceProfile):
+        feature_ref_data = reference_data[feature_name]
+    else:
+        feature_ref_data = reference_data[feature_name].dropna()
+    feature_cur_data = current_data[feature_name].dropna()
+
+    feature_type = "cat"
+    stat_test = get_stattest(
+        feature_ref_data,
+        feature_cur_data,
+        feature_type,
+        data_drift_options.get_feature_stattest_func(feature_name, feature_type),
+    )
+    drift_result = stat_test(feature_ref_data, feature_cur_data, feature_type, threshold)
+    p_value = drift_result.drift_score
+    drifted = drift_result.drifted
+    threshold = drift_result.actual_threshold
+
+    if isinstance(reference_data, ReferenceProfile):
+        ref_counts = feature_ref_data.get_value_counts("cat").copy()
+    else:
+        ref_counts = feature_ref_data.value_counts(sort=False)
+    cur_counts = feature_cur_data.value_counts(sort=False)
+    keys = set(ref_counts.keys()).union(set(cur_counts.keys()))
+    for key in keys:
+        if key not in ref_counts:
+            ref_counts.loc[key] = 0
+        if key not in cur_counts:
+            cur_counts.loc[key] = 0
+
+    ref_small_hist = list(reversed(list(map(list, zip(*sorted(ref_counts.items(), key=lambda x: x[0]))))))
+    cur_small_hist = list(reversed(list(map(list, zip(*sorted(cur_counts.items(), key=lambda x: x[0]))))))
+    feature_metrics = DataDriftAnalyzerFeatureMetrics(
+        ref_small_hist=ref_small_hist,
+        current_small_hist=cur_small_hist,
+        feature_type="cat",
+        stattest_name=stat_test.display_name,
+        p_value=p_value,
+        drift_detected=drifted,
+        threshold=threshold,
+    )
+    return PValueWithDrift(p_value, drifted), feature_metrics
+
+
+FeatureDriftResult = Tuple[str, PValueWithDrift, DataDriftAnalyzerFeatureMetrics]
+
+
+def _calculate_features_drift_chunk(
+    reference_data: DriftReferenceDataType,
+    current_data: pd.DataFrame,
+    features: List[Tuple[str, str]],
+    data_drift_options: DataDriftOptions,
+    batch_results: Dict[str, StatTestWithResult],
+) -> List[FeatureDriftResult]:
+    """Calculate drift for a chunk of (feature name, feature type) pairs, keeping the order of the chunk"""
+    result = []
+
+    for feature_name, feature_type in features:
+        if feature_type == "num":
+            p_value, feature_metrics = _calculate_num_feature_drift(
+                reference_data, current_data, feature_name, data_drift_options, batch_results.get(feature_name)
+            )
+
+        else:
+            p_value, feature_metrics = _calculate_cat_feature_drift(
+                reference_data, current_data, feature_name, data_drift_options
+            )
+
+        result.append((feature_name, p_value, feature_metrics))
+
+    return result
+
+
+def _split_to_chunks(items: list, n_chunks: int) -> List[list]:
+    """Split items to at most n_chunks contiguous chunks of almost equal size"""
+    n_chunks = max(1, min(n_chunks, len(items)))
+    chunk_size, rest = divmod(len(items), n_chunks)
+    chunks = []
+    start = 0
+
+    for chunk_idx in range(n_chunks):
+        end = start + chunk_size + (1 if chunk_idx < rest else 0)
+        chunks.append(items[start:end])
+        start = end
+
+    return chunks
+
+
+def _calculate_features_drift(
+    reference_data: DriftReferenceDataType,
+    current_data: pd.DataFrame,
+    features: List[Tuple[str, str]],
+    data_drift_options: DataDriftOptions,
+    batch_results: Dict[str, StatTestWithResult],
+) -> List[FeatureDriftResult]:
+    """Calculate drift for all features with the executor from the options.
+
+    Results are returned in the same order as features regardless of the executor.
+    """
+    executor_type = data_drift_options.get_executor()
+
+    if executor_type == "serial" or len(features) <= 1:
+        return _calculate_features_drift_chunk(
+            reference_data, current_data, features, data_drift_options, batch_results
+        )
+
+    max_workers = data_drift_options.get_max_workers()
+    chunks = _split_to_chunks(features, max_workers * data_drift_options.chunks_per_worker)
+    executor_class = ThreadPoolExecutor if executor_type == "thread" else ProcessPoolExecutor
+
+    with executor_class(max_workers=max_workers) as executor:
+        futures = []
+
+        for chunk in chunks:
+            if executor_type == "process":
+                # send to a worker process only the columns that it needs
+                chunk_columns = list(dict.fromkeys(feature_name for feature_name, _ in chunk))
+                if isinstance(reference_data, ReferenceProfile):
+                    chunk_reference_data = ReferenceProfile(
+                        columns={column: reference_data[column] for column in chunk_columns}
+                    )
+                else:
+                    chunk_reference_data = reference_data[chunk_columns]
+                chunk_current_data = current_data[chunk_columns]
+
+            else:
+                chunk_reference_data = reference_data
+                chunk_current_data = current_data
+
+            futures.append(
+                executor.submit(
+                    _calculate_features_drift_chunk,
+                    chunk_reference_data,
+                    chunk_current_data,
+                    chunk,
+                    data_drift_options,
+                    batch_results,
+                )
+            )
+
+        return [feature_result for future in futures for feature_result in future.result()]
+
+
+def _recognize_task(target_name: str, reference_data: DriftReferenceDataType) -> str:
+    if isinstance(reference_data, ReferenceProfile):
+        target = reference_data[target_name]
+        return "regression" if target.is_numeric and target.nunique("cat") >= 5 else "classification"
+    return recognize_task(target_name, reference_data)
+
+
+def _is_num_prediction(prediction_name: str, reference_data: DriftReferenceDataType) -> bool:
+    if isinstance(reference_data, ReferenceProfile):
+        prediction = reference_data[prediction_name]
+        return prediction.is_numeric and prediction.nunique("cat") > 5
+    return (
+        pd.api.types.is_numeric_dtype(reference_data[prediction_name].dtype)
+        and reference_data[prediction_name].nunique() > 5
+    )
+
+
+def _check_profile_has_column(reference_profile: ReferenceProfile, column_name: str):
+    if column_name not in reference_profile:
+        raise ValueError(
+            f"Reference profile has no column {column_name}, build it with get_reference_profile "
+            f"and the same column mapping"
+        )
+
+
 def get_overall_data_drift(
     current_data: pd.DataFrame,
-    reference_data: pd.DataFrame,
+    reference_data: DriftReferenceDataType,
     columns: DatasetColumns,
     data_drift_options: DataDriftOptions,
 ) -> DataDriftAnalyzerMetrics:
@@ -183,7 +496,7 @@ def get_overall_data_drift(
     drift_share = data_drift_options.drift_share
     # define type of target and prediction
     if target_column is not None:
-        task = recognize_task(target_column, reference_data)
+        task = _recognize_task(target_column, reference_data)
         if task == "regression":
             num_feature_names += [target_column]
         else:
@@ -191,22 +504,25 @@ def get_overall_data_drift(
 
     if prediction_column is not None:
         if isinstance(prediction_column, list) and len(prediction_column) > 2:
-            reference_data["predicted_labels"] = _get_pred_labels_from_prob(reference_data, prediction_column)
+            if isinstance(reference_data, ReferenceProfile):
+                _check_profile_has_column(reference_data, "predicted_labels")
+            else:
+                reference_data["predicted_labels"] = _get_pred_labels_from_prob(reference_data, prediction_column)
             current_data["predicted_labels"] = _get_pred_labels_from_prob(current_data, prediction_column)
             columns.utility_columns.prediction = "predicted_labels"
             cat_feature_names += [columns.utility_columns.prediction]
 
         elif isinstance(prediction_column, list) and len(prediction_column) == 2:
-            reference_data["prediction"] = reference_data[prediction_column[0]].values
+            if isinstance(reference_data, ReferenceProfile):
+                _check_profile_has_column(reference_data, "prediction")
+            else:
+                reference_data["prediction"] = reference_data[prediction_column[0]].values
             current_data["prediction"] = current_data[prediction_column[0]].values
             columns.utility_columns.prediction = "prediction"
             num_feature_names += [columns.utility_columns.prediction]
 
         elif isinstance(prediction_column, str):
-            if (
-                pd.api.types.is_numeric_dtype(reference_data[prediction_column].dtype)
-                and reference_data[prediction_column].nunique() > 5
-            ):
+            if _is_num_prediction(prediction_column, reference_data):
                 num_feature_names += [prediction_column]
             else:
                 cat_feature_names += [prediction_column]
@@ -214,87 +530,22 @@ def get_overall_data_drift(
     # calculate result
     features_metrics = {}
     p_values = {}
-
-    for feature_name in num_feature_names:
-        threshold = data_drift_options.get_threshold(feature_name)
-        feature_type = "num"
-        ref_feature = reference_data[feature_name].replace([-np.inf, np.inf], np.nan).dropna()
-        curr_feature = current_data[feature_name].replace([-np.inf, np.inf], np.nan).dropna()
-        test = get_stattest(
-            ref_feature,
-            curr_feature,
-            feature_type,
-            data_drift_options.get_feature_stattest_func(feature_name, feature_type),
-        )
-        drift_result = test(ref_feature, curr_feature, feature_type, threshold)
-        p_value = drift_result.drift_score
-        drifted = drift_result.drifted
-        threshold = drift_result.actual_threshold
-        p_values[feature_name] = PValueWithDrift(p_value, drifted)
-        current_nbinsx = data_drift_options.get_nbinsx(feature_name)
-        features_metrics[feature_name] = DataDriftAnalyzerFeatureMetrics(
-            current_small_hist=[
-                t.tolist()
-                for t in np.histogram(
-                    current_data[feature_name][np.isfinite(current_data[feature_name])],
-                    bins=current_nbinsx,
-                    density=True,
-                )
-            ],
-            ref_small_hist=[
-                t.tolist()
-                for t in np.histogram(
-                    reference_data[feature_name][np.isfinite(reference_data[feature_name])],
-                    bins=current_nbinsx,
-                    density=True,
-                )
-            ],
-            feature_type="num",
-            stattest_name=test.display_name,
-            p_value=p_value,
-            drift_detected=drifted,
-            threshold=threshold,
-        )
-
-    for feature_name in cat_feature_names:
-        threshold = data_drift_options.get_threshold(feature_name)
-        feature_ref_data = reference_data[feature_name].dropna()
-        feature_cur_data = current_data[feature_name].dropna()
-
-        feature_type = "cat"
-        stat_test = get_stattest(
-            feature_ref_data,
-            feature_cur_data,
-            feature_type,
-            data_drift_options.get_feature_stattest_func(feature_name, feature_type),
+    features = [(feature_name, "num") for feature_name in num_feature_names] + [
+        (feature_name, "cat") for feature_name in cat_feature_names
+    ]
+
+    if isinstance(reference_data, ReferenceProfile):
+        batch_results = {}
+    else:
+        batch_results = _calculate_num_features_batch_drift(
+            reference_data, current_data, num_feature_names, data_drift_options
         )
-        drift_result = stat_test(feature_ref_data, feature_cur_data, feature_type, threshold)
-        p_value = drift_result.drift_score
-        drifted = drift_result.drifted
-        threshold = drift_result.actual_threshold
-
-        p_values[feature_name] = PValueWithDrift(p_value, drifted)
 
-        ref_counts = feature_ref_data.value_counts(sort=False)
-        cur_counts = feature_cur_data.value_counts(sort=False)
-        keys = set(ref_counts.keys()).union(set(cur_counts.keys()))
-        for key in keys:
-            if key not in ref_counts:
-                ref_counts.loc[key] = 0
-            if key not in cur_counts:
-                cur_counts.loc[key] = 0
-
-        ref_small_hist = list(reversed(list(map(list, zip(*sorted(ref_counts.items(), key=lambda x: x[0]))))))
-        cur_small_hist = list(reversed(list(map(list, zip(*sorted(cur_counts.items(), key=lambda x: x[0]))))))
-        features_metrics[feature_name] = DataDriftAnalyzerFeatureMetrics(
-            ref_small_hist=ref_small_hist,
-            current_small_hist=cur_small_hist,
-            feature_type="cat",
-            stattest_name=stat_test.display_name,
-            p_value=p_value,
-            drift_detected=drifted,
-            threshold=threshold,
-        )
+    for feature_name, p_value, feature_metrics in _calculate_features_drift(
+        reference_data, current_data, features, data_drift_options, batch_results
+    ):
+        p_values[feature_name] = p_value
+        features_metrics[feature_name] = feature_metrics
 
     n_drifted_features, share_drifted_features, dataset_drift = dataset_drift_evaluation(p_values, drift_share)
     return DataDriftAnalyzerMetrics(
@@ -0,0 +1,75 @@
+"""Counts of duplicated rows and columns calculated with hashes of values
+
+Every column is hashed once, rows and columns with equal hashes are candidates to duplicates
+and only the candidates are compared by values, so the results are the same as
+`DataFrame.duplicated` and pairwise `Series.equals` return.
+"""
+
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+
+_ROW_HASH_MULTIPLIER = np.uint64(1000003)
+
+
+def get_column_hashes(column: pd.Series) -> np.ndarray:
+    """Hashes of values of the column, equal values get equal hashes.
+
+    Values are equal in terms of `Series.equals` and `DataFrame.duplicated`:
+    all null values of an object column are equal, 1 and 1.0 in an object column are equal,
+    -0.0 and 0.0 are equal, NaN values with any bits are equal.
+    """
+    if column.dtype == object:
+        # hashes of objects are calculated with their string representations, hash codes of unique values instead
+        column = pd.Series(pd.factorize(column.to_numpy())[0])
+
+    elif pd.api.types.is_float_dtype(column.dtype):
+        # NaN values can have different bits (inf - inf has the sign bit), -0.0 and 0.0 too
+        values = column.to_numpy()
+        column = pd.Series(np.where(np.isnan(values), np.nan, values + 0.0).astype(values.dtype, copy=False))
+
+    return pd.util.hash_pandas_object(column, index=False).to_numpy()
+
+
+def _count_equal_pairs(dataset: pd.DataFrame, column_names: List[str]) -> int:
+    """Number of pairs of equal columns among columns with equal hashes"""
+    groups: List[List[str]] = []
+
+    for column_name in column_names:
+        for group in groups:
+            if dataset[group[0]].equals(dataset[column_name]):
+                group.append(column_name)
+                break
+
+        else:
+            groups.append([column_name])
+
+    return sum(len(group) * (len(group) - 1) // 2 for group in groups)
+
+
+def get_number_of_duplicates(dataset: pd.DataFrame) -> Tuple[int, int]:
+    """Numbers of duplicated rows (as `dataset.duplicated().sum()`) and of pairs of equal columns
+
+    Hashes of columns are reduced to hashes of rows and to one hash of every column in one pass.
+    """
+    number_of_rows = dataset.shape[0]
+    row_hashes = np.zeros(number_of_rows, dtype=np.uint64)
+    # hashes of all values of a column are reduced to a weighted sum, so the order of values matters
+    weights = np.random.default_rng(0).integers(0, np.iinfo(np.uint64).max, number_of_rows, dtype=np.uint64)
+    columns_by_hash: Dict[int, List[str]] = {}
+
+    for column_name in dataset.columns:
+        hashes = get_column_hashes(dataset[column_name])
+        row_hashes = row_hashes * _ROW_HASH_MULTIPLIER ^ hashes
+        columns_by_hash.setdefault(int((hashes * weights).sum()), []).append(column_name)
+
+    # rows without equal hashes are not duplicates for sure
+    candidates = pd.Series(row_hashes).duplicated(keep=False).to_numpy()
+    number_of_duplicated_rows = int(dataset[candidates].duplicated().sum()) if candidates.any() else 0
+    number_of_duplicated_columns = sum(
+        _count_equal_pairs(dataset, column_names) for column_names in columns_by_hash.values() if len(column_names) > 1
+    )
+    return number_of_duplicated_rows, number_of_duplicated_columns
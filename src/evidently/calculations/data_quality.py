@@ -1,8 +1,10 @@
 """Methods for overall dataset quality calculations - rows count, a specific values count, etc."""
+import warnings
 from dataclasses import dataclass
 from dataclasses import fields
 from typing import Callable
 from typing import Dict
+from typing import List
 from typing import Optional
 from typing import Union
 
@@ -10,6 +12,9 @@ import numpy as np
 import pandas as pd
 from scipy.stats import chi2_contingency
 
+from evidently.calculations.reference_profile import ColumnReferenceProfile
+from evidently.calculations.reference_profile import ReferenceProfile
+from evidently.options.data_quality import DataQualityOptions
 from evidently.utils.data_operations import DatasetColumns
 
 
@@ -146,23 +151,48 @@ class DataQualityStats:
         raise KeyError(item)
 
 
-def _get_features_stats(feature: pd.Series, feature_type: str) -> FeatureQualityStats:
+def _get_value_counts(feature: pd.Series) -> pd.Series:
+    """Counts of values with NaN in the same order as `feature.value_counts(dropna=False)`.
+
+    Values are factorized once, the codes give counts of all values at once, and missing, unique
+    and most common values are taken from the counts. Every column is factorized separately:
+    one factorization of a block of columns hashes the same values and is slower with a larger hash table.
+    """
+    values = feature.to_numpy()
+    codes, uniques = pd.factorize(values)
+    is_null = codes == -1
+
+    if is_null.any():
+        # null values get code -1, they are counted as one more value in the order of the first appearance
+        # with the original null value (None or NaN) as value_counts does
+        first_null = int(np.argmax(is_null))
+        null_code = int(codes[:first_null].max()) + 1 if first_null > 0 else 0
+        codes = np.where(codes >= null_code, codes + 1, codes)
+        codes[is_null] = null_code
+        uniques = np.insert(np.asarray(uniques, dtype=values.dtype), null_code, values[first_null])
+
+    counts = pd.Series(np.bincount(codes, minlength=len(uniques)), index=uniques)
+    return counts.sort_values(ascending=False)
+
+
+def _get_common_stats(value_counts: pd.Series, feature_type: str) -> FeatureQualityStats:
+    """Stats of all feature types that are calculated from counts of values"""
+
     def get_percentage_from_all_values(value: Union[int, float]) -> float:
         return np.round(100 * value / all_values_count, 2)
 
     result = FeatureQualityStats(feature_type=feature_type)
-    all_values_count = feature.shape[0]
+    all_values_count = int(value_counts.sum())
 
     if not all_values_count > 0:
         # we have no data, return default stats for en empty dataset
         return result
 
-    result.missing_count = int(feature.isnull().sum())
-    result.count = int(feature.count())
-    all_values_count = feature.shape[0]
-    value_counts = feature.value_counts(dropna=False)
+    is_null = pd.isnull(value_counts.index)
+    result.missing_count = int(value_counts[is_null].sum())
+    result.count = all_values_count - result.missing_count
     result.missing_percentage = np.round(100 * result.missing_count / all_values_count, 2)
-    unique_count: int = feature.nunique()
+    unique_count: int = int((~is_null).sum())
     result.unique_count = unique_count
     result.unique_percentage = get_percentage_from_all_values(unique_count)
     result.most_common_value = value_counts.index[0]
@@ -172,45 +202,188 @@ def _get_features_stats(feature: pd.Series, feature_type: str) -> FeatureQuality
         result.most_common_not_null_value = value_counts.index[1]
         result.most_common_not_null_value_percentage = get_percentage_from_all_values(value_counts.iloc[1])
 
+    return result
+
+
+def _get_features_stats(feature: pd.Series, feature_type: str) -> FeatureQualityStats:
     if feature_type == "num":
+        return _get_num_features_stats(feature.to_frame(), [feature.name])[feature.name]
+
+    result = _get_common_stats(_get_value_counts(feature), feature_type)
+
+    if feature_type == "datetime" and feature.shape[0] > 0:
+        # cast datetime value to str for datetime features
+        result.most_common_value = str(result.most_common_value)
+        # cast datetime value to str for datetime features
+        result.max = str(feature.max())
+        result.min = str(feature.min())
+
+    return result
+
+
+def _get_num_features_stats(dataset: pd.DataFrame, feature_names: List[str]) -> Dict[str, FeatureQualityStats]:
+    """Stats of numerical features, calculated for all features at once with a 2-D array of values.
+
+    The results are the same as for every feature separately: percentiles and moments include infinite values
+    as pandas `describe` does.
+    """
+    result = {}
+
+    for feature_name in feature_names:
+        result[feature_name] = _get_common_stats(_get_value_counts(dataset[feature_name]), "num")
+
+    if dataset.shape[0] == 0 or not feature_names:
+        return result
+
+    values = dataset[feature_names].to_numpy(dtype=float, na_value=np.nan)
+    is_all_null = np.isnan(values).all(axis=0)
+
+    with warnings.catch_warnings(), np.errstate(invalid="ignore"):
+        # columns without values get NaN stats, do not warn about them
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+        infinite_counts = np.isinf(values).sum(axis=0)
+        maximums = np.nanmax(values, axis=0)
+        minimums = np.nanmin(values, axis=0)
+        means = np.nanmean(values, axis=0)
+        stds = np.nanstd(values, axis=0, ddof=1)
+        percentiles = np.nanpercentile(values, [25, 50, 75], axis=0)
+
+    for idx, feature_name in enumerate(feature_names):
+        feature_stats = result[feature_name]
+        dtype = dataset[feature_name].dtype
         # round most common feature value for numeric features to 1e-5
-        if not np.issubdtype(feature, np.number):
-            feature = feature.astype(float)
+        feature_stats.most_common_value = np.round(feature_stats.most_common_value, 5)
+        feature_stats.infinite_count = int(infinite_counts[idx])
+        feature_stats.infinite_percentage = np.round(100 * feature_stats.infinite_count / dataset.shape[0], 2)
+        maximum, minimum = maximums[idx], minimums[idx]
+
+        if isinstance(dtype, np.dtype) and np.issubdtype(dtype, np.integer) and not is_all_null[idx]:
+            # integer features keep the type of max and min values
+            maximum, minimum = dtype.type(maximum), dtype.type(minimum)
+
+        feature_stats.max = np.round(maximum, 2)
+        feature_stats.min = np.round(minimum, 2)
+        feature_stats.std = np.round(stds[idx], 2)
+        feature_stats.mean = np.round(means[idx], 2)
+        feature_stats.percentile_25 = np.round(percentiles[0, idx], 2)
+        feature_stats.percentile_50 = np.round(percentiles[1, idx], 2)
+        feature_stats.percentile_75 = np.round(percentiles[2, idx], 2)
+
+    return result
+
+
+def _get_features_stats_from_profile(column: ColumnReferenceProfile, feature_type: str) -> FeatureQualityStats:
+    """The same stats as `_get_features_stats` from a reference profile of the column.
+
+    Percentiles of sketched columns are approximate.
+    """
+
+    def get_percentage_from_all_values(value: Union[int, float]) -> float:
+        return np.round(100 * value / all_values_count, 2)
+
+    result = FeatureQualityStats(feature_type=feature_type)
+    result.count = column.size("cat")
+    result.missing_count = column.n_missing
+    all_values_count = result.count + result.missing_count
+
+    if not all_values_count > 0:
+        return result
+
+    value_counts = column.top_value_counts if column.value_counts is None else column.value_counts.head(2)
+
+    if result.missing_count > 0:
+        missing_counts = pd.Series([result.missing_count], index=[np.nan])
+        value_counts = pd.concat(
+            [
+                value_counts[value_counts > result.missing_count],
+                missing_counts,
+                value_counts[value_counts <= result.missing_count],
+            ]
+        )
+
+    result.missing_percentage = np.round(100 * result.missing_count / all_values_count, 2)
+    result.unique_count = column.n_unique
+    result.unique_percentage = get_percentage_from_all_values(column.n_unique)
+    result.most_common_value = value_counts.index[0]
+    result.most_common_value_percentage = get_percentage_from_all_values(value_counts.iloc[0])
+
+    if result.count > 0 and pd.isnull(result.most_common_value):
+        result.most_common_not_null_value = value_counts.index[1]
+        result.most_common_not_null_value_percentage = get_percentage_from_all_values(value_counts.iloc[1])
+
+    if feature_type == "num" and result.count == 0:
         result.most_common_value = np.round(result.most_common_value, 5)
-        result.infinite_count = int(np.sum(np.isinf(feature)))
+        result.infinite_count = 0
+        result.infinite_percentage = 0.0
+        result.max = result.min = result.mean = result.std = np.nan
+        result.percentile_25 = result.percentile_50 = result.percentile_75 = np.nan
+
+    elif feature_type == "num":
+        result.most_common_value = np.round(result.most_common_value, 5)
+        sorted_values, _ = column.get_weighted_values("cat")
+        n_negative_infinite = column.cumulative_counts(np.array([-np.inf]), "cat")[0]
+        n_positive_infinite = result.count - column.cumulative_counts(np.array([np.inf]), "cat", side="left")[0]
+        result.infinite_count = int(n_negative_infinite + n_positive_infinite)
         result.infinite_percentage = get_percentage_from_all_values(result.infinite_count)
-        result.max = np.round(feature.max(), 2)
-        result.min = np.round(feature.min(), 2)
-        common_stats = dict(feature.describe())
-        std = common_stats["std"]
+        result.max = np.round(sorted_values[-1], 2)
+        result.min = np.round(sorted_values[0], 2)
+
+        if n_negative_infinite > 0 and n_positive_infinite > 0:
+            mean = np.nan
+        elif n_negative_infinite > 0 or n_positive_infinite > 0:
+            mean = -np.inf if n_negative_infinite > 0 else np.inf
+        else:
+            mean = column.mean
+
+        if result.infinite_count > 0 or result.count < 2:
+            std = np.nan
+        else:
+            # sample std as pandas describe from the std of the population
+            std = column.std * np.sqrt(result.count / (result.count - 1))
+
         result.std = np.round(std, 2)
-        result.mean = np.round(common_stats["mean"], 2)
-        result.percentile_25 = np.round(common_stats["25%"], 2)
-        result.percentile_50 = np.round(common_stats["50%"], 2)
-        result.percentile_75 = np.round(common_stats["75%"], 2)
+        result.mean = np.round(mean, 2)
+        result.percentile_25 = np.round(column.quantile(0.25), 2)
+        result.percentile_50 = np.round(column.quantile(0.5), 2)
+        result.percentile_75 = np.round(column.quantile(0.75), 2)
 
     if feature_type == "datetime":
-        # cast datetime value to str for datetime features
         result.most_common_value = str(result.most_common_value)
-        # cast datetime value to str for datetime features
-        result.max = str(feature.max())
-        result.min = str(feature.min())
+        values = column.get_data("cat") if column.value_counts is None else pd.Series(column.value_counts.index)
+        result.max = str(values.max())
+        result.min = str(values.min())
 
     return result
 
 
+def _get_column_stats(
+    dataset: Union[pd.DataFrame, ReferenceProfile], column_name: str, feature_type: str
+) -> FeatureQualityStats:
+    if isinstance(dataset, ReferenceProfile):
+        return _get_features_stats_from_profile(dataset[column_name], feature_type)
+    return _get_features_stats(dataset[column_name], feature_type)
+
+
 def calculate_data_quality_stats(
-    dataset: pd.DataFrame, columns: DatasetColumns, task: Optional[str]
+    dataset: Union[pd.DataFrame, ReferenceProfile], columns: DatasetColumns, task: Optional[str]
 ) -> DataQualityStats:
+    """Calculate data quality stats for all columns of the dataset.
+
+    Reference profiles and sketches can be used in place of the dataset.
+    """
     result = DataQualityStats()
 
-    result.num_features_stats = {
-        feature_name: _get_features_stats(dataset[feature_name], feature_type="num")
-        for feature_name in columns.num_feature_names
-    }
+    if isinstance(dataset, ReferenceProfile):
+        result.num_features_stats = {
+            feature_name: _get_column_stats(dataset, feature_name, "num")
+            for feature_name in columns.num_feature_names
+        }
+
+    else:
+        result.num_features_stats = _get_num_features_stats(dataset, columns.num_feature_names)
 
     result.cat_features_stats = {
-        feature_name: _get_features_stats(dataset[feature_name], feature_type="cat")
+        feature_name: _get_column_stats(dataset, feature_name, "cat")
         for feature_name in columns.cat_feature_names
     }
 
@@ -221,7 +394,7 @@ def calculate_data_quality_stats(
         date_list = columns.datetime_feature_names
 
     result.datetime_features_stats = {
-        feature_name: _get_features_stats(dataset[feature_name], feature_type="datetime") for feature_name in date_list
+        feature_name: _get_column_stats(dataset, feature_name, "datetime") for feature_name in date_list
     }
 
     target_name = columns.utility_columns.target
@@ -230,10 +403,10 @@ def calculate_data_quality_stats(
         result.target_stats = {}
 
         if task == "classification":
-            result.target_stats[target_name] = _get_features_stats(dataset[target_name], feature_type="cat")
+            result.target_stats[target_name] = _get_column_stats(dataset, target_name, "cat")
 
         else:
-            result.target_stats[target_name] = _get_features_stats(dataset[target_name], feature_type="num")
+            result.target_stats[target_name] = _get_column_stats(dataset, target_name, "num")
 
     prediction_name = columns.utility_columns.prediction
 
@@ -241,10 +414,10 @@ def calculate_data_quality_stats(
         result.prediction_stats = {}
 
         if task == "classification":
-            result.prediction_stats[prediction_name] = _get_features_stats(dataset[prediction_name], feature_type="cat")
+            result.prediction_stats[prediction_name] = _get_column_stats(dataset, prediction_name, "cat")
 
         else:
-            result.prediction_stats[prediction_name] = _get_features_stats(dataset[prediction_name], feature_type="num")
+            result.prediction_stats[prediction_name] = _get_column_stats(dataset, prediction_name, "num")
 
     return result
 
@@ -307,6 +480,53 @@ def _cramer_v(x: pd.Series, y: pd.Series) -> float:
     return value
 
 
+def _cramer_v_by_codes(x_codes: np.ndarray, x_n_values: int, y_codes: np.ndarray, y_n_values: int) -> float:
+    """Calculate Cramér's V for integer codes of values, negative codes are missing values"""
+    is_present = (x_codes >= 0) & (y_codes >= 0)
+    contingency_table = np.bincount(
+        x_codes[is_present] * y_n_values + y_codes[is_present], minlength=x_n_values * y_n_values
+    ).reshape(x_n_values, y_n_values)
+    # keep only observed values as pd.crosstab does
+    contingency_table = contingency_table[contingency_table.sum(axis=1) > 0][:, contingency_table.sum(axis=0) > 0]
+    n_rows, n_cols = contingency_table.shape
+
+    if min(n_cols - 1, n_rows - 1) <= 0:
+        return np.nan
+
+    total = contingency_table.sum()
+    expected = np.outer(contingency_table.sum(axis=1), contingency_table.sum(axis=0)) / total
+    chi2_stat = ((contingency_table - expected) ** 2 / expected).sum()
+    return np.sqrt(chi2_stat / total / min(n_cols - 1, n_rows - 1))
+
+
+def _cramer_v_matrix(df: pd.DataFrame) -> pd.DataFrame:
+    """Compute Cramér's V for all pairs of columns, the same as `_corr_matrix(df, _cramer_v)`.
+
+    Each column is encoded to integer codes once, contingency tables are counted with np.bincount.
+    """
+    columns = df.columns
+    k = df.shape[1]
+
+    if k <= 1:
+        return pd.DataFrame()
+
+    codes = []
+    n_values = []
+
+    for column_name in columns:
+        column_codes, uniques = pd.factorize(df[column_name])
+        codes.append(column_codes)
+        n_values.append(len(uniques))
+
+    corr_array = np.eye(k)
+
+    for i in range(k):
+        for j in range(i):
+            corr_array[i, j] = corr_array[j, i] = _cramer_v_by_codes(codes[i], n_values[i], codes[j], n_values[j])
+
+    return pd.DataFrame(data=corr_array, columns=columns, index=columns)
+
+
 def _corr_matrix(df, func: Callable[[pd.Series, pd.Series], float]) -> pd.DataFrame:
     """Compute pairwise correlation of columns
     Args:
@@ -353,14 +573,38 @@ def _calculate_correlations(df: pd.DataFrame, num_for_corr, cat_for_corr, kind):
     elif kind == "kendall":
         return df[num_for_corr].corr("kendall")
     elif kind == "cramer_v":
-        return _corr_matrix(df[cat_for_corr], _cramer_v)
+        return _cramer_v_matrix(df[cat_for_corr])
 
 
-def calculate_correlations(dataset: pd.DataFrame, reference_features_stats: DataQualityStats, target_name) -> Dict:
+def sample_for_correlations(dataset: pd.DataFrame, options: Optional[DataQualityOptions] = None) -> pd.DataFrame:
+    """Random sample of rows for correlations if the dataset is bigger than the sample size in options"""
+    options = DataQualityOptions() if options is None else options
+    sample_size = options.get_correlation_sample_size()
+
+    if sample_size is None or dataset.shape[0] <= sample_size:
+        return dataset
+
+    return dataset.sample(n=sample_size, random_state=options.correlation_random_state)
+
+
+def calculate_correlations(
+    dataset: pd.DataFrame,
+    reference_features_stats: DataQualityStats,
+    target_name,
+    options: Optional[DataQualityOptions] = None,
+) -> Dict:
+    """Calculate correlation matrices of all kinds, kinds that are not selected in options get empty matrices"""
+    options = DataQualityOptions() if options is None else options
     num_for_corr, cat_for_corr = _select_features_for_corr(reference_features_stats, target_name)
+    kinds = options.get_correlation_kinds()
+    dataset = sample_for_correlations(dataset, options)
     correlations = {}
 
     for kind in ["pearson", "spearman", "kendall", "cramer_v"]:
-        correlations[kind] = _calculate_correlations(dataset, num_for_corr, cat_for_corr, kind)
+        if kind in kinds:
+            correlations[kind] = _calculate_correlations(dataset, num_for_corr, cat_for_corr, kind)
+
+        else:
+            correlations[kind] = pd.DataFrame()
 
     return correlations
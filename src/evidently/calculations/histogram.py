@@ -0,0 +1,196 @@
+"""Histograms of numerical data with bin edges shared by several datasets
+
+Bin edges and counts are the same as `np.histogram_bin_edges` and `np.histogram` return
+for the concatenated datasets, but the datasets are not concatenated when the binning scheme
+depends only on the range and the size of the data.
+"""
+
+from dataclasses import dataclass
+from typing import Dict
+from typing import Optional
+from typing import Sequence
+from typing import Union
+
+import numpy as np
+
+BinsType = Union[int, str]
+
+
+@dataclass
+class Histogram:
+    """Counts of values of several datasets in the same bins
+
+    Attributes:
+        edges: bin edges, values of i-th bin are in [edges[i], edges[i + 1]), the last bin includes its right edge
+        counts: counts of values in the bins by dataset name
+    """
+
+    edges: np.ndarray
+    counts: Dict[str, np.ndarray]
+
+
+def _get_outer_edges(datasets: Sequence[np.ndarray]):
+    not_empty = [values for values in datasets if values.shape[0] > 0]
+
+    if not not_empty:
+        return 0.0, 1.0
+
+    first_edge = min(values.min() for values in not_empty)
+    last_edge = max(values.max() for values in not_empty)
+
+    if not (np.isfinite(first_edge) and np.isfinite(last_edge)):
+        raise ValueError(f"autodetected range of [{first_edge}, {last_edge}] is not finite")
+
+    return float(first_edge), float(last_edge)
+
+
+def _get_sturges_n_bins(first_edges: np.ndarray, last_edges: np.ndarray, sizes: np.ndarray) -> np.ndarray:
+    """Numbers of bins of the "sturges" scheme as numpy calculates them, 1 for empty data or an empty range"""
+    with np.errstate(divide="ignore"):
+        width = (last_edges - first_edges) / (np.log2(sizes) + 1.0)
+
+    n_bins = np.ones(len(first_edges), dtype=int)
+    has_width = width > 0
+    n_bins[has_width] = np.ceil((last_edges[has_width] - first_edges[has_width]) / width[has_width]).astype(int)
+    return n_bins
+
+
+def get_equal_width_bin_edges_batch(first_edges: np.ndarray, last_edges: np.ndarray, n_bins: np.ndarray):
+    """Vectorized np.histogram_bin_edges(..., bins=n_bins) for many columns at once
+
+    Returns flat bin edges of all columns and offsets of the columns in the edges.
+    """
+    # empty range expands the same way as numpy does
+    same_edges = first_edges == last_edges
+    first_edges = np.where(same_edges, first_edges - 0.5, first_edges)
+    last_edges = np.where(same_edges, last_edges + 0.5, last_edges)
+    edges_offsets = np.concatenate([[0], np.cumsum(n_bins + 1)[:-1]]).astype(int)
+    edge_column = np.repeat(np.arange(len(n_bins)), n_bins + 1)
+    edge_index = np.arange(edge_column.shape[0]) - edges_offsets[edge_column]
+    # the same arithmetic as np.linspace
+    edges = edge_index * ((last_edges - first_edges) / n_bins)[edge_column] + first_edges[edge_column]
+    is_last = edge_index == n_bins[edge_column]
+    edges[is_last] = last_edges[edge_column[is_last]]
+    return edges, edges_offsets
+
+
+def get_sturges_bin_edges_batch(first_edges: np.ndarray, last_edges: np.ndarray, sizes: np.ndarray):
+    """Vectorized np.histogram_bin_edges(..., bins="sturges") for many columns at once
+
+    Args:
+        first_edges: minimums of values of every column
+        last_edges: maximums of values of every column
+        sizes: numbers of values of every column
+    Returns flat bin edges of all columns, the number of bins per column and offsets of the columns in the edges.
+    """
+    n_bins = _get_sturges_n_bins(first_edges, last_edges, sizes)
+    edges, edges_offsets = get_equal_width_bin_edges_batch(first_edges, last_edges, n_bins)
+    return edges, n_bins, edges_offsets
+
+
+def get_bin_edges_by_range(first_edge: float, last_edge: float, size: int, bins: Union[int, str]) -> np.ndarray:
+    """Bin edges of an integer number of bins or of "sturges" scheme for data with the range and the size"""
+    if isinstance(bins, str):
+        if bins != "sturges":
+            raise ValueError(f"Bin edges of {bins} scheme cannot be calculated by the range of data")
+
+        n_bins = _get_sturges_n_bins(np.array([first_edge]), np.array([last_edge]), np.array([size]))
+
+    else:
+        if bins < 1:
+            raise ValueError("`bins` must be positive, when an integer")
+
+        n_bins = np.array([bins])
+
+    edges, _ = get_equal_width_bin_edges_batch(
+        np.array([first_edge], dtype=float), np.array([last_edge], dtype=float), n_bins
+    )
+    return edges
+
+
+def get_bin_edges(datasets: Sequence[np.ndarray], bins: BinsType) -> np.ndarray:
+    """Bin edges of all datasets together as `np.histogram_bin_edges(np.concatenate(datasets), bins)`
+
+    Integer number of bins and "sturges" scheme are calculated from the range and the size of the data,
+    other schemes of numpy need the concatenated data.
+    Args:
+        datasets: 1-D arrays of numerical values without NaN
+        bins: number of equal-width bins or name of a numpy binning scheme
+    """
+    if isinstance(bins, str) and bins != "sturges":
+        return np.histogram_bin_edges(np.concatenate(datasets), bins=bins)
+
+    first_edge, last_edge = _get_outer_edges(datasets)
+    return get_bin_edges_by_range(first_edge, last_edge, sum(values.shape[0] for values in datasets), bins)
+
+
+def count_in_bins(values: np.ndarray, edges: np.ndarray, weights: Optional[np.ndarray] = None) -> np.ndarray:
+    """Counts of values in the bins as `np.histogram(values, edges, weights=weights)[0]`, NaN values are ignored"""
+    n_bins = edges.shape[0] - 1
+    bin_idx = np.searchsorted(edges, values, side="right") - 1
+    # the last bin includes its right edge
+    bin_idx[values == edges[-1]] = n_bins - 1
+    in_bins = (bin_idx >= 0) & (bin_idx < n_bins)
+
+    if weights is not None:
+        weights = weights[in_bins]
+
+    return np.bincount(bin_idx[in_bins], weights=weights, minlength=n_bins)
+
+
+def count_in_bins_batch(
+    columns: np.ndarray, edges: np.ndarray, n_bins: np.ndarray, edges_offsets: np.ndarray, bins_offsets: np.ndarray
+) -> np.ndarray:
+    """Counts of values of every column (features x rows, NaN ignored) in its own bins with one np.bincount
+
+    Args:
+        columns: 2-D features x rows array
+        edges, n_bins, edges_offsets: bins of all columns as `get_sturges_bin_edges_batch` returns them
+        bins_offsets: offsets of the columns in the flat counts
+    Returns flat counts of all columns, the same as `count_in_bins` of every column.
+    """
+    column_idx, row_idx = np.nonzero(~np.isnan(columns))
+    values = columns[column_idx, row_idx]
+    first_edges = edges[edges_offsets[column_idx]]
+    last_edges = edges[edges_offsets[column_idx] + n_bins[column_idx]]
+    column_bins = n_bins[column_idx]
+    bin_idx = ((values - first_edges) * (column_bins / (last_edges - first_edges))).astype(int)
+    bin_idx = np.clip(bin_idx, 0, column_bins - 1)
+    # fix rounding errors the same way as np.histogram: value belongs to [edge[i], edge[i + 1])
+    decrement = (values < edges[edges_offsets[column_idx] + bin_idx]) & (bin_idx > 0)
+    bin_idx[decrement] -= 1
+    increment = (values >= edges[edges_offsets[column_idx] + bin_idx + 1]) & (bin_idx < column_bins - 1)
+    bin_idx[increment] += 1
+    return np.bincount(bins_offsets[column_idx] + bin_idx, minlength=int(n_bins.sum()))
+
+
+def count_sorted_in_bins(sorted_values: np.ndarray, edges: np.ndarray) -> np.ndarray:
+    """Version of count_in_bins for sorted values without NaN, it costs O(bins * log(values))"""
+    positions = np.append(
+        np.searchsorted(sorted_values, edges[:-1], side="left"),
+        np.searchsorted(sorted_values, edges[-1:], side="right"),
+    )
+    return np.diff(positions)
+
+
+def get_density(counts: np.ndarray, edges: np.ndarray) -> np.ndarray:
+    """Probability density in the bins as `np.histogram(..., density=True)` returns it"""
+    return counts / np.diff(edges) / counts.sum()
+
+
+def get_histogram(
+    datasets: Dict[str, np.ndarray], bins: BinsType, weights: Optional[Dict[str, np.ndarray]] = None
+) -> Histogram:
+    """Histogram of several datasets with the same bin edges
+
+    Args:
+        datasets: 1-D arrays of numerical values without NaN by dataset name
+        bins: number of equal-width bins or name of a numpy binning scheme
+        weights: optional weights of values by dataset name
+    """
+    edges = get_bin_edges(list(datasets.values()), bins)
+    weights = weights or {}
+    return Histogram(
+        edges=edges,
+        counts={name: count_in_bins(values, edges, weights.get(name)) for name, values in datasets.items()},
+    )
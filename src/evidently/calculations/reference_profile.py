@@ -0,0 +1,461 @@
+"""Precalculated statistics of reference data for drift calculations"""
+
+import hashlib
+import json
+from typing import Callable
+from typing import Dict
+from typing import Optional
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass
+
+from evidently.pipeline.column_mapping import ColumnMapping
+from evidently.utils.data_operations import is_numeric_column
+
+# stattests that calculate drift from reference sketches, others need exact reference values
+SKETCH_STATTESTS = ("ks", "wasserstein", "psi", "kl_div", "jensenshannon")
+
+
+@dataclass(eq=False)
+class ColumnReferenceProfile:
+    """Statistics of a reference column that are enough to calculate drift without the column itself.
+
+    Numerical columns keep sorted non-null values (infinite values are at the edges),
+    other columns keep counts of non-null values.
+    Numerical values can be stored with `counts` - how many reference values every sorted value stands for.
+    Exact profiles store unique values with their counts, sketches (`exact` is False) store
+    a representative value of every equal-sized bucket of the sorted values together with
+    the minimum and the maximum with zero counts.
+    Feature type "num" uses finite values only and "cat" uses all non-null values
+    as drift calculations do with raw reference data.
+    """
+
+    name: str
+    dtype: np.dtype
+    sorted_values: Optional[np.ndarray]
+    value_counts: Optional[pd.Series]
+    finite_start: int
+    finite_end: int
+    n_unique_finite: int
+    n_unique: int
+    std: Optional[float]
+    counts: Optional[np.ndarray] = None
+    exact: bool = True
+    n_missing: int = 0
+    mean: Optional[float] = None
+    # the most common non-null values of numerical columns for data quality stats
+    top_value_counts: Optional[pd.Series] = None
+
+    @property
+    def is_numeric(self) -> bool:
+        return pd.api.types.is_numeric_dtype(self.dtype)
+
+    def check_exact(self):
+        if not self.exact:
+            raise ValueError(
+                f"Reference column {self.name} is a sketch without exact values, "
+                f"use one of stattests that support sketches: {', '.join(SKETCH_STATTESTS)}"
+            )
+
+    def _get_slice(self, feature_type: str) -> slice:
+        if feature_type == "num":
+            return slice(self.finite_start, self.finite_end)
+        return slice(None)
+
+    def get_weighted_values(self, feature_type: str) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """Get sorted numerical values and their counts (None if every value is counted once)"""
+        if self.sorted_values is None:
+            raise ValueError(f"Reference column {self.name} has no sorted values")
+        values_slice = self._get_slice(feature_type)
+        counts = None if self.counts is None else self.counts[values_slice]
+        return self.sorted_values[values_slice], counts
+
+    def cumulative_counts(self, values: np.ndarray, feature_type: str, side: str = "right") -> np.ndarray:
+        """Count reference values not greater than each of values (or less than for the left side)
+
+        Sketches interpolate counts linearly between bucket medians, a median has a half of its bucket below.
+        """
+        if not self.exact:
+            finite_values = self.sorted_values[self.finite_start : self.finite_end]
+            finite_counts = self.counts[self.finite_start : self.finite_end]
+            result = np.interp(values, finite_values, np.cumsum(finite_counts) - finite_counts / 2)
+            if feature_type != "num":
+                n_negative_infinite = self.counts[: self.finite_start].sum()
+                n_positive_infinite = self.counts[self.finite_end :].sum()
+                is_negative_counted = values >= -np.inf if side == "right" else values > -np.inf
+                is_positive_counted = values >= np.inf if side == "right" else np.zeros(np.shape(values), dtype=bool)
+                result = result + n_negative_infinite * is_negative_counted + n_positive_infinite * is_positive_counted
+            return result
+
+        sorted_values, counts = self.get_weighted_values(feature_type)
+        positions = np.searchsorted(sorted_values, values, side=side)
+        if counts is None:
+            return positions
+        return np.append(0, np.cumsum(counts))[positions]
+
+    def get_sorted_values(self, feature_type: str) -> np.ndarray:
+        self.check_exact()
+        if self.sorted_values is None:
+            return np.sort(self.get_data(feature_type).to_numpy())
+        sorted_values, counts = self.get_weighted_values(feature_type)
+        if counts is None:
+            return sorted_values
+        return np.repeat(sorted_values, counts)
+
+    def get_value_counts(self, feature_type: str) -> pd.Series:
+        self.check_exact()
+        if self.value_counts is not None:
+            return self.value_counts
+        sorted_values, counts = self.get_weighted_values(feature_type)
+        if counts is None:
+            sorted_values, counts = np.unique(sorted_values, return_counts=True)
+        return pd.Series(counts, index=sorted_values)
+
+    def get_data(self, feature_type: str) -> pd.Series:
+        """Restore the reference data (without the original order of values) for stattests without profile support
+
+        Sketches restore bucket representatives, it is enough for plots but not for stattests.
+        """
+        if self.sorted_values is not None:
+            sorted_values, counts = self.get_weighted_values(feature_type)
+            if counts is not None:
+                sorted_values = np.repeat(sorted_values, counts)
+            return pd.Series(sorted_values, name=self.name)
+        value_counts = self.get_value_counts(feature_type)
+        return pd.Series(np.repeat(value_counts.index.to_numpy(), value_counts.to_numpy()), name=self.name)
+
+    def size(self, feature_type: str) -> int:
+        if self.sorted_values is not None:
+            sorted_values, counts = self.get_weighted_values(feature_type)
+            return len(sorted_values) if counts is None else int(counts.sum())
+        return int(self.value_counts.sum())
+
+    def nunique(self, feature_type: str) -> int:
+        if self.sorted_values is not None and feature_type == "num":
+            return self.n_unique_finite
+        return self.n_unique
+
+    def nunique_with(self, current_data: pd.Series, feature_type: str) -> int:
+        """Count unique values in reference and current data together, for sketches it is an upper bound"""
+        if self.sorted_values is None:
+            return pd.concat([pd.Series(self.value_counts.index), current_data]).nunique()
+        sorted_values, _ = self.get_weighted_values(feature_type)
+        current_unique = pd.unique(current_data.dropna())
+        if len(sorted_values) == 0:
+            return len(current_unique)
+        positions = np.clip(np.searchsorted(sorted_values, current_unique), 0, len(sorted_values) - 1)
+        new_values = sorted_values[positions] != current_unique
+        return self.nunique(feature_type) + int(new_values.sum())
+
+    def quantile(self, q: float) -> float:
+        """Quantile of all non-null values with linear interpolation, sketches interpolate between buckets"""
+        if self.counts is None:
+            return float(np.quantile(self.sorted_values, q))
+        rank = (self.size("cat") - 1) * q
+        cumulative = np.cumsum(self.counts)
+
+        if not self.exact:
+            bucket_ranks = cumulative - self.counts + (self.counts - 1) / 2
+            return float(np.interp(rank, bucket_ranks, self.sorted_values))
+
+        lower_rank = int(np.floor(rank))
+        positions = np.searchsorted(cumulative, [lower_rank, lower_rank + 1], side="right")
+        lower, upper = self.sorted_values[np.minimum(positions, len(self.sorted_values) - 1)]
+        fraction = rank - lower_rank
+        # the same linear interpolation as np.quantile
+        if fraction >= 0.5:
+            return float(upper - (upper - lower) * (1 - fraction))
+        return float(lower + (upper - lower) * fraction)
+
+
+@dataclass(eq=False)
+class ReferenceProfile:
+    """Reference data statistics calculated once and used in place of the reference DataFrame in drift calculations.
+
+    Use `get_reference_profile` or `get_reference_sketch` to build it,
+    `save_reference_profile` and `load_reference_profile` to store it in a file.
+    """
+
+    columns: Dict[str, ColumnReferenceProfile]
+
+    def __getitem__(self, column_name: str) -> ColumnReferenceProfile:
+        return self.columns[column_name]
+
+    def __contains__(self, column_name: str) -> bool:
+        return column_name in self.columns
+
+    def get_hash(self) -> str:
+        """Hash of the profile content, the same in all runs for equal profiles (like a saved and loaded one)"""
+        hasher = hashlib.sha256()
+
+        for column_name, column in self.columns.items():
+            hasher.update(
+                repr(
+                    (
+                        column_name,
+                        column.name,
+                        str(column.dtype),
+                        column.finite_start,
+                        column.finite_end,
+                        column.n_unique_finite,
+                        column.n_unique,
+                        column.std,
+                        column.exact,
+                        column.n_missing,
+                        column.mean,
+                    )
+                ).encode()
+            )
+            arrays = [column.sorted_values, column.counts]
+
+            for series in (column.value_counts, column.top_value_counts):
+                arrays += [None, None] if series is None else [series.index.to_numpy(), series.to_numpy()]
+
+            for values in arrays:
+                _update_hash(hasher, values)
+
+        return hasher.hexdigest()
+
+
+def _update_hash(hasher, values: Optional[np.ndarray]) -> None:
+    if values is None:
+        hasher.update(b"none")
+        return
+
+    # strings are saved as unicode arrays, so they are hashed the same way as python strings
+    if values.dtype.kind in "OU":
+        values = pd.util.hash_array(values.astype(object), categorize=False)
+
+    hasher.update(repr((values.dtype.str, values.shape)).encode())
+    hasher.update(np.ascontiguousarray(values).tobytes())
+
+
+def _count_unique_sorted(sorted_values: np.ndarray) -> int:
+    if len(sorted_values) == 0:
+        return 0
+    return int((sorted_values[1:] != sorted_values[:-1]).sum()) + 1
+
+
+def get_column_reference_profile(column: pd.Series) -> ColumnReferenceProfile:
+    n_missing = int(column.isnull().sum())
+    column = column.dropna()
+
+    if is_numeric_column(column):
+        values = column.to_numpy()
+        sorted_values = np.sort(values.astype(float) if values.dtype == object else values)
+        finite_start = int(np.searchsorted(sorted_values, -np.inf, side="right"))
+        finite_end = int(np.searchsorted(sorted_values, np.inf, side="left"))
+        finite_values = sorted_values[finite_start:finite_end]
+        return ColumnReferenceProfile(
+            name=column.name,
+            dtype=column.dtype,
+            sorted_values=sorted_values,
+            value_counts=None,
+            finite_start=finite_start,
+            finite_end=finite_end,
+            n_unique_finite=_count_unique_sorted(finite_values),
+            n_unique=_count_unique_sorted(sorted_values),
+            std=float(np.std(finite_values)) if len(finite_values) > 0 else None,
+            n_missing=n_missing,
+            mean=float(np.mean(finite_values)) if len(finite_values) > 0 else None,
+            top_value_counts=column.value_counts().head(2),
+        )
+
+    value_counts = column.value_counts()
+    return ColumnReferenceProfile(
+        name=column.name,
+        dtype=column.dtype,
+        sorted_values=None,
+        value_counts=value_counts,
+        finite_start=0,
+        finite_end=0,
+        n_unique_finite=len(value_counts),
+        n_unique=len(value_counts),
+        std=None,
+        n_missing=n_missing,
+    )
+
+
+def get_column_reference_sketch(column: pd.Series, n_buckets: int = 1000) -> ColumnReferenceProfile:
+    """Calculate a compact profile of the column.
+
+    Numerical columns with not more than `n_buckets` unique values keep exact counts of the values.
+    Finite values of other numerical columns are split to `n_buckets` buckets of equal size
+    and only a median of every bucket with the bucket size is kept, so cumulative distribution
+    of the sketch differs from the real one not more than by 1 / n_buckets.
+    """
+    if n_buckets < 1:
+        raise ValueError(f"n_buckets should be a positive number, got {n_buckets}")
+
+    profile = get_column_reference_profile(column)
+
+    if profile.sorted_values is None:
+        return profile
+
+    sorted_values = profile.sorted_values
+    finite_start = profile.finite_start
+    finite_end = profile.finite_end
+
+    if profile.n_unique_finite <= n_buckets:
+        run_starts = np.flatnonzero(np.append(len(sorted_values) > 0, sorted_values[1:] != sorted_values[:-1]))
+        profile.sorted_values = sorted_values[run_starts]
+        profile.counts = np.diff(np.append(run_starts, len(sorted_values)))
+        profile.finite_start = int(finite_start > 0)
+        profile.finite_end = len(profile.sorted_values) - int(finite_end < len(sorted_values))
+        return profile
+
+    finite_values = sorted_values[finite_start:finite_end]
+    bounds = np.arange(n_buckets + 1) * len(finite_values) // n_buckets
+    values = [finite_values[:1], finite_values[(bounds[:-1] + bounds[1:] - 1) // 2], finite_values[-1:]]
+    counts = [[0], np.diff(bounds), [0]]
+
+    if finite_start > 0:
+        values.insert(0, sorted_values[:1])
+        counts.insert(0, [finite_start])
+
+    if finite_end < len(sorted_values):
+        values.append(sorted_values[-1:])
+        counts.append([len(sorted_values) - finite_end])
+
+    profile.sorted_values = np.concatenate(values)
+    profile.counts = np.concatenate(counts).astype(int)
+    profile.finite_start = int(finite_start > 0)
+    profile.finite_end = len(profile.sorted_values) - int(finite_end < len(sorted_values))
+    profile.exact = False
+    return profile
+
+
+def _get_reference_profile(
+    reference_data: pd.DataFrame,
+    column_mapping: Optional[ColumnMapping],
+    get_column_profile: Callable[[pd.Series, bool], ColumnReferenceProfile],
+) -> ReferenceProfile:
+    categorical_features = set()
+
+    if column_mapping is not None and column_mapping.categorical_features is not None:
+        categorical_features = set(column_mapping.categorical_features)
+
+    columns = {
+        column_name: get_column_profile(reference_data[column_name], column_name in categorical_features)
+        for column_name in reference_data
+    }
+
+    if column_mapping is not None and isinstance(column_mapping.prediction, list):
+        prediction_columns = column_mapping.prediction
+
+        if len(prediction_columns) > 2:
+            prediction_ids = np.argmax(reference_data[prediction_columns].to_numpy(), axis=-1)
+            columns["predicted_labels"] = get_column_profile(
+                pd.Series([prediction_columns[x] for x in prediction_ids], name="predicted_labels"), True
+            )
+
+        elif len(prediction_columns) == 2:
+            columns["prediction"] = get_column_profile(
+                pd.Series(reference_data[prediction_columns[0]].values, name="prediction"), False
+            )
+
+    return ReferenceProfile(columns=columns)
+
+
+def get_reference_profile(
+    reference_data: pd.DataFrame, column_mapping: Optional[ColumnMapping] = None
+) -> ReferenceProfile:
+    """Calculate reference profile for all columns of the reference data.
+
+    If column mapping has a list of prediction columns (probabilistic classification),
+    the profile also gets the prediction columns that drift calculations derive from them.
+    """
+    return _get_reference_profile(
+        reference_data, column_mapping, lambda column, is_categorical: get_column_reference_profile(column)
+    )
+
+
+def get_reference_sketch(
+    reference_data: pd.DataFrame, column_mapping: Optional[ColumnMapping] = None, n_buckets: int = 1000
+) -> ReferenceProfile:
+    """Calculate a compact reference profile that does not grow with the reference data size.
+
+    Numerical columns are sketched with `get_column_reference_sketch`, categorical features
+    from the column mapping and non-numerical columns keep exact counts of values.
+    Drift of sketched columns can be calculated with stattests from `SKETCH_STATTESTS` only,
+    ks and wasserstein results are approximate.
+    """
+
+    def get_column_profile(column: pd.Series, is_categorical: bool) -> ColumnReferenceProfile:
+        if is_categorical:
+            return get_column_reference_profile(column)
+        return get_column_reference_sketch(column, n_buckets)
+
+    return _get_reference_profile(reference_data, column_mapping, get_column_profile)
+
+
+def _to_savable_array(values: np.ndarray, column_name: str) -> np.ndarray:
+    if values.dtype != object:
+        return values
+    if not all(isinstance(value, str) for value in values):
+        raise ValueError(
+            f"Values of reference column {column_name} can not be saved, only numbers, strings and dates are supported"
+        )
+    return values.astype(str)
+
+
+def save_reference_profile(reference_profile: ReferenceProfile, path: str) -> None:
+    """Save reference profile to a numpy .npz file, values are saved without pickling
+
+    numpy adds .npz extension to the path if it has no one.
+    """
+    arrays = {}
+    columns_meta = []
+
+    for idx, column in enumerate(reference_profile.columns.values()):
+        columns_meta.append(
+            {
+                "name": column.name,
+                "dtype": str(column.dtype),
+                "finite_start": column.finite_start,
+                "finite_end": column.finite_end,
+                "n_unique_finite": column.n_unique_finite,
+                "n_unique": column.n_unique,
+                "std": column.std,
+                "exact": column.exact,
+                "n_missing": column.n_missing,
+                "mean": column.mean,
+            }
+        )
+        if column.sorted_values is not None:
+            arrays[f"{idx}.sorted_values"] = column.sorted_values
+        if column.counts is not None:
+            arrays[f"{idx}.counts"] = column.counts
+        for series_name in ("value_counts", "top_value_counts"):
+            series = getattr(column, series_name)
+            if series is not None:
+                arrays[f"{idx}.{series_name}.index"] = _to_savable_array(series.index.to_numpy(), column.name)
+                arrays[f"{idx}.{series_name}.values"] = series.to_numpy()
+
+    np.savez_compressed(path, columns=np.array(json.dumps(columns_meta)), **arrays)
+
+
+def load_reference_profile(path: str) -> ReferenceProfile:
+    """Load reference profile saved with `save_reference_profile`"""
+    columns = {}
+
+    with np.load(path, allow_pickle=False) as data:
+        for idx, column_meta in enumerate(json.loads(str(data["columns"]))):
+            series = {}
+            for series_name in ("value_counts", "top_value_counts"):
+                if f"{idx}.{series_name}.index" in data:
+                    series[series_name] = pd.Series(
+                        data[f"{idx}.{series_name}.values"], index=data[f"{idx}.{series_name}.index"]
+                    )
+            column_meta["dtype"] = pd.api.types.pandas_dtype(column_meta["dtype"])
+            columns[column_meta["name"]] = ColumnReferenceProfile(
+                sorted_values=data[f"{idx}.sorted_values"] if f"{idx}.sorted_values" in data else None,
+                counts=data[f"{idx}.counts"] if f"{idx}.counts" in data else None,
+                value_counts=series.get("value_counts"),
+                top_value_counts=series.get("top_value_counts"),
+                **column_meta,
+            )
+
+    return ReferenceProfile(columns=columns)
@@ -6,6 +6,7 @@ import numpy as np
 from scipy.stats import probplot
 
 from evidently.utils.data_operations import DatasetColumns
+from evidently.utils.data_operations import select_finite_rows
 
 
 class ErrorWithQuantiles:
@@ -72,9 +73,9 @@ def _calculate_quality_metrics(dataset, prediction_column, target_column, conf_i
     }
 
 
-def _prepare_dataset(dataset, target_column, prediction_column):
-    dataset.replace([np.inf, -np.inf], np.nan, inplace=True)
-    dataset.dropna(axis=0, how="any", inplace=True, subset=[target_column, prediction_column])
+def _prepare_dataset(dataset, target_column, prediction_column, feature_names) -> pd.DataFrame:
+    used_columns = list(dict.fromkeys([target_column, prediction_column, *feature_names]))
+    return select_finite_rows(dataset, [target_column, prediction_column], used_columns)
 
 
 def _calculate_underperformance(err_quantiles: ErrorWithQuantiles, conf_interval_n_sigmas: int = 1):
@@ -200,7 +201,7 @@ def calculate_regression_performance(
     if target_column is None or prediction_column is None:
         raise ValueError("Target and prediction should be present")
 
-    _prepare_dataset(dataset, target_column, prediction_column)
+    dataset = _prepare_dataset(dataset, target_column, prediction_column, num_feature_names + cat_feature_names)
     # calculate quality metrics
     quality_metrics = _calculate_quality_metrics(dataset, prediction_column, target_column)
     # error normality
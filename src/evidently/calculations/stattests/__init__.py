@@ -8,3 +8,4 @@ from .kl_div import kl_div_stat_test
 from .psi import psi_stat_test
 from .wasserstein_distance_norm import wasserstein_stat_test
 from .registry import get_stattest, register_stattest, StatTest, PossibleStatTestType, StatTestFuncType
+from .registry import get_default_stattest_by_stats, StatTestBatchFuncType
@@ -7,6 +7,7 @@ import pandas as pd
 
 from scipy.stats import chisquare
 
+from evidently.calculations.reference_profile import ColumnReferenceProfile
 from evidently.calculations.stattests.registry import StatTest, register_stattest
 
 
@@ -27,8 +28,29 @@ def _chi_stat_test(
     return p_value, p_value < threshold
 
 
+def _chi_stat_test_profile(
+    reference: ColumnReferenceProfile, current_data: pd.Series, feature_type: str, threshold: float
+) -> Tuple[float, bool]:
+    reference_counts = reference.get_value_counts(feature_type)
+    keys = list((set(reference_counts.index) | set(current_data)) - {np.nan})
+
+    ref_feature_dict = {**dict.fromkeys(keys, 0), **dict(reference_counts)}
+    current_feature_dict = {**dict.fromkeys(keys, 0), **dict(current_data.value_counts())}
+
+    k_norm = current_data.shape[0] / reference.size(feature_type)
+
+    f_exp = [ref_feature_dict[key] * k_norm for key in keys]
+    f_obs = [current_feature_dict[key] for key in keys]
+    p_value = chisquare(f_obs, f_exp)[1]
+    return p_value, p_value < threshold
+
+
 chi_stat_test = StatTest(
-    name="chisquare", display_name="chi-square p_value", func=_chi_stat_test, allowed_feature_types=["cat"]
+    name="chisquare",
+    display_name="chi-square p_value",
+    func=_chi_stat_test,
+    allowed_feature_types=["cat"],
+    func_profile=_chi_stat_test_profile,
 )
 
 register_stattest(chi_stat_test)
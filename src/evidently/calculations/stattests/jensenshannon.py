@@ -1,9 +1,14 @@
 from typing import Tuple
 
+import numpy as np
 import pandas as pd
+from scipy import special
 from scipy.spatial import distance
 
+from evidently.calculations.reference_profile import ColumnReferenceProfile
 from evidently.calculations.stattests.utils import get_binned_data
+from evidently.calculations.stattests.utils import get_binned_data_batch
+from evidently.calculations.stattests.utils import get_binned_data_from_profile
 from evidently.calculations.stattests.registry import StatTest, register_stattest
 
 
@@ -26,12 +31,43 @@ def _jensenshannon(
     return jensenshannon_value, jensenshannon_value >= threshold
 
 
+def _jensenshannon_profile(
+    reference: ColumnReferenceProfile, current_data: pd.Series, feature_type: str, threshold: float, n_bins: int = 30
+) -> Tuple[float, bool]:
+    """Compute the Jensen-Shannon distance with precalculated reference statistics"""
+    reference_percents, current_percents = get_binned_data_from_profile(
+        reference, current_data, feature_type, n_bins, False
+    )
+    jensenshannon_value = distance.jensenshannon(reference_percents, current_percents)
+    return jensenshannon_value, jensenshannon_value >= threshold
+
+
+def _jensenshannon_batch(
+    reference_data: np.ndarray, current_data: np.ndarray, feature_type: str, threshold: np.ndarray, n_bins: int = 30
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Compute the Jensen-Shannon distance for all features of 2-D rows x features arrays"""
+    reference_percents, current_percents, offsets = get_binned_data_batch(
+        reference_data, current_data, feature_type, n_bins, False
+    )
+    sizes = np.diff(np.append(offsets, len(reference_percents)))
+    reference_percents = reference_percents / np.repeat(np.add.reduceat(reference_percents, offsets), sizes)
+    current_percents = current_percents / np.repeat(np.add.reduceat(current_percents, offsets), sizes)
+    middle = (reference_percents + current_percents) / 2.0
+    js_values = np.add.reduceat(special.rel_entr(reference_percents, middle), offsets) + np.add.reduceat(
+        special.rel_entr(current_percents, middle), offsets
+    )
+    jensenshannon_values = np.sqrt(js_values / 2.0)
+    return jensenshannon_values, jensenshannon_values >= threshold
+
+
 jensenshannon_stat_test = StatTest(
     name="jensenshannon",
     display_name="Jensen-Shannon distance",
     func=_jensenshannon,
     allowed_feature_types=["cat", "num"],
     default_threshold=0.1,
+    func_batch=_jensenshannon_batch,
+    func_profile=_jensenshannon_profile,
 )
 
 register_stattest(jensenshannon_stat_test)
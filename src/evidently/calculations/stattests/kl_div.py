@@ -1,10 +1,15 @@
 from typing import Tuple
 
+import numpy as np
 import pandas as pd
+from scipy import special
 from scipy import stats
 
 from evidently.calculations.stattests.registry import StatTest, register_stattest
+from evidently.calculations.reference_profile import ColumnReferenceProfile
 from evidently.calculations.stattests.utils import get_binned_data
+from evidently.calculations.stattests.utils import get_binned_data_batch
+from evidently.calculations.stattests.utils import get_binned_data_from_profile
 
 
 def kl_div(
@@ -26,12 +31,37 @@ def kl_div(
     return kl_div_value, kl_div_value >= threshold
 
 
+def kl_div_profile(
+    reference: ColumnReferenceProfile, current_data: pd.Series, feature_type: str, threshold: float, n_bins: int = 30
+) -> Tuple[float, bool]:
+    """Compute the Kullback-Leibler divergence with precalculated reference statistics"""
+    reference_percents, current_percents = get_binned_data_from_profile(reference, current_data, feature_type, n_bins)
+    kl_div_value = stats.entropy(reference_percents, current_percents)
+    return kl_div_value, kl_div_value >= threshold
+
+
+def kl_div_batch(
+    reference_data: np.ndarray, current_data: np.ndarray, feature_type: str, threshold: np.ndarray, n_bins: int = 30
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Compute the Kullback-Leibler divergence for all features of 2-D rows x features arrays"""
+    reference_percents, current_percents, offsets = get_binned_data_batch(
+        reference_data, current_data, feature_type, n_bins
+    )
+    sizes = np.diff(np.append(offsets, len(reference_percents)))
+    reference_percents = reference_percents / np.repeat(np.add.reduceat(reference_percents, offsets), sizes)
+    current_percents = current_percents / np.repeat(np.add.reduceat(current_percents, offsets), sizes)
+    kl_div_values = np.add.reduceat(special.rel_entr(reference_percents, current_percents), offsets)
+    return kl_div_values, kl_div_values >= threshold
+
+
 kl_div_stat_test = StatTest(
     name="kl_div",
     display_name="Kullback-Leibler divergence",
     func=kl_div,
     allowed_feature_types=["cat", "num"],
     default_threshold=0.1,
+    func_batch=kl_div_batch,
+    func_profile=kl_div_profile,
 )
 
 register_stattest(kl_div_stat_test)
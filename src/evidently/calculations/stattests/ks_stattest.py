@@ -2,10 +2,17 @@
 # coding: utf-8
 from typing import Tuple
 
+import numpy as np
 import pandas as pd
+from scipy.stats import distributions
 from scipy.stats import ks_2samp
 
+from evidently.calculations.reference_profile import ColumnReferenceProfile
 from evidently.calculations.stattests.registry import StatTest, register_stattest
+from evidently.calculations.stattests.utils import get_merged_cumulative_counts
+
+# ks_2samp uses the exact p_value for samples not bigger than this and the asymptotic one for others
+KS_MAX_EXACT_SIZE = 10000
 
 
 def _ks_stat_test(
@@ -25,11 +32,70 @@ def _ks_stat_test(
     return p_value, p_value <= threshold
 
 
+def _ks_stat_test_profile(
+    reference: ColumnReferenceProfile, current_data: pd.Series, feature_type: str, threshold: float
+) -> Tuple[float, bool]:
+    """Run the two-sample Kolmogorov-Smirnov test with sorted reference values from the profile
+    Reference sketches give an approximate statistic and the asymptotic p_value.
+    """
+    current_values = np.sort(current_data.to_numpy())
+    n1 = reference.size(feature_type)
+    n2 = current_values.shape[0]
+
+    if reference.exact and max(n1, n2) <= KS_MAX_EXACT_SIZE:
+        p_value = ks_2samp(reference.get_sorted_values(feature_type), current_values)[1]
+
+    else:
+        # the same asymptotic p_value as ks_2samp without sorting the reference again
+        reference_values, _ = reference.get_weighted_values(feature_type)
+        data_all = np.concatenate([reference_values, current_values])
+        cdf_diffs = reference.cumulative_counts(data_all, feature_type) / n1 - np.searchsorted(
+            current_values, data_all, side="right"
+        ) / n2
+        statistic = max(np.clip(-cdf_diffs.min(), 0, 1), cdf_diffs.max())
+        m, n = sorted([float(n1), float(n2)], reverse=True)
+        p_value = np.clip(distributions.kstwo.sf(statistic, np.round(m * n / (m + n))), 0, 1)
+
+    return p_value, p_value <= threshold
+
+
+def _ks_stat_test_batch(
+    reference_data: np.ndarray, current_data: np.ndarray, feature_type: str, threshold: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Batch version of the two-sample Kolmogorov-Smirnov test for 2-D rows x features arrays
+    Statistics for all features are calculated from one sort, p_values for big samples are asymptotic
+    as in ks_2samp and small samples fall back to ks_2samp for the exact p_value.
+    """
+    merged_values, reference_counts, current_counts, reference_sizes, current_sizes = get_merged_cumulative_counts(
+        reference_data, current_data
+    )
+    cdf_diffs = reference_counts / reference_sizes[:, None] - current_counts / current_sizes[:, None]
+    # compare cdfs only after the last of equal values
+    last_of_equal = np.ones(merged_values.shape, dtype=bool)
+    last_of_equal[:, :-1] = merged_values[:, 1:] != merged_values[:, :-1]
+    statistics = np.where(last_of_equal, np.abs(cdf_diffs), 0).max(axis=1)
+
+    max_sizes = np.maximum(reference_sizes, current_sizes).astype(float)
+    min_sizes = np.minimum(reference_sizes, current_sizes).astype(float)
+    p_values = np.clip(distributions.kstwo.sf(statistics, np.round(max_sizes * min_sizes / (max_sizes + min_sizes))), 0, 1)
+
+    for idx in np.flatnonzero(max_sizes <= KS_MAX_EXACT_SIZE):
+        reference_column = reference_data[:, idx]
+        current_column = current_data[:, idx]
+        p_values[idx] = ks_2samp(
+            reference_column[~np.isnan(reference_column)], current_column[~np.isnan(current_column)]
+        )[1]
+
+    return p_values, p_values <= threshold
+
+
 ks_stat_test = StatTest(
     name="ks",
     display_name="K-S p_value",
     func=_ks_stat_test,
     allowed_feature_types=["num"],
+    func_batch=_ks_stat_test_batch,
+    func_profile=_ks_stat_test_profile,
 )
 
 register_stattest(ks_stat_test)
@@ -4,7 +4,10 @@ import pandas as pd
 import numpy as np
 
 from evidently.calculations.stattests.registry import StatTest, register_stattest
+from evidently.calculations.reference_profile import ColumnReferenceProfile
 from evidently.calculations.stattests.utils import get_binned_data
+from evidently.calculations.stattests.utils import get_binned_data_batch
+from evidently.calculations.stattests.utils import get_binned_data_from_profile
 
 
 def psi(
@@ -22,7 +25,12 @@ def psi(
         test_result: whether the drift is detected
     """
     reference_percents, current_percents = get_binned_data(reference_data, current_data, feature_type, n_bins)
+    return _psi_from_percents(reference_percents, current_percents, threshold)
 
+
+def _psi_from_percents(
+    reference_percents: np.ndarray, current_percents: np.ndarray, threshold: float
+) -> Tuple[float, bool]:
     def sub_psi(ref_perc, curr_perc):
         """Calculate the actual PSI value from comparing the values.
         Update the actual value to a very small number if equal to zero
@@ -37,12 +45,34 @@ def psi(
     return psi_value, psi_value >= threshold
 
 
+def psi_profile(
+    reference: ColumnReferenceProfile, current_data: pd.Series, feature_type: str, threshold: float, n_bins: int = 30
+) -> Tuple[float, bool]:
+    """Calculate the PSI with precalculated reference statistics"""
+    reference_percents, current_percents = get_binned_data_from_profile(reference, current_data, feature_type, n_bins)
+    return _psi_from_percents(reference_percents, current_percents, threshold)
+
+
+def psi_batch(
+    reference_data: np.ndarray, current_data: np.ndarray, feature_type: str, threshold: np.ndarray, n_bins: int = 30
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Calculate the PSI for all features of 2-D rows x features arrays"""
+    reference_percents, current_percents, offsets = get_binned_data_batch(
+        reference_data, current_data, feature_type, n_bins
+    )
+    values = (reference_percents - current_percents) * np.log(reference_percents / current_percents)
+    psi_values = np.add.reduceat(values, offsets)
+    return psi_values, psi_values >= threshold
+
+
 psi_stat_test = StatTest(
     name="psi",
     display_name="PSI",
     func=psi,
     allowed_feature_types=["cat", "num"],
     default_threshold=0.1,
+    func_batch=psi_batch,
+    func_profile=psi_profile,
 )
 
 register_stattest(psi_stat_test)
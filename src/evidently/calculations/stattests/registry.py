@@ -2,11 +2,16 @@ from typing import List, Union, Callable, Tuple, Dict, Optional
 
 import dataclasses
 
+import numpy as np
 import pandas as pd
 
 from evidently.calculations import stattests
+from evidently.calculations.reference_profile import ColumnReferenceProfile
 
 StatTestFuncType = Callable[[pd.Series, pd.Series, str, float], Tuple[float, bool]]
+StatTestBatchFuncType = Callable[[np.ndarray, np.ndarray, str, np.ndarray], Tuple[np.ndarray, np.ndarray]]
+StatTestProfileFuncType = Callable[[ColumnReferenceProfile, pd.Series, str, float], Tuple[float, bool]]
+ReferenceDataType = Union[pd.Series, ColumnReferenceProfile]
 
 
 @dataclasses.dataclass
@@ -23,14 +28,46 @@ class StatTest:
     func: StatTestFuncType
     allowed_feature_types: List[str]
     default_threshold: float = 0.05
+    # optional vectorized implementation: takes 2-D rows x features arrays (NaN values are ignored per column)
+    # and an array of thresholds per feature, returns arrays of drift scores and drift flags per feature
+    func_batch: Optional[StatTestBatchFuncType] = None
+    # optional implementation that uses precalculated statistics of reference data instead of the data itself,
+    # without it reference data is restored from the profile for func (sketches can not be restored)
+    func_profile: Optional[StatTestProfileFuncType] = None
 
     def __call__(
-        self, reference_data: pd.Series, current_data: pd.Series, feature_type: str, threshold: Optional[float]
+        self, reference_data: ReferenceDataType, current_data: pd.Series, feature_type: str, threshold: Optional[float]
     ) -> StatTestResult:
         actual_threshold = self.default_threshold if threshold is None else threshold
-        drift_score, drifted = self.func(reference_data, current_data, feature_type, actual_threshold)
+        if not isinstance(reference_data, ColumnReferenceProfile):
+            drift_score, drifted = self.func(reference_data, current_data, feature_type, actual_threshold)
+        elif self.func_profile is not None:
+            drift_score, drifted = self.func_profile(reference_data, current_data, feature_type, actual_threshold)
+        else:
+            reference_data.check_exact()
+            drift_score, drifted = self.func(
+                reference_data.get_data(feature_type), current_data, feature_type, actual_threshold
+            )
         return StatTestResult(drift_score=drift_score, drifted=drifted, actual_threshold=actual_threshold)
 
+    def batch(
+        self,
+        reference_data: np.ndarray,
+        current_data: np.ndarray,
+        feature_type: str,
+        thresholds: List[Optional[float]],
+    ) -> List[StatTestResult]:
+        if self.func_batch is None:
+            raise ValueError(f"Stattest {self.name} has no batch implementation")
+        actual_thresholds = [self.default_threshold if threshold is None else threshold for threshold in thresholds]
+        drift_scores, drifted = self.func_batch(
+            reference_data, current_data, feature_type, np.array(actual_thresholds, dtype=float)
+        )
+        return [
+            StatTestResult(drift_score=float(drift_score), drifted=bool(is_drifted), actual_threshold=threshold)
+            for drift_score, is_drifted, threshold in zip(drift_scores, drifted, actual_thresholds)
+        ]
+
 
 PossibleStatTestType = Union[str, StatTestFuncType, StatTest]
 
@@ -43,9 +80,17 @@ def register_stattest(stat_test: StatTest):
     _registered_stat_test_funcs[stat_test.func] = stat_test.name
 
 
-def _get_default_stattest(reference_data: pd.Series, current_data: pd.Series, feature_type: str) -> StatTest:
+def _get_default_stattest(reference_data: ReferenceDataType, current_data: pd.Series, feature_type: str) -> StatTest:
+    if isinstance(reference_data, ColumnReferenceProfile):
+        n_values = reference_data.nunique_with(current_data, feature_type)
+        return get_default_stattest_by_stats(reference_data.size(feature_type), n_values, feature_type)
     n_values = pd.concat([reference_data, current_data]).nunique()
-    if reference_data.shape[0] <= 1000:
+    return get_default_stattest_by_stats(reference_data.shape[0], n_values, feature_type)
+
+
+def get_default_stattest_by_stats(reference_size: int, n_values: int, feature_type: str) -> StatTest:
+    """Choose default stattest by the size of reference data and the number of unique values in both datasets"""
+    if reference_size <= 1000:
         if feature_type == "num":
             if n_values <= 5:
                 return stattests.chi_stat_test if n_values > 2 else stattests.z_stat_test
@@ -53,9 +98,8 @@ def _get_default_stattest(reference_data: pd.Series, current_data: pd.Series, fe
                 return stattests.ks_stat_test
         elif feature_type == "cat":
             return stattests.chi_stat_test if n_values > 2 else stattests.z_stat_test
-    elif reference_data.shape[0] > 1000:
+    elif reference_size > 1000:
         if feature_type == "num":
-            n_values = pd.concat([reference_data, current_data]).nunique()
             if n_values <= 5:
                 return stattests.jensenshannon_stat_test
             elif n_values > 5:
@@ -66,7 +110,10 @@ def _get_default_stattest(reference_data: pd.Series, current_data: pd.Series, fe
 
 
 def get_stattest(
-    reference_data: pd.Series, current_data: pd.Series, feature_type: str, stattest_func: Optional[PossibleStatTestType]
+    reference_data: ReferenceDataType,
+    current_data: pd.Series,
+    feature_type: str,
+    stattest_func: Optional[PossibleStatTestType],
 ) -> StatTest:
     if stattest_func is None:
         return _get_default_stattest(reference_data, current_data, feature_type)
@@ -1,6 +1,13 @@
 import pandas as pd
 import numpy as np
 
+from evidently.calculations.histogram import count_in_bins
+from evidently.calculations.histogram import count_in_bins_batch
+from evidently.calculations.histogram import get_bin_edges
+from evidently.calculations.histogram import get_bin_edges_by_range
+from evidently.calculations.histogram import get_sturges_bin_edges_batch
+from evidently.calculations.reference_profile import ColumnReferenceProfile
+
 
 def get_binned_data(reference: pd.Series, current: pd.Series, feature_type: str, n: int, feel_zeroes: bool = True):
     """Split variable into n buckets based on reference quantiles
@@ -15,22 +22,183 @@ def get_binned_data(reference: pd.Series, current: pd.Series, feature_type: str,
     """
     n_vals = reference.nunique()
     if feature_type == "num" and n_vals > 20:
+        reference_values = np.asarray(reference, dtype=float)
+        current_values = np.asarray(current, dtype=float)
+        bins = get_bin_edges([reference_values, current_values], "sturges")
 
-        bins = np.histogram_bin_edges(list(reference) + list(current), bins="sturges")
-
-        reference_percents = np.histogram(reference, bins)[0] / len(reference)
-        current_percents = np.histogram(current, bins)[0] / len(current)
+        reference_percents = count_in_bins(reference_values, bins) / len(reference)
+        current_percents = count_in_bins(current_values, bins) / len(current)
 
     else:
-        keys = list((set(reference.unique()) | set(current.unique())) - {np.nan})
+        reference_percents, current_percents = _get_percents_by_values(
+            reference.value_counts(), len(reference), current
+        )
+    if feel_zeroes:
+        np.place(reference_percents, reference_percents == 0, 0.0001)
+        np.place(current_percents, current_percents == 0, 0.0001)
+
+    return reference_percents, current_percents
+
+
+def _get_percents_by_values(reference_counts: pd.Series, reference_size: int, current: pd.Series):
+    keys = list((set(reference_counts.index) | set(current.unique())) - {np.nan})
+
+    ref_feature_dict = {**dict.fromkeys(keys, 0), **dict(reference_counts)}
+    current_feature_dict = {**dict.fromkeys(keys, 0), **dict(current.value_counts())}
+
+    reference_percents = np.array([ref_feature_dict[key] / reference_size for key in keys])
+    current_percents = np.array([current_feature_dict[key] / len(current) for key in keys])
+    return reference_percents, current_percents
+
+
+def get_binned_data_from_profile(
+    reference: ColumnReferenceProfile, current: pd.Series, feature_type: str, n: int, feel_zeroes: bool = True
+):
+    """Version of get_binned_data that uses precalculated reference statistics
+    Args:
+        reference: reference profile of the column
+        current: current data
+        feature_type: feature type
+        n: number of quantiles
+    Returns:
+        reference_percents: % of records in each bucket for reference
+        current_percents: % of records in each bucket for reference
+    """
+    reference_size = reference.size(feature_type)
+
+    if feature_type == "num" and reference.nunique(feature_type) > 20:
+        sorted_values, _ = reference.get_weighted_values(feature_type)
+        current_values = current.to_numpy()
+        first_edge = sorted_values[0]
+        last_edge = sorted_values[-1]
 
-        ref_feature_dict = {**dict.fromkeys(keys, 0), **dict(reference.value_counts())}
-        current_feature_dict = {**dict.fromkeys(keys, 0), **dict(current.value_counts())}
+        if len(current_values) > 0:
+            first_edge = min(first_edge, current_values.min())
+            last_edge = max(last_edge, current_values.max())
+
+        bins = get_bin_edges_by_range(first_edge, last_edge, reference_size + len(current_values), "sturges")
+        # the same counts as np.histogram for sorted data
+        cumulative_counts = np.append(
+            reference.cumulative_counts(bins[:-1], feature_type, side="left"),
+            reference.cumulative_counts(bins[-1:], feature_type, side="right"),
+        )
+        reference_percents = np.diff(cumulative_counts) / reference_size
+        current_percents = count_in_bins(current_values, bins) / len(current_values)
+
+    else:
+        reference_percents, current_percents = _get_percents_by_values(
+            reference.get_value_counts(feature_type), reference_size, current
+        )
 
-        reference_percents = np.array([ref_feature_dict[key] / len(reference) for key in keys])
-        current_percents = np.array([current_feature_dict[key] / len(current) for key in keys])
     if feel_zeroes:
         np.place(reference_percents, reference_percents == 0, 0.0001)
         np.place(current_percents, current_percents == 0, 0.0001)
 
     return reference_percents, current_percents
+
+
+def to_columns(data: np.ndarray) -> np.ndarray:
+    """Convert a 2-D rows x features array to a C-contiguous features x rows float array"""
+    return np.ascontiguousarray(np.asarray(data, dtype=float).T)
+
+
+def count_unique_values(data: np.ndarray) -> np.ndarray:
+    """Count unique non-NaN values in every column of 2-D rows x features array"""
+    sorted_columns = np.sort(to_columns(data), axis=1)
+    valid = ~np.isnan(sorted_columns)
+    new_values = valid[:, 1:] & (sorted_columns[:, 1:] != sorted_columns[:, :-1])
+    return new_values.sum(axis=1) + valid[:, :1].sum(axis=1)
+
+
+def get_merged_cumulative_counts(reference: np.ndarray, current: np.ndarray):
+    """Sort reference and current values of every column together in one pass
+    Args:
+        reference: 2-D rows x features array of reference data, NaN values are ignored
+        current: 2-D rows x features array of current data, NaN values are ignored
+    Returns:
+        merged_values: features x rows array of sorted values of both datasets, NaN values are at the end
+        reference_counts: number of reference values up to each position in merged_values
+        current_counts: number of current values up to each position in merged_values
+        reference_sizes: number of non-NaN reference values per feature
+        current_sizes: number of non-NaN current values per feature
+    """
+    reference_columns = to_columns(reference)
+    merged = np.concatenate([reference_columns, to_columns(current)], axis=1)
+    order = np.argsort(merged, axis=1, kind="mergesort")
+    merged_values = np.take_along_axis(merged, order, axis=1)
+    valid = ~np.isnan(merged_values)
+    from_reference = order < reference_columns.shape[1]
+    reference_counts = np.cumsum(from_reference & valid, axis=1)
+    current_counts = np.cumsum(~from_reference & valid, axis=1)
+    return merged_values, reference_counts, current_counts, reference_counts[:, -1], current_counts[:, -1]
+
+
+def get_binned_data_batch(
+    reference: np.ndarray, current: np.ndarray, feature_type: str, n: int, feel_zeroes: bool = True
+):
+    """Batch version of get_binned_data for all columns of 2-D rows x features arrays
+
+    Histograms for all numerical columns are calculated in one pass, columns with few unique values
+    fall back to get_binned_data.
+    Args:
+        reference: 2-D rows x features array of reference data, NaN values are ignored
+        current: 2-D rows x features array of current data, NaN values are ignored
+        feature_type: feature type
+        n: number of quantiles
+    Returns:
+        reference_percents: flat array of % of records in each bucket for reference for all features
+        current_percents: flat array of % of records in each bucket for current for all features
+        offsets: start of every feature in flat arrays
+    """
+    reference_columns = to_columns(reference)
+    current_columns = to_columns(current)
+    reference_sizes = (~np.isnan(reference_columns)).sum(axis=1)
+    current_sizes = (~np.isnan(current_columns)).sum(axis=1)
+
+    if feature_type == "num":
+        use_histogram = count_unique_values(reference) > 20
+
+    else:
+        use_histogram = np.zeros(len(reference_sizes), bool)
+
+    percents = {}
+
+    if use_histogram.any():
+        hist_reference = reference_columns[use_histogram]
+        hist_current = current_columns[use_histogram]
+        first_edges = np.fmin(np.nanmin(hist_reference, axis=1), np.nanmin(hist_current, axis=1))
+        last_edges = np.fmax(np.nanmax(hist_reference, axis=1), np.nanmax(hist_current, axis=1))
+        edges, n_bins, edges_offsets = get_sturges_bin_edges_batch(
+            first_edges, last_edges, reference_sizes[use_histogram] + current_sizes[use_histogram]
+        )
+        bins_offsets = np.concatenate([[0], np.cumsum(n_bins)[:-1]])
+        reference_counts = count_in_bins_batch(hist_reference, edges, n_bins, edges_offsets, bins_offsets)
+        current_counts = count_in_bins_batch(hist_current, edges, n_bins, edges_offsets, bins_offsets)
+        reference_percents = reference_counts / np.repeat(reference_sizes[use_histogram], n_bins)
+        current_percents = current_counts / np.repeat(current_sizes[use_histogram], n_bins)
+
+        for hist_idx, column_idx in enumerate(np.flatnonzero(use_histogram)):
+            start = bins_offsets[hist_idx]
+            end = start + n_bins[hist_idx]
+            percents[column_idx] = (reference_percents[start:end], current_percents[start:end])
+
+    for column_idx in np.flatnonzero(~use_histogram):
+        reference_column = reference_columns[column_idx]
+        current_column = current_columns[column_idx]
+        percents[column_idx] = get_binned_data(
+            pd.Series(reference_column[~np.isnan(reference_column)]),
+            pd.Series(current_column[~np.isnan(current_column)]),
+            feature_type,
+            n,
+            False,
+        )
+
+    reference_percents = np.concatenate([percents[idx][0] for idx in range(len(reference_sizes))])
+    current_percents = np.concatenate([percents[idx][1] for idx in range(len(reference_sizes))])
+    offsets = np.concatenate([[0], np.cumsum([len(percents[idx][0]) for idx in range(len(reference_sizes))])[:-1]])
+
+    if feel_zeroes:
+        np.place(reference_percents, reference_percents == 0, 0.0001)
+        np.place(current_percents, current_percents == 0, 0.0001)
+
+    return reference_percents, current_percents, offsets.astype(int)
@@ -4,7 +4,10 @@ import pandas as pd
 import numpy as np
 from scipy import stats
 
+from evidently.calculations.reference_profile import ColumnReferenceProfile
 from evidently.calculations.stattests.registry import StatTest, register_stattest
+from evidently.calculations.stattests.utils import get_merged_cumulative_counts
+from evidently.calculations.stattests.utils import to_columns
 
 
 def _wasserstein_distance_norm(
@@ -25,12 +28,51 @@ def _wasserstein_distance_norm(
     return wd_norm_value, wd_norm_value >= threshold
 
 
+def _wasserstein_distance_norm_profile(
+    reference: ColumnReferenceProfile, current_data: pd.Series, feature_type: str, threshold: float
+) -> Tuple[float, bool]:
+    """Compute the normed Wasserstein distance with sorted reference values and std from the profile
+    Reference sketches give an approximate distance.
+    """
+    reference_values, _ = reference.get_weighted_values(feature_type)
+    current_values = np.sort(current_data.to_numpy())
+    # the same calculation as scipy.stats.wasserstein_distance, merging of two sorted arrays is linear
+    all_values = np.sort(np.concatenate([reference_values, current_values]), kind="mergesort")
+    deltas = np.diff(all_values)
+    reference_cdf = reference.cumulative_counts(all_values[:-1], feature_type) / reference.size(feature_type)
+    current_cdf = np.searchsorted(current_values, all_values[:-1], side="right") / current_values.size
+    norm = max(reference.std if reference.std is not None else np.std(reference.get_sorted_values(feature_type)), 0.001)
+    wd_norm_value = np.sum(np.multiply(np.abs(reference_cdf - current_cdf), deltas)) / norm
+    return wd_norm_value, wd_norm_value >= threshold
+
+
+def _wasserstein_distance_norm_batch(
+    reference_data: np.ndarray, current_data: np.ndarray, feature_type: str, threshold: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Batch version of the normed Wasserstein distance for 2-D rows x features arrays
+    All features are sorted in one pass and distances are calculated from cumulative counts.
+    """
+    merged_values, reference_counts, current_counts, reference_sizes, current_sizes = get_merged_cumulative_counts(
+        reference_data, current_data
+    )
+    deltas = np.diff(merged_values, axis=1)
+    cdf_diffs = np.abs(
+        reference_counts[:, :-1] / reference_sizes[:, None] - current_counts[:, :-1] / current_sizes[:, None]
+    )
+    distances = np.where(np.isnan(deltas), 0, cdf_diffs * deltas).sum(axis=1)
+    norm = np.maximum(np.nanstd(to_columns(reference_data), axis=1), 0.001)
+    wd_norm_values = distances / norm
+    return wd_norm_values, wd_norm_values >= threshold
+
+
 wasserstein_stat_test = StatTest(
     name="wasserstein",
     display_name="Wasserstein distance (normed)",
     func=_wasserstein_distance_norm,
     allowed_feature_types=["num"],
     default_threshold=0.1,
+    func_batch=_wasserstein_distance_norm_batch,
+    func_profile=_wasserstein_distance_norm_profile,
 )
 
 register_stattest(wasserstein_stat_test)
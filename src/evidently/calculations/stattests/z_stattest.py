@@ -7,16 +7,19 @@ import pandas as pd
 
 from scipy.stats import norm
 
+from evidently.calculations.reference_profile import ColumnReferenceProfile
 from evidently.calculations.stattests.registry import StatTest, register_stattest
 
 
 def proportions_diff_z_stat_ind(ref: pd.DataFrame, curr: pd.DataFrame):
     # pylint: disable=invalid-name
-    n1 = len(ref)
-    n2 = len(curr)
+    return proportions_diff_z_stat_by_counts(len(ref), float(sum(ref)), len(curr), float(sum(curr)))
 
-    p1 = float(sum(ref)) / n1
-    p2 = float(sum(curr)) / n2
+
+def proportions_diff_z_stat_by_counts(n1: int, sum1: float, n2: int, sum2: float):
+    # pylint: disable=invalid-name
+    p1 = sum1 / n1
+    p2 = sum2 / n2
     P = float(p1 * n1 + p2 * n2) / (n1 + n2)
 
     return (p1 - p2) / np.sqrt(P * (1 - P) * (1.0 / n1 + 1.0 / n2))
@@ -57,11 +60,35 @@ def _z_stat_test(
     return p_value, p_value < threshold
 
 
+def _z_stat_test_profile(
+    reference: ColumnReferenceProfile, current_data: pd.Series, feature_type: str, threshold: float
+) -> Tuple[float, bool]:
+    reference_counts = reference.get_value_counts(feature_type)
+    current_unique = current_data.unique()
+    if len(reference_counts) == 1 and current_data.nunique() == 1 and reference_counts.index[0] == current_unique[0]:
+        p_value = 1
+    else:
+        keys = set(list(reference_counts.index) + list(current_unique)) - {np.nan}
+        first_key = sorted(list(keys))[0]
+        reference_size = reference.size(feature_type)
+        current_size = len(current_data)
+        p_value = proportions_diff_z_test(
+            proportions_diff_z_stat_by_counts(
+                reference_size,
+                float(reference_size - reference_counts.get(first_key, 0)),
+                current_size,
+                float(current_size - (current_data == first_key).sum()),
+            )
+        )
+    return p_value, p_value < threshold
+
+
 z_stat_test = StatTest(
     name="z",
     display_name="Z-test p_value",
     func=_z_stat_test,
     allowed_feature_types=["cat"],
+    func_profile=_z_stat_test_profile,
 )
 
 register_stattest(z_stat_test)
@@ -0,0 +1,594 @@
+"""Mergeable statistics of a sliding window of data for streaming calculations.
+
+Statistics are updated with added and removed values, so the cost of an update depends on the batch size only.
+Statistics of numerical columns with a sketch size keep bounded-size sketches instead of exact counts of values.
+"""
+
+from collections import deque
+from typing import Deque
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+from scipy.spatial import distance
+from scipy.stats import chisquare
+from scipy.stats import distributions
+
+from evidently.calculations.data_quality import FeatureQualityStats
+from evidently.calculations.stattests.psi import _psi_from_percents
+from evidently.calculations.stattests.z_stattest import proportions_diff_z_stat_by_counts
+from evidently.calculations.stattests.z_stattest import proportions_diff_z_test
+
+# stattests that can be calculated from counts of values or counts in bins
+STREAMING_STATTESTS = ("ks", "wasserstein", "psi", "kl_div", "jensenshannon", "chisquare", "z")
+
+
+class RingBuffer:
+    """Fixed size buffer with the last values of a column"""
+
+    def __init__(self, capacity: int, dtype):
+        if capacity < 1:
+            raise ValueError(f"Window size should be a positive number, got {capacity}")
+        self.values = np.empty(capacity, dtype=dtype)
+        self.start = 0
+        self.size = 0
+
+    def get_values(self) -> np.ndarray:
+        return self.values[(self.start + np.arange(self.size)) % len(self.values)]
+
+    def push(self, values: np.ndarray) -> np.ndarray:
+        """Add values to the buffer and return values that do not fit in it anymore"""
+        capacity = len(self.values)
+
+        if len(values) >= capacity:
+            evicted = np.concatenate([self.get_values(), values[:-capacity]])
+            self.values[:] = values[len(values) - capacity :]
+            self.start = 0
+            self.size = capacity
+            return evicted
+
+        n_evicted = max(0, self.size + len(values) - capacity)
+        evicted = self.values[(self.start + np.arange(n_evicted)) % capacity]
+        self.values[(self.start + self.size + np.arange(len(values))) % capacity] = values
+        self.start = (self.start + n_evicted) % capacity
+        self.size = min(capacity, self.size + len(values))
+        return evicted
+
+
+class SlidingExtremum:
+    """Maximum (or minimum) of a sliding window with amortized O(1) updates (monotonic queue)"""
+
+    def __init__(self, is_max: bool):
+        self.is_max = is_max
+        self.queue: Deque = deque()
+
+    def _is_before(self, value, other) -> bool:
+        return value > other if self.is_max else value < other
+
+    def add(self, values: np.ndarray):
+        if len(values) == 0:
+            return
+        accumulate = np.maximum.accumulate if self.is_max else np.minimum.accumulate
+        # the best of each value and all values after it, a value stays in the queue if no later value is before it
+        best_from = accumulate(values[::-1])[::-1]
+        is_kept = np.append(~np.asarray(self._is_before(best_from[1:], values[:-1]), dtype=bool), True)
+
+        while self.queue and self._is_before(best_from[0], self.queue[-1]):
+            self.queue.pop()
+        self.queue.extend(values[is_kept])
+
+    def remove(self, values: np.ndarray):
+        """Remove the oldest values of the window"""
+        for value in values:
+            if self.queue and self.queue[0] == value:
+                self.queue.popleft()
+
+    def get(self):
+        return self.queue[0] if self.queue else np.nan
+
+
+class RowReservoir:
+    """Uniform random sample of at most `size` rows of all added chunks (reservoir sampling)
+
+    The sample is the same for the same chunks and `random_state`.
+    `row_numbers` are positions of the sample rows among all added rows, the sample is not ordered by them.
+    """
+
+    def __init__(self, size: int, random_state: int = 0):
+        if size < 1:
+            raise ValueError(f"Sample size should be a positive number, got {size}")
+        self.size = size
+        self.n_rows = 0
+        self.sample: Optional[pd.DataFrame] = None
+        self.row_numbers = np.array([], dtype=int)
+        self._random = np.random.default_rng(random_state)
+
+    def add(self, rows: pd.DataFrame):
+        n_filled = min(max(self.size - self.n_rows, 0), len(rows))
+        sample = rows.iloc[:n_filled] if self.sample is None else pd.concat([self.sample, rows.iloc[:n_filled]])
+        sample_row_numbers = np.append(self.row_numbers, self.n_rows + np.arange(n_filled))
+        # the i-th row of all rows replaces a random row of the sample with probability size / (i + 1)
+        row_numbers = self.n_rows + np.arange(n_filled, len(rows))
+        slots = self._random.integers(0, row_numbers + 1) if len(row_numbers) > 0 else np.array([], dtype=int)
+        is_selected = slots < self.size
+        # a later row replaces an earlier one in the same slot
+        slots, last_positions = np.unique(slots[is_selected][::-1], return_index=True)
+        selected_rows = n_filled + np.flatnonzero(is_selected)[::-1][last_positions]
+
+        if len(slots) > 0:
+            is_left = np.ones(len(sample), dtype=bool)
+            is_left[slots] = False
+            sample = pd.concat([sample.iloc[is_left], rows.iloc[selected_rows]])
+            sample_row_numbers = np.append(sample_row_numbers[is_left], self.n_rows + selected_rows)
+
+        self.sample = sample.reset_index(drop=True)
+        self.row_numbers = sample_row_numbers
+        self.n_rows += len(rows)
+
+
+def get_bin_edges(reference_values: np.ndarray, n_bins: int) -> np.ndarray:
+    """Edges of equal-sized bins of finite reference values, values out of them get to two outer bins"""
+    finite_values = reference_values[np.isfinite(reference_values)]
+    if len(finite_values) == 0:
+        return np.array([0.0])
+    return np.unique(np.quantile(finite_values, np.linspace(0, 1, n_bins + 1)))
+
+
+def _get_quantiles_by_counts(sorted_values: np.ndarray, counts: np.ndarray, qs: np.ndarray) -> np.ndarray:
+    """Quantiles of sorted distinct values with their counts, the same as np.quantile of all values"""
+    cumulative = np.cumsum(counts)
+    ranks = (cumulative[-1] - 1) * qs
+    lower_ranks = np.floor(ranks)
+    positions = np.searchsorted(cumulative, [lower_ranks, lower_ranks + 1], side="right")
+    lower, upper = sorted_values[np.minimum(positions, len(sorted_values) - 1)]
+    fractions = ranks - lower_ranks
+    # the same linear interpolation as np.quantile
+    return np.where(fractions >= 0.5, upper - (upper - lower) * (1 - fractions), lower + (upper - lower) * fractions)
+
+
+def get_bin_edges_by_counts(sorted_values: np.ndarray, counts: np.ndarray, n_bins: int) -> np.ndarray:
+    """The same edges as `get_bin_edges` of all values given as sorted values with their counts"""
+    is_finite = np.isfinite(sorted_values)
+    if not is_finite.any():
+        return np.array([0.0])
+    return np.unique(
+        _get_quantiles_by_counts(sorted_values[is_finite], counts[is_finite], np.linspace(0, 1, n_bins + 1))
+    )
+
+
+class QuantileSketch:
+    """Mergeable sketch of numbers for quantiles with a bounded size (a hierarchy of compactors as in KLL sketches)
+
+    Every value of level h stands for 2**h values. A level with more values than its capacity is sorted
+    and every other value of it moves to the next level. The top level can keep `size` values, capacities
+    of lower levels decrease by 2/3 per level, so the sketch keeps less than 3 * `size` values.
+    Quantiles are exact until the first compaction, the error of ranks is about 1 / `size` of the number of values.
+    """
+
+    def __init__(self, size: int):
+        if size < 2:
+            raise ValueError(f"Sketch size should be at least 2, got {size}")
+        self.size = size
+        self.levels: List[np.ndarray] = []
+        # the first or the second value of every pair is kept in turn, so ranks are not biased to one side
+        self._offsets: List[int] = []
+
+    def _get_capacity(self, level: int) -> int:
+        return max(2, int(np.ceil(self.size * (2 / 3) ** (len(self.levels) - level - 1))))
+
+    def _compact(self, level: int):
+        if level + 1 == len(self.levels):
+            self.levels.append(np.array([], dtype=float))
+            self._offsets.append(0)
+
+        level_values = np.sort(self.levels[level])
+        n_compacted = len(level_values) // 2 * 2
+        self.levels[level + 1] = np.concatenate(
+            [self.levels[level + 1], level_values[self._offsets[level] : n_compacted : 2]]
+        )
+        self.levels[level] = level_values[n_compacted:]
+        self._offsets[level] = 1 - self._offsets[level]
+
+    def add(self, values: np.ndarray):
+        if not self.levels:
+            self.levels.append(np.array([], dtype=float))
+            self._offsets.append(0)
+
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        level = 0
+
+        # capacities of lower levels decrease when a level is added, so levels are checked again from the bottom
+        while level < len(self.levels):
+            if len(self.levels[level]) > self._get_capacity(level):
+                self._compact(level)
+                level = 0
+            else:
+                level += 1
+
+    def get_weighted_values(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Sorted values of the sketch and numbers of values they stand for"""
+        values = np.concatenate([np.array([], dtype=float)] + self.levels)
+        weights = np.concatenate(
+            [np.array([], dtype=np.int64)]
+            + [np.full(len(level_values), 2**level, dtype=np.int64) for level, level_values in enumerate(self.levels)]
+        )
+        order = np.argsort(values, kind="mergesort")
+        return values[order], weights[order]
+
+
+class DistinctCountSketch:
+    """Number of distinct numbers estimated by `size` smallest hashes of values (a KMV sketch)
+
+    The count is exact for fewer than `size` distinct values, the relative error is about 1 / sqrt(size).
+    """
+
+    def __init__(self, size: int):
+        if size < 2:
+            raise ValueError(f"Sketch size should be at least 2, got {size}")
+        self.size = size
+        self.hashes = np.array([], dtype=np.uint64)
+
+    def add(self, values: np.ndarray):
+        # -0.0 and 0.0 are the same value with other bits
+        hashes = pd.util.hash_array(values.astype(float) + 0.0)
+        self.hashes = np.unique(np.concatenate([self.hashes, hashes]))[: self.size]
+
+    def count(self) -> int:
+        if len(self.hashes) < self.size:
+            return len(self.hashes)
+        return int(round((self.size - 1) * 2.0**64 / (float(self.hashes[-1]) + 1.0)))
+
+
+class ColumnWindowStats:
+    """Statistics of a column that support adding and removing of values.
+
+    All columns keep counts of non-null values. Numerical columns (with `bin_edges`) keep counts of finite values
+    in bins, counts of infinite values and moments of finite values. Columns with `track_extremums` keep
+    the minimum and the maximum of values, for them values should be removed in the order they were added.
+
+    Numerical columns with `sketch_size` keep bounded-size state: at most `sketch_size` counts of values
+    (a Misra-Gries summary, exact until there are more distinct values), a `QuantileSketch`
+    and a `DistinctCountSketch`. Values cannot be removed from them.
+    """
+
+    def __init__(
+        self, bin_edges: Optional[np.ndarray] = None, track_extremums: bool = False, sketch_size: Optional[int] = None
+    ):
+        # counts of values in the order of their first appearance
+        self.value_counts = pd.Series(dtype=np.int64)
+        # False when counts of values are decreased to keep `sketch_size` of them
+        self.is_exact = True
+        self.sketch_size = sketch_size if bin_edges is not None else None
+        self.quantile_sketch = None if self.sketch_size is None else QuantileSketch(self.sketch_size)
+        self.distinct_count_sketch = None if self.sketch_size is None else DistinctCountSketch(self.sketch_size)
+        self.count = 0
+        self.n_missing = 0
+        # the null value of the column (None, NaN or NaT) as it appears in value counts of raw data
+        self.missing_value: object = np.nan
+        self.bin_edges = bin_edges
+        self.bin_counts = None if bin_edges is None else np.zeros(len(bin_edges) + 1, dtype=int)
+        self.n_negative_infinite = 0
+        self.n_positive_infinite = 0
+        self.n_finite = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.minimum = SlidingExtremum(is_max=False) if track_extremums else None
+        self.maximum = SlidingExtremum(is_max=True) if track_extremums else None
+
+    @property
+    def is_numeric(self) -> bool:
+        return self.bin_edges is not None
+
+    def get_weighted_values(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Sorted non-null values of a numerical column with their counts (values of the sketch without exact counts)"""
+        if not self.is_exact and self.quantile_sketch is not None:
+            return self.quantile_sketch.get_weighted_values()
+        values = self.value_counts.index.to_numpy(dtype=float)
+        order = np.argsort(values)
+        return values[order], self.value_counts.to_numpy()[order]
+
+    def set_bin_edges(self, bin_edges: np.ndarray):
+        """Replace bins of a numerical column, counts in new bins are calculated with counts of values"""
+        values, counts = self.get_weighted_values()
+        is_finite = np.isfinite(values)
+        self.bin_edges = bin_edges
+        self.bin_counts = np.bincount(
+            np.searchsorted(bin_edges, values[is_finite], side="right"),
+            weights=counts[is_finite],
+            minlength=len(bin_edges) + 1,
+        ).astype(int)
+
+    def _update_value_counts(self, values: np.ndarray, sign: int):
+        if len(values) == 0:
+            return
+
+        counts = sign * pd.Series(values, dtype=values.dtype).value_counts(sort=False)
+
+        if len(self.value_counts) > 0:
+            counts = pd.concat([self.value_counts, counts]).groupby(level=0, sort=False).sum()
+
+        if self.sketch_size is None:
+            counts = counts[counts > 0]
+
+        elif len(counts) > self.sketch_size:
+            # Misra-Gries summary: all counts are decreased by the (sketch_size + 1)-th largest count,
+            # so a value with more than count / (sketch_size + 1) values is always kept.
+            # Values with zero counts are kept while there is room, the order of first appearance is kept too
+            kth = len(counts) - self.sketch_size - 1
+            counts = counts - np.partition(counts.to_numpy(), kth)[kth]
+            kept = np.sort(np.argsort(-counts.to_numpy(), kind="mergesort")[: self.sketch_size])
+            counts = counts.iloc[kept]
+            self.is_exact = False
+
+        self.value_counts = counts
+
+    def _update(self, values: np.ndarray, sign: int):
+        is_null = pd.isnull(values)
+        if sign > 0 and is_null.any():
+            self.missing_value = values[is_null][0]
+        values = values[~is_null]
+        self.n_missing += sign * int(is_null.sum())
+        self.count += sign * len(values)
+        self._update_value_counts(values, sign)
+
+        if self.quantile_sketch is not None and self.distinct_count_sketch is not None:
+            self.quantile_sketch.add(values.astype(float))
+            self.distinct_count_sketch.add(values)
+
+        if self.bin_edges is not None:
+            values = values.astype(float)
+            finite_values = values[np.isfinite(values)]
+            self.n_negative_infinite += sign * int((values == -np.inf).sum())
+            self.n_positive_infinite += sign * int((values == np.inf).sum())
+            self.bin_counts += sign * np.bincount(
+                np.searchsorted(self.bin_edges, finite_values, side="right"), minlength=len(self.bin_counts)
+            )
+            self._update_moments(finite_values, sign)
+
+        if self.minimum is not None and self.maximum is not None:
+            if sign > 0:
+                self.minimum.add(values)
+                self.maximum.add(values)
+            else:
+                self.minimum.remove(values)
+                self.maximum.remove(values)
+
+    def _update_moments(self, values: np.ndarray, sign: int):
+        """Merge (or unmerge) moments of values with Chan's parallel algorithm"""
+        n_values = len(values)
+        if n_values == 0:
+            return
+        values_mean = float(values.mean())
+        values_m2 = float(((values - values_mean) ** 2).sum())
+
+        if sign > 0:
+            n_total = self.n_finite + n_values
+            delta = values_mean - self.mean
+            self.mean += delta * n_values / n_total
+            self.m2 += values_m2 + delta**2 * self.n_finite * n_values / n_total
+            self.n_finite = n_total
+            return
+
+        n_rest = self.n_finite - n_values
+        if n_rest <= 0:
+            self.n_finite, self.mean, self.m2 = 0, 0.0, 0.0
+            return
+        rest_mean = (self.n_finite * self.mean - n_values * values_mean) / n_rest
+        delta = values_mean - rest_mean
+        self.m2 = max(self.m2 - values_m2 - delta**2 * n_rest * n_values / self.n_finite, 0.0)
+        self.mean = rest_mean
+        self.n_finite = n_rest
+
+    def add(self, values: np.ndarray):
+        self._update(values, 1)
+
+    def remove(self, values: np.ndarray):
+        """Remove values that were added before, extremums expect the oldest values"""
+        if self.sketch_size is not None:
+            raise ValueError("Values cannot be removed from statistics with sketches")
+        self._update(values, -1)
+
+    def get_std(self) -> float:
+        """Standard deviation of finite values (population)"""
+        return float(np.sqrt(self.m2 / self.n_finite)) if self.n_finite > 0 else np.nan
+
+    def quantile(self, q: float) -> float:
+        """Quantile of values, exact if there are not more distinct values than bins.
+
+        Otherwise the quantile of finite values is interpolated inside bins, the outer bins are limited by min and max.
+        """
+        if self.is_exact and len(self.value_counts) <= len(self.bin_counts):
+            return self._quantile_by_counts(q)
+        if self.n_finite == 0:
+            return np.nan
+        edges = np.concatenate([[self.minimum.get()], self.bin_edges, [self.maximum.get()]]).astype(float)
+        edges = np.clip(edges, edges[np.isfinite(edges)].min(), edges[np.isfinite(edges)].max())
+        edges = np.maximum.accumulate(edges)
+        cumulative = np.append(0, np.cumsum(self.bin_counts))
+        return float(np.interp(q * self.n_finite, cumulative, edges))
+
+    def _quantile_by_counts(self, q: float) -> float:
+        if self.count == 0:
+            return np.nan
+        sorted_values, counts = self.get_weighted_values()
+        return float(_get_quantiles_by_counts(sorted_values, counts, np.array([q]))[0])
+
+    def get_feature_stats(self, feature_type: str, exact_percentiles: bool = False) -> FeatureQualityStats:
+        """The same stats as data quality calculations.
+
+        Percentiles of numerical features are approximate (see `quantile`), unless `exact_percentiles` is set:
+        then they are calculated with counts of all values (with the quantile sketch if counts are not exact).
+        Without exact counts the number of unique values is estimated and counts of most common values are lower
+        than the real ones by not more than count / (sketch_size + 1).
+        """
+
+        def get_percentage_from_all_values(value: float) -> float:
+            return np.round(100 * value / all_values_count, 2)
+
+        result = FeatureQualityStats(feature_type=feature_type)
+        all_values_count = self.count + self.n_missing
+
+        if not all_values_count > 0:
+            return result
+
+        top_value_counts: List[Tuple[object, int]] = list(self.value_counts.nlargest(2).items())
+
+        if self.n_missing > 0:
+            top_value_counts = (
+                [item for item in top_value_counts if item[1] > self.n_missing]
+                + [(self.missing_value, self.n_missing)]
+                + [item for item in top_value_counts if item[1] <= self.n_missing]
+            )
+
+        result.count = self.count
+        result.missing_count = self.n_missing
+        result.missing_percentage = get_percentage_from_all_values(self.n_missing)
+        if self.is_exact or self.distinct_count_sketch is None:
+            result.unique_count = len(self.value_counts)
+        else:
+            result.unique_count = self.distinct_count_sketch.count()
+        result.unique_percentage = get_percentage_from_all_values(result.unique_count)
+        result.most_common_value, most_common_count = top_value_counts[0]
+        result.most_common_value_percentage = get_percentage_from_all_values(most_common_count)
+
+        if result.count > 0 and pd.isnull(result.most_common_value):
+            result.most_common_not_null_value, most_common_not_null_count = top_value_counts[1]
+            result.most_common_not_null_value_percentage = get_percentage_from_all_values(most_common_not_null_count)
+
+        if feature_type == "num":
+            result.most_common_value = np.round(result.most_common_value, 5)
+            result.infinite_count = self.n_negative_infinite + self.n_positive_infinite
+            result.infinite_percentage = get_percentage_from_all_values(result.infinite_count)
+            result.max = np.round(self.maximum.get(), 2)
+            result.min = np.round(self.minimum.get(), 2)
+
+            if self.n_negative_infinite > 0 and self.n_positive_infinite > 0 or self.count == 0:
+                mean = np.nan
+            elif self.n_negative_infinite > 0 or self.n_positive_infinite > 0:
+                mean = -np.inf if self.n_negative_infinite > 0 else np.inf
+            else:
+                mean = self.mean
+
+            if result.infinite_count > 0 or self.count < 2:
+                std = np.nan
+            else:
+                std = np.sqrt(self.m2 / (self.count - 1))
+
+            result.mean = np.round(mean, 2)
+            result.std = np.round(std, 2)
+            quantile = self._quantile_by_counts if exact_percentiles else self.quantile
+            result.percentile_25 = np.round(quantile(0.25), 2)
+            result.percentile_50 = np.round(quantile(0.5), 2)
+            result.percentile_75 = np.round(quantile(0.75), 2)
+
+        if feature_type == "datetime":
+            result.most_common_value = str(result.most_common_value)
+            result.max = str(self.maximum.get())
+            result.min = str(self.minimum.get())
+
+        return result
+
+
+def get_stattest_by_counts(
+    reference: ColumnWindowStats, current: ColumnWindowStats, feature_type: str, stattest_name: Optional[str]
+) -> str:
+    """Choose the default stattest as get_stattest does for raw data"""
+    if stattest_name is not None:
+        if stattest_name not in STREAMING_STATTESTS:
+            raise ValueError(
+                f"Stattest {stattest_name} is not supported in streaming calculations, "
+                f"use one of {', '.join(STREAMING_STATTESTS)}"
+            )
+        return stattest_name
+
+    reference_size = reference.n_finite if feature_type == "num" else reference.count
+
+    if len(reference.value_counts) > 5 or len(current.value_counts) > 5:
+        n_values = 6
+    else:
+        n_values = len(reference.value_counts.index.union(current.value_counts.index))
+
+    if feature_type == "num" and n_values > 5:
+        return "ks" if reference_size <= 1000 else "wasserstein"
+    if reference_size <= 1000:
+        return "chisquare" if n_values > 2 else "z"
+    return "jensenshannon"
+
+
+def _get_aligned_counts(reference: ColumnWindowStats, current: ColumnWindowStats, feature_type: str):
+    """Counts of values (or of finite values in bins for numerical features) in the same order for both datasets"""
+    if feature_type == "num":
+        return reference.bin_counts, current.bin_counts, None
+    counts = pd.concat([reference.value_counts, current.value_counts], axis=1, sort=False).fillna(0).astype(int)
+    return counts.iloc[:, 0].to_numpy(), counts.iloc[:, 1].to_numpy(), list(counts.index)
+
+
+def calculate_drift_by_counts(
+    reference: ColumnWindowStats, current: ColumnWindowStats, feature_type: str, stattest_name: str, threshold: float
+) -> Tuple[float, bool]:
+    """Calculate drift score from counts of values.
+
+    Categorical features give the same results as stattests with raw data.
+    Numerical features use bins of reference data, so ks and wasserstein results are approximate
+    and binned stattests use other bins than with raw data.
+    """
+    reference_counts, current_counts, keys = _get_aligned_counts(reference, current, feature_type)
+    reference_size = reference_counts.sum()
+    current_size = current_counts.sum()
+
+    if stattest_name in ("psi", "kl_div", "jensenshannon"):
+        reference_percents = reference_counts / reference_size
+        current_percents = current_counts / current_size
+        if stattest_name == "jensenshannon":
+            drift_score = distance.jensenshannon(reference_percents, current_percents)
+            return drift_score, drift_score >= threshold
+        np.place(reference_percents, reference_percents == 0, 0.0001)
+        np.place(current_percents, current_percents == 0, 0.0001)
+        if stattest_name == "psi":
+            return _psi_from_percents(reference_percents, current_percents, threshold)
+        drift_score = stats.entropy(reference_percents, current_percents)
+        return drift_score, drift_score >= threshold
+
+    if stattest_name == "chisquare":
+        is_present = (reference_counts > 0) | (current_counts > 0)
+        k_norm = current_size / reference_size
+        p_value = chisquare(current_counts[is_present], reference_counts[is_present] * k_norm)[1]
+        return p_value, p_value < threshold
+
+    if stattest_name == "z":
+        is_present = (reference_counts > 0) | (current_counts > 0)
+        if is_present.sum() == 1 and reference_size > 0 and current_size > 0:
+            return 1, 1 < threshold
+        first = int(np.flatnonzero(is_present)[0]) if keys is None else keys.index(sorted(keys)[0])
+        p_value = proportions_diff_z_test(
+            proportions_diff_z_stat_by_counts(
+                reference_size,
+                float(reference_size - reference_counts[first]),
+                current_size,
+                float(current_size - current_counts[first]),
+            )
+        )
+        return p_value, p_value < threshold
+
+    if feature_type != "num":
+        raise ValueError(f"Stattest {stattest_name} is not applicable to categorical features")
+
+    cdf_diffs = np.cumsum(reference_counts) / reference_size - np.cumsum(current_counts) / current_size
+
+    if stattest_name == "ks":
+        statistic = np.abs(cdf_diffs).max()
+        m, n = sorted([float(reference_size), float(current_size)], reverse=True)
+        p_value = np.clip(distributions.kstwo.sf(statistic, np.round(m * n / (m + n))), 0, 1)
+        return p_value, p_value <= threshold
+
+    if stattest_name == "wasserstein":
+        # cdf differences at bin edges are interpolated linearly inside bins
+        cdf_diffs = np.abs(cdf_diffs[: len(reference.bin_edges)])
+        distance_value = np.sum(np.diff(reference.bin_edges) * (cdf_diffs[:-1] + cdf_diffs[1:]) / 2)
+        drift_score = distance_value / max(reference.get_std(), 0.001)
+        return drift_score, drift_score >= threshold
+
+    raise ValueError(f"Unexpected stattest {stattest_name}")
@@ -1,5 +1,6 @@
 #!/usr/bin/env python
 # coding: utf-8
+from typing import List
 from typing import Optional
 
 import pandas as pd
@@ -11,6 +12,22 @@ from evidently.model.widget import BaseWidgetInfo, TabInfo
 from evidently.dashboard.widgets.widget import Widget
 
 
+def _get_params_data(pr_table: list) -> List[dict]:
+    """Convert lines of a table from `calculate_pr_table` to rows of the big table widget"""
+    return [
+        {
+            "f1": float(round(top, 1)),
+            "f2": int(count),
+            "f3": float(round(prob, 2)),
+            "f4": int(tp),
+            "f5": int(fp),
+            "f6": float(round(precision, 1)),
+            "f7": float(round(recall, 1)),
+        }
+        for top, count, prob, tp, fp, precision, recall in pr_table
+    ]
+
+
 class ProbClassPRTableWidget(Widget):
     def __init__(self, title: str, dataset: str = "reference"):
         super().__init__(title)
@@ -60,29 +77,7 @@ class ProbClassPRTableWidget(Widget):
             if not isinstance(metrics.pr_table, list):
                 raise ValueError(f"Widget [{self.title}] got incorrect type for pr_table value")
 
-            pr_table_data: list = metrics.pr_table
-            params_data = []
-
-            for line in pr_table_data:
-                count = line[1]
-                prob = round(line[2], 2)
-                top = round(line[0], 1)
-                tp = line[3]
-                fp = line[4]
-                precision = round(line[5], 1)
-                recall = round(line[6], 1)
-
-                params_data.append(
-                    {
-                        "f1": float(top),
-                        "f2": int(count),
-                        "f3": float(prob),
-                        "f4": int(tp),
-                        "f5": int(fp),
-                        "f6": float(precision),
-                        "f7": float(recall),
-                    }
-                )
+            params_data = _get_params_data(metrics.pr_table)
 
             widget_info = BaseWidgetInfo(
                 title=self.title,
@@ -111,36 +106,13 @@ class ProbClassPRTableWidget(Widget):
             tabs = []
 
             for label in utility_columns.prediction:
-                params_data = []
-
                 if metrics.pr_table is None:
                     raise ValueError(f"Widget [{self.title}] got no pr_table value")
 
                 if not isinstance(metrics.pr_table, dict):
                     raise ValueError(f"Widget [{self.title}] got incorrect type of pr_table value")
 
-                pr_table_data_list = metrics.pr_table[label]
-
-                for line in pr_table_data_list:
-                    count = line[1]
-                    prob = round(line[2], 2)
-                    top = round(line[0], 1)
-                    tp = line[3]
-                    fp = line[4]
-                    precision = round(line[5], 1)
-                    recall = round(line[6], 1)
-
-                    params_data.append(
-                        {
-                            "f1": float(top),
-                            "f2": int(count),
-                            "f3": float(prob),
-                            "f4": int(tp),
-                            "f5": int(fp),
-                            "f6": float(precision),
-                            "f7": float(recall),
-                        }
-                    )
+                params_data = _get_params_data(metrics.pr_table[label])
 
                 tabs.append(
                     TabInfo(
@@ -6,7 +6,6 @@ from typing import Optional
 
 import pandas as pd
 
-import numpy as np
 
 import plotly.figure_factory as ff
 
@@ -15,6 +14,7 @@ from evidently.analyzers.prob_distribution_analyzer import ProbDistributionAnaly
 from evidently.model.widget import BaseWidgetInfo
 from evidently.dashboard.widgets.widget import Widget
 from evidently.options import ColorOptions
+from evidently.utils.data_operations import select_finite_rows
 
 
 class ProbClassPredDistrWidget(Widget):
@@ -46,10 +46,10 @@ class ProbClassPredDistrWidget(Widget):
             return None
 
         if self.dataset == "current":
-            dataset_to_plot = current_data.copy(deep=False) if current_data is not None else None
+            dataset_to_plot = current_data
 
         else:
-            dataset_to_plot = reference_data.copy(deep=False)
+            dataset_to_plot = reference_data
 
         if dataset_to_plot is None:
             if self.dataset == "reference":
@@ -57,7 +57,7 @@ class ProbClassPredDistrWidget(Widget):
 
             return None
 
-        dataset_to_plot.replace([np.inf, -np.inf], np.nan, inplace=True)
+        dataset_to_plot = select_finite_rows(dataset_to_plot, [], [utility_columns.target, *utility_columns.prediction])
 
         # plot distributions
         graphs = []
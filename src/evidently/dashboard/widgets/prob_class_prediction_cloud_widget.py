@@ -15,6 +15,7 @@ from evidently.analyzers.prob_classification_performance_analyzer import ProbCla
 from evidently.model.widget import BaseWidgetInfo
 from evidently.dashboard.widgets.widget import Widget
 from evidently.options import ColorOptions
+from evidently.utils.data_operations import select_finite_rows
 
 
 class ProbClassPredictionCloudWidget(Widget):
@@ -42,17 +43,17 @@ class ProbClassPredictionCloudWidget(Widget):
             return None
 
         if self.dataset == "current":
-            dataset_to_plot = current_data.copy(deep=False) if current_data is not None else None
+            dataset_to_plot = current_data
 
         else:
-            dataset_to_plot = reference_data.copy(deep=False)
+            dataset_to_plot = reference_data
 
         if dataset_to_plot is None:
             if self.dataset == "reference":
                 raise ValueError(f"Widget [{self.title}] requires reference dataset but it is None")
             return None
 
-        dataset_to_plot.replace([np.inf, -np.inf], np.nan, inplace=True)
+        dataset_to_plot = select_finite_rows(dataset_to_plot, [], [utility_columns.target, *utility_columns.prediction])
 
         # plot clouds
         graphs = []
@@ -14,6 +14,7 @@ from evidently.analyzers.regression_performance_analyzer import RegressionPerfor
 from evidently.model.widget import BaseWidgetInfo
 from evidently.dashboard.widgets.widget import Widget
 from evidently.options import ColorOptions
+from evidently.utils.data_operations import select_finite_rows
 
 
 class RegColoredPredActualWidget(Widget):
@@ -42,20 +43,18 @@ class RegColoredPredActualWidget(Widget):
             return None
 
         if self.dataset == "current":
-            dataset_to_plot = current_data.copy(deep=False) if current_data is not None else None
+            dataset_to_plot = current_data
 
         else:
-            dataset_to_plot = reference_data.copy(deep=False)
+            dataset_to_plot = reference_data
 
         if dataset_to_plot is None:
             if self.dataset == "reference":
                 raise ValueError(f"Widget [{self.title}] requires reference dataset but it is None")
             return None
 
-        dataset_to_plot.replace([np.inf, -np.inf], np.nan, inplace=True)
-        dataset_to_plot.dropna(
-            axis=0, how="any", inplace=True, subset=[results_utility_columns.target, results_utility_columns.prediction]
-        )
+        target_and_prediction = [results_utility_columns.target, results_utility_columns.prediction]
+        dataset_to_plot = select_finite_rows(dataset_to_plot, target_and_prediction, target_and_prediction)
 
         error = dataset_to_plot[results_utility_columns.prediction] - dataset_to_plot[results_utility_columns.target]
 
@@ -5,7 +5,6 @@ import json
 from typing import Optional
 
 import pandas as pd
-import numpy as np
 
 import plotly.graph_objs as go
 
@@ -14,6 +13,7 @@ from evidently.analyzers.regression_performance_analyzer import RegressionPerfor
 from evidently.model.widget import BaseWidgetInfo
 from evidently.dashboard.widgets.widget import Widget
 from evidently.options import ColorOptions
+from evidently.utils.data_operations import select_finite_rows
 
 
 class RegErrorTimeWidget(Widget):
@@ -42,20 +42,19 @@ class RegErrorTimeWidget(Widget):
             return None
 
         if self.dataset == "current":
-            dataset_to_plot = current_data.copy(deep=False) if current_data is not None else None
+            dataset_to_plot = current_data
 
         else:
-            dataset_to_plot = reference_data.copy(deep=False)
+            dataset_to_plot = reference_data
 
         if dataset_to_plot is None:
             if self.dataset == "reference":
                 raise ValueError(f"Widget [{self.title}] requires reference dataset but it is None")
             return None
 
-        dataset_to_plot.replace([np.inf, -np.inf], np.nan, inplace=True)
-        dataset_to_plot.dropna(
-            axis=0, how="any", inplace=True, subset=[results_utility_columns.target, results_utility_columns.prediction]
-        )
+        target_and_prediction = [results_utility_columns.target, results_utility_columns.prediction]
+        used_columns = target_and_prediction + ([results_utility_columns.date] if results_utility_columns.date else [])
+        dataset_to_plot = select_finite_rows(dataset_to_plot, target_and_prediction, used_columns)
 
         # plot error in time
         error_in_time = go.Figure()
@@ -14,6 +14,7 @@ from evidently import ColumnMapping
 from evidently.analyzers.regression_performance_analyzer import RegressionPerformanceAnalyzer
 from evidently.model.widget import BaseWidgetInfo, AdditionalGraphInfo
 from evidently.dashboard.widgets.widget import Widget
+from evidently.utils.data_operations import select_finite_rows
 
 
 def _error_bias_string(quantile_5, quantile_95):
@@ -47,12 +48,16 @@ class UnderperformSegmTableWidget(Widget):
             raise ValueError(f"Widget [{self.title}] requires 'target' and 'prediction' columns.")
 
         widget_info = None
-        if current_data is not None:
-            current_data.replace([np.inf, -np.inf], np.nan, inplace=True)
-            current_data.dropna(axis=0, how="any", inplace=True, subset=[target_name, prediction_name])
+        target_and_prediction = [target_name, prediction_name]
+        used_columns = list(
+            dict.fromkeys(
+                target_and_prediction + results.columns.num_feature_names + results.columns.cat_feature_names
+            )
+        )
+        reference_data = select_finite_rows(reference_data, target_and_prediction, used_columns)
 
-            reference_data.replace([np.inf, -np.inf], np.nan, inplace=True)
-            reference_data.dropna(axis=0, how="any", inplace=True, subset=[target_name, prediction_name])
+        if current_data is not None:
+            current_data = select_finite_rows(current_data, target_and_prediction, used_columns)
 
             ref_error = reference_data[prediction_name] - reference_data[target_name]
             current_error = current_data[prediction_name] - current_data[target_name]
@@ -73,9 +78,6 @@ class UnderperformSegmTableWidget(Widget):
             )
             merged_data = pd.concat([reference_data, current_data])
 
-            reference_data.drop(["dataset", "Error bias"], axis=1, inplace=True)
-            current_data.drop(["dataset", "Error bias"], axis=1, inplace=True)
-
             params_data = []
             additional_graphs_data = []
 
@@ -268,9 +270,6 @@ class UnderperformSegmTableWidget(Widget):
             )
 
         else:
-            reference_data.replace([np.inf, -np.inf], np.nan, inplace=True)
-            reference_data.dropna(axis=0, how="any", inplace=True, subset=[target_name, prediction_name])
-
             error = reference_data[prediction_name] - reference_data[target_name]
 
             quntile_5 = np.quantile(error, 0.05)
@@ -396,8 +395,6 @@ class UnderperformSegmTableWidget(Widget):
                     )
                 )
 
-            reference_data.drop("Error bias", axis=1, inplace=True)
-
             widget_info = BaseWidgetInfo(
                 title=self.title,
                 type="big_table",
@@ -11,4 +11,5 @@ from .data_quality_metrics import DataQualityCorrelationMetrics
 from .classification_performance_metrics import ClassificationPerformanceMetrics
 from .classification_performance_metrics import ClassificationPerformanceMetricsTopK
 from .classification_performance_metrics import ClassificationPerformanceMetricsThreshold
+from .classification_performance_metrics import ClassificationPerformanceMetricsSweep
 from .regression_performance_metrics import RegressionPerformanceMetrics
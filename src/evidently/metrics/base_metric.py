@@ -1,5 +1,6 @@
 import abc
 from dataclasses import dataclass
+from dataclasses import field
 from typing import Generic
 from typing import TypeVar
 from typing import Optional
@@ -7,6 +8,8 @@ from typing import Optional
 import pandas as pd
 
 from evidently.pipeline.column_mapping import ColumnMapping
+from evidently.utils.column_cache import ColumnCache
+from evidently.utils.fingerprint import DataFingerprint
 
 TResult = TypeVar("TResult")
 
@@ -16,6 +19,15 @@ class InputData:
     reference_data: Optional[pd.DataFrame]
     current_data: pd.DataFrame
     column_mapping: ColumnMapping
+    # preprocessed columns shared by all metrics calculated with the data
+    column_cache: ColumnCache = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.column_cache = ColumnCache(self.reference_data, self.current_data, self.column_mapping)
+
+    def get_fingerprint(self, dataset: str = "current", mode: str = "full") -> Optional[DataFingerprint]:
+        """Fingerprint of the "current" or "reference" data, calculated once for each mode"""
+        return self.column_cache.get_fingerprint(dataset, mode)
 
 
 class Metric(Generic[TResult]):
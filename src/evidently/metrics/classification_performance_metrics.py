@@ -3,6 +3,7 @@ import dataclasses
 from typing import Optional
 from typing import List
 from typing import Dict
+from typing import Tuple
 from typing import Union
 
 import numpy as np
@@ -14,8 +15,15 @@ from pandas.core.dtypes.api import is_string_dtype
 from pandas.core.dtypes.api import is_object_dtype
 
 from evidently import ColumnMapping
+from evidently.calculations.classification_performance import calculate_classification_quality
+from evidently.calculations.classification_performance import calculate_confusion_by_thresholds
+from evidently.calculations.classification_performance import calculate_quality_by_confusion_matrix
 from evidently.calculations.classification_performance import calculate_confusion_by_classes
+from evidently.calculations.classification_performance import ClassificationQuality
 from evidently.calculations.classification_performance import ConfusionMatrix
+from evidently.calculations.classification_performance import calculate_negative_rates
+from evidently.calculations.classification_performance import calculate_pr_table
+from evidently.calculations.classification_performance import downsample_curve
 from evidently.metrics.base_metric import InputData
 from evidently.metrics.base_metric import Metric
 
@@ -52,22 +60,70 @@ class ClassificationPerformanceResults:
     reference: Optional[DatasetClassificationPerformanceMetrics] = None
 
 
-def k_probability_threshold(prediction_probas: pd.DataFrame, k: Union[int, float]) -> float:
-    probas = prediction_probas.iloc[:, 0].sort_values(ascending=False)
+@dataclasses.dataclass
+class ClassificationPerformanceSweepResults:
+    """Results for every threshold or k value of a sweep, in the order of the sweep values"""
+
+    thresholds: Optional[List[float]]
+    k: Optional[List[Union[float, int]]]
+    current: List[DatasetClassificationPerformanceMetrics]
+    dummy: List[DatasetClassificationPerformanceMetrics]
+    reference: Optional[List[DatasetClassificationPerformanceMetrics]] = None
+
+    def get_results(
+        self, threshold: Optional[float] = None, k: Optional[Union[float, int]] = None
+    ) -> ClassificationPerformanceResults:
+        """Get results for one threshold or k value of the sweep"""
+        if threshold is not None:
+            idx = _get_sweep_index(self.thresholds, threshold)
+
+        else:
+            idx = _get_sweep_index(self.k, k, is_k=True)
+
+        if idx is None:
+            raise ValueError(f"Sweep has no results for threshold {threshold} and k {k}")
+
+        return ClassificationPerformanceResults(
+            current=self.current[idx],
+            dummy=self.dummy[idx],
+            reference=self.reference[idx] if self.reference is not None else None,
+        )
+
+
+def _get_sweep_index(values: Optional[list], value: Optional[Union[float, int]], is_k: bool = False) -> Optional[int]:
+    if values is None or value is None:
+        return None
+
+    for idx, sweep_value in enumerate(values):
+        # int and float k values have different meaning
+        if sweep_value == value and (not is_k or isinstance(sweep_value, float) == isinstance(value, float)):
+            return idx
+
+    return None
+
+
+def _get_k_index(k: Union[int, float], size: int) -> int:
     if isinstance(k, float):
         if k < 0.0 or k > 1.0:
             raise ValueError(f"K should be in range [0.0, 1.0] but was {k}")
-        return probas.iloc[max(int(np.ceil(k * prediction_probas.shape[0])) - 1, 0)]
+        return max(int(np.ceil(k * size)) - 1, 0)
     if isinstance(k, int):
-        return probas.iloc[min(k, prediction_probas.shape[0] - 1)]
+        return min(k, size - 1)
     raise ValueError(f"K has unexpected type {type(k)}")
 
 
+def k_probability_threshold(prediction_probas: pd.DataFrame, k: Union[int, float]) -> float:
+    probas = prediction_probas.iloc[:, 0].sort_values(ascending=False)
+    return probas.iloc[_get_k_index(k, prediction_probas.shape[0])]
+
+
 def threshold_probability_labels(
     prediction_probas: pd.DataFrame, pos_label: Union[str, int], neg_label: Union[str, int], threshold: float
 ) -> pd.Series:
     """Get prediction values by probabilities with the threshold apply"""
-    return prediction_probas[pos_label].apply(lambda x: pos_label if x >= threshold else neg_label)
+    labels = np.array([neg_label, pos_label], dtype=object)
+    is_positive = (prediction_probas[pos_label] >= threshold).to_numpy()
+    return pd.Series(labels[is_positive.astype(int)], index=prediction_probas.index, name=pos_label).infer_objects()
 
 
 def _calculate_k_variant(
@@ -89,34 +145,101 @@ def _calculate_threshold(target_data: pd.Series, prediction_probas: pd.DataFrame
     return classification_performance_metrics(target_data, prediction_labels, prediction_probas, pos_label)
 
 
+def _get_sweep_label_kind(label) -> Optional[str]:
+    if isinstance(label, str):
+        return "str"
+
+    if isinstance(label, (int, np.integer)) and not isinstance(label, (bool, np.bool_)):
+        return "int"
+
+    return None
+
+
+def _calculate_sweep(
+    target_data: pd.Series, prediction_probas: pd.DataFrame, thresholds: List[float]
+) -> List[DatasetClassificationPerformanceMetrics]:
+    """Calculate `_calculate_threshold` results for all thresholds.
+
+    Labels metrics of every threshold are derived from confusion counts of one sort of probabilities,
+    other metrics do not depend on the threshold and are calculated once.
+    """
+    pos_label, neg_label = prediction_probas.columns
+    labels = sorted(set(target_data.unique()))
+    base_metrics = _calculate_threshold(target_data, prediction_probas, thresholds[0])
+    label_kinds = {_get_sweep_label_kind(label) for label in labels + [pos_label, neg_label]}
+
+    if (
+        len(label_kinds) != 1
+        or None in label_kinds
+        or not set(labels) <= {pos_label, neg_label}
+        or prediction_probas[pos_label].isna().any()
+    ):
+        # labels are encoded by sklearn metrics in a different way, calculate every threshold separately
+        return [base_metrics] + [
+            _calculate_threshold(target_data, prediction_probas, threshold) for threshold in thresholds[1:]
+        ]
+
+    class_num = target_data.nunique()
+    confusion = calculate_confusion_by_thresholds(
+        (target_data == pos_label).to_numpy().astype(int), prediction_probas[pos_label].to_numpy(), thresholds
+    )
+    results = []
+
+    for idx in range(len(thresholds)):
+        counts = {
+            (pos_label, pos_label): confusion.tp[idx],
+            (pos_label, neg_label): confusion.fn[idx],
+            (neg_label, pos_label): confusion.fp[idx],
+            (neg_label, neg_label): confusion.tn[idx],
+        }
+        matrix_labels = set(labels)
+
+        if confusion.tp[idx] + confusion.fp[idx] > 0:
+            matrix_labels.add(pos_label)
+
+        if confusion.tn[idx] + confusion.fn[idx] > 0:
+            matrix_labels.add(neg_label)
+
+        sorted_labels = sorted(matrix_labels)
+        confusion_matrix = np.array([[counts[(row, column)] for column in sorted_labels] for row in sorted_labels])
+        quality = calculate_quality_by_confusion_matrix(confusion_matrix, sorted_labels, "binary", pos_label)
+        results.append(dataclasses.replace(base_metrics, **_get_labels_metrics(quality, labels, class_num, pos_label)))
+
+    return results
+
+
+def _calculate_dummy_metrics(
+    target_data: pd.Series, pos_label: Optional[Union[str, int]]
+) -> DatasetClassificationPerformanceMetrics:
+    labels_ratio = target_data.value_counts(normalize=True)
+    np.random.seed(0)
+    dummy_preds = np.random.choice(labels_ratio.index, len(target_data), p=labels_ratio)
+    return classification_performance_metrics(target_data, dummy_preds, None, pos_label)
+
+
 def classification_performance_metrics(
     target: pd.Series,
     prediction: pd.Series,
     prediction_probas: Optional[pd.DataFrame],
     pos_label: Optional[Union[str, int]],
+    rate_curve_size: Optional[int] = None,
 ) -> DatasetClassificationPerformanceMetrics:
+    """Calculate classification quality metrics for one dataset.
+
+    `rate_curve_size` limits the number of points of `rate_plots_data`, all ROC thresholds are kept by default.
+    """
 
     class_num = target.nunique()
     prediction_labels = prediction
-
-    if class_num > 2:
-        accuracy_score = sklearn.metrics.accuracy_score(target, prediction_labels)
-        avg_precision = sklearn.metrics.precision_score(target, prediction_labels, average="macro")
-        avg_recall = sklearn.metrics.recall_score(target, prediction_labels, average="macro")
-        avg_f1 = sklearn.metrics.f1_score(target, prediction_labels, average="macro")
-
-    else:
-        accuracy_score = sklearn.metrics.accuracy_score(target, prediction_labels)
-        avg_precision = sklearn.metrics.precision_score(
-            target, prediction_labels, average="binary", pos_label=pos_label
-        )
-        avg_recall = sklearn.metrics.recall_score(target, prediction_labels, average="binary", pos_label=pos_label)
-        avg_f1 = sklearn.metrics.f1_score(target, prediction_labels, average="binary", pos_label=pos_label)
+    quality = calculate_classification_quality(
+        target, prediction_labels, "macro" if class_num > 2 else "binary", pos_label=pos_label
+    )
 
     roc_auc: Optional[float] = None
     roc_aucs: Optional[list] = None
     log_loss: Optional[float] = None
     roc_curve: Optional[dict] = None
+    pr_table: Optional[dict] = None
 
     if prediction_probas is not None:
         binaraized_target = (
@@ -133,73 +256,86 @@ def classification_performance_metrics(
         for label in binaraized_target.columns:
             fprs, tprs, thrs = sklearn.metrics.roc_curve(binaraized_target[label], prediction_probas[label])
             roc_curve[label] = {"fpr": fprs.tolist(), "tpr": tprs.tolist(), "thrs": thrs.tolist()}
+        # pr table
+        pr_tables = calculate_pr_table(binaraized_target.to_numpy(), array_prediction)
+        pr_table = dict(zip(prediction_probas.columns, pr_tables))
 
-    # calculate class support and metrics matrix
-    metrics_matrix = sklearn.metrics.classification_report(target, prediction_labels, output_dict=True)
-
-    # calculate confusion matrix
     # labels = target_names if target_names else sorted(set(target.unique()) | set(prediction.unique()))
     labels = sorted(set(target.unique()))
-    conf_matrix = sklearn.metrics.confusion_matrix(target, prediction_labels)
-    confusion_by_classes = calculate_confusion_by_classes(conf_matrix, labels)
-    tpr: Optional[float] = None
-    tnr: Optional[float] = None
-    fpr: Optional[float] = None
-    fnr: Optional[float] = None
     rate_plots_data: Optional[dict] = None
 
-    # calculate rates metrics and plot data
-    if class_num == 2 and pos_label is not None:
-        conf_by_pos_label = confusion_by_classes[str(pos_label)]
-        tpr = conf_by_pos_label["tp"] / (conf_by_pos_label["tp"] + conf_by_pos_label["fn"])
-        tnr = conf_by_pos_label["tn"] / (conf_by_pos_label["tn"] + conf_by_pos_label["fp"])
-        fpr = conf_by_pos_label["fp"] / (conf_by_pos_label["fp"] + conf_by_pos_label["tn"])
-        fnr = conf_by_pos_label["fn"] / (conf_by_pos_label["fn"] + conf_by_pos_label["tp"])
-
+    # calculate rates plot data
     if class_num == 2 and prediction_probas is not None and roc_curve is not None:
         rate_plots_data = {}
         rate_plots_data["thrs"] = roc_curve[pos_label]["thrs"]
         rate_plots_data["tpr"] = roc_curve[pos_label]["tpr"]
         rate_plots_data["fpr"] = roc_curve[pos_label]["fpr"]
 
-        df = pd.DataFrame({"true": binaraized_target[pos_label].values, "preds": prediction_probas[pos_label].values})
-        tnrs = []
-        fnrs = []
-        for tr in rate_plots_data["thrs"]:
-            if tr < 1:
-                tn = df[(df.true == 0) & (df.preds < tr)].shape[0]
-                fn = df[(df.true == 1) & (df.preds < tr)].shape[0]
-                tp = df[(df.true == 1) & (df.preds >= tr)].shape[0]
-                fp = df[(df.true == 0) & (df.preds >= tr)].shape[0]
-                tnrs.append(tn / (tn + fp))
-                fnrs.append(fn / (fn + tp))
-            else:
-                fnrs.append(1)
-                tnrs.append(1)
+        tnrs, fnrs = calculate_negative_rates(
+            binaraized_target[pos_label].to_numpy(), prediction_probas[pos_label].to_numpy(), rate_plots_data["thrs"]
+        )
         rate_plots_data["fnr"] = fnrs
         rate_plots_data["tnr"] = tnrs
+        rate_plots_data = downsample_curve(rate_plots_data, rate_curve_size)
 
     return DatasetClassificationPerformanceMetrics(
-        accuracy=accuracy_score,
-        precision=avg_precision,
-        recall=avg_recall,
-        f1=avg_f1,
         roc_auc=roc_auc,
         log_loss=log_loss,
-        metrics_matrix=metrics_matrix,
-        confusion_matrix=ConfusionMatrix(labels=labels, values=conf_matrix.tolist()),
         roc_aucs=roc_aucs,
         roc_curve=roc_curve,
+        pr_table=pr_table,
+        rate_plots_data=rate_plots_data,
+        **_get_labels_metrics(quality, labels, class_num, pos_label),
+    )
+
+
+def _get_labels_metrics(
+    quality: ClassificationQuality, labels: list, class_num: int, pos_label: Optional[Union[str, int]]
+) -> dict:
+    """Fields of `DatasetClassificationPerformanceMetrics` which depend on predicted labels only"""
+    conf_matrix = quality.confusion_matrix
+    confusion_by_classes = calculate_confusion_by_classes(conf_matrix, labels)
+    tpr: Optional[float] = None
+    tnr: Optional[float] = None
+    fpr: Optional[float] = None
+    fnr: Optional[float] = None
+
+    # calculate rates metrics
+    if class_num == 2 and pos_label is not None:
+        conf_by_pos_label = confusion_by_classes[str(pos_label)]
+        tpr = conf_by_pos_label["tp"] / (conf_by_pos_label["tp"] + conf_by_pos_label["fn"])
+        tnr = conf_by_pos_label["tn"] / (conf_by_pos_label["tn"] + conf_by_pos_label["fp"])
+        fpr = conf_by_pos_label["fp"] / (conf_by_pos_label["fp"] + conf_by_pos_label["tn"])
+        fnr = conf_by_pos_label["fn"] / (conf_by_pos_label["fn"] + conf_by_pos_label["tp"])
+
+    return dict(
+        accuracy=quality.accuracy,
+        precision=quality.precision,
+        recall=quality.recall,
+        f1=quality.f1,
+        metrics_matrix=quality.metrics_matrix,
+        confusion_matrix=ConfusionMatrix(labels=labels, values=conf_matrix.tolist()),
         confusion_by_classes=confusion_by_classes,
         tpr=tpr,
         tnr=tnr,
         fpr=fpr,
         fnr=fnr,
-        rate_plots_data=rate_plots_data,
     )
 
 
 class ClassificationPerformanceMetrics(Metric[ClassificationPerformanceResults]):
+    """Classification quality metrics of current and reference datasets.
+
+    Args:
+        rate_curve_size: the maximum number of points in `rate_plots_data` for rendering,
+            all ROC thresholds are kept by default.
+    """
+
+    rate_curve_size: Optional[int]
+
+    def __init__(self, rate_curve_size: Optional[int] = None) -> None:
+        self.rate_curve_size = rate_curve_size
+
     def calculate(self, data: InputData) -> ClassificationPerformanceResults:
         if data.current_data is None:
             raise ValueError("current dataset should be present")
@@ -211,7 +347,7 @@ class ClassificationPerformanceMetrics(Metric[ClassificationPerformanceResults])
         prediction_probas = predictions.prediction_probas
 
         current_metrics = classification_performance_metrics(
-            target_data, prediction_data, prediction_probas, data.column_mapping.pos_label
+            target_data, prediction_data, prediction_probas, data.column_mapping.pos_label, self.rate_curve_size
         )
 
         # data for plots
@@ -230,6 +366,7 @@ class ClassificationPerformanceMetrics(Metric[ClassificationPerformanceResults])
                 ref_prediction_data,
                 ref_probas,
                 data.column_mapping.pos_label,
+                self.rate_curve_size,
             )
             if ref_probas is not None:
                 reference_metrics.plot_data = _collect_plot_data(ref_probas)
@@ -306,20 +443,99 @@ def _dummy_threshold_metrics(
     )
 
 
+class ClassificationPerformanceMetricsSweep(Metric[ClassificationPerformanceSweepResults]):
+    """Classification quality metrics for a list of probability thresholds or top-k values.
+
+    Probabilities are sorted once and confusion counts of all thresholds are calculated in one pass,
+    results of every threshold are equal to `ClassificationPerformanceMetricsThreshold` or
+    `ClassificationPerformanceMetricsTopK` results. Binary classification with probabilities only.
+
+    Args:
+        thresholds: probability thresholds of positive predictions
+        k: top-k values, an int is a number of objects and a float is a share of objects
+    """
+
+    thresholds: Optional[List[float]]
+    k: Optional[List[Union[float, int]]]
+
+    def __init__(
+        self, thresholds: Optional[List[float]] = None, k: Optional[List[Union[float, int]]] = None
+    ) -> None:
+        if (thresholds is None) == (k is None):
+            raise ValueError("Only one of thresholds or k should be given")
+
+        if not (thresholds or k):
+            raise ValueError("Sweep should have at least one threshold or k value")
+
+        self.thresholds = thresholds
+        self.k = k
+
+    def has_point(self, threshold: Optional[float] = None, k: Optional[Union[float, int]] = None) -> bool:
+        if threshold is not None:
+            return _get_sweep_index(self.thresholds, threshold) is not None
+
+        return _get_sweep_index(self.k, k, is_k=True) is not None
+
+    def _calculate_dataset(
+        self, dataset: pd.DataFrame, mapping: ColumnMapping
+    ) -> Tuple[List[float], List[DatasetClassificationPerformanceMetrics]]:
+        target_data = dataset[mapping.target]
+        prediction_probas = get_prediction_data(dataset, mapping).prediction_probas
+
+        if prediction_probas is None or len(set(target_data.unique())) > 2:
+            raise ValueError("Sweep can be used only with binary classification with probas")
+
+        if self.k is not None:
+            sorted_probas = -np.sort(-prediction_probas.iloc[:, 0].to_numpy())
+            thresholds = [sorted_probas[_get_k_index(k, sorted_probas.shape[0])] for k in self.k]
+
+        else:
+            thresholds = list(self.thresholds or [])
+
+        return thresholds, _calculate_sweep(target_data, prediction_probas, thresholds)
+
+    def calculate(self, data: InputData) -> ClassificationPerformanceSweepResults:
+        current_data = _cleanup_data(data.current_data, data.column_mapping)
+        current_thresholds, current_results = self._calculate_dataset(current_data, data.column_mapping)
+        dummy_metrics = _calculate_dummy_metrics(
+            current_data[data.column_mapping.target], data.column_mapping.pos_label
+        )
+        reference_results = None
+
+        if data.reference_data is not None:
+            reference_data = _cleanup_data(data.reference_data, data.column_mapping)
+            _, reference_results = self._calculate_dataset(reference_data, data.column_mapping)
+
+        return ClassificationPerformanceSweepResults(
+            thresholds=self.thresholds,
+            k=self.k,
+            current=current_results,
+            dummy=[_dummy_threshold_metrics(threshold, dummy_metrics) for threshold in current_thresholds],
+            reference=reference_results,
+        )
+
+    def get_parameters(self) -> tuple:
+        return (
+            tuple(self.thresholds) if self.thresholds is not None else None,
+            tuple(self.k) if self.k is not None else None,
+        )
+
+
 class ClassificationPerformanceMetricsThresholdBase(Metric[ClassificationPerformanceResults]):
+    # subclasses with a sweep take their results from it instead of a calculation
+    sweep: Optional[ClassificationPerformanceMetricsSweep] = None
+
     def calculate(self, data: InputData) -> ClassificationPerformanceResults:
+        if self.sweep is not None:
+            return self.get_sweep_results(self.sweep.get_result())
+
         current_data = _cleanup_data(data.current_data, data.column_mapping)
         target_data = current_data[data.column_mapping.target]
         threshold = self.get_threshold(current_data, data.column_mapping)
         current_results = self.calculate_metric(data.current_data, data.column_mapping)
 
         # dummy
-        labels_ratio = target_data.value_counts(normalize=True)
-        np.random.seed(0)
-        dummy_preds = np.random.choice(labels_ratio.index, len(target_data), p=labels_ratio)
-        dummy_metrics = classification_performance_metrics(
-            target_data, dummy_preds, None, data.column_mapping.pos_label
-        )
+        dummy_metrics = _calculate_dummy_metrics(target_data, data.column_mapping.pos_label)
         dummy_results = _dummy_threshold_metrics(threshold, dummy_metrics)
         reference_results = None
         if data.reference_data is not None:
@@ -338,10 +554,17 @@ class ClassificationPerformanceMetricsThresholdBase(Metric[ClassificationPerform
     def calculate_metric(self, dataset: pd.DataFrame, mapping: ColumnMapping):
         raise NotImplementedError()
 
+    def get_sweep_results(self, results: ClassificationPerformanceSweepResults) -> ClassificationPerformanceResults:
+        raise NotImplementedError(f"{type(self).__name__} does not support results of a sweep")
+
 
 class ClassificationPerformanceMetricsTopK(ClassificationPerformanceMetricsThresholdBase):
-    def __init__(self, k: Union[float, int]):
+    def __init__(self, k: Union[float, int], sweep: Optional[ClassificationPerformanceMetricsSweep] = None):
+        if sweep is not None and not sweep.has_point(k=k):
+            raise ValueError(f"Sweep has no k value {k}")
+
         self.k = k
+        self.sweep = sweep
 
     def get_threshold(self, dataset: pd.DataFrame, mapping: ColumnMapping) -> float:
         predictions = get_prediction_data(dataset, mapping)
@@ -355,13 +578,22 @@ class ClassificationPerformanceMetricsTopK(ClassificationPerformanceMetricsThres
         prediction_probas = predictions.prediction_probas
         return _calculate_k_variant(target_data, prediction_probas, labels, self.k)
 
+    def get_sweep_results(self, results: ClassificationPerformanceSweepResults) -> ClassificationPerformanceResults:
+        return results.get_results(k=self.k)
+
     def get_parameters(self) -> tuple:
         return tuple((self.k,))
 
 
 class ClassificationPerformanceMetricsThreshold(ClassificationPerformanceMetricsThresholdBase):
-    def __init__(self, classification_threshold: float):
+    def __init__(
+        self, classification_threshold: float, sweep: Optional[ClassificationPerformanceMetricsSweep] = None
+    ):
+        if sweep is not None and not sweep.has_point(threshold=classification_threshold):
+            raise ValueError(f"Sweep has no threshold {classification_threshold}")
+
         self.threshold = classification_threshold
+        self.sweep = sweep
 
     def get_threshold(self, dataset: pd.DataFrame, mapping: ColumnMapping) -> float:
         return self.threshold
@@ -373,6 +605,9 @@ class ClassificationPerformanceMetricsThreshold(ClassificationPerformanceMetrics
         prediction_probas = predictions.prediction_probas
         return _calculate_threshold(target_data, prediction_probas, self.threshold)
 
+    def get_sweep_results(self, results: ClassificationPerformanceSweepResults) -> ClassificationPerformanceResults:
+        return results.get_results(threshold=self.threshold)
+
     def get_parameters(self) -> tuple:
         return tuple((self.threshold,))
 
@@ -398,6 +633,18 @@ class PredictionData:
     prediction_probas: Optional[pd.DataFrame]
 
 
+def _get_max_proba_labels(prediction_probas: pd.DataFrame) -> pd.Series:
+    """Get the column name with the max probability for every row as `idxmax(axis=1)`"""
+    values = prediction_probas.to_numpy()
+
+    if prediction_probas.isna().to_numpy().any():
+        # idxmax skips NaN values
+        return prediction_probas.idxmax(axis=1)
+
+    labels = prediction_probas.columns.to_numpy()[np.argmax(values, axis=1)]
+    return pd.Series(labels, index=prediction_probas.index)
+
+
 def get_prediction_data(data: pd.DataFrame, mapping: ColumnMapping, threshold: float = 0.5) -> PredictionData:
     """Get predicted values and optional prediction probabilities from source data.
     Also take into account a threshold value - if a probability is less than the value, do not take it into account.
@@ -409,9 +656,8 @@ def get_prediction_data(data: pd.DataFrame, mapping: ColumnMapping, threshold: f
     # for multiclass classification return just values and probas
     if isinstance(mapping.prediction, list) and len(mapping.prediction) > 2:
         # list of columns with prediction probas, should be same as target labels
-        return PredictionData(
-            predictions=data[mapping.prediction].idxmax(axis=1), prediction_probas=data[mapping.prediction]
-        )
+        prediction_probas = data[mapping.prediction]
+        return PredictionData(predictions=_get_max_proba_labels(prediction_probas), prediction_probas=prediction_probas)
 
     # calculate labels as np.array - for better negative label calculations for binary classification
     if mapping.target_names is not None:
@@ -464,12 +710,12 @@ def get_prediction_data(data: pd.DataFrame, mapping: ColumnMapping, threshold: f
             pos_preds = data[mapping.prediction]
 
         else:
-            pos_preds = data[mapping.prediction].apply(lambda x: 1.0 - x)
+            pos_preds = 1.0 - data[mapping.prediction]
 
         prediction_probas = pd.DataFrame.from_dict(
             {
                 mapping.pos_label: pos_preds,
-                neg_label: pos_preds.apply(lambda x: 1.0 - x),
+                neg_label: 1.0 - pos_preds,
             }
         )
         predictions = threshold_probability_labels(prediction_probas, mapping.pos_label, neg_label, threshold)
@@ -480,12 +726,12 @@ def get_prediction_data(data: pd.DataFrame, mapping: ColumnMapping, threshold: f
         if mapping.prediction in [0, "0"]:
             pos_preds = data[mapping.prediction]
         else:
-            pos_preds = data[mapping.prediction].apply(lambda x: 1.0 - x)
-        predictions = pos_preds.apply(lambda x: 0 if x >= threshold else 1)
+            pos_preds = 1.0 - data[mapping.prediction]
+        predictions = pd.Series(np.where(pos_preds >= threshold, 0, 1), index=pos_preds.index, name=pos_preds.name)
         prediction_probas = pd.DataFrame.from_dict(
             {
                 0: pos_preds,
-                1: pos_preds.apply(lambda x: 1.0 - x),
+                1: 1.0 - pos_preds,
             }
         )
         return PredictionData(predictions=predictions, prediction_probas=prediction_probas)
@@ -500,7 +746,7 @@ def get_prediction_data(data: pd.DataFrame, mapping: ColumnMapping, threshold: f
         prediction_probas = pd.DataFrame.from_dict(
             {
                 1: data[mapping.prediction],
-                0: data[mapping.prediction].apply(lambda x: 1.0 - x),
+                0: 1.0 - data[mapping.prediction],
             }
         )
         return PredictionData(predictions=predictions, prediction_probas=prediction_probas)
@@ -510,21 +756,12 @@ def get_prediction_data(data: pd.DataFrame, mapping: ColumnMapping, threshold: f
 
 
 def _collect_plot_data(prediction_probas: pd.DataFrame):
+    # percentiles of all columns at once, a row for each percentile
+    percentiles = np.percentile(prediction_probas.to_numpy(dtype=float), [0, 25, 50, 75, 100], axis=0)
     res = {}
-    mins = []
-    lowers = []
-    means = []
-    uppers = []
-    maxs = []
-    for col in prediction_probas.columns:
-        mins.append(np.percentile(prediction_probas[col], 0))
-        lowers.append(np.percentile(prediction_probas[col], 25))
-        means.append(np.percentile(prediction_probas[col], 50))
-        uppers.append(np.percentile(prediction_probas[col], 75))
-        maxs.append(np.percentile(prediction_probas[col], 100))
-    res["mins"] = mins
-    res["lowers"] = lowers
-    res["means"] = means
-    res["uppers"] = uppers
-    res["maxs"] = maxs
+    res["mins"] = percentiles[0].tolist()
+    res["lowers"] = percentiles[1].tolist()
+    res["means"] = percentiles[2].tolist()
+    res["uppers"] = percentiles[3].tolist()
+    res["maxs"] = percentiles[4].tolist()
     return res
@@ -2,6 +2,7 @@ import dataclasses
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Union
 from dataclasses import dataclass
 
 import pandas as pd
@@ -10,7 +11,9 @@ from evidently.metrics.base_metric import InputData
 from evidently.metrics.base_metric import Metric
 from evidently.calculations.data_drift import get_overall_data_drift
 from evidently.calculations.data_drift import DataDriftAnalyzerMetrics
+from evidently.calculations.reference_profile import ReferenceProfile
 from evidently.metrics.utils import make_hist_for_num_plot
+from evidently.metrics.utils import make_hist_for_num_plot_by_histogram
 from evidently.metrics.utils import make_hist_for_cat_plot
 from evidently.model.widget import BaseWidgetInfo
 from evidently.renderers.base_renderer import default_renderer
@@ -18,7 +21,6 @@ from evidently.renderers.base_renderer import MetricHtmlInfo
 from evidently.renderers.base_renderer import MetricRenderer
 from evidently.options import DataDriftOptions
 from evidently.options import OptionsProvider
-from evidently.utils.data_operations import process_columns
 
 
 @dataclass
@@ -38,7 +40,7 @@ class DataDriftMetrics(Metric[DataDriftMetricsResults]):
         return tuple((self.options,))
 
     def calculate(self, data: InputData) -> DataDriftMetricsResults:
-        columns = process_columns(data.current_data, data.column_mapping)
+        columns = data.column_cache.get_columns()
         options_provider: OptionsProvider = OptionsProvider()
 
         if self.options is not None:
@@ -58,14 +60,31 @@ class DataDriftMetrics(Metric[DataDriftMetricsResults]):
         distr_for_plots = {}
 
         for feature in columns.num_feature_names:
-            distr_for_plots[feature] = make_hist_for_num_plot(data.current_data[feature], data.reference_data[feature])
+            if isinstance(data.reference_data, ReferenceProfile):
+                distr_for_plots[feature] = make_hist_for_num_plot(
+                    data.current_data[feature], _get_reference_column(data.reference_data, feature)
+                )
+
+            else:
+                distr_for_plots[feature] = make_hist_for_num_plot_by_histogram(
+                    data.column_cache.get_histogram(feature, "doane")
+                )
 
         for feature in columns.cat_feature_names:
-            distr_for_plots[feature] = make_hist_for_cat_plot(data.current_data[feature], data.reference_data[feature])
+            distr_for_plots[feature] = make_hist_for_cat_plot(
+                data.current_data[feature], _get_reference_column(data.reference_data, feature)
+            )
 
         return DataDriftMetricsResults(options=options, metrics=drift_metrics, distr_for_plots=distr_for_plots)
 
 
+def _get_reference_column(reference_data: Union[pd.DataFrame, ReferenceProfile], column_name: str) -> pd.Series:
+    if isinstance(reference_data, ReferenceProfile):
+        # non-null values are enough for plots
+        return reference_data[column_name].get_data("cat")
+    return reference_data[column_name]
+
+
 @default_renderer(wrap_type=DataDriftMetrics)
 class TestNumberOfDriftedFeaturesRenderer(MetricRenderer):
     def render_json(self, obj: DataDriftMetrics) -> dict:
@@ -1,17 +1,54 @@
 import re
 
 from dataclasses import dataclass
-from itertools import combinations
 from typing import Any
 from typing import Dict
+from typing import Iterator
 from typing import List
+from typing import Mapping
 from typing import Optional
+from typing import Tuple
 
 import numpy as np
 import pandas as pd
 
+from evidently.calculations.data_integrity import get_number_of_duplicates
 from evidently.metrics.base_metric import InputData
 from evidently.metrics.base_metric import Metric
+from evidently.utils.column_cache import ColumnCache
+
+
+class CountsOfValues(Mapping[str, pd.DataFrame]):
+    """Counts of values of columns (DataFrames with columns "x" and "count") calculated on the first request
+
+    The mapping is pickled and copied as a dict with counts of all columns.
+    """
+
+    def __init__(self, column_cache: ColumnCache, dataset_name: str, column_names: List[str]):
+        self._column_cache = column_cache
+        self._dataset_name = dataset_name
+        self._column_names = column_names
+        self._counts: Dict[str, pd.DataFrame] = {}
+
+    def __getitem__(self, column_name: str) -> pd.DataFrame:
+        if column_name not in self._counts:
+            if column_name not in self._column_names:
+                raise KeyError(column_name)
+
+            df_counts = self._column_cache.get_value_counts(self._dataset_name, column_name).reset_index()
+            df_counts.columns = ["x", "count"]
+            self._counts[column_name] = df_counts
+
+        return self._counts[column_name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._column_names)
+
+    def __len__(self) -> int:
+        return len(self._column_names)
+
+    def __reduce__(self):
+        return dict, (dict(self),)
 
 
 @dataclass
@@ -29,7 +66,7 @@ class DataIntegrityMetricsValues:
     columns_type: dict
     nans_by_columns: dict
     number_uniques_by_columns: dict
-    counts_of_values: dict
+    counts_of_values: Mapping[str, pd.DataFrame]
 
 
 @dataclass
@@ -40,28 +77,28 @@ class DataIntegrityMetricsResults:
 
 class DataIntegrityMetrics(Metric[DataIntegrityMetricsResults]):
     @staticmethod
-    def _get_integrity_metrics_values(dataset: pd.DataFrame, columns: tuple) -> DataIntegrityMetricsValues:
-        counts_of_values = {}
-        for col in dataset.columns:
-            feature = dataset[col]
-            df_counts = feature.value_counts(dropna=False).reset_index()
-            df_counts.columns = ["x", "count"]
-            counts_of_values[col] = df_counts
+    def _get_integrity_metrics_values(
+        dataset: pd.DataFrame, columns: tuple, column_cache: ColumnCache, dataset_name: str
+    ) -> DataIntegrityMetricsValues:
+        nunique = pd.Series(
+            [column_cache.get_nunique(dataset_name, col) for col in dataset.columns], index=dataset.columns, dtype=int
+        )
+        number_of_duplicated_rows, number_of_duplicated_columns = get_number_of_duplicates(dataset)
         return DataIntegrityMetricsValues(
             number_of_columns=len(columns),
             number_of_rows=dataset.shape[0],
             number_of_nans=dataset.isna().sum().sum(),
             number_of_columns_with_nans=dataset.isna().any().sum(),
             number_of_rows_with_nans=dataset.isna().any(axis=1).sum(),
-            number_of_constant_columns=len(dataset.columns[dataset.nunique() <= 1]),  # type: ignore
+            number_of_constant_columns=len(dataset.columns[nunique <= 1]),  # type: ignore
             number_of_empty_rows=dataset.isna().all(1).sum(),
             number_of_empty_columns=dataset.isna().all().sum(),
-            number_of_duplicated_rows=dataset.duplicated().sum(),
-            number_of_duplicated_columns=sum([1 for i, j in combinations(dataset, 2) if dataset[i].equals(dataset[j])]),
+            number_of_duplicated_rows=number_of_duplicated_rows,
+            number_of_duplicated_columns=number_of_duplicated_columns,
             columns_type=dict(dataset.dtypes.to_dict()),
             nans_by_columns=dataset.isna().sum().to_dict(),
-            number_uniques_by_columns=dict(dataset.nunique().to_dict()),
-            counts_of_values=counts_of_values,
+            number_uniques_by_columns=dict(nunique.to_dict()),
+            counts_of_values=CountsOfValues(column_cache, dataset_name, list(dataset.columns)),
         )
 
     def calculate(self, data: InputData) -> DataIntegrityMetricsResults:
@@ -96,13 +133,13 @@ class DataIntegrityMetrics(Metric[DataIntegrityMetricsResults]):
         current_columns = np.intersect1d(columns, data.current_data.columns)
 
         curr_data = data.current_data[current_columns]
-        current_stats = self._get_integrity_metrics_values(curr_data, current_columns)
+        current_stats = self._get_integrity_metrics_values(curr_data, current_columns, data.column_cache, "current")
 
         if data.reference_data is not None:
             reference_columns = np.intersect1d(columns, data.reference_data.columns)
             ref_data = data.reference_data[reference_columns]
             reference_stats: Optional[DataIntegrityMetricsValues] = self._get_integrity_metrics_values(
-                ref_data, reference_columns
+                ref_data, reference_columns, data.column_cache, "reference"
             )
 
         else:
@@ -130,36 +167,33 @@ class DataIntegrityValueByRegexpMetrics(Metric[DataIntegrityValueByRegexpMetricR
         self.column_name = column_name
         self.reg_exp_compiled = re.compile(reg_exp)
 
+    def _get_not_matched_values(self, column_cache: ColumnCache, dataset_name: str) -> Tuple[int, pd.DataFrame]:
+        """Number and counts of not-null values not matched the regexp.
+
+        Values are matched once per unique value, factorized values of the column are shared by all
+        regexp metrics of the column via the column cache.
+        """
+        codes, uniques = column_cache.get_factorized(dataset_name, self.column_name)
+        counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+        matched = pd.Series([str(value) for value in uniques], dtype=object).str.match(self.reg_exp)
+        not_matched = ~matched.to_numpy(dtype=bool)
+        df_counts = pd.DataFrame({"x": uniques[not_matched], "count": counts[not_matched]})
+        df_counts = df_counts.sort_values("count", ascending=False, kind="stable", ignore_index=True)
+        return int(counts[not_matched].sum()), df_counts
+
     def calculate(self, data: InputData) -> DataIntegrityValueByRegexpMetricResult:
         mult = None
         not_matched_values = {}
         not_matched_table = {}
-        selector = data.current_data[self.column_name].apply(lambda x: bool(self.reg_exp_compiled.match(str(x))))
-        n = selector.sum()
-        not_matched_values["current"] = data.current_data[self.column_name].dropna().shape[0] - n
-
-        df_counts = (
-            data.current_data[self.column_name]
-            .dropna()[~selector.dropna().astype(bool)]
-            .value_counts(dropna=False)
-            .reset_index()
+        not_matched_values["current"], not_matched_table["current"] = self._get_not_matched_values(
+            data.column_cache, "current"
         )
-        df_counts.columns = ["x", "count"]
-        not_matched_table["current"] = df_counts
 
         if data.reference_data is not None:
-            selector = data.reference_data[self.column_name].apply(lambda x: bool(self.reg_exp_compiled.match(str(x))))
-            n = selector.sum()
-            not_matched_values["reference"] = data.reference_data[self.column_name].dropna().shape[0] - n
-            mult = data.current_data.shape[0] / data.reference_data.shape[0]
-            df_counts = (
-                data.reference_data[self.column_name]
-                .dropna()[~selector.dropna().astype(bool)]
-                .value_counts(dropna=False)
-                .reset_index()
+            not_matched_values["reference"], not_matched_table["reference"] = self._get_not_matched_values(
+                data.column_cache, "reference"
             )
-            df_counts.columns = ["x", "count"]
-            not_matched_table["reference"] = df_counts
+            mult = data.current_data.shape[0] / data.reference_data.shape[0]
 
         return DataIntegrityValueByRegexpMetricResult(
             not_matched_values=not_matched_values,
@@ -237,66 +271,36 @@ class DataIntegrityNullValuesMetrics(Metric[DataIntegrityNullValuesMetricsResult
         # use frozenset because metrics parameters should be immutable/hashable for deduplication
         self.null_values = frozenset(null_values)
 
+    @staticmethod
+    def _get_null_values_mask(dataset: pd.DataFrame, null_value: Any) -> pd.DataFrame:
+        """Mask of values of one null kind, None means all pandas null-types like numpy.NAN, pandas.NA, pandas.NaT"""
+        if null_value is None:
+            return dataset.isnull()
+
+        # compare by equality, so numpy.NaN in the null values list does not match NaN values
+        return dataset == null_value
+
     def _calculate_null_values_stats(self, dataset: pd.DataFrame) -> DataIntegrityNullValues:
-        different_nulls = {null_value: 0 for null_value in self.null_values}
-        columns_with_nulls = set()
-        number_of_nulls = 0
-        number_of_nulls_by_column: Dict[str, int] = {}
-        different_nulls_by_column: Dict[str, Dict[Any, int]] = {}
-
-        for column_name in dataset.columns:
-            number_of_nulls_by_column[column_name] = 0
-            different_nulls_by_column[column_name] = {}
-
-            for null_value in self.null_values:
-                different_nulls_by_column[column_name][null_value] = 0
-
-        number_of_rows_with_nulls = 0
-        number_of_columns = len(dataset.columns)
-        number_of_rows = dataset.shape[0]
-
-        for column_name in dataset.columns:
-            # iterate by each value in custom null-values list and check the value in a column
-            for null_value in self.null_values:
-                if null_value is None:
-                    # check all pandas null-types like numpy.NAN, pandas.NA, pandas.NaT, etc
-                    column_null = dataset[column_name].isnull().sum()
-
-                else:
-                    column_null = (dataset[column_name] == null_value).sum()
-
-                if column_null > 0:
-                    # increase overall counter
-                    number_of_nulls += column_null
-                    # increase by-column counter
-                    number_of_nulls_by_column[column_name] += column_null
-                    # increase by-null-value counter for each column
-                    different_nulls_by_column[column_name][null_value] += column_null
-                    # increase by-null-value counter
-                    different_nulls[null_value] += column_null
-                    # add the column to set of columns with a null value
-                    columns_with_nulls.add(column_name)
-
-        for _, row in dataset.iterrows():
-            if None in self.null_values:
-                # check pandas null-values
-                if row.isnull().any():
-                    # if there is a null-value - just increase the counter and move to check the next row
-                    number_of_rows_with_nulls += 1
-                    continue
-
-            for null_value in self.null_values:
-                if null_value is None:
-                    # if there is a pandas null-value
-                    increase_counter = row.isnull().any()
-
-                else:
-                    # if there is another null value
-                    increase_counter = null_value in row
-
-                if increase_counter:
-                    number_of_rows_with_nulls += 1
-                    continue
+        number_of_rows, number_of_columns = dataset.shape
+        different_nulls: Dict[Any, int] = {}
+        number_of_nulls_by_column: Dict[str, int] = {column_name: 0 for column_name in dataset.columns}
+        different_nulls_by_column: Dict[str, Dict[Any, int]] = {column_name: {} for column_name in dataset.columns}
+        # a value can be of several null kinds, it is counted for every kind but the row is counted once
+        rows_with_nulls = np.zeros(number_of_rows, dtype=bool)
+
+        for null_value in self.null_values:
+            mask = self._get_null_values_mask(dataset, null_value)
+            counts_by_column = mask.sum(axis=0)
+            different_nulls[null_value] = int(counts_by_column.sum())
+            rows_with_nulls |= mask.to_numpy().any(axis=1)
+
+            for column_name, column_null in counts_by_column.items():
+                different_nulls_by_column[column_name][null_value] = int(column_null)
+                number_of_nulls_by_column[column_name] += int(column_null)
+
+        number_of_nulls = sum(different_nulls.values())
+        number_of_rows_with_nulls = int(rows_with_nulls.sum())
+        columns_with_nulls = {column_name for column_name, value in number_of_nulls_by_column.items() if value > 0}
 
         share_of_nulls_by_column = {
             column_name: value / number_of_rows for column_name, value in number_of_nulls_by_column.items()
@@ -12,11 +12,12 @@ from evidently import TaskType
 from evidently.calculations.data_quality import calculate_correlations
 from evidently.calculations.data_quality import calculate_data_quality_stats
 from evidently.calculations.data_quality import DataQualityStats
+from evidently.calculations.data_quality import sample_for_correlations
 from evidently.metrics.base_metric import InputData
 from evidently.metrics.base_metric import Metric
-from evidently.metrics.utils import make_hist_for_num_plot
+from evidently.metrics.utils import make_hist_for_num_plot_by_histogram
 from evidently.metrics.utils import make_hist_for_cat_plot
-from evidently.utils.data_operations import process_columns
+from evidently.options import DataQualityOptions
 from evidently.utils.data_operations import recognize_task
 
 
@@ -30,11 +31,16 @@ class DataQualityMetricsResults:
 
 
 class DataQualityMetrics(Metric[DataQualityMetricsResults]):
+    options: Optional[DataQualityOptions]
+
+    def __init__(self, options: Optional[DataQualityOptions] = None) -> None:
+        self.options = options
+
     def calculate(self, data: InputData) -> DataQualityMetricsResults:
         if data.current_data is None:
             raise ValueError("Current dataset should be present")
 
-        columns = process_columns(data.current_data, data.column_mapping)
+        columns = data.column_cache.get_columns()
         target_name = columns.utility_columns.target
 
         if data.column_mapping.task is None:
@@ -54,11 +60,17 @@ class DataQualityMetrics(Metric[DataQualityMetricsResults]):
             task = data.column_mapping.task
 
         current_features_stats = calculate_data_quality_stats(data.current_data, columns, task)
-        current_correlations = calculate_correlations(data.current_data, current_features_stats, target_name)
+        current_correlations = calculate_correlations(
+            data.current_data, current_features_stats, target_name, self.options
+        )
         reference_features_stats = None
 
         if data.reference_data is not None:
-            reference_features_stats = calculate_data_quality_stats(data.reference_data, columns, task)
+            reference_features_stats = data.column_cache.get_reference_state(
+                "data_quality_stats",
+                (columns, task),
+                lambda: calculate_data_quality_stats(data.reference_data, columns, task),
+            )
 
         # data for visualisation
         if data.reference_data is not None:
@@ -88,22 +100,19 @@ class DataQualityMetrics(Metric[DataQualityMetricsResults]):
 
         for feature in num_columns:
             counts_of_value_feature = {}
-            curr_feature = data.current_data[feature]
-            current_counts = data.current_data[feature].value_counts(dropna=False).reset_index()
+            current_counts = data.column_cache.get_value_counts("current", feature).reset_index()
             current_counts.columns = ["x", "count"]
             counts_of_value_feature["current"] = current_counts
 
-            ref_feature = None
-
             if reference_data is not None:
-                ref_feature = reference_data[feature]
-
-                reference_counts = ref_feature.value_counts(dropna=False).reset_index()
+                reference_counts = data.column_cache.get_value_counts("reference", feature).reset_index()
                 reference_counts.columns = ["x", "count"]
                 counts_of_value_feature["reference"] = reference_counts
 
             counts_of_values[feature] = counts_of_value_feature
-            distr_for_plots[feature] = make_hist_for_num_plot(curr_feature, ref_feature)
+            distr_for_plots[feature] = make_hist_for_num_plot_by_histogram(
+                data.column_cache.get_histogram(feature, "doane")
+            )
 
         for feature in cat_columns:
             curr_feature = data.current_data[feature]
@@ -181,12 +190,12 @@ class DataQualityValueListMetrics(Metric[DataQualityValueListMetricsResults]):
         values_in_list = data.current_data[self.column].isin(self.values).sum()
         number_not_in_list = rows_count - values_in_list
         counts_of_value = {}
-        current_counts = data.current_data[self.column].value_counts(dropna=False).reset_index()
+        current_counts = data.column_cache.get_value_counts("current", self.column).reset_index()
         current_counts.columns = ["x", "count"]
         counts_of_value["current"] = current_counts
 
         if data.reference_data is not None and self.values is not None:
-            reference_counts = data.reference_data[self.column].value_counts(dropna=False).reset_index()
+            reference_counts = data.column_cache.get_value_counts("reference", self.column).reset_index()
             reference_counts.columns = ["x", "count"]
             counts_of_value["reference"] = reference_counts
 
@@ -241,27 +250,19 @@ class DataQualityValueRangeMetrics(Metric[DataQualityValueRangeMetricsResults]):
         if self.right is None and data.reference_data is not None:
             self.right = ref_max
 
-        rows_count = data.current_data[self.column].dropna().shape[0]
+        current_not_null_values = data.column_cache.get_not_null_values("current", self.column)
+        rows_count = current_not_null_values.shape[0]
 
         if self.left is None or self.right is None:
             raise ValueError("Cannot define one or both of range parameters")
 
-        number_in_range = (
-            data.current_data[self.column]
-            .dropna()
-            .between(left=float(self.left), right=float(self.right), inclusive="both")
-            .sum()
-        )
+        number_in_range = current_not_null_values.between(
+            left=float(self.left), right=float(self.right), inclusive="both"
+        ).sum()
         number_not_in_range = rows_count - number_in_range
 
         # visualisation
-        curr_feature = data.current_data[self.column]
-
-        ref_feature = None
-        if data.reference_data is not None:
-            ref_feature = data.reference_data[self.column]
-
-        distr_for_plot = make_hist_for_num_plot(curr_feature, ref_feature)
+        distr_for_plot = make_hist_for_num_plot_by_histogram(data.column_cache.get_histogram(self.column, "doane"))
 
         return DataQualityValueRangeMetricsResults(
             number_in_range=number_in_range,
@@ -301,16 +302,11 @@ class DataQualityValueQuantileMetrics(Metric[DataQualityValueQuantileMetricsResu
 
     def calculate(self, data: InputData) -> DataQualityValueQuantileMetricsResults:
         # visualisation
-
-        curr_feature = data.current_data[self.column]
-
-        ref_feature = None
         ref_value = None
         if data.reference_data is not None:
-            ref_feature = data.reference_data[self.column]
             ref_value = data.reference_data[self.column].quantile(self.quantile)
 
-        distr_for_plot = make_hist_for_num_plot(curr_feature, ref_feature)
+        distr_for_plot = make_hist_for_num_plot_by_histogram(data.column_cache.get_histogram(self.column, "doane"))
         return DataQualityValueQuantileMetricsResults(
             value=data.current_data[self.column].quantile(self.quantile),
             quantile=self.quantile,
@@ -340,9 +336,11 @@ class DataQualityCorrelationMetrics(Metric[DataQualityCorrelationMetricsResults]
     """Calculate different correlations with target, predictions and features"""
 
     method: str
+    options: Optional[DataQualityOptions]
 
-    def __init__(self, method: str = "pearson") -> None:
+    def __init__(self, method: str = "pearson", options: Optional[DataQualityOptions] = None) -> None:
         self.method = method
+        self.options = options
 
     def _get_correlations(
         self,
@@ -352,7 +350,7 @@ class DataQualityCorrelationMetrics(Metric[DataQualityCorrelationMetricsResults]
         num_features: Optional[List[str]],
         is_classification_task: bool,
     ) -> DataCorrelation:
-        correlation_matrix = dataset.corr(method=self.method)
+        correlation_matrix = sample_for_correlations(dataset, self.options).corr(method=self.method)
         correlation_matrix_for_plot = correlation_matrix.copy()
         # fill diagonal with 1 values for getting abs max values
         np.fill_diagonal(correlation_matrix.values, 0)
@@ -413,12 +411,16 @@ class DataQualityCorrelationMetrics(Metric[DataQualityCorrelationMetricsResults]
         )
 
         if data.reference_data is not None:
-            reference_correlation: Optional[DataCorrelation] = self._get_correlations(
-                dataset=data.reference_data,
-                target_name=target_name,
-                prediction_name=prediction_name,
-                num_features=num_features,
-                is_classification_task=is_classification_task,
+            reference_correlation: Optional[DataCorrelation] = data.column_cache.get_reference_state(
+                "data_quality_correlations",
+                (self.method, self.options),
+                lambda: self._get_correlations(
+                    dataset=data.reference_data,
+                    target_name=target_name,
+                    prediction_name=prediction_name,
+                    num_features=num_features,
+                    is_classification_task=is_classification_task,
+                ),
             )
 
         else:
@@ -10,7 +10,6 @@ from sklearn.metrics import mean_absolute_percentage_error
 from sklearn.metrics import mean_squared_error
 from sklearn.metrics import r2_score
 
-from evidently.utils.data_operations import process_columns
 from evidently.metrics.base_metric import InputData
 from evidently.metrics.base_metric import Metric
 from evidently.calculations.regression_performance import calculate_regression_performance
@@ -18,6 +17,7 @@ from evidently.metrics.utils import make_target_bins_for_reg_plots
 from evidently.metrics.utils import make_hist_for_cat_plot
 from evidently.metrics.utils import apply_func_to_binned_data
 from evidently.metrics.utils import make_hist_for_num_plot
+from evidently.utils.data_operations import select_finite_rows
 
 
 @dataclass
@@ -54,18 +54,30 @@ class RegressionPerformanceMetrics(Metric[RegressionPerformanceMetricsResults]):
         return ()
 
     def calculate(self, data: InputData) -> RegressionPerformanceMetricsResults:
-        columns = process_columns(data.current_data, data.column_mapping)
+        columns = data.column_cache.get_columns()
 
         if data.current_data is None:
             raise ValueError("current dataset should be present")
 
+        target_and_prediction = [columns.utility_columns.target, columns.utility_columns.prediction]
+
+        if None in target_and_prediction:
+            raise ValueError("Target and prediction should be present")
+
+        # rows without target or prediction are skipped, the input data is not changed
+        current_data = select_finite_rows(data.current_data, target_and_prediction, target_and_prediction)
+        reference_data = None
+
+        if data.reference_data is not None:
+            reference_data = select_finite_rows(data.reference_data, target_and_prediction, target_and_prediction)
+
         current_metrics = calculate_regression_performance(
             dataset=data.current_data, columns=columns, error_bias_prefix="current_"
         )
         error_bias = current_metrics.error_bias
         reference_metrics = None
 
-        if data.reference_data is not None:
+        if reference_data is not None:
             reference_metrics = calculate_regression_performance(
                 dataset=data.reference_data, columns=columns, error_bias_prefix="ref_"
             )
@@ -79,33 +91,33 @@ class RegressionPerformanceMetrics(Metric[RegressionPerformanceMetricsResults]):
                         error_bias[feature_name] = current_bias
 
         r2_score_value = r2_score(
-            y_true=data.current_data[data.column_mapping.target],
-            y_pred=data.current_data[data.column_mapping.prediction],
+            y_true=current_data[data.column_mapping.target],
+            y_pred=current_data[data.column_mapping.prediction],
         )
         rmse_score_value = mean_squared_error(
-            y_true=data.current_data[data.column_mapping.target],
-            y_pred=data.current_data[data.column_mapping.prediction],
+            y_true=current_data[data.column_mapping.target],
+            y_pred=current_data[data.column_mapping.prediction],
         )
 
         # mae default values
-        dummy_preds = data.current_data[data.column_mapping.target].median()
+        dummy_preds = current_data[data.column_mapping.target].median()
         mean_abs_error_default = mean_absolute_error(
-            y_true=data.current_data[data.column_mapping.target], y_pred=[dummy_preds] * data.current_data.shape[0]
+            y_true=current_data[data.column_mapping.target], y_pred=[dummy_preds] * current_data.shape[0]
         )
         # rmse default values
         rmse_ref = None
-        if data.reference_data is not None:
+        if reference_data is not None:
             rmse_ref = mean_squared_error(
-                y_true=data.reference_data[data.column_mapping.target],
-                y_pred=data.reference_data[data.column_mapping.prediction],
+                y_true=reference_data[data.column_mapping.target],
+                y_pred=reference_data[data.column_mapping.prediction],
             )
-        dummy_preds = data.current_data[data.column_mapping.target].mean()
+        dummy_preds = current_data[data.column_mapping.target].mean()
         rmse_default = mean_squared_error(
-            y_true=data.current_data[data.column_mapping.target], y_pred=[dummy_preds] * data.current_data.shape[0]
+            y_true=current_data[data.column_mapping.target], y_pred=[dummy_preds] * current_data.shape[0]
         )
         # mape default values
         # optimal constant for mape
-        s = data.current_data[data.column_mapping.target]
+        s = current_data[data.column_mapping.target]
         inv_y = 1 / s[s != 0].values
         w = inv_y / sum(inv_y)
         idxs = np.argsort(w)
@@ -117,16 +129,16 @@ class RegressionPerformanceMetrics(Metric[RegressionPerformanceMetricsResults]):
 
         mean_abs_perc_error_default = (
             mean_absolute_percentage_error(
-                y_true=data.current_data[data.column_mapping.target], y_pred=[dummy_preds] * data.current_data.shape[0]
+                y_true=current_data[data.column_mapping.target], y_pred=[dummy_preds] * current_data.shape[0]
             )
             * 100
         )
         #  r2_score default values
         r2_score_ref = None
-        if data.reference_data is not None:
+        if reference_data is not None:
             r2_score_ref = r2_score(
-                y_true=data.reference_data[data.column_mapping.target],
-                y_pred=data.reference_data[data.column_mapping.prediction],
+                y_true=reference_data[data.column_mapping.target],
+                y_pred=reference_data[data.column_mapping.prediction],
             )
         # max error default values
         abs_error_max_ref = None
@@ -134,8 +146,8 @@ class RegressionPerformanceMetrics(Metric[RegressionPerformanceMetricsResults]):
         if reference_metrics is not None:
             abs_error_max_ref = reference_metrics.abs_error_max
 
-        y_true = data.current_data[data.column_mapping.target]
-        y_pred = data.current_data[data.column_mapping.prediction]
+        y_true = current_data[data.column_mapping.target]
+        y_pred = current_data[data.column_mapping.prediction]
         abs_error_max_default = np.abs(y_true - y_true.median()).max()
 
         #  me default values
@@ -144,17 +156,17 @@ class RegressionPerformanceMetrics(Metric[RegressionPerformanceMetricsResults]):
         # visualisation
 
         df_target_binned = make_target_bins_for_reg_plots(
-            data.current_data, data.column_mapping.target, data.column_mapping.prediction, data.reference_data
+            current_data, data.column_mapping.target, data.column_mapping.prediction, reference_data
         )
         curr_target_bins = df_target_binned.loc[df_target_binned.data == "curr", "target_binned"]
         ref_target_bins = None
-        if data.reference_data is not None:
+        if reference_data is not None:
             ref_target_bins = df_target_binned.loc[df_target_binned.data == "ref", "target_binned"]
         hist_for_plot = make_hist_for_cat_plot(curr_target_bins, ref_target_bins)
 
         vals_for_plots = {}
 
-        if data.reference_data is not None:
+        if reference_data is not None:
             is_ref_data = True
 
         else:
@@ -169,12 +181,12 @@ class RegressionPerformanceMetrics(Metric[RegressionPerformanceMetricsResults]):
             )
 
         # me plot
-        err_curr = data.current_data[data.column_mapping.prediction] - data.current_data[data.column_mapping.target]
+        err_curr = current_data[data.column_mapping.prediction] - current_data[data.column_mapping.target]
         err_ref = None
 
         if is_ref_data:
             err_ref = (
-                data.reference_data[data.column_mapping.prediction] - data.reference_data[data.column_mapping.target]
+                reference_data[data.column_mapping.prediction] - reference_data[data.column_mapping.target]
             )
         me_hist_for_plot = make_hist_for_num_plot(err_curr, err_ref)
 
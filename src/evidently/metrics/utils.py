@@ -1,7 +1,11 @@
+from typing import Dict
 from typing import Tuple
 import numpy as np
 import pandas as pd
 
+from evidently.calculations.histogram import Histogram
+from evidently.calculations.histogram import get_histogram
+
 
 def make_hist_df(hist: Tuple[np.array, np.array]) -> pd.DataFrame:
     hist_df = pd.DataFrame(
@@ -15,16 +19,20 @@ def make_hist_df(hist: Tuple[np.array, np.array]) -> pd.DataFrame:
 
 
 def make_hist_for_num_plot(curr: pd.Series, ref: pd.Series = None):
-    result = {}
+    datasets = {"current": _get_not_null_values(curr)}
     if ref is not None:
-        ref = ref.dropna()
-    bins = np.histogram_bin_edges(pd.concat([curr.dropna(), ref]), bins="doane")
-    curr_hist = np.histogram(curr, bins=bins)
-    result["current"] = make_hist_df(curr_hist)
-    if ref is not None:
-        ref_hist = np.histogram(ref, bins=bins)
-        result["reference"] = make_hist_df(ref_hist)
-    return result
+        datasets["reference"] = _get_not_null_values(ref)
+    return make_hist_for_num_plot_by_histogram(get_histogram(datasets, "doane"))
+
+
+def make_hist_for_num_plot_by_histogram(histogram: Histogram) -> Dict[str, pd.DataFrame]:
+    """Data for make_hist_for_num_plot from precalculated histogram, for example, from the column cache"""
+    return {dataset: make_hist_df((counts, histogram.edges)) for dataset, counts in histogram.counts.items()}
+
+
+def _get_not_null_values(data: pd.Series) -> np.ndarray:
+    values = data.to_numpy(dtype=float, na_value=np.nan)
+    return values[~np.isnan(values)]
 
 
 def make_hist_for_cat_plot(curr: pd.Series, ref: pd.Series = None):
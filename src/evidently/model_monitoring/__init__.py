@@ -6,3 +6,4 @@ from .monitors.data_quality import DataQualityMonitor
 from .monitors.regression_performance import RegressionPerformanceMonitor
 from .monitors.classification_performance import ClassificationPerformanceMonitor
 from .monitors.prob_classification_performance import ProbClassificationPerformanceMonitor
+from .streaming import StreamingModelMonitoring
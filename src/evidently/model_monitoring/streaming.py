@@ -0,0 +1,102 @@
+from typing import Dict
+from typing import Generator
+from typing import Optional
+from typing import Sequence
+
+import pandas as pd
+
+from evidently.analyzers.data_drift_analyzer import DataDriftAnalyzer
+from evidently.analyzers.data_quality_analyzer import DataQualityAnalyzer
+from evidently.analyzers.data_quality_analyzer import DataQualityAnalyzerResults
+from evidently.analyzers.streaming import ColumnsStats
+from evidently.calculations.data_quality import DataQualityStats
+from evidently.calculations.data_quality import calculate_correlations
+from evidently.calculations.data_quality import calculate_data_quality_stats
+from evidently.calculations.streaming import RingBuffer
+from evidently.model_monitoring.monitoring import MetricsType
+from evidently.model_monitoring.monitoring import ModelMonitor
+from evidently.model_monitoring.monitoring import ModelMonitoring
+from evidently.model_monitoring.monitors.data_drift import DataDriftMonitor
+from evidently.model_monitoring.monitors.data_quality import DataQualityMonitor
+from evidently.options import DataDriftOptions
+from evidently.options import DataQualityOptions
+from evidently.pipeline.column_mapping import ColumnMapping
+
+STREAMING_MONITORS = (DataDriftMonitor, DataQualityMonitor)
+
+
+class StreamingModelMonitoring(ModelMonitoring):
+    """Model monitoring of a sliding window of current data that is updated with new rows.
+
+    `update` adds rows to the window of the last `window_size` rows and updates statistics of the window
+    with added and removed rows only, `metrics` returns the same metrics as ModelMonitoring
+    with the window as current data.
+
+    Only DataDriftMonitor and DataQualityMonitor are supported. Drift of numerical features
+    is calculated with `n_bins` equal-sized bins of reference data, so it is approximate,
+    see `calculate_drift_by_counts` for details. Percentiles of numerical features are approximate too.
+    Correlations of current data are not calculated.
+    """
+
+    def __init__(
+        self,
+        monitors: Sequence[ModelMonitor],
+        reference_data: pd.DataFrame,
+        column_mapping: Optional[ColumnMapping] = None,
+        window_size: int = 1000,
+        n_bins: int = 100,
+        options: Optional[list] = None,
+    ):
+        super().__init__(monitors, options)
+
+        for monitor in self.monitors:
+            if not isinstance(monitor, STREAMING_MONITORS):
+                raise ValueError(f"{type(monitor).__name__} does not support streaming calculations")
+
+        self.stats = ColumnsStats(reference_data, column_mapping, n_bins)
+        self.stats.add_reference(reference_data)
+        self.buffers: Dict[str, RingBuffer] = {
+            column_name: RingBuffer(window_size, float if self.stats.is_numeric(column_name) else object)
+            for column_name in self.stats.get_column_names()
+        }
+        self.reference_features_stats: Optional[DataQualityStats] = None
+        self.reference_correlations: Dict[str, pd.DataFrame] = {}
+
+        if any(isinstance(monitor, DataQualityMonitor) for monitor in self.monitors):
+            # reference data does not change, calculate its stats once
+            self.reference_features_stats = calculate_data_quality_stats(
+                reference_data, self.stats.columns, self.stats.task
+            )
+            self.reference_correlations = calculate_correlations(
+                reference_data,
+                self.reference_features_stats,
+                self.stats.columns.utility_columns.target,
+                self.options_provider.get(DataQualityOptions),
+            )
+
+    def update(self, new_rows: pd.DataFrame) -> None:
+        """Add new rows to the window of current data"""
+        for column_name, buffer in self.buffers.items():
+            values = self.stats.get_values(new_rows, column_name)
+            evicted = buffer.push(values)
+            current_stats = self.stats.current_stats[column_name]
+            # add values before removing them, extremums expect this order when a batch is bigger than the window
+            current_stats.add(values)
+            current_stats.remove(evicted)
+
+    def metrics(self) -> Generator[MetricsType, None, None]:
+        if DataDriftAnalyzer in self.get_analyzers():
+            self.analyzers_results[DataDriftAnalyzer] = self.stats.calculate_data_drift(
+                self.options_provider.get(DataDriftOptions)
+            )
+
+        if DataQualityAnalyzer in self.get_analyzers():
+            self.analyzers_results[DataQualityAnalyzer] = DataQualityAnalyzerResults(
+                columns=self.stats.columns,
+                reference_features_stats=self.reference_features_stats,
+                reference_correlations=self.reference_correlations,
+                current_features_stats=self.stats.get_current_features_stats(),
+                current_correlations={},
+            )
+
+        return super().metrics()
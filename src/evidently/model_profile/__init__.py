@@ -2,3 +2,4 @@
 # coding: utf-8
 
 from .model_profile import Profile
+from .chunked import ChunkedProfile
@@ -0,0 +1,128 @@
+"""Profile of data that is read in chunks, for datasets that do not fit in memory"""
+
+from typing import Iterable
+from typing import Optional
+from typing import Sequence
+
+import pandas as pd
+
+from evidently.analyzers.data_drift_analyzer import DataDriftAnalyzer
+from evidently.analyzers.data_quality_analyzer import DataQualityAnalyzer
+from evidently.analyzers.data_quality_analyzer import DataQualityAnalyzerResults
+from evidently.analyzers.streaming import ColumnsStats
+from evidently.calculations.data_quality import calculate_correlations
+from evidently.calculations.streaming import RowReservoir
+from evidently.model_profile.model_profile import Profile
+from evidently.model_profile.sections.base_profile_section import ProfileSection
+from evidently.model_profile.sections.data_drift_profile_section import DataDriftProfileSection
+from evidently.model_profile.sections.data_quality_profile_section import DataQualityProfileSection
+from evidently.options import DataDriftOptions
+from evidently.options import DataQualityOptions
+from evidently.pipeline.column_mapping import ColumnMapping
+
+CHUNKED_SECTIONS = (DataDriftProfileSection, DataQualityProfileSection)
+DEFAULT_CORRELATION_SAMPLE_SIZE = 100000
+
+
+class ChunkedProfile(Profile):
+    """Profile of reference and current data that are iterables of chunks (DataFrames with the same columns).
+
+    Every chunk updates mergeable statistics of columns and is not kept, results are finalized after the last chunk.
+    Numerical columns keep bounded-size sketches of `sketch_size` values (see `ColumnWindowStats`),
+    so memory does not depend on the number of rows, only categorical columns keep exact counts of all values.
+
+    Only DataDriftProfileSection and DataQualityProfileSection are supported. Differences from Profile results:
+    - columns and the task are defined by the first reference chunk;
+    - numerical columns get `n_bins` equal-sized bins of all reference chunks, bins are defined
+      by counts of values after the last reference chunk;
+    - drift of numerical features is calculated with counts in the bins: KS statistic at bin edges only,
+      wasserstein distance with CDFs interpolated inside bins, see `calculate_drift_by_counts`;
+    - stats of numerical features with not more than `sketch_size` distinct values are exact,
+      otherwise percentiles, the number of unique values and counts of the most common value are approximate;
+    - correlations (Kendall too) are calculated with a uniform random sample of rows of each dataset,
+      of `DataQualityOptions.correlation_sample_size` rows (DEFAULT_CORRELATION_SAMPLE_SIZE by default).
+    """
+
+    def __init__(
+        self,
+        sections: Sequence[ProfileSection],
+        options: Optional[list] = None,
+        n_bins: int = 100,
+        sketch_size: int = 10000,
+    ) -> None:
+        super().__init__(sections, options)
+
+        for section in self.stages:
+            if not isinstance(section, CHUNKED_SECTIONS):
+                raise ValueError(f"{type(section).__name__} does not support chunked calculations")
+
+        self.n_bins = n_bins
+        self.sketch_size = sketch_size
+
+    def calculate(  # type: ignore
+        self,
+        reference_data: Iterable[pd.DataFrame],
+        current_data: Optional[Iterable[pd.DataFrame]] = None,
+        column_mapping: Optional[ColumnMapping] = None,
+    ) -> None:
+        if column_mapping is None:
+            column_mapping = ColumnMapping()
+
+        quality_options = self.options_provider.get(DataQualityOptions)
+        sample_size = quality_options.get_correlation_sample_size() or DEFAULT_CORRELATION_SAMPLE_SIZE
+        reference_sample = RowReservoir(sample_size, quality_options.correlation_random_state)
+        current_sample = RowReservoir(sample_size, quality_options.correlation_random_state)
+        stats: Optional[ColumnsStats] = None
+
+        for chunk in reference_data:
+            if stats is None:
+                stats = ColumnsStats(
+                    chunk, column_mapping, self.n_bins, reference_extremums=True, sketch_size=self.sketch_size
+                )
+            stats.add_reference(chunk)
+            reference_sample.add(chunk[stats.get_column_names()])
+
+        if stats is None or reference_sample.sample is None:
+            raise ValueError("reference_data should have at least one chunk")
+
+        # bins of the first chunk do not fit later chunks of ordered data
+        stats.set_reference_bin_edges()
+
+        if current_data is not None:
+            for chunk in current_data:
+                stats.add_current(chunk)
+                current_sample.add(chunk[stats.get_column_names()])
+
+            if current_sample.sample is None:
+                raise ValueError("current_data should have at least one chunk")
+
+        if DataDriftAnalyzer in self.get_analyzers():
+            if current_sample.sample is None:
+                raise ValueError("current_data should be present")
+
+            self.analyzers_results[DataDriftAnalyzer] = stats.calculate_data_drift(
+                self.options_provider.get(DataDriftOptions)
+            )
+
+        if DataQualityAnalyzer in self.get_analyzers():
+            target_name = stats.columns.utility_columns.target
+            reference_features_stats = stats.get_features_stats(stats.reference_stats, exact_percentiles=True)
+            results = DataQualityAnalyzerResults(
+                columns=stats.columns,
+                reference_features_stats=reference_features_stats,
+                reference_correlations=calculate_correlations(
+                    reference_sample.sample, reference_features_stats, target_name, quality_options
+                ),
+            )
+
+            if current_sample.sample is not None:
+                results.current_features_stats = stats.get_current_features_stats(exact_percentiles=True)
+                results.current_correlations = calculate_correlations(
+                    current_sample.sample, results.current_features_stats, target_name, quality_options
+                )
+
+            self.analyzers_results[DataQualityAnalyzer] = results
+
+        for stage in self.stages:
+            stage.options_provider = self.options_provider
+            stage.calculate(None, None, column_mapping, self.analyzers_results)
@@ -8,6 +8,7 @@ from .color_scheme import (
     NIGHTOWL_COLOR_OPTIONS,
 )
 from .data_drift import DataDriftOptions
+from .data_quality import DataQualityOptions
 from .quality_metrics import QualityMetricsOptions
 
 TypeParam = TypeVar("TypeParam")
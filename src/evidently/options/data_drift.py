@@ -1,3 +1,4 @@
+import os
 import warnings
 from dataclasses import dataclass
 from typing import Dict
@@ -9,6 +10,7 @@ from evidently.calculations.stattests import StatTest
 
 
 DEFAULT_NBINSX = 10
+DRIFT_EXECUTORS = ("serial", "thread", "process")
 
 
 @dataclass
@@ -39,6 +41,11 @@ class DataDriftOptions:
                               per feature.
         cat_target_stattest_func: Defines a custom statistical test to detect target drift in CatTargetDrift.
         num_target_stattest_func: Defines a custom statistical test to detect target drift in NumTargetDrift.
+        executor: Defines how per-feature drift is calculated: "serial" (default), "thread" for a thread pool
+                  or "process" for a process pool. With "process" custom stattests should be picklable.
+        max_workers: Defines the number of workers for "thread" and "process" executors.
+                     Uses the number of CPUs if not set.
+        chunks_per_worker: Defines into how many chunks of features the work is split per worker.
     """
 
     confidence: Optional[Union[float, Dict[str, float]]] = None
@@ -60,6 +67,10 @@ class DataDriftOptions:
     cat_target_stattest_func: Optional[PossibleStatTestType] = None
     num_target_stattest_func: Optional[PossibleStatTestType] = None
 
+    executor: str = "serial"
+    max_workers: Optional[int] = None
+    chunks_per_worker: int = 1
+
     def as_dict(self):
         return {
             "confidence": self.confidence,
@@ -94,6 +105,20 @@ class DataDriftOptions:
             return self.nbinsx.get(feature_name, DEFAULT_NBINSX)
         raise ValueError(f"DataDriftOptions.nbinsx is incorrect type {type(self.nbinsx)}")
 
+    def get_executor(self) -> str:
+        if self.executor not in DRIFT_EXECUTORS:
+            raise ValueError(
+                f"DataDriftOptions.executor is incorrect: {self.executor}. Expected one of {list(DRIFT_EXECUTORS)}"
+            )
+        return self.executor
+
+    def get_max_workers(self) -> int:
+        if self.max_workers is None:
+            return os.cpu_count() or 1
+        if isinstance(self.max_workers, int) and self.max_workers > 0:
+            return self.max_workers
+        raise ValueError(f"DataDriftOptions.max_workers should be a positive int, got {self.max_workers}")
+
     def get_feature_stattest_func(self, feature_name: str, feature_type: str) -> Optional[PossibleStatTestType]:
         if self.feature_stattest_func is not None and any(
             [
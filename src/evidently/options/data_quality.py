@@ -0,0 +1,49 @@
+from dataclasses import dataclass
+from typing import List
+from typing import Optional
+
+CORRELATION_KINDS = ("pearson", "spearman", "kendall", "cramer_v")
+
+
+@dataclass
+class DataQualityOptions:
+    """Configuration for Data Quality calculations.
+
+    Attributes:
+        correlation_kinds: Defines which correlation matrices are calculated, all kinds by default.
+                           Matrices of other kinds are empty.
+        correlation_sample_size: Defines the maximum number of rows for correlation calculations.
+                                 Correlations of bigger datasets are calculated with a random sample of rows.
+        correlation_random_state: Defines the seed of the random sample of rows.
+    """
+
+    correlation_kinds: Optional[List[str]] = None
+    correlation_sample_size: Optional[int] = None
+    correlation_random_state: int = 0
+
+    def as_dict(self):
+        return {
+            "correlation_kinds": self.correlation_kinds,
+            "correlation_sample_size": self.correlation_sample_size,
+            "correlation_random_state": self.correlation_random_state,
+        }
+
+    def get_correlation_kinds(self) -> List[str]:
+        if self.correlation_kinds is None:
+            return list(CORRELATION_KINDS)
+        for kind in self.correlation_kinds:
+            if kind not in CORRELATION_KINDS:
+                raise ValueError(
+                    f"DataQualityOptions.correlation_kinds has incorrect kind: {kind}. "
+                    f"Expected one of {list(CORRELATION_KINDS)}"
+                )
+        return list(self.correlation_kinds)
+
+    def get_correlation_sample_size(self) -> Optional[int]:
+        if self.correlation_sample_size is None:
+            return None
+        if isinstance(self.correlation_sample_size, int) and self.correlation_sample_size > 0:
+            return self.correlation_sample_size
+        raise ValueError(
+            f"DataQualityOptions.correlation_sample_size should be a positive int, got {self.correlation_sample_size}"
+        )
@@ -1,9 +1,10 @@
 import itertools
-from typing import List, Dict, Type, Sequence, Optional
+from typing import List, Dict, Type, Sequence, Optional, Union
 
 import pandas
 
 from evidently.analyzers.base_analyzer import Analyzer
+from evidently.calculations.reference_profile import ReferenceProfile
 from evidently.options import OptionsProvider
 from evidently.pipeline.column_mapping import ColumnMapping
 from evidently.pipeline.stage import PipelineStage
@@ -28,24 +29,40 @@ class Pipeline:
 
     def execute(
         self,
-        reference_data: pandas.DataFrame,
+        reference_data: Union[pandas.DataFrame, ReferenceProfile],
         current_data: Optional[pandas.DataFrame] = None,
         column_mapping: Optional[ColumnMapping] = None,
     ) -> None:
         if column_mapping is None:
             column_mapping = ColumnMapping()
 
-        #  making shallow copy - this copy DOES NOT copy existing data, but contains link to it:
-        #  - this copy WILL DISCARD all columns changes or rows changes (adding or removing)
-        #  - this copy WILL KEEP all values' changes in existing rows and columns.
-        rdata = reference_data.copy()
-        cdata = None if current_data is None else current_data.copy()
         for analyzer in self.get_analyzers():
             instance = analyzer()
             instance.options_provider = self.options_provider
-            self.analyzers_results[analyzer] = instance.calculate(rdata, cdata, column_mapping)
+            self.analyzers_results[analyzer] = instance.calculate(
+                _get_view(reference_data), _get_view(current_data), column_mapping
+            )
         for stage in self.stages:
             stage.options_provider = self.options_provider
             stage.calculate(
-                rdata.copy(), None if cdata is None else cdata.copy(), column_mapping, self.analyzers_results
+                _get_view(reference_data),
+                _get_view(current_data),
+                column_mapping,
+                self.analyzers_results,
             )
+
+
+def _get_view(data: Union[pandas.DataFrame, ReferenceProfile, None]) -> Union[pandas.DataFrame, ReferenceProfile, None]:
+    """Shallow copy of the data for one analyzer or stage.
+
+    The copy DOES NOT copy existing data, but contains link to it:
+    - adding, removing or replacing columns of the copy WILL NOT change the data
+    - changing values in existing columns of the copy in place WILL change the data,
+      so analyzers and widgets select cleaned rows and columns into new frames instead.
+    Reference profile is never changed by analyzers and is passed as is,
+    only analyzers that support it (DataDriftAnalyzer) can be used with it.
+    """
+    if data is None or isinstance(data, ReferenceProfile):
+        return data
+
+    return data.copy(deep=False)
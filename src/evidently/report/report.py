@@ -7,6 +7,7 @@ from typing import Union
 import pandas as pd
 
 from evidently import ColumnMapping
+from evidently.calculations.reference_profile import ReferenceProfile
 from evidently.utils.data_operations import DatasetColumns
 from evidently.utils.data_operations import process_columns
 from evidently.metric_preset.metric_preset import MetricPreset
@@ -16,6 +17,7 @@ from evidently.model.dashboard import DashboardInfo
 from evidently.suite.base_suite import Display
 from evidently.suite.base_suite import Suite
 from evidently.suite.base_suite import find_metric_renderer
+from evidently.suite.result_cache import ResultCache
 
 
 class Report(Display):
@@ -23,11 +25,17 @@ class Report(Display):
     _columns_info: DatasetColumns
     metrics: List[Union[Metric, MetricPreset]]
 
-    def __init__(self, metrics: List[Union[Metric, MetricPreset]]):
+    def __init__(
+        self,
+        metrics: List[Union[Metric, MetricPreset]],
+        executor: str = "serial",
+        max_workers: Optional[int] = None,
+        result_cache: Optional[ResultCache] = None,
+    ):
         super().__init__()
         # just save all metrics and metric presets
         self.metrics = metrics
-        self._inner_suite = Suite()
+        self._inner_suite = Suite(executor=executor, max_workers=max_workers, result_cache=result_cache)
 
     def run(
             self,
@@ -36,6 +44,16 @@ class Report(Display):
             current_data: pd.DataFrame,
             column_mapping: Optional[ColumnMapping] = None,
     ) -> None:
+        # metrics need full frames for plots, chunks of data are supported by ChunkedProfile only
+        if not isinstance(current_data, pd.DataFrame):
+            raise ValueError("current_data should be a pandas DataFrame, Report does not support data in chunks")
+
+        if reference_data is not None and not isinstance(reference_data, (pd.DataFrame, ReferenceProfile)):
+            raise ValueError(
+                "reference_data should be a pandas DataFrame or a ReferenceProfile, "
+                "Report does not support data in chunks"
+            )
+
         if column_mapping is None:
             column_mapping = ColumnMapping()
 
@@ -1,9 +1,13 @@
 import dataclasses
 import random
-from typing import Callable, Union, Optional, List
+import os
+from typing import Callable, Dict, Hashable, Iterable, Iterator, Union, Optional, List, Sequence
 
+import numpy as np
 import pandas as pd
 
+from evidently.calculations.streaming import RowReservoir
+
 
 @dataclasses.dataclass
 class SamplingOptions:
@@ -11,6 +15,8 @@ class SamplingOptions:
     random_seed: int = 1
     ratio: float = 1.0
     n: int = 1
+    # column with strata for stratified sampling
+    column: Optional[str] = None
 
 
 @dataclasses.dataclass
@@ -21,12 +27,35 @@ class DataOptions:
     header: bool
     # should be list of names, or None if columns should be inferred from data
     column_names: Optional[List[str]]
+    # one of FILE_FORMATS, or None if the format should be inferred from the file extension
+    file_format: Optional[str]
 
-    def __init__(self, date_column: str = "datetime", separator=",", header=True, column_names=None):
+    def __init__(self, date_column: str = "datetime", separator=",", header=True, column_names=None, file_format=None):
         self.date_column = date_column
         self.header = header
         self.separator = separator
         self.column_names = column_names
+        self.file_format = file_format
+
+
+FILE_FORMATS = ("csv", "parquet", "feather", "arrow")
+
+_FILE_EXTENSIONS = {
+    ".parquet": "parquet",
+    ".pq": "parquet",
+    ".feather": "feather",
+    ".arrow": "arrow",
+    ".ipc": "arrow",
+}
+
+
+def get_file_format(filename: str, data_options: DataOptions) -> str:
+    """Format of the file from data options or from the file extension, files with unknown extensions are CSV"""
+    if data_options.file_format is not None:
+        if data_options.file_format not in FILE_FORMATS:
+            raise ValueError(f"Unexpected file format {data_options.file_format}, expected one of {FILE_FORMATS}")
+        return data_options.file_format
+    return _FILE_EXTENSIONS.get(os.path.splitext(filename)[1].lower(), "csv")
 
 
 def _skiprows(sampling_options: SamplingOptions) -> Union[Callable[[int], bool], None]:
@@ -58,18 +87,227 @@ class DataLoader:
     def __init__(self):
         pass
 
-    def load(self, filename: str, data_options: DataOptions, sampling_options: SamplingOptions = None):
+    def load(
+        self,
+        filename: str,
+        data_options: DataOptions,
+        sampling_options: SamplingOptions = None,
+        columns: Optional[Sequence[str]] = None,
+    ):
+        """Read the data, only `columns` that are present in the file if they are set.
+
+        Parquet, Feather and Arrow IPC files are memory-mapped, they require pyarrow.
+        """
         sampling_opts = SamplingOptions("none", 0, 0) if sampling_options is None else sampling_options
-        parse_dates = [data_options.date_column] if data_options.date_column else False
-        return pd.read_csv(
-            filename,
-            header=0 if data_options.header else None,
-            sep=data_options.separator,
-            skiprows=_skiprows(sampling_opts),
-            parse_dates=parse_dates,
+        if sampling_opts.type in CHUNK_SAMPLING_TYPES:
+            chunks = list(self.load_chunks(filename, data_options, sampling_opts, SAMPLING_CHUNK_SIZE, columns))
+            return pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame()
+        file_format = get_file_format(filename, data_options)
+        if file_format != "csv":
+            _check_no_sampling(sampling_opts, file_format)
+            if file_format == "parquet":
+                return _read_parquet(filename, columns)
+            return _read_arrow(filename, columns)
+        return pd.read_csv(filename, **_get_csv_arguments(data_options, sampling_opts, columns))
+
+    def load_chunks(
+        self,
+        filename: str,
+        data_options: DataOptions,
+        sampling_options: SamplingOptions = None,
+        chunk_size: int = 100000,
+        columns: Optional[Sequence[str]] = None,
+    ) -> Iterator[pd.DataFrame]:
+        """Read the data by chunks of `chunk_size` rows, only `columns` that are present in the file if they are set.
+
+        Parquet files are read by row groups, Feather and Arrow IPC files by record batches.
+        """
+        sampling_opts = SamplingOptions("none", 0, 0) if sampling_options is None else sampling_options
+        if chunk_size < 1:
+            raise ValueError(f"Chunk size should be a positive number, got {chunk_size}")
+        if sampling_opts.type in CHUNK_SAMPLING_TYPES:
+            if columns is not None and sampling_opts.column is not None:
+                columns = list(columns) + [sampling_opts.column]
+            chunks = self.load_chunks(filename, data_options, None, chunk_size, columns)
+            return sample_chunks(chunks, sampling_opts)
+        file_format = get_file_format(filename, data_options)
+        if file_format != "csv":
+            _check_no_sampling(sampling_opts, file_format)
+            if file_format == "parquet":
+                return _read_parquet_row_groups(filename, columns)
+            return _read_arrow_batches(filename, columns)
+        return _read_csv_chunks(
+            pd.read_csv(filename, chunksize=chunk_size, **_get_csv_arguments(data_options, sampling_opts, columns))
         )
 
 
+# sampling types that are applied to chunks of data in any format instead of skipping rows of CSV files
+CHUNK_SAMPLING_TYPES = ("bernoulli", "reservoir", "stratified")
+SAMPLING_CHUNK_SIZE = 100000
+
+
+def _check_chunk_sampling_options(sampling_options: SamplingOptions):
+    if sampling_options.type in ("bernoulli", "stratified") and not 0 < sampling_options.ratio <= 1:
+        raise ValueError(f"{sampling_options.type} sampling should have 'ratio' parameter in (0, 1]")
+    if sampling_options.type == "reservoir" and sampling_options.n < 1:
+        raise ValueError("reservoir sampling should have 'n' parameter >= 1")
+    if sampling_options.type == "stratified" and sampling_options.column is None:
+        raise ValueError("stratified sampling should have 'column' parameter")
+
+
+def sample_chunks(chunks: Iterable[pd.DataFrame], sampling_options: SamplingOptions) -> Iterator[pd.DataFrame]:
+    """Sample rows of chunks with one of CHUNK_SAMPLING_TYPES:
+    - bernoulli: every row is taken with probability `ratio`
+    - reservoir: uniform random sample of `n` rows in the order of the data, it is one chunk after all chunks are read
+    - stratified: `ratio` of rows of every stratum, rounded up or down randomly. Strata are values of `column`,
+      or dates of its values for datetime columns
+
+    Bernoulli and stratified samples do not depend on how the data is split into chunks.
+    """
+    _check_chunk_sampling_options(sampling_options)
+
+    if sampling_options.type == "bernoulli":
+        random_generator = np.random.default_rng(sampling_options.random_seed)
+        for chunk in chunks:
+            yield chunk[random_generator.random(len(chunk)) < sampling_options.ratio]
+
+    elif sampling_options.type == "reservoir":
+        reservoir = RowReservoir(sampling_options.n, sampling_options.random_seed)
+        for chunk in chunks:
+            reservoir.add(chunk)
+        if reservoir.sample is not None:
+            yield reservoir.sample.iloc[np.argsort(reservoir.row_numbers)].reset_index(drop=True)
+
+    elif sampling_options.type == "stratified":
+        sampler = _StratifiedSampler(sampling_options)
+        for chunk in chunks:
+            yield chunk[sampler.select(chunk)]
+
+    else:
+        raise ValueError(f"Unexpected chunk sampling type {sampling_options.type}")
+
+
+class _StratifiedSampler:
+    """Systematic sampling of every stratum with a random start, it takes rows where `position * ratio + offset`
+    (position of the row in its stratum) reaches the next integer"""
+
+    def __init__(self, sampling_options: SamplingOptions):
+        self.ratio = sampling_options.ratio
+        self.column = sampling_options.column
+        self.random_generator = np.random.default_rng(sampling_options.random_seed)
+        self.counts: Dict[Hashable, int] = {}
+        self.offsets: Dict[Hashable, float] = {}
+
+    def select(self, chunk: pd.DataFrame) -> np.ndarray:
+        if self.column not in chunk:
+            raise ValueError(f"Column {self.column} for stratified sampling is not present in the data")
+        values = chunk[self.column]
+        if pd.api.types.is_datetime64_any_dtype(values):
+            values = values.dt.normalize()
+        codes, uniques = pd.factorize(values)
+        # null values (code -1) are one more stratum
+        strata = list(uniques) + [None]
+        codes = np.where(codes < 0, len(uniques), codes)
+
+        for code in pd.unique(codes):
+            if strata[code] not in self.offsets:
+                self.offsets[strata[code]] = self.random_generator.random()
+
+        counts = np.array([self.counts.get(stratum, 0) for stratum in strata])
+        offsets = np.array([self.offsets.get(stratum, 0.0) for stratum in strata])
+        positions = counts[codes] + pd.Series(codes).groupby(codes).cumcount().to_numpy()
+        thresholds = positions * self.ratio + offsets[codes]
+        new_counts = counts + np.bincount(codes, minlength=len(strata))
+
+        for stratum, count in zip(strata, new_counts):
+            if count > 0:
+                self.counts[stratum] = int(count)
+
+        return np.floor(thresholds + self.ratio) > np.floor(thresholds)
+
+
+def _get_csv_arguments(data_options: DataOptions, sampling_options: SamplingOptions, columns: Optional[Sequence[str]]):
+    parse_dates = [data_options.date_column] if data_options.date_column else False
+    columns_set = None if columns is None else set(columns)
+    # a callable does not fail on columns that are not present in the file
+    usecols = None if columns_set is None else lambda name: name in columns_set
+    return dict(
+        header=0 if data_options.header else None,
+        names=data_options.column_names,
+        sep=data_options.separator,
+        skiprows=_skiprows(sampling_options),
+        parse_dates=parse_dates,
+        usecols=usecols,
+    )
+
+
+def _check_no_sampling(sampling_options: SamplingOptions, file_format: str):
+    if sampling_options.type != "none":
+        raise ValueError(
+            f"{sampling_options.type} sampling is not supported for {file_format} files, "
+            f"use one of {CHUNK_SAMPLING_TYPES}"
+        )
+
+
+def _read_csv_chunks(reader) -> Iterator[pd.DataFrame]:
+    try:
+        yield from reader
+    finally:
+        reader.close()
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.ipc  # noqa: F401
+        import pyarrow.parquet  # noqa: F401
+    except ImportError as err:
+        raise ImportError("Cannot import pyarrow, it is required to read Parquet, Feather and Arrow files") from err
+    return pyarrow
+
+
+def _get_present_columns(schema, columns: Optional[Sequence[str]]) -> Optional[List[str]]:
+    if columns is None:
+        return None
+    columns_set = set(columns)
+    return [name for name in schema.names if name in columns_set]
+
+
+def _read_parquet(filename: str, columns: Optional[Sequence[str]]) -> pd.DataFrame:
+    pyarrow = _import_pyarrow()
+    parquet_file = pyarrow.parquet.ParquetFile(filename, memory_map=True)
+    return parquet_file.read(columns=_get_present_columns(parquet_file.schema_arrow, columns)).to_pandas()
+
+
+def _read_parquet_row_groups(filename: str, columns: Optional[Sequence[str]]) -> Iterator[pd.DataFrame]:
+    pyarrow = _import_pyarrow()
+    parquet_file = pyarrow.parquet.ParquetFile(filename, memory_map=True)
+    present_columns = _get_present_columns(parquet_file.schema_arrow, columns)
+    for row_group in range(parquet_file.num_row_groups):
+        yield parquet_file.read_row_group(row_group, columns=present_columns).to_pandas()
+
+
+def _read_arrow(filename: str, columns: Optional[Sequence[str]]) -> pd.DataFrame:
+    """Feather (version 2) and Arrow IPC files have the same format"""
+    pyarrow = _import_pyarrow()
+    with pyarrow.memory_map(filename) as source:
+        reader = pyarrow.ipc.open_file(source)
+        table = reader.read_all()
+        present_columns = _get_present_columns(reader.schema, columns)
+        # only selected columns are copied from the memory-mapped file
+        return (table if present_columns is None else table.select(present_columns)).to_pandas()
+
+
+def _read_arrow_batches(filename: str, columns: Optional[Sequence[str]]) -> Iterator[pd.DataFrame]:
+    pyarrow = _import_pyarrow()
+    with pyarrow.memory_map(filename) as source:
+        reader = pyarrow.ipc.open_file(source)
+        present_columns = _get_present_columns(reader.schema, columns)
+        for batch_index in range(reader.num_record_batches):
+            table = pyarrow.Table.from_batches([reader.get_batch(batch_index)])
+            yield (table if present_columns is None else table.select(present_columns)).to_pandas()
+
+
 CHUNK_SIZE = 1000
 
 
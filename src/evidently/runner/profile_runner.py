@@ -1,7 +1,9 @@
 import json
 from dataclasses import dataclass
 from typing import Dict
+from typing import Optional
 
+from evidently.model_profile import ChunkedProfile
 from evidently.model_profile import Profile
 from evidently.model_profile.sections.data_drift_profile_section import DataDriftProfileSection
 from evidently.model_profile.sections.data_quality_profile_section import DataQualityProfileSection
@@ -22,6 +24,8 @@ from evidently.utils import NumpyEncoder
 class ProfileRunnerOptions(RunnerOptions):
     profile_parts: Dict[str, Dict[str, str]]
     pretty_print: bool
+    # read data by chunks of this size and calculate a ChunkedProfile, if it is set
+    chunk_size: Optional[int] = None
 
 
 parts_mapping = dict(
@@ -41,8 +45,6 @@ class ProfileRunner(Runner):
         self.options = options
 
     def run(self):
-        (reference_data, current_data) = self._parse_data()
-
         parts = []
 
         for part, _ in self.options.profile_parts.items():
@@ -51,8 +53,18 @@ class ProfileRunner(Runner):
                 raise ValueError(f"Unknown profile section {part}")
             parts.append(part_class())
 
-        profile = Profile(sections=parts, options=self.options.options)
-        profile.calculate(reference_data, current_data, self.options.column_mapping)
+        profile: Profile
+
+        if self.options.chunk_size is None:
+            (reference_data, current_data) = self._parse_data()
+            profile = Profile(sections=parts, options=self.options.options)
+            profile.calculate(reference_data, current_data, self.options.column_mapping)
+
+        else:
+            (reference_chunks, current_chunks) = self._parse_data_chunks(self.options.chunk_size)
+            profile = ChunkedProfile(sections=parts, options=self.options.options)
+            profile.calculate(reference_chunks, current_chunks, self.options.column_mapping)
+
         output_path = (
             self.options.output_path
             if self.options.output_path.endswith(".json")
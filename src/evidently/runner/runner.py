@@ -5,7 +5,7 @@ from dataclasses import dataclass
 
 from evidently.options import DataDriftOptions, QualityMetricsOptions
 from evidently.pipeline.column_mapping import ColumnMapping
-from evidently.runner.loader import DataLoader, SamplingOptions, DataOptions
+from evidently.runner.loader import DataLoader, SamplingOptions, DataOptions, get_file_format
 
 
 @dataclass
@@ -39,23 +39,81 @@ def parse_options(raw_dict: Optional[Dict[str, Dict[str, object]]]) -> List[obje
     return result
 
 
+def get_columns_to_load(column_mapping: ColumnMapping, filename: str, data_options: DataOptions) -> Optional[List[str]]:
+    """Columns of the data that are used with the column mapping, or None if all columns are needed.
+
+    Features that are not listed in the column mapping are inferred from all columns.
+    Only the date column of CSV files is parsed as dates, so other datetime features of them are never inferred.
+    """
+    file_format = get_file_format(filename, data_options)
+
+    if column_mapping.numerical_features is None or column_mapping.categorical_features is None:
+        return None
+
+    if column_mapping.datetime_features is None and file_format != "csv":
+        return None
+
+    if file_format == "csv" and not data_options.header and data_options.column_names is None:
+        # columns have no names to select them by
+        return None
+
+    prediction = column_mapping.prediction
+    columns = [column_mapping.target, column_mapping.datetime, column_mapping.id, data_options.date_column]
+    columns += [prediction] if isinstance(prediction, str) else list(prediction or [])
+    columns += column_mapping.numerical_features + column_mapping.categorical_features
+    columns += column_mapping.datetime_features or []
+    return [column for column in dict.fromkeys(columns) if column is not None]
+
+
 class Runner:
     def __init__(self, options: RunnerOptions):
         self.options = options
 
     def _parse_data(self):
         loader = DataLoader()
+        column_mapping = self.options.column_mapping
 
         reference_data = loader.load(
-            self.options.reference_data_path, self.options.reference_data_options, self.options.reference_data_sampling
+            self.options.reference_data_path,
+            self.options.reference_data_options,
+            self.options.reference_data_sampling,
+            get_columns_to_load(column_mapping, self.options.reference_data_path, self.options.reference_data_options),
         )
         logging.info(f"reference dataset loaded: {len(reference_data)} rows")
         if self.options.current_data_path:
             current_data = loader.load(
-                self.options.current_data_path, self.options.current_data_options, self.options.current_data_sampling
+                self.options.current_data_path,
+                self.options.current_data_options,
+                self.options.current_data_sampling,
+                get_columns_to_load(column_mapping, self.options.current_data_path, self.options.current_data_options),
             )
             logging.info(f"current dataset loaded: {len(current_data)} rows")
         else:
             current_data = None
 
         return reference_data, current_data
+
+    def _parse_data_chunks(self, chunk_size: int):
+        """Iterators of chunks of reference and current data, the data is read while the chunks are iterated"""
+        loader = DataLoader()
+        column_mapping = self.options.column_mapping
+
+        reference_chunks = loader.load_chunks(
+            self.options.reference_data_path,
+            self.options.reference_data_options,
+            self.options.reference_data_sampling,
+            chunk_size,
+            get_columns_to_load(column_mapping, self.options.reference_data_path, self.options.reference_data_options),
+        )
+        if self.options.current_data_path:
+            current_chunks = loader.load_chunks(
+                self.options.current_data_path,
+                self.options.current_data_options,
+                self.options.current_data_sampling,
+                chunk_size,
+                get_columns_to_load(column_mapping, self.options.current_data_path, self.options.current_data_options),
+            )
+        else:
+            current_chunks = None
+
+        return reference_chunks, current_chunks
@@ -3,14 +3,22 @@ import copy
 import dataclasses
 import json
 import logging
-from typing import Optional, Tuple, Iterator, Union
+import multiprocessing
+import os
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+from typing import Dict, List, Optional, Union
 
 from evidently.dashboard.dashboard import TemplateParams, save_lib_files, save_data_file, SaveMode, SaveModeMap
 from evidently.metrics.base_metric import Metric, InputData
 from evidently.renderers.base_renderer import TestRenderer, RenderersDefinitions, DEFAULT_RENDERERS, MetricRenderer
 from evidently.renderers.notebook_utils import determine_template
-from evidently.suite.execution_graph import ExecutionGraph, SimpleExecutionGraph
+from evidently.suite.execution_graph import DependencyExecutionGraph, ExecutionGraph, _discover_dependencies
+from evidently.suite.result_cache import ResultCache
 from evidently.tests.base_test import Test, TestResult, GroupingTypes
+from evidently.utils.column_cache import ColumnCache
 from evidently.utils import NumpyEncoder
 
 
@@ -44,10 +52,7 @@ def find_metric_renderer(obj, renderers: RenderersDefinitions) -> MetricRenderer
     raise KeyError(f"No renderer found for {obj}")
 
 
-def _discover_dependencies(test: Union[Metric, Test]) -> Iterator[Tuple[str, Union[Metric, Test]]]:
-    for field_name, field in test.__dict__.items():
-        if issubclass(type(field), (Metric, Test)):
-            yield field_name, field
+SUITE_EXECUTORS = ("serial", "thread", "process")
 
 
 @dataclasses.dataclass
@@ -61,12 +66,88 @@ class Context:
     test_results: dict
     state: State
     renderers: RenderersDefinitions
+    column_cache: Optional[ColumnCache] = None
 
 
 class ExecutionError(Exception):
     pass
 
 
+@dataclasses.dataclass
+class _ResultsContext:
+    """Context with results of dependencies only, it is sent to a worker process instead of the whole context"""
+
+    metric_results: dict
+
+
+def _detach_calculation(calculation: Metric, results: dict) -> Metric:
+    calculation_copy = copy.copy(calculation)
+    context = _ResultsContext(metric_results={})
+    calculation_copy.set_context(context)
+
+    for field_name, dependency in _discover_dependencies(calculation):
+        if isinstance(dependency, Metric):
+            dependency_copy = copy.copy(dependency)
+            dependency_copy.set_context(context)
+            context.metric_results[dependency_copy] = results[dependency]
+            calculation_copy.__setattr__(field_name, dependency_copy)
+
+    return calculation_copy
+
+
+def _calculate(calculation: Metric, data: InputData):
+    return calculation.calculate(data)
+
+
+# input data of a worker process, it is set once when the worker starts
+_worker_data: Optional[InputData] = None
+
+
+def _set_worker_data(data: InputData) -> None:
+    global _worker_data
+    _worker_data = data
+
+
+def _calculate_with_worker_data(calculation: Metric):
+    if _worker_data is None:
+        raise ExecutionError("Input data is not set in the worker process")
+
+    return calculation.calculate(_worker_data)
+
+
+class _DataProcessPool:
+    """Worker processes that get the input data once when they start, calculations are sent without the data.
+
+    Submitted calculations return futures as executors of concurrent.futures do.
+    multiprocessing.Pool is used because ProcessPoolExecutor supports an initializer in Python 3.7+ only.
+    """
+
+    def __init__(self, max_workers: int, data: InputData):
+        self._pool = multiprocessing.Pool(max_workers, initializer=_set_worker_data, initargs=(data,))
+
+    def __enter__(self) -> "_DataProcessPool":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self._pool.close()
+
+        else:
+            self._pool.terminate()
+
+        self._pool.join()
+
+    def submit(self, calculation: Metric) -> Future:
+        future: Future = Future()
+        self._pool.apply_async(
+            _calculate_with_worker_data,
+            (calculation,),
+            callback=future.set_result,
+            error_callback=future.set_exception,
+        )
+        return future
+
+
 class Display:
     @abc.abstractmethod
     def _build_dashboard_info(self):
@@ -139,9 +220,32 @@ class Display:
 
 
 class Suite:
+    """Metrics and tests with their execution context.
+
+    Calculations of metrics without dependencies between them can be run concurrently with `executor`
+    "thread" or "process" and `max_workers` workers (the number of CPUs by default).
+    The "process" executor sends a copy of the input data to every worker process once, when it starts,
+    and then sends calculations only, so metrics should be picklable.
+    Results of calculations are reused from `result_cache` when the same metrics are calculated with the same data.
+    """
+
     context: Context
 
-    def __init__(self):
+    def __init__(
+        self,
+        executor: str = "serial",
+        max_workers: Optional[int] = None,
+        result_cache: Optional[ResultCache] = None,
+    ):
+        if executor not in SUITE_EXECUTORS:
+            raise ValueError(f"Executor is incorrect: {executor}. Expected one of {list(SUITE_EXECUTORS)}")
+
+        if max_workers is not None and max_workers < 1:
+            raise ValueError(f"max_workers should be a positive int, got {max_workers}")
+
+        self.executor = executor
+        self.max_workers = max_workers
+        self.result_cache = result_cache
         self.context = Context(
             execution_graph=None,
             metrics=[],
@@ -179,7 +283,7 @@ class Suite:
         self.context.state = States.Init
 
     def verify(self):
-        self.context.execution_graph = SimpleExecutionGraph(self.context.metrics, self.context.tests)
+        self.context.execution_graph = DependencyExecutionGraph(self.context.metrics, self.context.tests)
         self.context.state = States.Verified
 
     def run_calculate(self, data: InputData):
@@ -189,23 +293,111 @@ class Suite:
         if self.context.state in [States.Calculated, States.Tested]:
             return
 
+        # results are available in the context during calculations for metrics with dependencies
         results: dict = {}
+        self.context.metric_results = results
+        self.context.column_cache = data.column_cache
+        data.column_cache.reference_store = self.result_cache
 
         if self.context.execution_graph is not None:
             execution_graph: ExecutionGraph = self.context.execution_graph
+            metrics_by_calculation: Dict[Metric, List[Metric]] = {}
 
-            calculations = {}
             for metric, calculation in execution_graph.get_metric_execution_iterator():
-                if calculation not in calculations:
+                metrics_by_calculation.setdefault(calculation, []).append(metric)
+
+            cache_keys = self._get_cache_keys(list(metrics_by_calculation), data)
+            calculated: set = set()
+
+            def set_result(calculation: Metric, result, from_cache: bool = False):
+                for metric in metrics_by_calculation[calculation]:
+                    results[metric] = result
+
+                key = cache_keys.get(calculation)
+
+                if self.result_cache is not None and key is not None and not from_cache:
+                    self.result_cache.save(key, result)
+
+            for calculation, key in cache_keys.items():
+                if self.result_cache is None or key is None:
+                    continue
+
+                result = self.result_cache.load(key)
+
+                if result is not None:
+                    logging.debug(f"Loaded the result of {type(calculation)} from the cache")
+                    set_result(calculation, result, from_cache=True)
+                    calculated.add(calculation)
+
+            if self.executor == "serial" or len(metrics_by_calculation) - len(calculated) <= 1:
+                for calculation in metrics_by_calculation:
+                    if calculation in calculated:
+                        continue
+
                     logging.debug(f"Executing {type(calculation)}...")
-                    calculations[calculation] = calculation.calculate(data)
-                else:
-                    logging.debug(f"Using cached result for {type(calculation)}")
-                results[metric] = calculations[calculation]
+                    set_result(calculation, calculation.calculate(data))
+
+            else:
+                self._run_concurrent_calculations(execution_graph, data, set_result, calculated)
 
-        self.context.metric_results = results
         self.context.state = States.Calculated
 
+    def _get_cache_keys(self, calculations: List[Metric], data: InputData) -> Dict[Metric, Optional[str]]:
+        if self.result_cache is None:
+            return {}
+
+        data_key = self.result_cache.get_data_key(data)
+        return {calculation: self.result_cache.get_key(calculation, data_key) for calculation in calculations}
+
+    def _run_concurrent_calculations(
+        self, execution_graph: ExecutionGraph, data: InputData, set_result, calculated: set
+    ) -> None:
+        """Submit each calculation to the pool as soon as all its dependencies are calculated"""
+        dependencies = {
+            calculation: calculation_dependencies
+            for calculation, calculation_dependencies in execution_graph.get_calculation_dependencies().items()
+            if calculation not in calculated
+        }
+        pending: Dict[Future, Metric] = {}
+        max_workers = self.max_workers or os.cpu_count() or 1
+        executor: Union[ThreadPoolExecutor, _DataProcessPool]
+
+        if self.executor == "thread":
+            executor = ThreadPoolExecutor(max_workers=max_workers)
+
+        else:
+            executor = _DataProcessPool(max_workers, data)
+
+        with executor:
+
+            def submit_ready():
+                for calculation, calculation_dependencies in list(dependencies.items()):
+                    if not all(dependency in calculated for dependency in calculation_dependencies):
+                        continue
+
+                    logging.debug(f"Executing {type(calculation)}...")
+
+                    if isinstance(executor, _DataProcessPool):
+                        future = executor.submit(_detach_calculation(calculation, self.context.metric_results))
+
+                    else:
+                        future = executor.submit(_calculate, calculation, data)
+
+                    pending[future] = calculation
+                    del dependencies[calculation]
+
+            submit_ready()
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    calculation = pending.pop(future)
+                    set_result(calculation, future.result())
+                    calculated.add(calculation)
+
+                submit_ready()
+
     def run_checks(self):
         if self.context.state in [States.Init, States.Verified]:
             raise ExecutionError("No calculation was made, run 'run_calculate' first'")
@@ -1,12 +1,18 @@
 import abc
 import functools
 import logging
-from typing import List, Tuple, Type, Dict
+from typing import List, Tuple, Type, Dict, Iterator, Union
 
 from evidently.metrics.base_metric import Metric
 from evidently.tests.base_test import Test
 
 
+def _discover_dependencies(test: Union[Metric, Test]) -> Iterator[Tuple[str, Union[Metric, Test]]]:
+    for field_name, field in test.__dict__.items():
+        if issubclass(type(field), (Metric, Test)):
+            yield field_name, field
+
+
 class ExecutionGraph:
     @abc.abstractmethod
     def get_metric_execution_iterator(self) -> List[Tuple[Metric, Metric]]:
@@ -16,11 +22,18 @@ class ExecutionGraph:
     def get_test_execution_iterator(self) -> List[Test]:
         raise NotImplementedError()
 
+    def get_calculation_dependencies(self) -> Dict[Metric, List[Metric]]:
+        """Calculations that should be done before each calculation, no dependencies by default"""
+        return {calculation: [] for _, calculation in self.get_metric_execution_iterator()}
+
 
 class SimpleExecutionGraph(ExecutionGraph):
     """
     Simple execution graph without any work with dependencies at all,
-     assumes that metrics already in order for execution
+     assumes that metrics already in order for execution.
+
+    Suite uses DependencyExecutionGraph, this graph is kept as a public fallback
+    for code that builds execution graphs itself and orders metrics on its own.
     """
 
     metrics: List[Metric]
@@ -55,3 +68,97 @@ def _aggregate_metrics(agg, item):
 def _aggregate_by_parameters(agg: dict, metric: Metric) -> dict:
     agg[metric.get_parameters()] = agg.get(metric.get_parameters(), []) + [metric]
     return agg
+
+
+class DependencyExecutionGraph(ExecutionGraph):
+    """
+    Execution graph of metric calculations with dependencies between them.
+
+    Metrics of the same type with the same parameters are calculated once.
+    A metric depends on metrics in its fields, calculations are sorted so that dependencies go first
+    and calculations without dependencies between them keep the order of metrics.
+    """
+
+    metrics: List[Metric]
+    tests: List[Test]
+
+    def __init__(self, metrics: List[Metric], tests: List[Test]):
+        self.metrics = metrics
+        self.tests = tests
+        self._metric_to_calculation: Dict[Metric, Metric] = {}
+        calculations_by_parameters: Dict[tuple, Metric] = {}
+
+        for metric in metrics:
+            key = (type(metric), metric.get_parameters())
+
+            try:
+                hash(key)
+
+            except TypeError:
+                # metrics with unhashable parameters (like options) are calculated separately
+                key = (type(metric), id(metric))
+
+            self._metric_to_calculation[metric] = calculations_by_parameters.setdefault(key, metric)
+
+        self._dependencies: Dict[Metric, List[Metric]] = {}
+
+        for calculation in calculations_by_parameters.values():
+            dependencies = []
+
+            for _, dependency in _discover_dependencies(calculation):
+                if not isinstance(dependency, Metric):
+                    continue
+
+                if dependency not in self._metric_to_calculation:
+                    raise ValueError(
+                        f"Metric {type(dependency).__name__} is a dependency of {type(calculation).__name__} "
+                        f"but it was not added to the graph"
+                    )
+
+                if self._metric_to_calculation[dependency] not in dependencies:
+                    dependencies.append(self._metric_to_calculation[dependency])
+
+            self._dependencies[calculation] = dependencies
+
+        self._calculations_order = self._sort_calculations()
+
+    def _sort_calculations(self) -> List[Metric]:
+        """Topological sort of calculations (Kahn's algorithm), the order of metrics is kept where it is possible"""
+        n_dependencies = {calculation: len(dependencies) for calculation, dependencies in self._dependencies.items()}
+        dependents: Dict[Metric, List[Metric]] = {calculation: [] for calculation in self._dependencies}
+
+        for calculation, dependencies in self._dependencies.items():
+            for dependency in dependencies:
+                dependents[dependency].append(calculation)
+
+        ready = [calculation for calculation, count in n_dependencies.items() if count == 0]
+        result = []
+
+        while ready:
+            calculation = ready.pop(0)
+            result.append(calculation)
+
+            for dependent in dependents[calculation]:
+                n_dependencies[dependent] -= 1
+
+                if n_dependencies[dependent] == 0:
+                    ready.append(dependent)
+
+        if len(result) != len(self._dependencies):
+            cycle = [type(calculation).__name__ for calculation, count in n_dependencies.items() if count > 0]
+            raise ValueError(f"Metrics have circular dependencies: {', '.join(cycle)}")
+
+        return result
+
+    def get_metric_execution_iterator(self) -> List[Tuple[Metric, Metric]]:
+        order = {calculation: idx for idx, calculation in enumerate(self._calculations_order)}
+        return sorted(
+            ((metric, self._metric_to_calculation[metric]) for metric in self.metrics),
+            key=lambda item: order[item[1]],
+        )
+
+    def get_calculation_dependencies(self) -> Dict[Metric, List[Metric]]:
+        return {calculation: list(self._dependencies[calculation]) for calculation in self._calculations_order}
+
+    def get_test_execution_iterator(self) -> List[Test]:
+        return self.tests
@@ -0,0 +1,238 @@
+"""On-disk cache of metric results shared by runs of reports and test suites"""
+
+import dataclasses
+import enum
+import hashlib
+import logging
+import os
+import pickle
+import re
+import tempfile
+from typing import Any
+from typing import Hashable
+from typing import Optional
+
+import numpy as np
+
+from evidently._version import __version__
+from evidently.metrics.base_metric import InputData
+from evidently.metrics.base_metric import Metric
+
+DEFAULT_MAX_SIZE = 1024**3
+_RESULT_FILE_SUFFIX = ".pkl"
+# re.Pattern is available in Python 3.7+ only
+_PATTERN_TYPE = type(re.compile(""))
+
+
+class _NotCacheable(Exception):
+    pass
+
+
+def _get_type_name(value_type: type) -> str:
+    return f"{value_type.__module__}.{value_type.__qualname__}"
+
+
+def _get_token(value: Any) -> Hashable:
+    """Representation of a parameter that is the same in all runs for equal parameters.
+
+    Raises _NotCacheable for values without such a representation (like lambdas or arbitrary objects).
+    """
+    if value is None or isinstance(value, (bool, int, float, str, bytes)):
+        return value
+
+    if isinstance(value, enum.Enum):
+        return _get_type_name(type(value)), value.name
+
+    if isinstance(value, np.generic):
+        return value.item()
+
+    if isinstance(value, Metric):
+        return _get_type_name(type(value)), _get_token(value.get_parameters())
+
+    if isinstance(value, (list, tuple)):
+        return type(value).__name__, tuple(_get_token(item) for item in value)
+
+    if isinstance(value, (set, frozenset)):
+        return "set", tuple(sorted(repr(_get_token(item)) for item in value))
+
+    if isinstance(value, dict):
+        return "dict", tuple(sorted((repr(_get_token(key)), _get_token(item)) for key, item in value.items()))
+
+    if isinstance(value, _PATTERN_TYPE):
+        return "re", value.pattern, value.flags
+
+    if isinstance(value, np.ndarray) and not value.dtype.hasobject:
+        return "ndarray", value.dtype.str, value.shape, hashlib.sha256(np.ascontiguousarray(value).tobytes()).digest()
+
+    if isinstance(value, type):
+        return "type", _get_type_name(value)
+
+    if dataclasses.is_dataclass(value):
+        return _get_type_name(type(value)), tuple(
+            (field.name, _get_token(getattr(value, field.name))) for field in dataclasses.fields(value)
+        )
+
+    if callable(value) and hasattr(value, "__qualname__") and "<" not in value.__qualname__:
+        # module level functions and classes, not lambdas and local functions
+        return "callable", value.__module__, value.__qualname__
+
+    raise _NotCacheable(f"{type(value).__name__} parameters are not supported")
+
+
+class ResultCache:
+    """Results of metric calculations pickled to files in `directory`.
+
+    A result is reused by a calculation of the same metric type with the same parameters
+    (`Metric.get_parameters`), column mapping and full fingerprints of reference and current data
+    (see `evidently.utils.fingerprint`, reference profiles are hashed by their content)
+    in any run of any report or test suite with the cache.
+    Statistics of the reference data only (`ColumnCache.get_reference_state`) are kept by the hash of
+    the reference and the column mapping, so they are reused by runs with the same reference and new current data.
+    Metrics with parameters that cannot be represented the same way in every run (like lambdas) are always calculated.
+
+    Files of the least recently used results are removed when the size of all files is over `max_size` bytes.
+    """
+
+    def __init__(self, directory: str, max_size: int = DEFAULT_MAX_SIZE):
+        if max_size < 0:
+            raise ValueError(f"max_size should be a non-negative int, got {max_size}")
+
+        self.directory = directory
+        self.max_size = max_size
+        os.makedirs(directory, exist_ok=True)
+
+    def get_data_key(self, data: InputData) -> Optional[Hashable]:
+        """Part of keys of all calculations with the data, None if results with the data should not be cached"""
+        reference_hash = data.column_cache.get_data_hash("reference")
+        current_hash = data.column_cache.get_data_hash("current")
+
+        if current_hash is None or (data.reference_data is not None and reference_hash is None):
+            return None
+
+        try:
+            column_mapping = _get_token(data.column_mapping)
+
+        except _NotCacheable as error:
+            logging.debug(f"Results are not cached: {error}")
+            return None
+
+        return reference_hash, current_hash, column_mapping
+
+    def get_reference_key(
+        self, reference_hash: Optional[str], column_mapping: Any, name: str, parameters: tuple
+    ) -> Optional[str]:
+        """Key of a value calculated from the reference data only, None if the value should not be cached"""
+        if reference_hash is None:
+            return None
+
+        try:
+            column_mapping_token = _get_token(column_mapping)
+            parameters_token = _get_token(parameters)
+
+        except _NotCacheable as error:
+            logging.debug(f"Reference state {name} is not cached: {error}")
+            return None
+
+        return hashlib.sha256(
+            repr((__version__, "reference", name, parameters_token, reference_hash, column_mapping_token)).encode()
+        ).hexdigest()
+
+    def get_key(self, metric: Metric, data_key: Optional[Hashable]) -> Optional[str]:
+        """Key of the metric calculation with the data, None if its result should not be cached"""
+        if data_key is None:
+            return None
+
+        try:
+            metric_token = _get_token(metric)
+
+        except _NotCacheable as error:
+            logging.debug(f"Results of {type(metric).__name__} are not cached: {error}")
+            return None
+
+        return hashlib.sha256(repr((__version__, metric_token, data_key)).encode()).hexdigest()
+
+    def _get_path(self, key: str) -> str:
+        return os.path.join(self.directory, key + _RESULT_FILE_SUFFIX)
+
+    def load(self, key: str) -> Any:
+        """The cached result or None"""
+        path = self._get_path(key)
+
+        try:
+            with open(path, "rb") as result_file:
+                result = pickle.load(result_file)
+
+        except FileNotFoundError:
+            return None
+
+        except Exception as error:  # pylint: disable=broad-except
+            logging.warning(f"Cannot load a cached result from {path}, it is removed: {error}")
+            self._remove(path)
+            return None
+
+        # modification time is the time of the last use for eviction
+        try:
+            os.utime(path)
+
+        except FileNotFoundError:
+            pass
+
+        return result
+
+    def save(self, key: str, result: Any) -> None:
+        try:
+            content = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+
+        except Exception as error:  # pylint: disable=broad-except
+            logging.debug(f"Result of type {type(result).__name__} is not cached: {error}")
+            return
+
+        # results are written to a temporary file and renamed, so concurrent runs never read a part of a file
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+
+        try:
+            with os.fdopen(file_descriptor, "wb") as result_file:
+                result_file.write(content)
+
+            os.replace(temporary_path, self._get_path(key))
+
+        except OSError as error:
+            logging.warning(f"Cannot save a result to the cache: {error}")
+            self._remove(temporary_path)
+            return
+
+        self.evict()
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+
+        except FileNotFoundError:
+            pass
+
+    def evict(self) -> None:
+        """Remove the least recently used results while the size of all results is over max_size"""
+        files = []
+
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if entry.name.endswith(_RESULT_FILE_SUFFIX):
+                    stat = entry.stat()
+                    files.append((stat.st_mtime, stat.st_size, entry.path))
+
+        size = sum(file_size for _, file_size, _ in files)
+
+        for _, file_size, path in sorted(files):
+            if size <= self.max_size:
+                break
+
+            self._remove(path)
+            size -= file_size
+
+    def clear(self) -> None:
+        """Remove all cached results"""
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if entry.name.endswith(_RESULT_FILE_SUFFIX):
+                    self._remove(entry.path)
@@ -3,6 +3,7 @@ import dataclasses
 import uuid
 from collections import Counter
 from datetime import datetime
+from typing import Dict
 from typing import List
 from typing import Optional
 from typing import Union
@@ -19,11 +20,13 @@ from evidently.pipeline.column_mapping import ColumnMapping
 from evidently.suite.base_suite import Suite
 from evidently.suite.base_suite import Display
 from evidently.suite.base_suite import find_test_renderer
+from evidently.suite.result_cache import ResultCache
 from evidently.test_preset.test_preset import TestPreset
 from evidently.tests.base_test import BaseTestGenerator
 from evidently.tests.base_test import DEFAULT_GROUP
 from evidently.tests.base_test import Test
 from evidently.tests.base_test import TestResult
+from evidently.utils.fingerprint import FINGERPRINT_MODES
 
 
 class TestSuite(Display):
@@ -32,8 +35,22 @@ class TestSuite(Display):
     _test_presets: List[TestPreset]
     _test_generators: List[BaseTestGenerator]
 
-    def __init__(self, tests: Optional[List[Union[Test, TestPreset, BaseTestGenerator]]]):
-        self._inner_suite = Suite()
+    def __init__(
+        self,
+        tests: Optional[List[Union[Test, TestPreset, BaseTestGenerator]]],
+        executor: str = "serial",
+        max_workers: Optional[int] = None,
+        result_cache: Optional[ResultCache] = None,
+        fingerprint_mode: Optional[str] = "sampled",
+    ):
+        if fingerprint_mode is not None and fingerprint_mode not in FINGERPRINT_MODES:
+            raise ValueError(
+                f"Fingerprint mode is incorrect: {fingerprint_mode}. Expected one of {list(FINGERPRINT_MODES)} or None"
+            )
+
+        self._inner_suite = Suite(executor=executor, max_workers=max_workers, result_cache=result_cache)
+        self._fingerprint_mode = fingerprint_mode
+        self._fingerprints: Dict[str, dict] = {}
         self._test_presets = []
         self._test_generators = []
 
@@ -69,9 +86,10 @@ class TestSuite(Display):
             column_mapping = ColumnMapping()
 
         self._columns_info = process_columns(current_data, column_mapping)
+        data = InputData(reference_data, current_data, column_mapping)
 
         for preset in self._test_presets:
-            tests = preset.generate_tests(InputData(reference_data, current_data, column_mapping), self._columns_info)
+            tests = preset.generate_tests(data, self._columns_info)
 
             for test in tests:
                 if isinstance(test, BaseTestGenerator):
@@ -84,8 +102,16 @@ class TestSuite(Display):
             self._add_tests_from_generator(test_generator)
 
         self._inner_suite.verify()
-        self._inner_suite.run_calculate(InputData(reference_data, current_data, column_mapping))
+        self._inner_suite.run_calculate(data)
         self._inner_suite.run_checks()
+        self._fingerprints = {}
+
+        if self._fingerprint_mode is not None:
+            for dataset in ("reference", "current"):
+                fingerprint = data.get_fingerprint(dataset, self._fingerprint_mode)
+
+                if fingerprint is not None:
+                    self._fingerprints[dataset] = fingerprint.as_dict()
 
     def as_dict(self) -> dict:
         test_results = []
@@ -109,6 +135,7 @@ class TestSuite(Display):
                 "by_status": counter,
             },
             "columns_info": dataclasses.asdict(self._columns_info),
+            "fingerprints": self._fingerprints,
         }
 
     def _build_dashboard_info(self):
@@ -7,6 +7,7 @@ from evidently.metrics.classification_performance_metrics import ClassificationP
 from evidently.metrics.classification_performance_metrics import ClassificationPerformanceResults
 from evidently.metrics.classification_performance_metrics import ClassificationPerformanceMetricsTopK
 from evidently.metrics.classification_performance_metrics import ClassificationPerformanceMetricsThreshold
+from evidently.metrics.classification_performance_metrics import ClassificationPerformanceMetricsSweep
 from evidently.metrics.classification_performance_metrics import DatasetClassificationPerformanceMetrics
 from evidently.model.widget import BaseWidgetInfo
 from evidently.renderers.base_renderer import default_renderer
@@ -77,6 +78,7 @@ class SimpleClassificationTestTopK(SimpleClassificationTest, ABC):
         lte: Optional[Numeric] = None,
         not_eq: Optional[Numeric] = None,
         not_in: Optional[List[Union[Numeric, str, bool]]] = None,
+        sweep: Optional[ClassificationPerformanceMetricsSweep] = None,
     ):
         super().__init__(
             eq=eq,
@@ -90,10 +92,13 @@ class SimpleClassificationTestTopK(SimpleClassificationTest, ABC):
         )
         if k is not None and classification_threshold is not None:
             raise ValueError("Only one of classification_threshold or k should be given")
+        if sweep is not None and k is None and classification_threshold is None:
+            raise ValueError("Sweep can be used only with classification_threshold or k")
+        # with a sweep the results are read from the sweep calculated once for all thresholds
         if k is not None:
-            self.metric = ClassificationPerformanceMetricsTopK(k)
+            self.metric = ClassificationPerformanceMetricsTopK(k, sweep=sweep)
         if classification_threshold is not None:
-            self.metric = ClassificationPerformanceMetricsThreshold(classification_threshold)
+            self.metric = ClassificationPerformanceMetricsThreshold(classification_threshold, sweep=sweep)
         self.k = k
         self.threshold = classification_threshold
 
@@ -0,0 +1,257 @@
+"""Per-run cache of column preprocessing shared by all metrics of a suite"""
+
+import copy
+import threading
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Hashable
+from typing import Optional
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+
+from evidently.calculations.histogram import BinsType
+from evidently.calculations.histogram import Histogram
+from evidently.calculations.histogram import count_sorted_in_bins
+from evidently.calculations.histogram import get_bin_edges
+from evidently.calculations.reference_profile import ReferenceProfile
+from evidently.pipeline.column_mapping import ColumnMapping
+from evidently.utils.data_operations import DatasetColumns
+from evidently.utils.data_operations import process_columns
+from evidently.utils.fingerprint import DataFingerprint
+from evidently.utils.fingerprint import get_fingerprint
+
+DATASETS = ("current", "reference")
+
+
+class ColumnCache:
+    """Memoized column calculations for the current and reference datasets of one run.
+
+    Values are calculated on the first request and reused by all metrics.
+    Datasets should not change after the first request of their values,
+    `hits` and `misses` count requests to the cache.
+    The cache is thread-safe: a value requested by several threads at once is calculated once.
+
+    Values calculated from the reference dataset only (`get_reference_state`) are also kept in
+    `reference_store` (a `ResultCache`) when it is set, so runs with the same reference reuse them.
+    """
+
+    def __init__(
+        self,
+        reference_data: Optional[pd.DataFrame],
+        current_data: Optional[pd.DataFrame],
+        column_mapping: Optional[ColumnMapping],
+    ):
+        self._datasets = {"current": current_data, "reference": reference_data}
+        self._column_mapping = column_mapping
+        self._values: Dict[Tuple[Hashable, ...], Any] = {}
+        self.hits = 0
+        self.misses = 0
+        self.reference_store: Optional[Any] = None
+        self._init_locks()
+
+    def _init_locks(self) -> None:
+        # the lock guards values, counters and locks of keys, a lock of a key is held while its value is calculated
+        self._lock = threading.Lock()
+        self._key_locks: Dict[Tuple[Hashable, ...], threading.Lock] = {}
+
+    def __getstate__(self) -> dict:
+        # locks are not pickled, the cache is sent to worker processes with the input data
+        state = self.__dict__.copy()
+        del state["_lock"]
+        del state["_key_locks"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._init_locks()
+
+    def _get(self, key: Tuple[Hashable, ...], calculate: Callable[[], Any]) -> Any:
+        with self._lock:
+            if key in self._values:
+                self.hits += 1
+                return self._values[key]
+
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        # values of other keys are calculated in parallel, values of the same key wait for the first calculation
+        with key_lock:
+            with self._lock:
+                if key in self._values:
+                    self.hits += 1
+                    return self._values[key]
+
+                self.misses += 1
+
+            value = calculate()
+
+            with self._lock:
+                self._values[key] = value
+                self._key_locks.pop(key, None)
+
+        return value
+
+    def _get_dataset(self, dataset: str) -> Optional[pd.DataFrame]:
+        if dataset not in DATASETS:
+            raise ValueError(f"Unexpected dataset {dataset}, expected one of {list(DATASETS)}")
+
+        return self._datasets[dataset]
+
+    def _get_column(self, dataset: str, column_name: str) -> pd.Series:
+        data = self._get_dataset(dataset)
+
+        if data is None:
+            raise ValueError(f"The {dataset} dataset is not present")
+
+        return data[column_name]
+
+    def get_fingerprint(self, dataset: str, mode: str = "full") -> Optional[DataFingerprint]:
+        """Fingerprint of the dataset, None if the dataset is not present or is not a DataFrame"""
+
+        def calculate():
+            data = self._get_dataset(dataset)
+            return get_fingerprint(data, mode) if isinstance(data, pd.DataFrame) else None
+
+        return self._get((dataset, "fingerprint", mode), calculate)
+
+    def get_data_hash(self, dataset: str) -> Optional[str]:
+        """Hash of the dataset content, the same in all runs for equal datasets
+
+        DataFrames are hashed by their full fingerprints and reference profiles by their content,
+        None is returned if the dataset is not present or cannot be hashed.
+        """
+
+        def calculate():
+            data = self._get_dataset(dataset)
+
+            if isinstance(data, ReferenceProfile):
+                return data.get_hash()
+
+            fingerprint = self.get_fingerprint(dataset)
+            return None if fingerprint is None else fingerprint.hash
+
+        return self._get((dataset, "hash"), calculate)
+
+    def get_reference_state(self, name: str, parameters: tuple, calculate: Callable[[], Any]) -> Any:
+        """Value that `calculate` gets from the reference dataset, the column mapping and `parameters` only
+
+        The value is loaded from `reference_store` or calculated and saved there,
+        `name` and `parameters` should identify the calculation in all runs. The result should not be changed.
+        """
+
+        def load_or_calculate():
+            store = self.reference_store
+            key = None
+
+            if store is not None:
+                key = store.get_reference_key(self.get_data_hash("reference"), self._column_mapping, name, parameters)
+
+            value = None if key is None else store.load(key)
+
+            if value is None:
+                value = calculate()
+
+                if key is not None:
+                    store.save(key, value)
+
+            return value
+
+        # parameters can be unhashable (like lists of columns), their representation is the same during a run
+        return self._get(("reference", "state", name, repr(parameters)), load_or_calculate)
+
+    def get_columns(self) -> DatasetColumns:
+        """Columns of the current dataset as `process_columns` returns them.
+
+        A copy is returned every time because some calculations change the lists of columns.
+        """
+        columns = self._get(
+            ("columns",),
+            lambda: process_columns(
+                self._datasets["current"], self._column_mapping if self._column_mapping else ColumnMapping()
+            ),
+        )
+        return copy.deepcopy(columns)
+
+    def get_value_counts(self, dataset: str, column_name: str) -> pd.Series:
+        """Counts of values with NaN as `value_counts(dropna=False)`, the result should not be changed"""
+        return self._get(
+            (dataset, column_name, "value_counts"),
+            lambda: self._get_column(dataset, column_name).value_counts(dropna=False),
+        )
+
+    def get_nunique(self, dataset: str, column_name: str) -> int:
+        """Number of unique non-null values"""
+        return self._get(
+            (dataset, column_name, "nunique"),
+            lambda: int(self._get_column(dataset, column_name).nunique()),
+        )
+
+    def get_factorized(self, dataset: str, column_name: str) -> Tuple[np.ndarray, Any]:
+        """Codes of values (-1 for NaN) and unique not-null values as `pd.factorize` returns them
+
+        The result should not be changed.
+        """
+        return self._get(
+            (dataset, column_name, "factorized"),
+            lambda: pd.factorize(self._get_column(dataset, column_name)),
+        )
+
+    def get_not_null_values(self, dataset: str, column_name: str) -> pd.Series:
+        """Values without NaN as `dropna()`, the result should not be changed"""
+        return self._get(
+            (dataset, column_name, "not_null"),
+            lambda: self._get_column(dataset, column_name).dropna(),
+        )
+
+    def get_finite_values(self, dataset: str, column_name: str) -> np.ndarray:
+        """Numerical values without NaN and infinite values, the result should not be changed"""
+
+        def calculate():
+            values = self._get_column(dataset, column_name).to_numpy(dtype=float, na_value=np.nan)
+            return values[np.isfinite(values)]
+
+        return self._get((dataset, column_name, "finite"), calculate)
+
+    def get_sorted_values(self, dataset: str, column_name: str) -> np.ndarray:
+        """Sorted finite numerical values, the result should not be changed"""
+        return self._get(
+            (dataset, column_name, "sorted"),
+            lambda: np.sort(self.get_finite_values(dataset, column_name)),
+        )
+
+    def _get_present_datasets(self, column_name: str) -> Tuple[str, ...]:
+        return tuple(
+            dataset
+            for dataset in DATASETS
+            if self._datasets[dataset] is not None and column_name in self._datasets[dataset]
+        )
+
+    def get_bin_edges(self, column_name: str, bins: BinsType) -> np.ndarray:
+        """Bin edges of finite values of the column in all present datasets, the result should not be changed"""
+        return self._get(
+            ("bin_edges", column_name, bins),
+            lambda: get_bin_edges(
+                [self.get_sorted_values(dataset, column_name) for dataset in self._get_present_datasets(column_name)],
+                bins,
+            ),
+        )
+
+    def get_histogram(self, column_name: str, bins: BinsType) -> Histogram:
+        """Histogram of finite values of the column with the same bins for all present datasets
+
+        Datasets without the column are skipped, the result should not be changed.
+        """
+
+        def calculate():
+            edges = self.get_bin_edges(column_name, bins)
+            return Histogram(
+                edges=edges,
+                counts={
+                    dataset: count_sorted_in_bins(self.get_sorted_values(dataset, column_name), edges)
+                    for dataset in self._get_present_datasets(column_name)
+                },
+            )
+
+        return self._get(("histogram", column_name, bins), calculate)
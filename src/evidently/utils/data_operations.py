@@ -9,12 +9,61 @@ from evidently import ColumnMapping
 
 
 def replace_infinity_values_to_nan(dataframe: pd.DataFrame) -> pd.DataFrame:
-    #   document somewhere, that all analyzers are mutators, i.e. they will change
-    #   the dataframe, like here: replace inf and nan values.
+    #   the dataframe is changed in place, use select_finite_rows to keep the data unchanged
     dataframe.replace([np.inf, -np.inf], np.nan, inplace=True)
     return dataframe
 
 
+def is_numeric_column(column: pd.Series) -> bool:
+    """Column with numbers that can be converted to floats, bool columns are not numeric"""
+    return pd.api.types.is_numeric_dtype(column) and not pd.api.types.is_bool_dtype(column)
+
+
+def get_finite_rows_mask(dataset: pd.DataFrame, columns: Sequence[str]) -> pd.Series:
+    """Mask of rows without NaN and infinite values in the columns"""
+    mask = np.ones(dataset.shape[0], dtype=bool)
+
+    for column in columns:
+        values = dataset[column]
+
+        if pd.api.types.is_float_dtype(values.dtype):
+            mask &= np.isfinite(values.to_numpy(dtype=float, na_value=np.nan))
+
+        else:
+            mask &= (values.notna() & ~values.isin([np.inf, -np.inf])).to_numpy()
+
+    return pd.Series(mask, index=dataset.index)
+
+
+def _replace_infinity_values_to_nan(values: pd.Series) -> pd.Series:
+    if pd.api.types.is_float_dtype(values.dtype):
+        return values.mask(np.isinf(values))
+
+    if pd.api.types.is_object_dtype(values.dtype):
+        return values.replace([np.inf, -np.inf], np.nan)
+
+    return values
+
+
+def select_finite_rows(
+    dataset: pd.DataFrame, subset: Sequence[str], columns: Optional[Sequence[str]] = None
+) -> pd.DataFrame:
+    """Rows without NaN and infinite values in `subset` columns with infinite values replaced with NaN.
+
+    The result is the same as `replace_infinity_values_to_nan` and `dropna(subset=subset)` give, but the dataset
+    is not changed and only `columns` (all columns by default) are copied to the result.
+    """
+    mask = get_finite_rows_mask(dataset, subset)
+
+    if columns is None:
+        columns = list(dataset.columns)
+
+    if not columns:
+        return pd.DataFrame(index=dataset.index[mask])
+
+    return pd.concat([_replace_infinity_values_to_nan(dataset[column][mask]) for column in columns], axis=1)
+
+
 @dataclass
 class DatasetUtilityColumns:
     date: Optional[str]
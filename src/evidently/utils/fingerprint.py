@@ -0,0 +1,224 @@
+"""Fingerprints of DataFrames to check if data changed between runs
+
+A fingerprint keeps a hash of every column, of the index and of the whole DataFrame.
+Hashes are the same in all runs with the same versions of pandas and numpy.
+"""
+
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+FINGERPRINT_MODES = ("full", "sampled")
+DEFAULT_SAMPLE_SIZE = 10000
+_TYPE_HASH_MULTIPLIER = np.uint64(1000003)
+
+
+@dataclass
+class DataFingerprint:
+    """Hashes of a DataFrame
+
+    Attributes:
+        mode: "full" if all rows are hashed, "sampled" if every `step`-th row is hashed
+        n_rows: number of rows of the DataFrame
+        step: step between hashed rows, 1 for "full" mode
+        index: hash of the index
+        columns: hash of every column by column name in the order of columns
+        hash: hash of all of the above
+    """
+
+    mode: str
+    n_rows: int
+    step: int
+    index: str
+    columns: Dict[Any, str]
+    hash: str
+
+    def get_changed_columns(self, other: "DataFingerprint") -> List[Any]:
+        """Columns that are added, removed or have other values in `other`, all columns if rows are different"""
+        column_names = list(self.columns)
+        column_names += [column_name for column_name in other.columns if column_name not in self.columns]
+
+        if (self.mode, self.n_rows, self.step, self.index) != (other.mode, other.n_rows, other.step, other.index):
+            return column_names
+
+        return [
+            column_name
+            for column_name in column_names
+            if self.columns.get(column_name) != other.columns.get(column_name)
+        ]
+
+    def as_dict(self) -> dict:
+        return {
+            "mode": self.mode,
+            "n_rows": self.n_rows,
+            "step": self.step,
+            "hash": self.hash,
+            "index": self.index,
+            "columns": {str(column_name): column_hash for column_name, column_hash in self.columns.items()},
+        }
+
+
+def _hash_strings(values: np.ndarray) -> np.ndarray:
+    return pd.util.hash_array(np.array([str(value) for value in values], dtype=object), categorize=False)
+
+
+def _hash_values_of_type(values: np.ndarray, value_type: type) -> np.ndarray:
+    if value_type is str:
+        # unique strings are hashed
+        return pd.util.hash_array(values)
+
+    if value_type is int:
+        # ints out of int64 are hashed as strings
+        hashes = np.empty(len(values), dtype=np.uint64)
+        is_int64 = np.array([-(2**63) <= value < 2**63 for value in values], dtype=bool)
+        hashes[is_int64] = pd.util.hash_array(np.array(values[is_int64].tolist(), dtype=np.int64))
+        hashes[~is_int64] = _hash_strings(values[~is_int64])
+        return hashes
+
+    if value_type in (bool, float):
+        return pd.util.hash_array(np.array(values.tolist(), dtype=value_type))
+
+    return _hash_strings(values)
+
+
+def _hash_objects(values: np.ndarray) -> np.ndarray:
+    """Hashes of values with their types, "1" and 1 get different hashes.
+
+    A hash depends on the value only, not on other values of the array.
+    """
+    type_codes, unique_types = pd.factorize(np.frompyfunc(type, 1, 1)(values))
+    type_hashes = pd.util.hash_array(np.array([value_type.__qualname__ for value_type in unique_types], dtype=object))
+    hashes = np.empty(len(values), dtype=np.uint64)
+
+    for code, value_type in enumerate(unique_types):
+        is_type = type_codes == code
+        hashes[is_type] = _hash_values_of_type(values[is_type], value_type) * _TYPE_HASH_MULTIPLIER ^ type_hashes[code]
+
+    return hashes
+
+
+def _get_values_bytes(column: pd.Series) -> bytes:
+    """Bytes of values that do not depend on splitting of values into chunks"""
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        codes = column.cat.codes.to_numpy()
+        categories = np.append(column.cat.categories.to_numpy(dtype=object), np.nan)
+        # code -1 of null values takes NaN at the end of categories
+        return _hash_objects(categories)[codes].tobytes()
+
+    values = column.to_numpy()
+
+    if values.dtype.hasobject:
+        return _hash_objects(values).tobytes()
+
+    return np.ascontiguousarray(values).tobytes()
+
+
+class _ValuesHash:
+    """Hash of values added by chunks, the same for all splits of values into chunks of the same dtype"""
+
+    def __init__(self, name: Any):
+        self._digest = hashlib.sha256()
+        self._digest.update(repr(name).encode())
+        self._dtype: Optional[str] = None
+
+    def add(self, values: pd.Series) -> None:
+        dtype = str(values.dtype)
+
+        # dtype is hashed when it changes only, so chunks of the same dtype are hashed as one array
+        if dtype != self._dtype:
+            self._digest.update(f"\0{dtype}\0".encode())
+            self._dtype = dtype
+
+        self._digest.update(_get_values_bytes(values))
+
+    def get(self) -> str:
+        return self._digest.hexdigest()
+
+
+class FingerprintCalculator:
+    """Fingerprint of a DataFrame added by chunks of rows with the same columns.
+
+    In "full" mode the fingerprint is the same as the fingerprint of the concatenated chunks
+    if columns of all chunks have the same dtypes. "sampled" mode hashes every `step`-th row,
+    in "full" mode `step` is 1. Columns of a chunk are hashed in `max_workers` threads if it is greater than 1.
+    """
+
+    def __init__(self, mode: str = "full", step: int = 1, max_workers: Optional[int] = None):
+        if mode not in FINGERPRINT_MODES:
+            raise ValueError(f"Fingerprint mode is incorrect: {mode}. Expected one of {list(FINGERPRINT_MODES)}")
+
+        if step < 1 or (mode == "full" and step != 1):
+            raise ValueError(f"step should be 1 in full mode and a positive int in sampled mode, got {step}")
+
+        self.mode = mode
+        self.step = step
+        self.max_workers = max_workers
+        self.n_rows = 0
+        self._index = _ValuesHash("__index__")
+        self._column_names: Optional[list] = None
+        self._columns: List[_ValuesHash] = []
+
+    def add(self, chunk: pd.DataFrame) -> None:
+        if self._column_names is None:
+            self._column_names = list(chunk.columns)
+            self._columns = [_ValuesHash(column_name) for column_name in chunk.columns]
+
+        elif list(chunk.columns) != self._column_names:
+            raise ValueError("All chunks should have the same columns")
+
+        # positions of hashed rows are counted from the first row of the first chunk
+        sample = chunk.iloc[(-self.n_rows) % self.step :: self.step]
+        self.n_rows += chunk.shape[0]
+        self._index.add(sample.index.to_series())
+
+        def add_column(position: int):
+            self._columns[position].add(sample.iloc[:, position])
+
+        if self.max_workers is not None and self.max_workers > 1 and len(self._columns) > 1:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                list(executor.map(add_column, range(len(self._columns))))
+
+        else:
+            for position in range(len(self._columns)):
+                add_column(position)
+
+    def get(self) -> DataFingerprint:
+        column_names = self._column_names or []
+        column_hashes = [(name, values_hash.get()) for name, values_hash in zip(column_names, self._columns)]
+        index = self._index.get()
+        digest = hashlib.sha256()
+        digest.update(repr((self.mode, self.n_rows, self.step, index, column_hashes)).encode())
+        return DataFingerprint(
+            mode=self.mode,
+            n_rows=self.n_rows,
+            step=self.step,
+            index=index,
+            columns=dict(column_hashes),
+            hash=digest.hexdigest(),
+        )
+
+
+def get_fingerprint(
+    dataset: pd.DataFrame,
+    mode: str = "full",
+    sample_size: int = DEFAULT_SAMPLE_SIZE,
+    max_workers: Optional[int] = None,
+) -> DataFingerprint:
+    """Fingerprint of all rows ("full" mode) or of evenly spaced rows, at most `sample_size` ("sampled" mode).
+
+    Sampled fingerprints are fast for large data but do not see changes in rows out of the sample.
+    """
+    if sample_size < 1:
+        raise ValueError(f"sample_size should be a positive int, got {sample_size}")
+
+    step = max(1, -(-dataset.shape[0] // sample_size)) if mode == "sampled" else 1
+    calculator = FingerprintCalculator(mode, step, max_workers)
+    calculator.add(dataset)
+    return calculator.get()
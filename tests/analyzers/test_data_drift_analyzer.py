@@ -100,3 +100,59 @@ def test_data_drift_analyzer_with_different_values_in_reference_and_current_data
     # check features in results
     assert result.metrics.n_features == 3
     assert result.metrics.dataset_drift is False
+
+
+@pytest.mark.parametrize(
+    "executor, max_workers",
+    (
+        ("thread", 2),
+        ("thread", 10),
+        ("process", 2),
+    ),
+)
+def test_data_drift_analyzer_parallel_executors(executor: str, max_workers: int) -> None:
+    reference_data = DataFrame(
+        {
+            "numerical_feature_1": [0.5, 0.0, 4.8, 2.1, 1.5, 3.3],
+            "numerical_feature_2": [0, 5, 6, 3, 1, 2],
+            "numerical_feature_3": [4, 5.5, 4, 0, 1, 9],
+            "categorical_feature_1": ["a", "b", "a", "c", "a", "a"],
+            "categorical_feature_2": ["x", "y", "x", "x", "x", "y"],
+            "target": [1, 0, 1, 0, 1, 1],
+        }
+    )
+    current_data = DataFrame(
+        {
+            "numerical_feature_1": [1.5, 2.0, 8.8, 2.1, 4.5, 0.3],
+            "numerical_feature_2": [1, 5, 2, 3, 1, 8],
+            "numerical_feature_3": [4, 1.5, 4, 3, 1, 9],
+            "categorical_feature_1": ["a", "c", "c", "c", "a", "b"],
+            "categorical_feature_2": ["x", "y", "y", "y", "x", "y"],
+            "target": [1, 0, 0, 0, 1, 0],
+        }
+    )
+    column_mapping = ColumnMapping(categorical_features=["categorical_feature_1", "categorical_feature_2"])
+
+    serial_analyzer = DataDriftAnalyzer()
+    serial_analyzer.options_provider = OptionsProvider()
+    expected = serial_analyzer.calculate(reference_data.copy(), current_data.copy(), column_mapping)
+
+    options_provider: OptionsProvider = OptionsProvider()
+    options_provider.add(DataDriftOptions(executor=executor, max_workers=max_workers))
+    parallel_analyzer = DataDriftAnalyzer()
+    parallel_analyzer.options_provider = options_provider
+    result = parallel_analyzer.calculate(reference_data.copy(), current_data.copy(), column_mapping)
+
+    assert list(result.metrics.features.keys()) == list(expected.metrics.features.keys())
+    assert result.metrics == expected.metrics
+
+
+def test_data_drift_analyzer_unknown_executor() -> None:
+    options_provider: OptionsProvider = OptionsProvider()
+    options_provider.add(DataDriftOptions(executor="gpu"))
+    analyzer = DataDriftAnalyzer()
+    analyzer.options_provider = options_provider
+    data = DataFrame({"feature1": [1, 2, 3], "feature2": [1.5, 2.5, 3.5]})
+
+    with pytest.raises(ValueError):
+        analyzer.calculate(data, data, ColumnMapping())
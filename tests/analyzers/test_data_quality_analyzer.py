@@ -6,8 +6,14 @@ import pandas as pd
 from evidently import ColumnMapping
 from evidently.analyzers.data_quality_analyzer import DataQualityAnalyzer
 from evidently.calculations import data_quality
+from evidently.calculations.data_quality import calculate_correlations
 from evidently.calculations.data_quality import calculate_data_quality_stats
 from evidently.calculations.data_quality import FeatureQualityStats
+from evidently.calculations.reference_profile import get_reference_profile
+from evidently.calculations.reference_profile import get_reference_sketch
+from evidently.calculations.reference_profile import load_reference_profile
+from evidently.calculations.reference_profile import save_reference_profile
+from evidently.options import DataQualityOptions
 from evidently.utils.data_operations import process_columns
 
 import pytest
@@ -516,6 +522,56 @@ def test_data_profile_analyzer_empty_features() -> None:
     )
 
 
+@pytest.mark.parametrize(
+    "dataset",
+    (
+        pd.DataFrame(
+            {
+                "num": [np.nan, 2, 2, 432, 1.5, np.nan, np.nan],
+                "num_with_inf": [np.inf, 2, 2, -np.inf, 1.5, np.nan, 0],
+                "cat": ["y", "n", "n/a", "n", None, "y", "n"],
+                "datetime": pd.to_datetime(["2012-01-05", None, "2002-12-05", "2012-01-05", None, None, "2003-01-01"]),
+            }
+        ),
+        pd.DataFrame(
+            {
+                "num": [np.nan, np.nan, np.nan],
+                "num_with_inf": [np.inf, np.inf, 1],
+                "cat": [None, None, None],
+                "datetime": [np.nan, np.nan, np.nan],
+            }
+        ),
+    ),
+)
+def test_calculate_data_quality_stats_with_reference_profile(dataset: pd.DataFrame, tmp_path) -> None:
+    data_mapping = ColumnMapping(
+        numerical_features=["num", "num_with_inf"], categorical_features=["cat"], datetime_features=["datetime"]
+    )
+    columns = process_columns(dataset, data_mapping)
+    expected = calculate_data_quality_stats(dataset, columns, None)
+    save_reference_profile(get_reference_sketch(dataset, data_mapping), tmp_path / "sketch.npz")
+
+    for reference_profile in (
+        get_reference_profile(dataset, data_mapping),
+        load_reference_profile(tmp_path / "sketch.npz"),
+    ):
+        result = calculate_data_quality_stats(reference_profile, columns, None)
+        assert result.get_all_features() == expected.get_all_features()
+
+
+def test_calculate_data_quality_stats_with_reference_sketch() -> None:
+    dataset = pd.DataFrame({"num": np.random.default_rng(0).normal(size=10000)})
+    columns = process_columns(dataset, ColumnMapping(numerical_features=["num"]))
+    expected = calculate_data_quality_stats(dataset, columns, None)["num"]
+    result = calculate_data_quality_stats(get_reference_sketch(dataset, n_buckets=100), columns, None)["num"]
+
+    for field in ("count", "missing_count", "unique_count", "min", "max", "mean", "std", "most_common_value"):
+        assert getattr(result, field) == getattr(expected, field)
+
+    for field in ("percentile_25", "percentile_50", "percentile_75"):
+        assert getattr(result, field) == pytest.approx(getattr(expected, field), abs=0.02)
+
+
 def test_data_profile_analyzer_regression() -> None:
     data_profile_analyzer = DataQualityAnalyzer()
     reference_data = pd.DataFrame(
@@ -805,6 +861,21 @@ def test_cramer_v() -> None:
 def test_corr_matrix(df: pd.DataFrame, expected: np.array) -> None:
     corr_matrix = data_quality._corr_matrix(df, data_quality._cramer_v)
     assert np.allclose(corr_matrix.values, expected)
+    assert np.allclose(data_quality._cramer_v_matrix(df).values, expected)
+
+
+def test_cramer_v_matrix() -> None:
+    df = pd.DataFrame(
+        {
+            "x": ["a", "b", None, "a", "c", "b", "a", "c", "c", "a"],
+            "y": [1, 2, 2, 1, 1, np.nan, 2, 3, 3, 1],
+            "z": [True, False, True, True, False, True, False, True, True, True],
+            "constant": ["e"] * 10,
+        }
+    )
+    pd.testing.assert_frame_equal(
+        data_quality._cramer_v_matrix(df), data_quality._corr_matrix(df, data_quality._cramer_v)
+    )
 
 
 @pytest.mark.parametrize(
@@ -908,3 +979,96 @@ def test_calculate_correlations(kind: str, expected_corr_df: np.array) -> None:
     assert num_for_corr == ["num_feature_1", "num_feature_2", "num_feature_3", "num_feature_4", "target"]
     assert cat_for_corr == ["cat_feature_1", "cat_feature_2", "cat_feature_3", "cat_feature_4"]
     assert np.allclose(corr_df, expected_corr_df, equal_nan=True)
+
+
+def test_calculate_correlations_with_options() -> None:
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {
+            "num_feature_1": rng.normal(size=1000),
+            "num_feature_2": rng.normal(size=1000),
+            "cat_feature": rng.choice(["a", "b", "c"], size=1000),
+        }
+    )
+    column_mapping = ColumnMapping(
+        numerical_features=["num_feature_1", "num_feature_2"], categorical_features=["cat_feature"]
+    )
+    columns = process_columns(df, column_mapping)
+    features_stats = calculate_data_quality_stats(df, columns, None)
+
+    options = DataQualityOptions(correlation_kinds=["pearson", "cramer_v"])
+    correlations = calculate_correlations(df, features_stats, None, options)
+    expected = calculate_correlations(df, features_stats, None)
+    assert list(correlations) == ["pearson", "spearman", "kendall", "cramer_v"]
+    assert correlations["spearman"].empty
+    assert correlations["kendall"].empty
+    pd.testing.assert_frame_equal(correlations["pearson"], expected["pearson"])
+    pd.testing.assert_frame_equal(correlations["cramer_v"], expected["cramer_v"])
+
+    options = DataQualityOptions(correlation_sample_size=100, correlation_random_state=1)
+    correlations = calculate_correlations(df, features_stats, None, options)
+    sample = df.sample(n=100, random_state=1)
+    pd.testing.assert_frame_equal(correlations["kendall"], sample[["num_feature_1", "num_feature_2"]].corr("kendall"))
+    # the same sample with the same random state
+    same_sample_correlations = calculate_correlations(df, features_stats, None, options)
+    pd.testing.assert_frame_equal(correlations["pearson"], same_sample_correlations["pearson"])
+
+
+@pytest.mark.parametrize(
+    "feature",
+    [
+        pd.Series(["a", None, "b", "a", None, "c"]),
+        pd.Series([1.0, np.nan, 2.0, 1.0, np.nan, 2.0, 3.0]),
+        pd.Series([3, 1, 2, 3, 1, 2]),
+        pd.Series([np.nan, 2.0, np.nan, 2.0, 1.0]),
+        pd.Series(pd.to_datetime(["2020-01-01", None, "2020-01-02", "2020-01-01"])),
+        pd.Series([], dtype=float),
+    ],
+)
+def test_get_value_counts(feature: pd.Series) -> None:
+    expected = feature.value_counts(dropna=False)
+    value_counts = data_quality._get_value_counts(feature)
+    assert [repr(value) for value in value_counts.index] == [repr(value) for value in expected.index]
+    assert list(value_counts) == list(expected)
+
+
+def test_get_num_features_stats() -> None:
+    df = pd.DataFrame(
+        {
+            "float": [1.5, np.nan, 2.25, 1.5, 3.0, np.nan],
+            "int": [1, 2, 3, 3, 5, 8],
+            "object": pd.Series([1, 2, 2, None, 4, 5], dtype=object),
+            "with_inf": [1.0, np.inf, 2.0, np.nan, 2.0, 4.0],
+            "empty": [np.nan] * 6,
+        }
+    )
+    result = data_quality._get_num_features_stats(df, list(df.columns))
+
+    assert list(result) == list(df.columns)
+    assert result["int"] == FeatureQualityStats(
+        feature_type="num",
+        count=6,
+        infinite_count=0,
+        infinite_percentage=0.0,
+        missing_count=0,
+        missing_percentage=0.0,
+        unique_count=5,
+        unique_percentage=83.33,
+        percentile_25=2.25,
+        percentile_50=3.0,
+        percentile_75=4.5,
+        max=8,
+        min=1,
+        mean=3.67,
+        most_common_value=3,
+        most_common_value_percentage=33.33,
+        std=2.5,
+    )
+    assert result["with_inf"].infinite_count == 1
+    assert np.isnan(result["with_inf"].std)
+    assert result["with_inf"].max == np.inf
+    assert result["empty"].count == 0
+    assert np.isnan(result["empty"].mean)
+
+    for column_name in df.columns:
+        assert data_quality._get_features_stats(df[column_name], "num") == result[column_name]
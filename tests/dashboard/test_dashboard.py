@@ -1,5 +1,6 @@
 from typing import ClassVar
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -68,3 +69,26 @@ def test_dashboards_without_current_data_prob_classification() -> None:
     assert dashboard.analyzers_results is not None
     dashboard.calculate(test_data, test_data, data_mapping)
     assert dashboard.analyzers_results is not None
+
+
+def test_dashboard_does_not_change_input_data() -> None:
+    reference_data = pd.DataFrame(
+        {
+            "target": [1.0, 0.5, np.inf, 2.0, 3.0, np.nan, 4.0, 1.0],
+            "prediction": [1.0, -np.inf, 1.0, 2.5, 2.0, 1.0, 3.0, 1.5],
+            "num_feature": [1.0, 2.0, 3.0, np.inf, 5.0, 6.0, 7.0, 8.0],
+            "cat_feature": ["a", "b", "a", "b", "a", "b", "a", "b"],
+        }
+    )
+    current_data = reference_data.iloc[::-1].reset_index(drop=True)
+    initial_reference_data = reference_data.copy()
+    initial_current_data = current_data.copy()
+    dashboard = Dashboard(tabs=[RegressionPerformanceTab()])
+    dashboard.calculate(
+        reference_data,
+        current_data,
+        ColumnMapping(numerical_features=["num_feature"], categorical_features=["cat_feature"]),
+    )
+
+    pd.testing.assert_frame_equal(reference_data, initial_reference_data)
+    pd.testing.assert_frame_equal(current_data, initial_current_data)
@@ -0,0 +1,133 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn import metrics
+
+from evidently.calculations.classification_performance import calculate_classification_quality
+from evidently.calculations.classification_performance import calculate_negative_rates
+from evidently.calculations.classification_performance import calculate_pr_table
+from evidently.calculations.classification_performance import downsample_curve
+
+
+def test_calculate_pr_table():
+    target = np.array([1, 0, 1, 1, 0])
+    probas = np.array([0.9, 0.8, 0.7, 0.3, 0.1])
+    assert calculate_pr_table(target, probas, step_size=0.4) == [
+        [40.0, 2, 0.7, 1, 1, 50.0, 33.3],
+        [80.0, 4, 0.1, 3, 1, 75.0, 100.0],
+        [100.0, 5, 0.1, 3, 2, 60.0, 100.0],
+    ]
+
+
+def test_calculate_pr_table_keeps_order_of_equal_probabilities():
+    target = np.array([0, 1, 0, 1])
+    probas = np.array([0.5, 0.5, 0.5, 0.5])
+    assert calculate_pr_table(target, probas, step_size=0.25) == [
+        [25.0, 1, 0.5, 0, 1, 0.0, 0.0],
+        [50.0, 2, 0.5, 1, 1, 50.0, 50.0],
+        [75.0, 3, 0.5, 1, 2, 33.3, 50.0],
+        [100.0, 4, 0.5, 2, 2, 50.0, 100.0],
+    ]
+
+
+def test_calculate_pr_table_for_all_classes():
+    rng = np.random.default_rng(0)
+    target = rng.integers(0, 3, 1000)
+    binaraized_target = (target.reshape(-1, 1) == np.arange(3)).astype(int)
+    probas = np.round(rng.random((1000, 3)), 2)
+    tables = calculate_pr_table(binaraized_target, probas)
+    assert len(tables) == 3
+
+    for idx, table in enumerate(tables):
+        assert table == calculate_pr_table(binaraized_target[:, idx], probas[:, idx])
+        assert len(table) == 20
+        assert table[-1][1] == 1000
+        assert table[-1][3] == binaraized_target[:, idx].sum()
+
+
+def test_calculate_pr_table_with_incorrect_shapes():
+    with pytest.raises(ValueError):
+        calculate_pr_table(np.array([1, 0]), np.array([[0.5, 0.5], [0.5, 0.5]]))
+
+
+def test_calculate_negative_rates():
+    target = np.array([1, 0, 1, 1, 0])
+    probas = np.array([0.9, 0.8, 0.7, 0.3, 0.1])
+    tnr, fnr = calculate_negative_rates(target, probas, np.array([1.9, 0.9, 0.7, 0.3, 0.1]))
+    assert tnr == [1.0, 1.0, 0.5, 0.5, 0.0]
+    assert fnr == pytest.approx([1.0, 2 / 3, 1 / 3, 0.0, 0.0])
+
+
+def test_downsample_curve():
+    curve = {"thrs": [5, 4, 3, 2, 1, 0], "tpr": [0.0, 0.2, 0.4, 0.6, 0.8, 1.0]}
+    assert downsample_curve(curve, None) is curve
+    assert downsample_curve(curve, 6) is curve
+    assert downsample_curve(curve, 3) == {"thrs": [5, 3, 0], "tpr": [0.0, 0.4, 1.0]}
+
+    with pytest.raises(ValueError):
+        downsample_curve(curve, 1)
+
+
+def _get_labels(kind: str, size: int, labels_count: int, seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    labels = {
+        "int": np.arange(labels_count) * 3 - 2,
+        "str": np.array([f"label_{idx}" for idx in range(labels_count)], dtype=object),
+        "bool": np.array([True, False][:labels_count]),
+        "float": np.arange(labels_count) * 2.0,
+    }[kind]
+    return rng.choice(labels, size)
+
+
+@pytest.mark.filterwarnings("ignore::sklearn.exceptions.UndefinedMetricWarning")
+@pytest.mark.parametrize("kind", ["int", "str", "bool", "float"])
+@pytest.mark.parametrize("labels_count", [1, 2, 4])
+@pytest.mark.parametrize("size", [1, 7, 500])
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_calculate_classification_quality_is_equal_to_sklearn(kind: str, labels_count: int, size: int, seed: int):
+    target = _get_labels(kind, size, labels_count, seed)
+    prediction = _get_labels(kind, size, labels_count, seed + 100)
+    labels = sorted(set(target) | set(prediction))
+
+    if len(labels) > 2:
+        averages = [("macro", None)]
+
+    else:
+        averages = [("binary", labels[0]), ("binary", labels[-1])]
+
+    for average, pos_label in averages:
+        average_args = {"average": average}
+
+        if average == "binary":
+            average_args["pos_label"] = pos_label
+
+        result = calculate_classification_quality(pd.Series(target), pd.Series(prediction), average, pos_label)
+        assert result.accuracy == metrics.accuracy_score(target, prediction)
+        assert result.precision == metrics.precision_score(target, prediction, **average_args)
+        assert result.recall == metrics.recall_score(target, prediction, **average_args)
+        assert result.f1 == metrics.f1_score(target, prediction, **average_args)
+        expected_metrics_matrix = metrics.classification_report(target, prediction, output_dict=True)
+        assert result.metrics_matrix == expected_metrics_matrix
+        assert list(result.metrics_matrix) == list(expected_metrics_matrix)
+        assert np.array_equal(result.confusion_matrix, metrics.confusion_matrix(target, prediction))
+
+
+def test_calculate_classification_quality_with_object_labels():
+    target = pd.Series([1, 0, 1, 1], dtype=object)
+    prediction = pd.Series([1, 1, 0, 1])
+    result = calculate_classification_quality(target, prediction, "binary", pos_label=1)
+    assert result.accuracy == 0.5
+    assert result.precision == pytest.approx(2 / 3)
+    assert result.recall == pytest.approx(2 / 3)
+    assert result.confusion_matrix.tolist() == [[0, 1], [1, 2]]
+
+
+def test_calculate_classification_quality_errors():
+    with pytest.raises(ValueError):
+        calculate_classification_quality(np.array([0, 1, 2]), np.array([0, 1, 1]), "binary", pos_label=1)
+
+    with pytest.raises(ValueError):
+        calculate_classification_quality(np.array([0, 1]), np.array([0, 1]), "binary", pos_label=3)
+
+    with pytest.raises(ValueError):
+        calculate_classification_quality(np.array([0, 1]), np.array([0, 1]), "micro")
@@ -0,0 +1,71 @@
+from itertools import combinations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from evidently.calculations.data_integrity import get_number_of_duplicates
+
+
+def _get_random_dataset(seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    size = int(rng.integers(0, 30))
+    data: dict = {}
+
+    for column in range(int(rng.integers(1, 8))):
+        kind = rng.integers(0, 4)
+
+        if kind == 0:
+            data[column] = rng.integers(0, 2, size)
+
+        elif kind == 1:
+            data[column] = np.where(rng.random(size) < 0.3, np.nan, rng.integers(0, 2, size).astype(float))
+
+        elif kind == 2:
+            data[column] = rng.choice(np.array(["a", None, 1, 1.0], dtype=object), size)
+
+        else:
+            data[column] = data[int(rng.integers(0, column))] if column else rng.integers(0, 2, size)
+
+    return pd.DataFrame(data)
+
+
+@pytest.mark.parametrize(
+    "dataset",
+    [
+        pd.DataFrame(
+            {
+                "object_1": pd.Series([1, None, "x"], dtype=object),
+                "object_2": pd.Series([1.0, np.nan, "x"], dtype=object),
+                "float_1": [0.0, 1.0, np.nan],
+                "float_2": [-0.0, 1.0, np.nan],
+                "int": [1, 2, 1],
+                "float_3": [1.0, 2.0, 1.0],
+                "category": pd.Categorical(["a", "b", "a"]),
+                "object_3": ["a", "b", "a"],
+                "datetime": [pd.NaT, pd.Timestamp(0), pd.NaT],
+            }
+        ),
+        pd.DataFrame(),
+        pd.DataFrame(index=range(3)),
+    ]
+    + [_get_random_dataset(seed) for seed in range(20)],
+)
+def test_get_number_of_duplicates(dataset: pd.DataFrame):
+    expected_columns = sum(1 for i, j in combinations(dataset, 2) if dataset[i].equals(dataset[j]))
+    assert get_number_of_duplicates(dataset) == (dataset.duplicated().sum(), expected_columns)
+
+
+def test_get_number_of_duplicates_with_nan_bits():
+    with np.errstate(invalid="ignore"):
+        # NaN with the sign bit
+        negative_nan = (np.array([np.inf]) - np.array([np.inf]))[0]
+
+    dataset = pd.DataFrame(
+        {
+            "first": [np.nan, 1.0, negative_nan, negative_nan],
+            "second": [negative_nan, 1.0, np.nan, np.nan],
+            "third": np.array([np.nan, 1.0, negative_nan, np.nan], dtype=np.float32),
+        }
+    )
+    assert get_number_of_duplicates(dataset) == (2, 1)
@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+
+from evidently.calculations.histogram import count_in_bins
+from evidently.calculations.histogram import count_in_bins_batch
+from evidently.calculations.histogram import count_sorted_in_bins
+from evidently.calculations.histogram import get_bin_edges
+from evidently.calculations.histogram import get_density
+from evidently.calculations.histogram import get_histogram
+from evidently.calculations.histogram import get_sturges_bin_edges_batch
+
+
+@pytest.mark.parametrize("bins", (1, 7, "sturges", "doane", "auto"))
+@pytest.mark.parametrize(
+    "reference, current",
+    (
+        (np.array([]), np.array([])),
+        (np.array([2.0, 2.0]), np.array([2.0])),
+        (np.array([1, 5, 3, 8, 8]), np.array([], dtype=int)),
+        (np.random.default_rng(0).normal(0, 1, 500), np.random.default_rng(1).exponential(2, 300)),
+        (np.round(np.random.default_rng(2).normal(0, 10, 1000)), np.arange(-50.0, 50.0)),
+    ),
+)
+def test_histogram_is_equal_to_numpy(reference: np.ndarray, current: np.ndarray, bins) -> None:
+    expected_edges = np.histogram_bin_edges(np.concatenate([reference, current]), bins=bins)
+    edges = get_bin_edges([reference, current], bins)
+    np.testing.assert_array_equal(edges, expected_edges)
+
+    for values in (reference, current):
+        expected_counts = np.histogram(values, edges)[0]
+        np.testing.assert_array_equal(count_in_bins(values, edges), expected_counts)
+        np.testing.assert_array_equal(count_sorted_in_bins(np.sort(values), edges), expected_counts)
+
+    histogram = get_histogram({"reference": reference, "current": current}, bins)
+    np.testing.assert_array_equal(histogram.edges, expected_edges)
+    np.testing.assert_array_equal(histogram.counts["current"], np.histogram(current, edges)[0])
+
+
+def test_batch_histograms_are_equal_to_numpy() -> None:
+    rng = np.random.default_rng(3)
+    columns = np.array(
+        [rng.normal(0, 1, 200), np.round(rng.normal(0, 10, 200)), np.full(200, 2.0), rng.exponential(2, 200)]
+    )
+    columns[3, ::7] = np.nan
+    finite = [column[~np.isnan(column)] for column in columns]
+    edges, n_bins, edges_offsets = get_sturges_bin_edges_batch(
+        np.array([column.min() for column in finite]),
+        np.array([column.max() for column in finite]),
+        np.array([len(column) for column in finite]),
+    )
+    bins_offsets = np.concatenate([[0], np.cumsum(n_bins)[:-1]])
+    counts = count_in_bins_batch(columns, edges, n_bins, edges_offsets, bins_offsets)
+
+    for idx, column in enumerate(finite):
+        expected_edges = np.histogram_bin_edges(column, bins="sturges")
+        column_edges = edges[edges_offsets[idx] : edges_offsets[idx] + n_bins[idx] + 1]
+        np.testing.assert_array_equal(column_edges, expected_edges)
+        column_counts = counts[bins_offsets[idx] : bins_offsets[idx] + n_bins[idx]]
+        np.testing.assert_array_equal(column_counts, np.histogram(column, expected_edges)[0])
+
+
+def test_count_in_bins_with_weights_and_values_out_of_bins() -> None:
+    edges = np.array([0.0, 1.0, 2.0])
+    values = np.array([-1.0, 0.0, 0.5, 1.0, 2.0, 3.0, np.nan])
+    weights = np.array([1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0])
+    np.testing.assert_array_equal(count_in_bins(values, edges), [2, 2])
+    np.testing.assert_array_equal(count_in_bins(values, edges, weights), [5.0, 9.0])
+    np.testing.assert_array_equal(count_sorted_in_bins(np.sort(values[:-1]), edges), [2, 2])
+    np.testing.assert_allclose(
+        get_density(count_in_bins(values, edges, weights), edges),
+        np.histogram(values[:-1], edges, weights=weights[:-1], density=True)[0],
+    )
+
+
+def test_bin_edges_errors() -> None:
+    with pytest.raises(ValueError):
+        get_bin_edges([np.array([1.0, np.inf])], 10)
+
+    with pytest.raises(ValueError):
+        get_bin_edges([np.array([1.0, 2.0])], 0)
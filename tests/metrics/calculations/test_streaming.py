@@ -0,0 +1,111 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from evidently.calculations.streaming import ColumnWindowStats
+from evidently.calculations.streaming import DistinctCountSketch
+from evidently.calculations.streaming import QuantileSketch
+from evidently.calculations.streaming import RowReservoir
+from evidently.calculations.streaming import SlidingExtremum
+from evidently.calculations.streaming import _get_quantiles_by_counts
+
+
+@pytest.mark.parametrize("is_max", (True, False))
+def test_sliding_extremum(is_max: bool):
+    rng = np.random.default_rng(0)
+    values = rng.integers(0, 10, 100).astype(float)
+    extremum = SlidingExtremum(is_max)
+
+    for start in range(0, 100, 7):
+        extremum.add(values[start : start + 7])
+
+    for start in range(0, 90, 9):
+        extremum.remove(values[start : start + 9])
+        window = values[start + 9 :]
+        assert extremum.get() == (window.max() if is_max else window.min())
+
+
+def test_row_reservoir():
+    data = pd.DataFrame({"row": np.arange(20)})
+    counts = np.zeros(20)
+
+    for random_state in range(300):
+        reservoir = RowReservoir(5, random_state)
+
+        for start in range(0, 20, 3):
+            reservoir.add(data.iloc[start : start + 3])
+
+        assert reservoir.n_rows == 20
+        assert reservoir.sample["row"].nunique() == 5
+        assert reservoir.row_numbers.tolist() == reservoir.sample["row"].tolist()
+        counts[reservoir.sample["row"]] += 1
+
+    # every row gets to the sample with the same probability
+    assert counts / 300 == pytest.approx(np.full(20, 0.25), abs=0.1)
+
+
+def test_row_reservoir_small_data():
+    data = pd.DataFrame({"row": np.arange(4)})
+    reservoir = RowReservoir(5)
+    reservoir.add(data)
+
+    assert reservoir.sample["row"].tolist() == [0, 1, 2, 3]
+
+
+def test_quantile_sketch():
+    values = np.random.default_rng(0).exponential(1, 100000)
+    sketch = QuantileSketch(500)
+    sketch.add(values[:300])
+    np.testing.assert_array_equal(sketch.get_weighted_values()[0], np.sort(values[:300]))
+
+    for start in range(300, len(values), 1000):
+        sketch.add(values[start : start + 1000])
+
+    sorted_values, weights = sketch.get_weighted_values()
+    assert weights.sum() == len(values)
+    assert len(sorted_values) < 3 * 500
+    qs = np.linspace(0.05, 0.95, 19)
+    quantiles = _get_quantiles_by_counts(sorted_values, weights, qs)
+    # ranks of approximate quantiles among all values
+    assert np.searchsorted(np.sort(values), quantiles) / len(values) == pytest.approx(qs, abs=0.01)
+
+
+def test_distinct_count_sketch():
+    sketch = DistinctCountSketch(1000)
+    sketch.add(np.array([1.0, -0.0, 0.0, 1.0, np.inf]))
+    assert sketch.count() == 3
+
+    for start in range(0, 50000, 5000):
+        sketch.add(np.arange(start, start + 5000) / 7)
+        sketch.add(np.arange(start, start + 5000) / 7)
+
+    assert sketch.count() == pytest.approx(50000, rel=0.1)
+
+
+def test_column_window_stats_with_sketches():
+    rng = np.random.default_rng(0)
+    values = np.where(rng.random(20000) < 0.2, 5.0, rng.normal(0, 1, 20000))
+    stats = ColumnWindowStats(np.array([-1.0, 0.0, 1.0]), track_extremums=True, sketch_size=50)
+
+    for start in range(0, len(values), 1000):
+        stats.add(values[start : start + 1000])
+
+    assert not stats.is_exact
+    assert len(stats.value_counts) == 50
+    feature_stats = stats.get_feature_stats("num", exact_percentiles=True)
+    assert feature_stats.most_common_value == 5.0
+    # the count of the most common value is lower by not more than count / (sketch_size + 1)
+    assert 0 <= 20 - feature_stats.most_common_value_percentage <= 100 / 51 + 0.01
+    assert feature_stats.unique_count == pytest.approx(len(np.unique(values)), rel=0.5)
+    assert feature_stats.percentile_50 == pytest.approx(np.quantile(values, 0.5), abs=0.1)
+
+    with pytest.raises(ValueError, match="cannot be removed"):
+        stats.remove(values[:1000])
+
+    # counts are exact while there are not more distinct values than sketch_size
+    stats = ColumnWindowStats(np.array([0.0]), track_extremums=True, sketch_size=50)
+    stats.add(np.array([1.0, 2.0, 2.0, np.nan]))
+    stats.add(np.array([3.0, 2.0, np.inf]))
+    assert stats.is_exact
+    assert stats.value_counts.to_dict() == {1.0: 1, 2.0: 3, 3.0: 1, np.inf: 1}
+    assert stats.get_feature_stats("num", exact_percentiles=True).percentile_25 == 2.0
@@ -12,7 +12,11 @@ from evidently.calculations.classification_performance import ConfusionMatrix
 from evidently.pipeline.column_mapping import ColumnMapping
 from evidently.metrics.base_metric import InputData
 from evidently.metrics import ClassificationPerformanceMetrics
+from evidently.metrics import ClassificationPerformanceMetricsSweep
 from evidently.metrics import ClassificationPerformanceMetricsThreshold
+from evidently.metrics import ClassificationPerformanceMetricsTopK
+from evidently.metrics.classification_performance_metrics import ClassificationPerformanceMetricsThresholdBase
+from evidently.metrics.classification_performance_metrics import _collect_plot_data
 from evidently.metrics.classification_performance_metrics import get_prediction_data
 from evidently.metrics.classification_performance_metrics import k_probability_threshold
 from evidently.metrics.classification_performance_metrics import threshold_probability_labels
@@ -478,3 +482,120 @@ def test_threshold_probability_labels(
     probas: pd.DataFrame, pos_label: str, neg_label: str, threshold: float, expected: pd.Series
 ) -> None:
     assert threshold_probability_labels(probas, pos_label, neg_label, threshold).tolist() == expected
+
+
+def test_classification_performance_metrics_rate_curve_size() -> None:
+    rng = np.random.default_rng(0)
+    test_dataset = pd.DataFrame({"target": rng.integers(0, 2, 1000), "prediction": rng.random(1000)})
+    data_mapping = ColumnMapping(pos_label=1)
+    data = InputData(current_data=test_dataset, reference_data=None, column_mapping=data_mapping)
+    full_result = ClassificationPerformanceMetrics().calculate(data)
+    result = ClassificationPerformanceMetrics(rate_curve_size=50).calculate(data)
+    full_rates = full_result.current.rate_plots_data
+    rates = result.current.rate_plots_data
+    assert len(full_rates["thrs"]) > 50
+    assert set(rates.keys()) == {"thrs", "tpr", "fpr", "fnr", "tnr"}
+
+    for key, values in rates.items():
+        assert len(values) == 50
+        assert values[0] == full_rates[key][0]
+        assert values[-1] == full_rates[key][-1]
+
+
+def test_get_prediction_data_multiclass_labels() -> None:
+    data = pd.DataFrame(
+        {
+            "target": ["a", "b", "c", "a"],
+            "a": [0.5, 0.2, 0.3, 0.4],
+            "b": [0.3, 0.6, 0.3, 0.4],
+            "c": [0.2, 0.2, 0.4, 0.2],
+        }
+    )
+    mapping = ColumnMapping(prediction=["a", "b", "c"])
+    predictions = get_prediction_data(data, mapping).predictions
+    assert predictions.equals(data[["a", "b", "c"]].idxmax(axis=1))
+    assert predictions.tolist() == ["a", "b", "c", "a"]
+
+    data.loc[0, "a"] = np.nan
+    assert get_prediction_data(data, mapping).predictions.tolist() == ["b", "b", "c", "a"]
+
+
+def test_collect_plot_data() -> None:
+    probas = pd.DataFrame({"a": [0.1, 0.5, 0.9, 0.3, 0.7], "b": [0.9, 0.5, 0.1, 0.7, 0.3]})
+    assert _collect_plot_data(probas) == {
+        "mins": [0.1, 0.1],
+        "lowers": [0.3, 0.3],
+        "means": [0.5, 0.5],
+        "uppers": [0.7, 0.7],
+        "maxs": [0.9, 0.9],
+    }
+
+
+@pytest.mark.parametrize(
+    "data, mapping",
+    (
+        (
+            pd.DataFrame(
+                {
+                    "target": [1, 1, 1, 1, 0, 0, 0, 0, 0, 0],
+                    "prediction": [0.9, 0.7, 0.0, 0.5, 0.1, 0.4, 0.6, 0.2, 0.2, 0.8],
+                }
+            ),
+            ColumnMapping(pos_label=1),
+        ),
+        (
+            pd.DataFrame(
+                {
+                    "target": ["a", "a", "a", "a", "b", "b", "b", "b", "b", "b"],
+                    "a": [0.9, 0.7, 0.0, 0.5, 0.1, 0.4, 0.6, 0.2, 0.2, 0.8],
+                    "b": [0.1, 0.3, 1.0, 0.5, 0.9, 0.6, 0.4, 0.8, 0.8, 0.2],
+                }
+            ),
+            ColumnMapping(prediction=["a", "b"], pos_label="a"),
+        ),
+    ),
+)
+def test_classification_performance_metrics_sweep(data: pd.DataFrame, mapping: ColumnMapping) -> None:
+    input_data = InputData(current_data=data, reference_data=data.iloc[2:], column_mapping=mapping)
+    thresholds = [0.0, 0.2, 0.5, 0.8, 1.0]
+    result = ClassificationPerformanceMetricsSweep(thresholds=thresholds).calculate(input_data)
+
+    for threshold in thresholds:
+        expected = ClassificationPerformanceMetricsThreshold(threshold).calculate(input_data)
+        assert result.get_results(threshold=threshold) == expected
+
+    k_values = [1, 3, 0.1, 0.5]
+    result = ClassificationPerformanceMetricsSweep(k=k_values).calculate(input_data)
+
+    for k in k_values:
+        expected = ClassificationPerformanceMetricsTopK(k).calculate(input_data)
+        assert result.get_results(k=k) == expected
+
+    with pytest.raises(ValueError):
+        result.get_results(k=2)
+
+
+def test_classification_performance_metrics_sweep_errors() -> None:
+    with pytest.raises(ValueError):
+        ClassificationPerformanceMetricsSweep()
+
+    with pytest.raises(ValueError):
+        ClassificationPerformanceMetricsSweep(thresholds=[0.5], k=[1])
+
+    with pytest.raises(ValueError):
+        ClassificationPerformanceMetricsThreshold(0.3, sweep=ClassificationPerformanceMetricsSweep(thresholds=[0.5]))
+
+
+def test_classification_performance_metrics_threshold_base_subclass() -> None:
+    # subclasses without sweeps do not need sweep results
+    class HalfThreshold(ClassificationPerformanceMetricsThresholdBase):
+        def get_threshold(self, dataset: pd.DataFrame, mapping: ColumnMapping) -> float:
+            return 0.5
+
+        def calculate_metric(self, dataset: pd.DataFrame, mapping: ColumnMapping):
+            return ClassificationPerformanceMetricsThreshold(0.5).calculate_metric(dataset, mapping)
+
+    data = pd.DataFrame({"target": [1, 0, 1, 0], "prediction": [0.9, 0.7, 0.2, 0.1]})
+    input_data = InputData(current_data=data, reference_data=None, column_mapping=ColumnMapping(pos_label=1))
+    expected = ClassificationPerformanceMetricsThreshold(0.5).calculate(input_data)
+    assert HalfThreshold().calculate(input_data).current == expected.current
@@ -8,6 +8,10 @@ import pytest
 from evidently.pipeline.column_mapping import ColumnMapping
 from evidently.metrics.base_metric import InputData
 from evidently.metrics.data_drift_metrics import DataDriftMetrics
+from evidently.calculations.reference_profile import get_reference_profile
+from evidently.calculations.reference_profile import get_reference_sketch
+from evidently.calculations.reference_profile import load_reference_profile
+from evidently.calculations.reference_profile import save_reference_profile
 
 
 @pytest.mark.parametrize(
@@ -140,3 +144,54 @@ def test_data_drift_metrics_value_error(
         metric.calculate(
             data=InputData(current_data=current_dataset, reference_data=reference_dataset, column_mapping=data_mapping)
         )
+
+
+@pytest.mark.parametrize(
+    "data_mapping",
+    (
+        ColumnMapping(),
+        ColumnMapping(prediction=["label_a", "label_b"]),
+        ColumnMapping(prediction=["label_a", "label_b", "label_c"]),
+    ),
+)
+def test_data_drift_metrics_with_reference_profile(data_mapping: ColumnMapping, tmp_path) -> None:
+    reference_dataset = pd.DataFrame(
+        {
+            "category_feature": ["a", "b", "c", "a", "a", "c"],
+            "numerical_feature": [6, 6, 6, 9, 9, 9],
+            "label_a": [0.3, 0.2, 0.1, 0.5, 0.5, 0.5],
+            "label_b": [0.5, 0.5, 0.8, 0.3, 0.2, 0.4],
+            "label_c": [0.2, 0.3, 0.1, 0.2, 0.3, 0.1],
+            "target": [1, 1, 1, 0, 0, 1],
+        }
+    )
+    current_dataset = pd.DataFrame(
+        {
+            "category_feature": ["a", "b", "c", "b", "b", "c"],
+            "numerical_feature": [6, 7, 6, 1, 2, 9],
+            "label_a": [0.9, 0.5, 0.3, 0.2, 0.1, 0.5],
+            "label_b": [0.05, 0.5, 0.6, 0.7, 0.6, 0.3],
+            "label_c": [0.05, 0.0, 0.1, 0.1, 0.3, 0.2],
+            "target": [0, 0, 0, 1, 0, 1],
+        }
+    )
+    expected = DataDriftMetrics().calculate(
+        data=InputData(
+            current_data=current_dataset.copy(), reference_data=reference_dataset.copy(), column_mapping=data_mapping
+        )
+    )
+    save_reference_profile(get_reference_sketch(reference_dataset, data_mapping), tmp_path / "sketch.npz")
+
+    for reference_profile in (
+        get_reference_profile(reference_dataset, data_mapping),
+        load_reference_profile(tmp_path / "sketch.npz"),
+    ):
+        result = DataDriftMetrics().calculate(
+            data=InputData(
+                current_data=current_dataset.copy(),
+                reference_data=reference_profile,
+                column_mapping=data_mapping,
+            )
+        )
+        assert result.metrics == expected.metrics
+        assert result.distr_for_plots.keys() == expected.distr_for_plots.keys()
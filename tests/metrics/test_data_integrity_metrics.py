@@ -1,3 +1,5 @@
+import pickle
+
 import numpy as np
 import pandas as pd
 
@@ -5,6 +7,7 @@ from evidently.pipeline.column_mapping import ColumnMapping
 from evidently.metrics.base_metric import InputData
 from evidently.metrics import DataIntegrityMetrics
 from evidently.metrics import DataIntegrityNullValuesMetrics
+from evidently.metrics import DataIntegrityValueByRegexpMetrics
 
 
 def test_data_integrity_metrics() -> None:
@@ -26,6 +29,29 @@ def test_data_integrity_metrics() -> None:
     assert result.current_stats.number_of_rows == 3
 
 
+def test_data_integrity_metrics_duplicates_and_counts_of_values() -> None:
+    test_dataset = pd.DataFrame(
+        {
+            "feature_1": ["a", None, "a"],
+            "feature_2": ["a", np.nan, "a"],
+            "feature_3": [1.0, 2.0, 1.0],
+        }
+    )
+    metric = DataIntegrityMetrics()
+    result = metric.calculate(
+        data=InputData(current_data=test_dataset, reference_data=None, column_mapping=ColumnMapping())
+    )
+    assert result.current_stats.number_of_duplicated_rows == 1
+    assert result.current_stats.number_of_duplicated_columns == 1
+    assert list(result.current_stats.counts_of_values) == ["feature_1", "feature_2", "feature_3"]
+    assert result.current_stats.counts_of_values["feature_3"].to_dict("list") == {"x": [1.0, 2.0], "count": [2, 1]}
+
+    # counts of all columns are calculated for pickling
+    counts_of_values = pickle.loads(pickle.dumps(result.current_stats.counts_of_values))
+    assert isinstance(counts_of_values, dict)
+    assert counts_of_values["feature_1"].to_dict("list") == {"x": ["a", None], "count": [2, 1]}
+
+
 def test_data_integrity_metrics_different_null_values() -> None:
     test_dataset = pd.DataFrame(
         {
@@ -102,3 +128,48 @@ def test_data_integrity_metrics_different_null_values() -> None:
     assert result.current_null_values.number_of_different_nulls == 4
     assert result.current_null_values.number_of_nulls == 6
     assert result.reference_null_values is None
+
+
+def test_data_integrity_metrics_rows_with_null_values() -> None:
+    test_dataset = pd.DataFrame(
+        {
+            "category_feature": ["", "a", "b", None],
+            "numerical_feature": [0, np.inf, 2, 0],
+        }
+    )
+    data_mapping = ColumnMapping()
+    metric = DataIntegrityNullValuesMetrics(null_values=["", 0], replace=True)
+    result = metric.calculate(
+        data=InputData(current_data=test_dataset, reference_data=None, column_mapping=data_mapping)
+    )
+    # a row with null-values of several kinds is counted once, pandas nulls are not null-values here
+    assert result.current_null_values.number_of_rows_with_nulls == 2
+    assert result.current_null_values.share_of_rows_with_nulls == 0.5
+    assert result.current_null_values.different_nulls == {"": 1, 0: 2}
+
+    metric = DataIntegrityNullValuesMetrics()
+    result = metric.calculate(
+        data=InputData(current_data=test_dataset, reference_data=None, column_mapping=data_mapping)
+    )
+    assert result.current_null_values.number_of_rows_with_nulls == 3
+    assert result.current_null_values.columns_with_nulls == ["category_feature", "numerical_feature"]
+
+
+def test_data_integrity_value_by_regexp_metrics() -> None:
+    current_dataset = pd.DataFrame({"feature": ["US", "de", None, "DE", "de", "X1", "US"]})
+    reference_dataset = pd.DataFrame({"feature": [np.nan, "nan", "US", "de"]})
+    data = InputData(current_data=current_dataset, reference_data=reference_dataset, column_mapping=ColumnMapping())
+
+    result = DataIntegrityValueByRegexpMetrics(column_name="feature", reg_exp=r"[A-Z]{2}").calculate(data)
+    assert result.not_matched_values == {"current": 3, "reference": 2}
+    assert result.not_matched_table["current"].to_dict("list") == {"x": ["de", "X1"], "count": [2, 1]}
+    assert result.not_matched_table["reference"].to_dict("list") == {"x": ["nan", "de"], "count": [1, 1]}
+    assert result.mult == 7 / 4
+
+    # null values are not matched as strings
+    result = DataIntegrityValueByRegexpMetrics(column_name="feature", reg_exp=r"nan|None").calculate(data)
+    assert result.not_matched_values == {"current": 6, "reference": 2}
+
+    # the column is factorized once for all regexps
+    assert data.column_cache.misses == 2
+    assert data.column_cache.hits == 2
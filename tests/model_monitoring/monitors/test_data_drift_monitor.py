@@ -1,5 +1,38 @@
+import pandas as pd
+
+from evidently import ColumnMapping
+from evidently.calculations.reference_profile import get_reference_profile
+from evidently.model_monitoring import ModelMonitoring
 from evidently.model_monitoring.monitors.data_drift import DataDriftMonitor
 
+from tests.model_monitoring.helpers import collect_metrics_results
+
 
 def test_monitor_id():
     assert DataDriftMonitor().monitor_id() == "data_drift"
+
+
+def test_data_drift_monitor_with_reference_profile() -> None:
+    reference_data = pd.DataFrame(
+        {
+            "numerical_feature": [1, 2, 3, 4, 5, 6, 7, 8],
+            "category_feature": ["a", "b", "a", "b", "a", "b", "a", "b"],
+        }
+    )
+    current_data = pd.DataFrame(
+        {
+            "numerical_feature": [5, 6, 7, 8, 9, 10, 11, 12],
+            "category_feature": ["a", "a", "a", "a", "a", "b", "a", "b"],
+        }
+    )
+    monitoring = ModelMonitoring(monitors=[DataDriftMonitor()], options=None)
+    monitoring.execute(reference_data=reference_data, current_data=current_data, column_mapping=ColumnMapping())
+    expected = collect_metrics_results(monitoring.metrics())
+
+    monitoring = ModelMonitoring(monitors=[DataDriftMonitor()], options=None)
+    monitoring.execute(
+        reference_data=get_reference_profile(reference_data),
+        current_data=current_data,
+        column_mapping=ColumnMapping(),
+    )
+    assert collect_metrics_results(monitoring.metrics()) == expected
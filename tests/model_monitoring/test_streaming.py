@@ -0,0 +1,88 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from evidently.model_monitoring import DataDriftMonitor
+from evidently.model_monitoring import DataQualityMonitor
+from evidently.model_monitoring import ModelMonitoring
+from evidently.model_monitoring import RegressionPerformanceMonitor
+from evidently.model_monitoring import StreamingModelMonitoring
+from evidently.pipeline.column_mapping import ColumnMapping
+
+from tests.model_monitoring.helpers import collect_metrics_results
+
+
+def _get_data(size: int, shift: float, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(
+        {
+            "numerical_feature": rng.normal(shift, 1, size),
+            "discrete_feature": rng.integers(0, 4, size).astype(float),
+            "categorical_feature": rng.choice(["a", "b", "c", None], size),
+            "datetime_feature": pd.Timestamp("2022-01-01") + pd.to_timedelta(rng.integers(0, 50, size), unit="D"),
+            "target": rng.integers(0, 2, size),
+            "prediction": rng.integers(0, 2, size),
+        }
+    )
+
+
+def test_streaming_model_monitoring_is_equal_to_model_monitoring_for_the_window():
+    reference_data = _get_data(2000, 0, seed=0)
+    current_data = _get_data(3000, 0.3, seed=1)
+    column_mapping = ColumnMapping(
+        numerical_features=["numerical_feature", "discrete_feature"],
+        categorical_features=["categorical_feature"],
+        datetime_features=["datetime_feature"],
+    )
+    streaming_monitoring = StreamingModelMonitoring(
+        [DataDriftMonitor(), DataQualityMonitor()], reference_data, column_mapping, window_size=1000
+    )
+
+    for start in range(0, len(current_data), 370):
+        streaming_monitoring.update(current_data.iloc[start : start + 370])
+
+    monitoring = ModelMonitoring([DataDriftMonitor(), DataQualityMonitor()])
+    monitoring.execute(reference_data, current_data.iloc[-1000:].reset_index(drop=True), column_mapping)
+    expected = collect_metrics_results(monitoring.metrics())
+    result = collect_metrics_results(streaming_monitoring.metrics())
+
+    assert result.keys() == expected.keys()
+
+    for metric_name, expected_values in expected.items():
+        assert [value["labels"] for value in result[metric_name]] == [value["labels"] for value in expected_values]
+
+        for value, expected_value in zip(result[metric_name], expected_values):
+            labels = value["labels"] or {}
+
+            if labels.get("feature") == "numerical_feature" and labels.get("metric") != "most_common_value":
+                # numerical drift and percentiles are calculated with bins of reference data
+                assert value["value"] == pytest.approx(expected_value["value"], abs=0.05)
+
+            else:
+                assert value["value"] == pytest.approx(expected_value["value"])
+
+
+def test_streaming_model_monitoring_window():
+    reference_data = pd.DataFrame({"feature": ["a", "b", "a", "b"]})
+    column_mapping = ColumnMapping(categorical_features=["feature"], target=None, prediction=None)
+    streaming_monitoring = StreamingModelMonitoring(
+        [DataQualityMonitor()], reference_data, column_mapping, window_size=3
+    )
+    streaming_monitoring.update(pd.DataFrame({"feature": ["a", "c"]}))
+    streaming_monitoring.update(pd.DataFrame({"feature": ["c", "d"]}))
+    result = collect_metrics_results(streaming_monitoring.metrics())
+    current_stats = {
+        value["labels"]["metric"]: value["value"]
+        for value in result["data_quality:quality_stat"]
+        if value["labels"]["dataset"] == "current"
+    }
+    assert current_stats["count"] == 3
+    assert current_stats["unique_count"] == 2
+    assert current_stats["most_common_value"] == "c"
+    assert current_stats["new_in_current_values_count"] == 2
+    assert current_stats["unused_in_current_values_count"] == 2
+
+
+def test_streaming_model_monitoring_with_unsupported_monitor():
+    with pytest.raises(ValueError):
+        StreamingModelMonitoring([RegressionPerformanceMonitor()], pd.DataFrame({"feature": [1, 2]}))
@@ -0,0 +1,220 @@
+import json
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from evidently import ColumnMapping
+from evidently.model_profile import ChunkedProfile
+from evidently.model_profile import Profile
+from evidently.model_profile.sections import DataDriftProfileSection
+from evidently.model_profile.sections import DataQualityProfileSection
+from evidently.model_profile.sections import RegressionPerformanceProfileSection
+from evidently.options import DataQualityOptions
+from evidently.runner.loader import DataLoader
+from evidently.runner.loader import DataOptions
+
+
+def _get_data(size: int, shift: float, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(
+        {
+            "numerical_feature": rng.normal(shift, 1, size),
+            "discrete_feature": rng.integers(0, 4, size).astype(float),
+            "categorical_feature": rng.choice(["a", "b", "c", None], size),
+            "datetime_feature": pd.Timestamp("2022-01-01") + pd.to_timedelta(rng.integers(0, 50, size), unit="D"),
+            "target": rng.integers(0, 2, size),
+            "prediction": rng.integers(0, 2, size),
+        }
+    )
+
+
+def _get_chunks(data: pd.DataFrame, chunk_size: int):
+    return (data.iloc[start : start + chunk_size] for start in range(0, len(data), chunk_size))
+
+
+def _compare(result, expected, path: str = ""):
+    if isinstance(expected, dict):
+        assert result.keys() == expected.keys(), path
+        for key, value in expected.items():
+            _compare(result[key], value, f"{path}/{key}")
+
+    elif isinstance(expected, list):
+        assert len(result) == len(expected), path
+        for index, value in enumerate(expected):
+            _compare(result[index], value, f"{path}[{index}]")
+
+    elif "numerical_feature" in path and isinstance(expected, float) and "correlations" not in path:
+        # numerical drift is calculated with bins of reference data
+        assert result == pytest.approx(expected, abs=0.05), path
+
+    elif isinstance(expected, float):
+        assert result == pytest.approx(expected, nan_ok=True), path
+
+    else:
+        assert result == expected, path
+
+
+def _get_results(profile) -> dict:
+    results = json.loads(profile.json(), parse_constant=lambda value: float(value))
+    results.pop("timestamp")
+
+    for section_results in results.values():
+        section_results.pop("datetime")
+        # histograms of numerical features use bins of reference data
+        for feature_metrics in section_results["data"].get("metrics", {}).values():
+            if isinstance(feature_metrics, dict) and feature_metrics.get("feature_type") == "num":
+                feature_metrics.pop("current_small_hist")
+                feature_metrics.pop("ref_small_hist")
+
+    return results
+
+
+def test_chunked_profile_is_equal_to_profile():
+    reference_data = _get_data(2000, 0, seed=0)
+    current_data = _get_data(3000, 0.3, seed=1)
+    column_mapping = ColumnMapping(
+        numerical_features=["numerical_feature", "discrete_feature"],
+        categorical_features=["categorical_feature"],
+        datetime_features=["datetime_feature"],
+    )
+    chunked_profile = ChunkedProfile([DataDriftProfileSection(), DataQualityProfileSection()])
+    chunked_profile.calculate(_get_chunks(reference_data, 700), _get_chunks(current_data, 700), column_mapping)
+    profile = Profile([DataDriftProfileSection(), DataQualityProfileSection()])
+    profile.calculate(reference_data, current_data, column_mapping)
+
+    _compare(_get_results(chunked_profile), _get_results(profile))
+
+
+def test_chunked_profile_with_ordered_chunks():
+    # values of later chunks are out of the range of the first chunk
+    reference_data = _get_data(4000, 0, seed=0).sort_values("numerical_feature", ignore_index=True)
+    current_data = _get_data(4000, 0.5, seed=1).sort_values("numerical_feature", ignore_index=True)
+    chunked_profile = ChunkedProfile([DataDriftProfileSection(), DataQualityProfileSection()])
+    chunked_profile.calculate(_get_chunks(reference_data, 500), _get_chunks(current_data, 500))
+    profile = Profile([DataDriftProfileSection(), DataQualityProfileSection()])
+    profile.calculate(reference_data, current_data)
+    result = chunked_profile.object()
+    expected = profile.object()
+
+    drift = result["data_drift"]["data"]["metrics"]["numerical_feature"]
+    expected_drift = expected["data_drift"]["data"]["metrics"]["numerical_feature"]
+    assert drift["drift_score"] == pytest.approx(expected_drift["drift_score"], abs=0.01)
+
+    for dataset in ("reference", "current"):
+        stats = result["data_quality"]["data"]["metrics"][dataset]["numerical_feature"]
+        expected_stats = expected["data_quality"]["data"]["metrics"][dataset]["numerical_feature"]
+        for percentile in ("percentile_25", "percentile_50", "percentile_75"):
+            assert stats[percentile] == expected_stats[percentile]
+
+
+def test_chunked_profile_with_sketches():
+    reference_data = _get_data(4000, 0, seed=0).sort_values("numerical_feature", ignore_index=True)
+    current_data = _get_data(4000, 0.5, seed=1)
+    chunked_profile = ChunkedProfile([DataDriftProfileSection(), DataQualityProfileSection()], sketch_size=200)
+    chunked_profile.calculate(_get_chunks(reference_data, 500), _get_chunks(current_data, 500))
+    profile = Profile([DataDriftProfileSection(), DataQualityProfileSection()])
+    profile.calculate(reference_data, current_data)
+    result = chunked_profile.object()
+    expected = profile.object()
+
+    drift = result["data_drift"]["data"]["metrics"]["numerical_feature"]
+    expected_drift = expected["data_drift"]["data"]["metrics"]["numerical_feature"]
+    assert drift["drift_score"] == pytest.approx(expected_drift["drift_score"], abs=0.02)
+
+    for dataset in ("reference", "current"):
+        stats = result["data_quality"]["data"]["metrics"][dataset]
+        expected_stats = expected["data_quality"]["data"]["metrics"][dataset]
+        # columns with few values are counted exactly
+        assert stats["discrete_feature"] == expected_stats["discrete_feature"]
+        numerical_stats = stats["numerical_feature"]
+        expected_numerical_stats = expected_stats["numerical_feature"]
+        assert numerical_stats["unique_count"] == pytest.approx(expected_numerical_stats["unique_count"], rel=0.3)
+
+        for percentile in ("percentile_25", "percentile_50", "percentile_75"):
+            assert numerical_stats[percentile] == pytest.approx(expected_numerical_stats[percentile], abs=0.05)
+
+
+def _get_chunks_peak_memory(n_chunks: int) -> int:
+    def get_chunks(seed: int):
+        rng = np.random.default_rng(seed)
+        for _ in range(n_chunks):
+            yield pd.DataFrame({"numerical_feature": rng.normal(0, 1, 2000), "other_feature": rng.exponential(1, 2000)})
+
+    chunked_profile = ChunkedProfile(
+        [DataDriftProfileSection(), DataQualityProfileSection()],
+        options=[DataQualityOptions(correlation_sample_size=500)],
+        sketch_size=500,
+    )
+    tracemalloc.start()
+
+    try:
+        chunked_profile.calculate(get_chunks(0), get_chunks(1))
+        return tracemalloc.get_traced_memory()[1]
+
+    finally:
+        tracemalloc.stop()
+
+
+def test_chunked_profile_memory_does_not_grow_with_rows():
+    # every value is distinct, exact counts of values would grow with the number of rows
+    assert _get_chunks_peak_memory(64) < 1.3 * _get_chunks_peak_memory(16)
+
+
+def test_chunked_profile_without_current_data():
+    reference_data = _get_data(100, 0, seed=0)
+    chunked_profile = ChunkedProfile([DataQualityProfileSection()])
+    chunked_profile.calculate(_get_chunks(reference_data, 30))
+    result = chunked_profile.object()["data_quality"]["data"]
+
+    assert result["metrics"]["reference"]["numerical_feature"]["count"] == 100
+    assert "current" not in result["metrics"]
+
+    with pytest.raises(ValueError, match="current_data should be present"):
+        ChunkedProfile([DataDriftProfileSection()]).calculate(_get_chunks(reference_data, 30))
+
+
+def test_chunked_profile_correlations_sample():
+    reference_data = _get_data(1000, 0, seed=0)
+    options = DataQualityOptions(correlation_sample_size=100)
+    chunked_profile = ChunkedProfile([DataQualityProfileSection()], options=[options])
+    chunked_profile.calculate(_get_chunks(reference_data, 300))
+    correlations = chunked_profile.object()["data_quality"]["data"]["correlations"]["reference"]
+
+    assert set(correlations) == {"pearson", "spearman", "kendall", "cramer_v"}
+    assert -1 <= correlations["kendall"]["numerical_feature"]["discrete_feature"] <= 1
+
+
+def test_chunked_profile_errors():
+    with pytest.raises(ValueError, match="RegressionPerformanceProfileSection does not support chunked calculations"):
+        ChunkedProfile([RegressionPerformanceProfileSection()])
+
+    with pytest.raises(ValueError, match="reference_data should have at least one chunk"):
+        ChunkedProfile([DataQualityProfileSection()]).calculate(iter([]))
+
+
+def test_chunked_profile_with_csv_chunks(tmp_path):
+    reference_data = _get_data(500, 0, seed=0).rename(columns={"datetime_feature": "datetime"})
+    current_data = _get_data(500, 0.3, seed=1).rename(columns={"datetime_feature": "datetime"})
+    reference_data.to_csv(tmp_path / "reference.csv", index=False)
+    current_data.to_csv(tmp_path / "current.csv", index=False)
+    column_mapping = ColumnMapping(
+        numerical_features=["numerical_feature", "discrete_feature"],
+        categorical_features=["categorical_feature"],
+    )
+    loader = DataLoader()
+    chunked_profile = ChunkedProfile([DataDriftProfileSection(), DataQualityProfileSection()])
+    chunked_profile.calculate(
+        loader.load_chunks(str(tmp_path / "reference.csv"), DataOptions(), chunk_size=200),
+        loader.load_chunks(str(tmp_path / "current.csv"), DataOptions(), chunk_size=200),
+        column_mapping,
+    )
+    expected_profile = ChunkedProfile([DataDriftProfileSection(), DataQualityProfileSection()])
+    expected_profile.calculate(
+        _get_chunks(loader.load(str(tmp_path / "reference.csv"), DataOptions()), 200),
+        _get_chunks(loader.load(str(tmp_path / "current.csv"), DataOptions()), 200),
+        column_mapping,
+    )
+
+    _compare(_get_results(chunked_profile), _get_results(expected_profile))
@@ -1,5 +1,7 @@
+import json
 from typing import ClassVar
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -13,6 +15,7 @@ from evidently.model_profile.sections import ProbClassificationPerformanceProfil
 from evidently.model_profile.sections import RegressionPerformanceProfileSection
 from evidently.model_profile.sections import DataQualityProfileSection
 from evidently.model_profile.sections.base_profile_section import ProfileSection
+from evidently.utils.numpy_encoder import NumpyEncoder
 
 
 @pytest.mark.parametrize(
@@ -73,3 +76,51 @@ def test_model_profile_without_current_data_prob_classification() -> None:
     my_profile.calculate(test_data, test_data, data_mapping)
     result = my_profile.json()
     assert result is not None
+
+
+def test_model_profile_does_not_change_input_data() -> None:
+    reference_data = pd.DataFrame(
+        {
+            "target": [1.0, 0.5, np.inf, 2.0, 3.0, np.nan],
+            "prediction": [1.0, -np.inf, 1.0, 2.5, 2.0, 1.0],
+            "num_feature": [1.0, 2.0, 3.0, np.inf, 5.0, 6.0],
+            "cat_feature": ["a", "b", "a", "b", "a", "b"],
+        }
+    )
+    current_data = reference_data.iloc[::-1].reset_index(drop=True)
+    initial_reference_data = reference_data.copy()
+    initial_current_data = current_data.copy()
+    data_mapping = ColumnMapping(numerical_features=["num_feature"], categorical_features=["cat_feature"])
+    my_profile = Profile(
+        [RegressionPerformanceProfileSection(), NumTargetDriftProfileSection(), DataQualityProfileSection()]
+    )
+    my_profile.calculate(reference_data, current_data, data_mapping)
+
+    pd.testing.assert_frame_equal(reference_data, initial_reference_data)
+    pd.testing.assert_frame_equal(current_data, initial_current_data)
+
+    expected_profile = Profile([RegressionPerformanceProfileSection()])
+    expected_profile.calculate(
+        initial_reference_data.replace([np.inf, -np.inf], np.nan).dropna(subset=["target", "prediction"]),
+        initial_current_data.replace([np.inf, -np.inf], np.nan).dropna(subset=["target", "prediction"]),
+        data_mapping,
+    )
+    # compare serialized values as NaN values are not equal to each other
+    assert json.dumps(my_profile.object()["regression_performance"]["data"]["metrics"], cls=NumpyEncoder) == json.dumps(
+        expected_profile.object()["regression_performance"]["data"]["metrics"], cls=NumpyEncoder
+    )
+
+
+def test_model_profile_does_not_change_input_data_prob_classification() -> None:
+    test_data = pd.DataFrame(
+        {
+            "target": ["0", "1", "0", "1", "0"],
+            "0": [0.1, np.inf, 0.3, 0.4, 0.9],
+            "1": [0.9, 0.6, 0.7, 0.6, 0.1],
+        }
+    )
+    initial_data = test_data.copy()
+    my_profile = Profile([ProbClassificationPerformanceProfileSection(), CatTargetDriftProfileSection()])
+    my_profile.calculate(test_data, test_data, ColumnMapping(target="target", prediction=["0", "1"]))
+
+    pd.testing.assert_frame_equal(test_data, initial_data)
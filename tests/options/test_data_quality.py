@@ -0,0 +1,17 @@
+import pytest
+
+from evidently.options import DataQualityOptions
+
+
+def test_correlation_kinds():
+    assert DataQualityOptions().get_correlation_kinds() == ["pearson", "spearman", "kendall", "cramer_v"]
+    assert DataQualityOptions(correlation_kinds=["pearson"]).get_correlation_kinds() == ["pearson"]
+
+    with pytest.raises(ValueError):
+        DataQualityOptions(correlation_kinds=["pearson", "phik"]).get_correlation_kinds()
+
+
+@pytest.mark.parametrize("sample_size", [0, -1, 1.5])
+def test_correlation_sample_size_invalid(sample_size):
+    with pytest.raises(ValueError):
+        DataQualityOptions(correlation_sample_size=sample_size).get_correlation_sample_size()
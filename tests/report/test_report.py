@@ -0,0 +1,16 @@
+import pandas as pd
+import pytest
+
+from evidently.metrics import DataIntegrityMetrics
+from evidently.report import Report
+
+
+def test_report_with_chunks():
+    data = pd.DataFrame({"feature": [1, 2, 3, 4]})
+    chunks = (data.iloc[start : start + 2] for start in range(0, 4, 2))
+
+    with pytest.raises(ValueError, match="current_data should be a pandas DataFrame"):
+        Report(metrics=[DataIntegrityMetrics()]).run(reference_data=data, current_data=chunks)
+
+    with pytest.raises(ValueError, match="reference_data should be a pandas DataFrame or a ReferenceProfile"):
+        Report(metrics=[DataIntegrityMetrics()]).run(reference_data=chunks, current_data=data)
@@ -0,0 +1,184 @@
+import re
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from evidently import ColumnMapping
+from evidently.runner.loader import DataLoader
+from evidently.runner.loader import DataOptions
+from evidently.runner.loader import SamplingOptions
+from evidently.runner.loader import get_file_format
+from evidently.runner.loader import sample_chunks
+from evidently.runner.runner import get_columns_to_load
+
+
+def _get_data() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "datetime": pd.date_range("2022-01-01", periods=5),
+            "feature": [1.0, 2.0, 3.0, 4.0, 5.0],
+            "category": ["a", "b", "a", "b", "c"],
+            "unused": [0, 0, 0, 0, 0],
+            "target": [1, 0, 1, 0, 1],
+        }
+    )
+
+
+@pytest.mark.parametrize(
+    "filename, file_format, expected",
+    (
+        ("data.csv", None, "csv"),
+        ("data.txt", None, "csv"),
+        ("data.parquet", None, "parquet"),
+        ("data.PQ", None, "parquet"),
+        ("data.feather", None, "feather"),
+        ("data.arrow", None, "arrow"),
+        ("data.txt", "parquet", "parquet"),
+    ),
+)
+def test_get_file_format(filename: str, file_format: str, expected: str):
+    assert get_file_format(filename, DataOptions(file_format=file_format)) == expected
+
+
+def test_get_file_format_error():
+    with pytest.raises(ValueError, match="Unexpected file format xlsx"):
+        get_file_format("data.csv", DataOptions(file_format="xlsx"))
+
+
+def test_get_columns_to_load():
+    column_mapping = ColumnMapping(numerical_features=["feature"], categorical_features=["category"])
+
+    assert get_columns_to_load(column_mapping, "data.csv", DataOptions()) == [
+        "target",
+        "datetime",
+        "prediction",
+        "feature",
+        "category",
+    ]
+    # features are inferred from all columns
+    assert get_columns_to_load(ColumnMapping(categorical_features=["category"]), "data.csv", DataOptions()) is None
+    # datetime features of typed formats are inferred from all columns
+    assert get_columns_to_load(column_mapping, "data.parquet", DataOptions()) is None
+    # columns of CSV files without header have no names
+    assert get_columns_to_load(column_mapping, "data.csv", DataOptions(header=False)) is None
+
+    column_mapping.datetime_features = []
+    assert get_columns_to_load(column_mapping, "data.parquet", DataOptions()) is not None
+
+
+def test_load_csv_columns(tmp_path):
+    _get_data().to_csv(tmp_path / "data.csv", index=False)
+    loader = DataLoader()
+    columns = ["datetime", "feature", "target", "prediction"]
+    data = loader.load(str(tmp_path / "data.csv"), DataOptions(), columns=columns)
+
+    assert data.columns.tolist() == ["datetime", "feature", "target"]
+    assert pd.api.types.is_datetime64_any_dtype(data["datetime"])
+
+    chunks = list(loader.load_chunks(str(tmp_path / "data.csv"), DataOptions(), chunk_size=2, columns=columns))
+
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), data)
+
+
+@pytest.mark.parametrize("file_format", ("parquet", "feather"))
+def test_load_arrow_formats(tmp_path, file_format: str):
+    pytest.importorskip("pyarrow")
+    data = _get_data()
+    filename = str(tmp_path / f"data.{file_format}")
+    getattr(data, f"to_{file_format}")(filename)
+    loader = DataLoader()
+    columns = ["datetime", "feature", "target", "prediction"]
+
+    pd.testing.assert_frame_equal(loader.load(filename, DataOptions()), data)
+    pd.testing.assert_frame_equal(
+        loader.load(filename, DataOptions(), columns=columns), data[["datetime", "feature", "target"]]
+    )
+    chunks = list(loader.load_chunks(filename, DataOptions(), columns=columns))
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), data[["datetime", "feature", "target"]])
+
+
+def _get_sampling_data() -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            "row": np.arange(1000),
+            "target": rng.choice(["a", "b", "c", None], 1000, p=[0.6, 0.3, 0.09, 0.01]),
+            "datetime": pd.Timestamp("2022-01-01") + pd.to_timedelta(np.arange(1000) * 3600, unit="s"),
+        }
+    )
+
+
+def _sample(data: pd.DataFrame, sampling_options: SamplingOptions, chunk_size: int) -> pd.DataFrame:
+    chunks = (data.iloc[start : start + chunk_size] for start in range(0, len(data), chunk_size))
+    return pd.concat(list(sample_chunks(chunks, sampling_options)), ignore_index=True)
+
+
+@pytest.mark.parametrize(
+    "sampling_options",
+    (
+        SamplingOptions("bernoulli", random_seed=3, ratio=0.2),
+        SamplingOptions("stratified", random_seed=3, ratio=0.2, column="target"),
+        SamplingOptions("stratified", random_seed=3, ratio=0.2, column="datetime"),
+    ),
+)
+def test_sample_chunks_does_not_depend_on_chunks(sampling_options: SamplingOptions):
+    data = _get_sampling_data()
+    sample = _sample(data, sampling_options, 1000)
+
+    assert 150 < len(sample) < 250
+    assert sample["row"].is_monotonic_increasing
+    pd.testing.assert_frame_equal(_sample(data, sampling_options, 77), sample)
+
+
+def test_sample_chunks_stratified():
+    data = _get_sampling_data()
+    sample = _sample(data, SamplingOptions("stratified", ratio=0.1, column="target"), 130)
+    counts = sample["target"].value_counts(dropna=False)
+
+    for value, count in data["target"].value_counts(dropna=False).items():
+        assert abs(counts[value] - count * 0.1) < 1
+
+    # days are strata of datetime values
+    sample = _sample(data.iloc[:960], SamplingOptions("stratified", ratio=0.25, column="datetime"), 130)
+    assert (sample["datetime"].dt.normalize().value_counts() == 6).all()
+
+
+def test_sample_chunks_reservoir():
+    data = _get_sampling_data()
+    sample = _sample(data, SamplingOptions("reservoir", random_seed=5, n=100), 130)
+
+    assert len(sample) == 100
+    assert sample["row"].is_unique
+    assert sample["row"].is_monotonic_increasing
+    assert len(_sample(data.iloc[:30], SamplingOptions("reservoir", n=100), 130)) == 30
+
+
+@pytest.mark.parametrize(
+    "sampling_options, error",
+    (
+        (SamplingOptions("bernoulli", ratio=0), "bernoulli sampling should have 'ratio' parameter in (0, 1]"),
+        (SamplingOptions("reservoir", n=0), "reservoir sampling should have 'n' parameter >= 1"),
+        (SamplingOptions("stratified", ratio=0.5), "stratified sampling should have 'column' parameter"),
+        (
+            SamplingOptions("stratified", ratio=0.5, column="feature"),
+            "Column feature for stratified sampling is not present in the data",
+        ),
+    ),
+)
+def test_sample_chunks_errors(sampling_options: SamplingOptions, error: str):
+    with pytest.raises(ValueError, match=re.escape(error)):
+        _sample(_get_sampling_data(), sampling_options, 100)
+
+
+def test_load_with_chunk_sampling(tmp_path):
+    data = _get_sampling_data()
+    data.to_csv(tmp_path / "data.csv", index=False)
+    loader = DataLoader()
+    sampling_options = SamplingOptions("stratified", ratio=0.2, column="target")
+    data_options = DataOptions(date_column=None)
+    sample = loader.load(str(tmp_path / "data.csv"), data_options, sampling_options, columns=["row"])
+
+    assert sample.columns.tolist() == ["row", "target"]
+    pd.testing.assert_frame_equal(sample, _sample(data[["row", "target"]], sampling_options, 1000))
@@ -1,7 +1,16 @@
 import numpy as np
 import pandas as pd
+import pytest
 from pytest import approx
 
+from evidently.calculations.reference_profile import get_column_reference_profile
+from evidently.calculations.reference_profile import get_column_reference_sketch
+from evidently.calculations.stattests import StatTest
+from evidently.calculations.stattests import jensenshannon_stat_test
+from evidently.calculations.stattests import kl_div_stat_test
+from evidently.calculations.stattests import ks_stat_test
+from evidently.calculations.stattests import psi_stat_test
+from evidently.calculations.stattests import wasserstein_stat_test
 from evidently.calculations.stattests import z_stat_test
 from evidently.calculations.stattests.chisquare_stattest import chi_stat_test
 
@@ -36,3 +45,126 @@ def test_freq_obs_not_eq_freq_exp() -> None:
     reference = pd.Series([1, 2, 3, 4, 5, 6]).repeat([x * 2 for x in [16, 18, 16, 14, 12, 12]])
     current = pd.Series([1, 2, 3, 4, 5, 6]).repeat([16, 16, 16, 16, 16, 8])
     assert chi_stat_test.func(reference, current, "cat", 0.5) == (approx(0.67309, abs=1e-5), False)
+
+
+def _batch_test_data(rows: int, seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    data = np.stack(
+        [
+            rng.normal(size=rows),
+            rng.integers(0, 8, size=rows).astype(float),
+            rng.integers(0, 100, size=rows).astype(float),
+            np.round(rng.exponential(size=rows), 1),
+            np.full(rows, 3.0),
+        ],
+        axis=1,
+    )
+    data[rng.random(data.shape) < 0.1] = np.nan
+    return data
+
+
+@pytest.mark.parametrize(
+    "stattest", (ks_stat_test, wasserstein_stat_test, psi_stat_test, kl_div_stat_test, jensenshannon_stat_test)
+)
+@pytest.mark.parametrize("reference_rows, current_rows", ((50, 70), (1000, 12000)))
+def test_stattest_batch_equals_single_feature(stattest, reference_rows, current_rows) -> None:
+    reference = _batch_test_data(reference_rows, 0)
+    current = _batch_test_data(current_rows, 1) + 0.1
+    batch_results = stattest.batch(reference, current, "num", [None] * reference.shape[1])
+
+    for feature_idx, batch_result in enumerate(batch_results):
+        result = stattest(
+            pd.Series(reference[:, feature_idx]).dropna(), pd.Series(current[:, feature_idx]).dropna(), "num", None
+        )
+        assert batch_result.drift_score == approx(result.drift_score, rel=1e-9, nan_ok=True)
+        assert batch_result.drifted == result.drifted
+        assert batch_result.actual_threshold == result.actual_threshold
+
+
+@pytest.mark.parametrize(
+    "stattest",
+    (ks_stat_test, wasserstein_stat_test, psi_stat_test, kl_div_stat_test, jensenshannon_stat_test),
+)
+@pytest.mark.parametrize("reference_rows, current_rows", ((50, 70), (1000, 12000)))
+def test_stattest_with_reference_profile(stattest, reference_rows, current_rows) -> None:
+    reference = _batch_test_data(reference_rows, 0)
+    current = _batch_test_data(current_rows, 1) + 0.1
+
+    for feature_idx in range(reference.shape[1]):
+        reference_data = pd.Series(reference[:, feature_idx]).dropna()
+        current_data = pd.Series(current[:, feature_idx]).dropna()
+        expected = stattest(reference_data, current_data, "num", None)
+        result = stattest(get_column_reference_profile(reference_data), current_data, "num", None)
+        assert result.drift_score == approx(expected.drift_score, rel=1e-9, nan_ok=True)
+        assert result.drifted == expected.drifted
+
+
+@pytest.mark.parametrize(
+    "stattest",
+    (ks_stat_test, wasserstein_stat_test, psi_stat_test, kl_div_stat_test, jensenshannon_stat_test),
+)
+@pytest.mark.parametrize("reference_rows, current_rows", ((50, 70), (1000, 12000)))
+def test_stattest_with_exact_reference_sketch(stattest, reference_rows, current_rows) -> None:
+    reference = _batch_test_data(reference_rows, 0)
+    current = _batch_test_data(current_rows, 1) + 0.1
+
+    for feature_idx in range(reference.shape[1]):
+        reference_data = pd.Series(reference[:, feature_idx]).dropna()
+        current_data = pd.Series(current[:, feature_idx]).dropna()
+        reference_sketch = get_column_reference_sketch(reference_data, n_buckets=1000)
+        assert reference_sketch.exact
+        expected = stattest(reference_data, current_data, "num", None)
+        result = stattest(reference_sketch, current_data, "num", None)
+        assert result.drift_score == approx(expected.drift_score, rel=1e-9, nan_ok=True)
+        assert result.drifted == expected.drifted
+
+
+@pytest.mark.parametrize(
+    "stattest, tolerance",
+    (
+        (ks_stat_test, approx(0, abs=0.05)),
+        (wasserstein_stat_test, approx(0, abs=0.002)),
+        (psi_stat_test, approx(0, abs=0.001)),
+        (kl_div_stat_test, approx(0, abs=0.001)),
+        (jensenshannon_stat_test, approx(0, abs=0.01)),
+    ),
+)
+def test_stattest_with_reference_sketch(stattest, tolerance) -> None:
+    rng = np.random.default_rng(0)
+    reference_data = pd.Series(rng.normal(size=100000))
+    current_data = pd.Series(rng.normal(0.02, size=5000))
+    reference_sketch = get_column_reference_sketch(reference_data, n_buckets=1000)
+    assert not reference_sketch.exact
+    expected = stattest(reference_data, current_data, "num", None)
+    result = stattest(reference_sketch, current_data, "num", None)
+    assert result.drift_score - expected.drift_score == tolerance
+
+
+def test_stattest_without_sketch_support() -> None:
+    reference_sketch = get_column_reference_sketch(pd.Series(np.arange(100.0)), n_buckets=10)
+
+    custom_stattest = StatTest(
+        name="custom", display_name="custom", func=lambda *args: (0.0, False), allowed_feature_types=["num"]
+    )
+
+    for stattest in (custom_stattest, chi_stat_test):
+        with pytest.raises(ValueError):
+            stattest(reference_sketch, pd.Series(np.arange(50.0)), "num", None)
+
+
+@pytest.mark.parametrize(
+    "reference, current",
+    (
+        (pd.Series(["a", "b", "c"]).repeat([10, 12, 10]), pd.Series(["a", "b", "d"]).repeat([10, 10, 10])),
+        (pd.Series(["a", "b"]).repeat([10, 15]), pd.Series(["a", "b"]).repeat([12, 10])),
+        (pd.Series([1, 2, 3]).repeat([16, 18, 16]), pd.Series([1, 2, 3]).repeat([16, 16, 16])),
+    ),
+)
+def test_cat_stattests_with_reference_profile(reference: pd.Series, current: pd.Series) -> None:
+    reference_profile = get_column_reference_profile(reference)
+
+    for stattest in (chi_stat_test, z_stat_test, psi_stat_test, jensenshannon_stat_test):
+        expected = stattest(reference, current, "cat", None)
+        result = stattest(reference_profile, current, "cat", None)
+        assert result.drift_score == approx(expected.drift_score, rel=1e-9)
+        assert result.drifted == expected.drifted
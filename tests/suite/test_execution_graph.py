@@ -0,0 +1,155 @@
+import pandas as pd
+import pytest
+
+from evidently.metrics.base_metric import InputData
+from evidently.metrics.base_metric import Metric
+from evidently.suite.base_suite import Suite
+from evidently.suite.execution_graph import DependencyExecutionGraph
+from evidently.suite.execution_graph import SimpleExecutionGraph
+from evidently.test_preset import DataQuality
+from evidently.test_preset import DataStability
+from evidently.test_preset import NoTargetPerformance
+from evidently.test_suite import TestSuite
+
+
+class ColumnSumMetric(Metric[float]):
+    def __init__(self, column_name: str):
+        self.column_name = column_name
+
+    def calculate(self, data: InputData) -> float:
+        return float(data.current_data[self.column_name].sum())
+
+
+class SumsRatioMetric(Metric[float]):
+    def __init__(self, numerator: ColumnSumMetric, denominator: ColumnSumMetric):
+        self.numerator = numerator
+        self.denominator = denominator
+
+    def calculate(self, data: InputData) -> float:
+        return self.numerator.get_result() / self.denominator.get_result()
+
+
+def test_dependency_execution_graph_order():
+    numerator = ColumnSumMetric("a")
+    denominator = ColumnSumMetric("b")
+    ratio = SumsRatioMetric(numerator, denominator)
+    same_denominator = ColumnSumMetric("b")
+    graph = DependencyExecutionGraph([ratio, numerator, denominator, same_denominator], [])
+
+    assert graph.get_metric_execution_iterator() == [
+        (numerator, numerator),
+        (denominator, denominator),
+        (same_denominator, denominator),
+        (ratio, ratio),
+    ]
+    assert graph.get_calculation_dependencies() == {
+        numerator: [],
+        denominator: [],
+        ratio: [numerator, denominator],
+    }
+
+
+def test_simple_execution_graph():
+    first = ColumnSumMetric("a")
+    second = ColumnSumMetric("b")
+    same_first = ColumnSumMetric("a")
+    graph = SimpleExecutionGraph([second, first, same_first], [])
+
+    assert graph.get_metric_execution_iterator() == [(second, second), (first, first), (same_first, first)]
+    assert graph.get_calculation_dependencies() == {second: [], first: []}
+
+
+def test_dependency_execution_graph_with_circular_dependencies():
+    numerator = ColumnSumMetric("a")
+    denominator = ColumnSumMetric("b")
+    ratio = SumsRatioMetric(numerator, denominator)
+    numerator.ratio = ratio
+
+    with pytest.raises(ValueError):
+        DependencyExecutionGraph([ratio, numerator, denominator], [])
+
+
+@pytest.mark.parametrize("executor", ["serial", "thread", "process"])
+def test_suite_executors(executor):
+    suite = Suite(executor=executor, max_workers=2)
+    ratio = SumsRatioMetric(ColumnSumMetric("a"), ColumnSumMetric("b"))
+    suite.add_metric(ratio)
+    suite.add_metric(ColumnSumMetric("a"))
+    suite.run_calculate(InputData(None, pd.DataFrame({"a": [1, 2, 3], "b": [2, 4, 6]}), None))
+
+    assert ratio.get_result() == 0.5
+    assert len(suite.context.metric_results) == 4
+
+
+class PickleCounter:
+    pickles = 0
+
+    def __getstate__(self):
+        PickleCounter.pickles += 1
+        return {}
+
+
+class FailingMetric(Metric[float]):
+    def calculate(self, data: InputData) -> float:
+        raise ValueError("Calculation failed")
+
+
+def test_suite_process_executor_sends_data_once():
+    suite = Suite(executor="process", max_workers=2)
+    metrics = [ColumnSumMetric(column_name) for column_name in "abcdef"]
+
+    for metric in metrics:
+        suite.add_metric(metric)
+
+    data = InputData(None, pd.DataFrame({column_name: [1, 2] for column_name in "abcdef"}), None)
+    # the counter is pickled with the data, once per worker at most (never with fork)
+    data.counter = PickleCounter()
+    PickleCounter.pickles = 0
+    suite.run_calculate(data)
+
+    assert [metric.get_result() for metric in metrics] == [3.0] * 6
+    assert PickleCounter.pickles <= 2
+
+    suite = Suite(executor="process", max_workers=2)
+    suite.add_metric(FailingMetric())
+
+    with pytest.raises(ValueError, match="Calculation failed"):
+        suite.run_calculate(InputData(None, pd.DataFrame({"a": [1]}), None))
+
+
+def test_suite_with_incorrect_executor():
+    with pytest.raises(ValueError):
+        Suite(executor="cluster")
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_test_suite_with_concurrent_executor(executor):
+    reference_data = pd.DataFrame(
+        {
+            "numerical_feature": [1, 2, 3, 4, 5, 6, 7, 8],
+            "categorical_feature": ["a", "b", "a", "c", "a", "b", "a", "c"],
+            "target": [0, 1, 0, 1, 0, 1, 0, 1],
+            "prediction": [0, 1, 0, 1, 0, 0, 0, 1],
+        }
+    )
+    current_data = reference_data.iloc[::-1].reset_index(drop=True)
+    presets = [DataQuality(), DataStability(), NoTargetPerformance()]
+    expected = TestSuite(tests=presets)
+    expected.run(reference_data=reference_data, current_data=current_data)
+    test_suite = TestSuite(tests=presets, executor=executor, max_workers=2)
+    test_suite.run(reference_data=reference_data, current_data=current_data)
+
+    result = test_suite.as_dict()
+    expected_result = expected.as_dict()
+    assert result["summary"] == expected_result["summary"]
+    assert [test["status"] for test in result["tests"]] == [test["status"] for test in expected_result["tests"]]
+
+
+def test_suite_shares_column_cache():
+    data = pd.DataFrame({"feature": [1, 2, 2, None], "target": [0, 1, 0, 1], "prediction": [0, 1, 1, 1]})
+    test_suite = TestSuite(tests=[DataQuality(), DataStability()])
+    test_suite.run(reference_data=data, current_data=data)
+    column_cache = test_suite._inner_suite.context.column_cache
+
+    assert column_cache is not None
+    assert column_cache.hits > 0
@@ -0,0 +1,184 @@
+import os
+import re
+
+import pandas as pd
+import pytest
+
+from evidently.calculations.reference_profile import get_reference_profile
+from evidently.calculations.reference_profile import load_reference_profile
+from evidently.calculations.reference_profile import save_reference_profile
+from evidently.metrics import data_quality_metrics
+from evidently.metrics.base_metric import InputData
+from evidently.metrics.base_metric import Metric
+from evidently.pipeline.column_mapping import ColumnMapping
+from evidently.suite.base_suite import Suite
+from evidently.suite.result_cache import ResultCache
+from evidently.suite.result_cache import _get_token
+from evidently.suite.result_cache import _NotCacheable
+from evidently.test_preset import DataQuality
+from evidently.test_preset import DataStability
+from evidently.test_suite import TestSuite
+
+
+class CountedSumMetric(Metric[float]):
+    calculations = 0
+
+    def __init__(self, column_name: str, transform=None):
+        self.column_name = column_name
+        self.transform = transform
+
+    def calculate(self, data: InputData) -> float:
+        CountedSumMetric.calculations += 1
+        return float(data.current_data[self.column_name].sum())
+
+
+class HalfMetric(Metric[float]):
+    def __init__(self, total: CountedSumMetric):
+        self.total = total
+
+    def calculate(self, data: InputData) -> float:
+        return self.total.get_result() / 2
+
+
+def _run(result_cache: ResultCache, metric: Metric, data: pd.DataFrame, executor: str = "serial") -> float:
+    suite = Suite(executor=executor, max_workers=2, result_cache=result_cache)
+    suite.add_metric(metric)
+    suite.run_calculate(InputData(None, data, None))
+    return metric.get_result()
+
+
+@pytest.mark.parametrize("executor", ["serial", "thread"])
+def test_result_cache(tmp_path, executor):
+    result_cache = ResultCache(str(tmp_path))
+    data = pd.DataFrame({"a": [1, 2, 3], "b": [2, 4, 6]})
+    CountedSumMetric.calculations = 0
+
+    assert _run(result_cache, HalfMetric(CountedSumMetric("a")), data, executor) == 3
+    assert _run(result_cache, HalfMetric(CountedSumMetric("a")), data, executor) == 3
+    assert CountedSumMetric.calculations == 1
+
+    # other parameters or other data
+    assert _run(result_cache, CountedSumMetric("b"), data, executor) == 12
+    assert _run(result_cache, CountedSumMetric("a"), data.assign(a=[1, 2, 4]), executor) == 7
+    assert _run(result_cache, CountedSumMetric("a"), data.astype({"a": float}), executor) == 6
+    assert CountedSumMetric.calculations == 4
+
+    # parameters without a stable representation
+    assert _run(result_cache, CountedSumMetric("a", transform=lambda x: x), data, executor) == 6
+    assert _run(result_cache, CountedSumMetric("a", transform=lambda x: x), data, executor) == 6
+    assert CountedSumMetric.calculations == 6
+
+
+def test_get_token():
+    assert _get_token(re.compile("a+", re.IGNORECASE)) == _get_token(re.compile("a+", re.IGNORECASE))
+    assert _get_token(re.compile("a+")) != _get_token(re.compile("a+", re.IGNORECASE))
+    assert _get_token({"b": [1, 2], "a": {3}}) == _get_token({"a": {3}, "b": [1, 2]})
+
+    with pytest.raises(_NotCacheable):
+        _get_token(lambda x: x)
+
+    with pytest.raises(_NotCacheable):
+        _get_token(object())
+
+
+def test_result_cache_eviction(tmp_path):
+    result_cache = ResultCache(str(tmp_path))
+
+    for index, key in enumerate(["first", "second", "third"]):
+        result_cache.save(key, "x" * 1000)
+        path = tmp_path / f"{key}.pkl"
+        os.utime(path, (index, index))
+
+    size = os.path.getsize(tmp_path / "first.pkl")
+    assert result_cache.load("first") == "x" * 1000
+
+    result_cache.max_size = 2 * size
+    result_cache.evict()
+    assert sorted(os.listdir(tmp_path)) == ["first.pkl", "third.pkl"]
+    assert result_cache.load("second") is None
+
+    result_cache.clear()
+    assert os.listdir(tmp_path) == []
+
+
+def test_result_cache_with_broken_file(tmp_path):
+    result_cache = ResultCache(str(tmp_path))
+    (tmp_path / "key.pkl").write_bytes(b"not a pickle")
+
+    assert result_cache.load("key") is None
+    assert os.listdir(tmp_path) == []
+
+
+@pytest.mark.parametrize("executor", ["serial", "process"])
+def test_test_suite_with_result_cache(tmp_path, executor):
+    reference_data = pd.DataFrame(
+        {
+            "numerical_feature": [1, 2, 3, 4, 5, 6, 7, 8],
+            "categorical_feature": ["a", "b", "a", "c", "a", "b", None, "c"],
+            "target": [0, 1, 0, 1, 0, 1, 0, 1],
+            "prediction": [0, 1, 0, 1, 0, 0, 0, 1],
+        }
+    )
+    current_data = reference_data.iloc[::-1].reset_index(drop=True)
+    expected = TestSuite(tests=[DataQuality(), DataStability()])
+    expected.run(reference_data=reference_data, current_data=current_data)
+    result_cache = ResultCache(str(tmp_path))
+
+    for _ in range(2):
+        test_suite = TestSuite(tests=[DataQuality(), DataStability()], executor=executor, result_cache=result_cache)
+        test_suite.run(reference_data=reference_data, current_data=current_data)
+        result = test_suite.as_dict()
+        assert [test["status"] for test in result["tests"]] == [test["status"] for test in expected.as_dict()["tests"]]
+        test_suite._build_dashboard_info()
+
+    assert len([name for name in os.listdir(tmp_path) if name.endswith(".pkl")]) > 0
+
+
+def test_result_cache_reuses_reference_state(tmp_path, monkeypatch):
+    reference_calculations = []
+    calculate_data_quality_stats = data_quality_metrics.calculate_data_quality_stats
+
+    def counted_calculate_data_quality_stats(dataset, columns, task):
+        if dataset is not current_data:
+            reference_calculations.append(dataset)
+        return calculate_data_quality_stats(dataset, columns, task)
+
+    monkeypatch.setattr(data_quality_metrics, "calculate_data_quality_stats", counted_calculate_data_quality_stats)
+    result_cache = ResultCache(str(tmp_path))
+    reference_data = pd.DataFrame({"feature": [1.0, 2.0, 3.0, 4.0], "category": ["a", "b", "a", "c"]})
+    expected = None
+
+    # new current data every run, the reference stats are calculated once
+    for shift in range(3):
+        current_data = reference_data.assign(feature=reference_data["feature"] + shift)
+        metric = data_quality_metrics.DataQualityMetrics()
+        suite = Suite(result_cache=result_cache)
+        suite.add_metric(metric)
+        suite.run_calculate(InputData(reference_data, current_data, ColumnMapping()))
+        result = metric.get_result()
+        assert result.features_stats.num_features_stats["feature"].max == 4.0 + shift
+        expected = expected or result.reference_features_stats
+        assert result.reference_features_stats == expected
+
+    assert len(reference_calculations) == 1
+
+    # reference profiles are keyed by their content
+    profile = get_reference_profile(reference_data)
+    save_reference_profile(profile, str(tmp_path / "profile.npz"))
+    loaded_profile = load_reference_profile(str(tmp_path / "profile.npz"))
+    assert loaded_profile.get_hash() == profile.get_hash()
+    assert get_reference_profile(reference_data.assign(feature=0.0)).get_hash() != profile.get_hash()
+
+    for reference in (profile, loaded_profile):
+        data = InputData(reference, current_data, ColumnMapping())
+        assert result_cache.get_data_key(data) is not None
+        data.column_cache.reference_store = result_cache
+        columns = data.column_cache.get_columns()
+        stats = data.column_cache.get_reference_state(
+            "data_quality_stats",
+            (columns, None),
+            lambda: counted_calculate_data_quality_stats(reference, columns, None),
+        )
+        assert stats.num_features_stats["feature"].max == 4.0
+
+    assert len(reference_calculations) == 2
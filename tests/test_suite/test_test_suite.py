@@ -153,6 +153,10 @@ def test_export_to_json():
         "target_names": None,
         "utility_columns": {"date": None, "id_column": None, "prediction": "pred_result", "target": "result"},
     }
+    assert set(json_result["fingerprints"]) == {"reference", "current"}
+    assert json_result["fingerprints"]["current"]["mode"] == "sampled"
+    assert json_result["fingerprints"]["current"]["n_rows"] == current_data.shape[0]
+    assert list(json_result["fingerprints"]["current"]["columns"]) == list(current_data.columns)
     assert "summary" in json_result
 
     summary_result = json_result["summary"]
@@ -1,10 +1,21 @@
 import json
+import pickle
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import pytest
 
 import numpy as np
 import pandas as pd
 
+from evidently.metrics.base_metric import InputData
+from evidently.pipeline.column_mapping import ColumnMapping
+from evidently.utils.column_cache import ColumnCache
+from evidently.utils.data_operations import get_finite_rows_mask
+from evidently.utils.data_operations import select_finite_rows
+from evidently.utils.fingerprint import FingerprintCalculator
+from evidently.utils.fingerprint import get_fingerprint
 from evidently.utils.numpy_encoder import NumpyEncoder
 
 
@@ -74,3 +85,165 @@ def test_numpy_encoder_incompatible_types(test_object, type_name_in_error: str)
     with pytest.raises(TypeError) as error:
         json.dumps(test_object, cls=NumpyEncoder)
         assert type_name_in_error in str(error)
+
+
+def test_column_cache():
+    current_data = pd.DataFrame({"feature": [1.0, np.nan, np.inf, 3.0, 1.0], "category": ["a", "b", "a", None, "a"]})
+    reference_data = pd.DataFrame({"feature": [2.0, 2.0, -np.inf], "category": ["b", "b", "c"]})
+    cache = ColumnCache(reference_data, current_data, ColumnMapping(categorical_features=["category"]))
+
+    columns = cache.get_columns()
+    assert columns.num_feature_names == ["feature"]
+    columns.num_feature_names.append("other")
+    assert cache.get_columns().num_feature_names == ["feature"]
+
+    pd.testing.assert_series_equal(
+        cache.get_value_counts("current", "category"), current_data["category"].value_counts(dropna=False)
+    )
+    assert cache.get_nunique("reference", "category") == 2
+    np.testing.assert_equal(cache.get_finite_values("current", "feature"), [1.0, 3.0, 1.0])
+    np.testing.assert_equal(cache.get_sorted_values("current", "feature"), [1.0, 1.0, 3.0])
+    assert list(cache.get_not_null_values("current", "category")) == ["a", "b", "a", "a"]
+    assert (cache.hits, cache.misses) == (2, 6)
+
+    cache.get_value_counts("current", "category")
+    assert (cache.hits, cache.misses) == (3, 6)
+
+    with pytest.raises(ValueError):
+        cache.get_nunique("other", "category")
+
+
+def test_column_cache_in_threads():
+    cache = ColumnCache(None, pd.DataFrame({"feature": [1.0, 2.0]}), None)
+    calculations = []
+    barrier = threading.Barrier(4)
+
+    def calculate():
+        calculations.append(1)
+        # other threads request the value while it is calculated
+        time.sleep(0.05)
+        return len(calculations)
+
+    def request(_):
+        barrier.wait()
+        return cache._get(("key",), calculate)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        assert list(executor.map(request, range(4))) == [1, 1, 1, 1]
+
+    assert (cache.hits, cache.misses) == (3, 1)
+
+    copied_cache = pickle.loads(pickle.dumps(cache))
+    assert copied_cache._get(("key",), calculate) == 1
+    assert copied_cache.get_nunique("current", "feature") == 2
+
+
+def test_column_cache_without_reference():
+    cache = ColumnCache(None, pd.DataFrame({"feature": [1, 2]}), None)
+
+    with pytest.raises(ValueError):
+        cache.get_nunique("reference", "feature")
+
+
+def test_column_cache_histogram():
+    current_data = pd.DataFrame({"feature": [1.0, np.nan, np.inf, 3.0, 1.0, 5.0]})
+    reference_data = pd.DataFrame({"feature": [2.0, 2.0, -np.inf, 0.0]})
+    cache = ColumnCache(reference_data, current_data, None)
+
+    histogram = cache.get_histogram("feature", "doane")
+    expected_edges = np.histogram_bin_edges([1.0, 3.0, 1.0, 5.0, 2.0, 2.0, 0.0], bins="doane")
+    np.testing.assert_equal(histogram.edges, expected_edges)
+    assert list(histogram.counts) == ["current", "reference"]
+    np.testing.assert_equal(histogram.counts["current"], np.histogram([1.0, 3.0, 1.0, 5.0], expected_edges)[0])
+    np.testing.assert_equal(histogram.counts["reference"], np.histogram([2.0, 2.0, 0.0], expected_edges)[0])
+    assert cache.get_histogram("feature", "doane") is histogram
+    assert cache.get_bin_edges("feature", "doane") is histogram.edges
+
+    histogram = ColumnCache(None, current_data, None).get_histogram("feature", 2)
+    np.testing.assert_equal(histogram.edges, [1.0, 3.0, 5.0])
+    assert list(histogram.counts) == ["current"]
+    np.testing.assert_equal(histogram.counts["current"], [2, 2])
+
+
+def test_select_finite_rows():
+    dataset = pd.DataFrame(
+        {
+            "target": [1.0, np.inf, 3.0, np.nan, 5.0],
+            "prediction": ["a", "b", None, "d", "e"],
+            "feature": [-np.inf, 2.0, 3.0, 4.0, 5.0],
+            "category": ["a", np.inf, "c", "d", "e"],
+        },
+        index=[10, 11, 12, 13, 13],
+    )
+    initial_dataset = dataset.copy()
+    expected = dataset.replace([np.inf, -np.inf], np.nan).dropna(subset=["target", "prediction"])
+
+    pd.testing.assert_frame_equal(select_finite_rows(dataset, ["target", "prediction"]), expected)
+    pd.testing.assert_frame_equal(
+        select_finite_rows(dataset, ["target", "prediction"], ["feature", "target"]), expected[["feature", "target"]]
+    )
+    pd.testing.assert_series_equal(
+        get_finite_rows_mask(dataset, ["target", "category"]),
+        pd.Series([True, False, True, False, True], index=dataset.index),
+    )
+    pd.testing.assert_frame_equal(dataset, initial_dataset)
+
+
+def _get_fingerprint_dataset() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "objects": pd.Series(["a", None, 1, 1.0, True, np.nan, "1", [1], 2**70, "a"], dtype=object),
+            "strings": ["a", "b", None, "a", "c", "b", "a", None, "d", "a"],
+            "floats": [1.0, np.nan, -0.0, 2.5, np.inf, 1.0, 3.0, 4.0, 5.0, 6.0],
+            "category": pd.Categorical(["x", "y", None, "x", "y", "x", "z", "x", "y", "x"]),
+            "datetime": pd.date_range("2022-01-01", periods=10),
+        },
+        index=range(100, 110),
+    )
+
+
+@pytest.mark.parametrize("chunk_size", (1, 3, 4, 10))
+@pytest.mark.parametrize("mode, step", (("full", 1), ("sampled", 3)))
+def test_fingerprint_of_chunks(chunk_size: int, mode: str, step: int):
+    dataset = _get_fingerprint_dataset()
+    calculator = FingerprintCalculator(mode, step, max_workers=2)
+
+    for start in range(0, dataset.shape[0], chunk_size):
+        calculator.add(dataset.iloc[start : start + chunk_size])
+
+    fingerprint = calculator.get()
+    assert fingerprint == get_fingerprint(dataset, mode, sample_size=4)
+    assert fingerprint.n_rows == 10
+    assert list(fingerprint.columns) == list(dataset.columns)
+
+
+def test_fingerprint_changes():
+    dataset = _get_fingerprint_dataset()
+    fingerprint = get_fingerprint(dataset)
+
+    assert get_fingerprint(dataset.copy()) == fingerprint
+    assert fingerprint.get_changed_columns(get_fingerprint(dataset.copy())) == []
+
+    changed = dataset.copy()
+    changed.loc[105, "floats"] = 0.0
+    changed.at[106, "objects"] = 1
+    assert fingerprint.get_changed_columns(get_fingerprint(changed)) == ["objects", "floats"]
+    assert get_fingerprint(changed).hash != fingerprint.hash
+
+    assert fingerprint.get_changed_columns(get_fingerprint(dataset.drop(columns="strings"))) == ["strings"]
+    assert fingerprint.get_changed_columns(get_fingerprint(dataset.astype({"floats": np.float32}))) == ["floats"]
+    assert fingerprint.get_changed_columns(get_fingerprint(dataset.reset_index(drop=True))) == list(dataset.columns)
+    assert get_fingerprint(dataset, "sampled", sample_size=4).hash != fingerprint.hash
+
+
+def test_fingerprint_of_input_data():
+    dataset = _get_fingerprint_dataset()
+    data = InputData(reference_data=None, current_data=dataset, column_mapping=ColumnMapping())
+
+    assert data.get_fingerprint() == get_fingerprint(dataset)
+    assert data.get_fingerprint() is data.get_fingerprint()
+    assert data.get_fingerprint("current", "sampled") == get_fingerprint(dataset, "sampled")
+    assert data.get_fingerprint("reference") is None
+
+    with pytest.raises(ValueError):
+        get_fingerprint(dataset, "partial")
@@ -1,9 +1,11 @@
 import json
 
 import pandas as pd
+import pytest
 
 from pytest import approx
 
+from evidently.metrics import ClassificationPerformanceMetricsSweep
 from evidently.pipeline.column_mapping import ColumnMapping
 from evidently.tests import TestAccuracyScore
 from evidently.tests import TestPrecisionScore
@@ -558,3 +560,37 @@ def test_fnr_test_render_json() -> None:
         "parameters": {"condition": {"eq": {"absolute": 1e-12, "relative": 0.2, "value": 0.5}}, "fnr": 0.5},
         "status": "SUCCESS",
     }
+
+
+def test_classification_tests_with_sweep() -> None:
+    test_dataset = pd.DataFrame(
+        {
+            "target": [1, 1, 1, 1, 0, 0, 0, 0, 0, 0],
+            "prediction": [0.9, 0.7, 0.0, 0.5, 0.1, 0.4, 0.6, 0.2, 0.2, 0.8],
+        }
+    )
+    column_mapping = ColumnMapping(pos_label=1)
+    thresholds = [0.3, 0.5, 0.7]
+    sweep = ClassificationPerformanceMetricsSweep(thresholds=thresholds)
+    tests = [TestPrecisionScore(classification_threshold=threshold, sweep=sweep, gt=0) for threshold in thresholds]
+    tests += [TestTPR(classification_threshold=threshold, sweep=sweep, gt=0) for threshold in thresholds]
+    suite = TestSuite(tests=tests)
+    suite.run(current_data=test_dataset, reference_data=test_dataset, column_mapping=column_mapping)
+    assert suite
+
+    expected_suite = TestSuite(
+        tests=[TestPrecisionScore(classification_threshold=threshold, gt=0) for threshold in thresholds]
+        + [TestTPR(classification_threshold=threshold, gt=0) for threshold in thresholds]
+    )
+    expected_suite.run(current_data=test_dataset, reference_data=test_dataset, column_mapping=column_mapping)
+    assert json.loads(suite.json())["tests"] == json.loads(expected_suite.json())["tests"]
+
+
+def test_classification_tests_with_sweep_errors() -> None:
+    sweep = ClassificationPerformanceMetricsSweep(k=[1, 0.5])
+
+    with pytest.raises(ValueError):
+        TestPrecisionScore(k=0.3, sweep=sweep)
+
+    with pytest.raises(ValueError):
+        TestPrecisionScore(sweep=sweep)